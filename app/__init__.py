@@ -1,11 +1,11 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Flask app factory — registers all blueprints, starts APScheduler (queue drainer + heartbeat), and spawns the daemon outbox-retry thread.
+purpose: Flask app factory — registers all blueprints, starts APScheduler (Trello and Procore queue drainers + heartbeat), and spawns the daemon outbox-retry thread.
 exports:
   create_app: Factory that builds and returns the configured Flask application
-  init_scheduler: Starts APScheduler with queue-drainer (5 min) and heartbeat (30 min) jobs
-imports_from: [app/trello, app/procore, app/brain, app/auth/routes, app/history, app/admin, app/models, app/config, app/db_config, app/logging_config, app/services/outbox_service, app/trello/api, apscheduler]
+  init_scheduler: Starts APScheduler with Trello and Procore inbound-queue upkeep (5 min), scheduling-snapshot refresh and heartbeat (30 min) jobs
+imports_from: [app/trello, app/procore, app/brain, app/auth/routes, app/history, app/admin, app/models, app/config, app/db_config, app/json_provider, app/logging_config, app/services/outbox_service, app/trello/api, apscheduler]
 imported_by: [run.py]
 invariants:
   - Scheduler only starts on one process: checks WERKZEUG_RUN_MAIN or IS_RENDER_SCHEDULER to avoid duplication in multi-worker deploys.
@@ -47,7 +47,7 @@ logger = configure_logging(log_level=os.environ.get("LOG_LEVEL", "INFO"), log_fi
 
 def init_scheduler(app):
     """Initialize the background scheduler for Trello queue draining and heartbeat."""
-    from app.trello import drain_trello_queue
+    from app.trello import ensure_inbound_worker, inbound_queue
 
     # Tests never need APScheduler. Starting it registers an atexit shutdown that
     # logs after pytest closes stdout → noisy "I/O operation on closed file".
@@ -72,13 +72,19 @@ def init_scheduler(app):
     }
     scheduler = BackgroundScheduler(executors=executors)
 
-    # --- Queue drainer job (runs every 5 minutes) ---
+    # --- Inbound Trello queue upkeep (runs every 5 minutes) ---
+    # The drain itself is continuous (ensure_inbound_worker); this job starts the
+    # worker in the scheduler process (so a backlog left by a restart drains even
+    # before the next webhook), hands back claims from dead workers and purges
+    # old completed rows.
     def queue_drainer():
         with app.app_context():
             try:
-                drained = drain_trello_queue(max_items=5)
-                if drained:
-                    logger.info("Trello queue drainer executed", items_drained=drained)
+                released = inbound_queue.release_stale_claims()
+                ensure_inbound_worker(app)
+                purged = inbound_queue.purge_completed()
+                if released or purged:
+                    logger.info("Trello queue drainer executed", claims_released=released, rows_purged=purged)
             except Exception as e:
                 logger.warning("Trello queue drainer failed", error=str(e))
 
@@ -91,6 +97,109 @@ def init_scheduler(app):
         replace_existing=True,
     )
 
+    # --- Inbound Procore webhook queue upkeep (every 5 minutes) ---
+    # Same shape as the Trello drainer: start this process's drain thread, hand back
+    # claims from dead workers and purge old completed rows.
+    def procore_queue_drainer():
+        from app.procore import ensure_procore_inbound_worker
+        from app.procore import inbound_queue as procore_inbound_queue
+
+        with app.app_context():
+            try:
+                released = procore_inbound_queue.release_stale_claims()
+                ensure_procore_inbound_worker(app)
+                purged = procore_inbound_queue.purge_completed()
+                if released or purged:
+                    logger.info("Procore queue drainer executed", claims_released=released, rows_purged=purged)
+            except Exception as e:
+                logger.warning("Procore queue drainer failed", error=str(e))
+
+    scheduler.add_job(
+        func=procore_queue_drainer,
+        trigger="interval",
+        minutes=5,
+        id="procore_queue_drainer",
+        name="Procore Queue Drainer",
+        replace_existing=True,
+    )
+
+    # --- Procore webhook receipt purge (hourly) ---
+    # webhook_receipts only needs the current 15s dedup window; older Procore rows are
+    # kept PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS for the metrics page, then deleted.
+    def webhook_receipt_purge():
+        from app.procore.helpers import purge_webhook_receipts
+
+        with app.app_context():
+            try:
+                purged = purge_webhook_receipts()
+                if purged:
+                    logger.info("Webhook receipts purged", rows_purged=purged)
+            except Exception as e:
+                logger.warning("Webhook receipt purge failed", error=str(e))
+
+    scheduler.add_job(
+        func=webhook_receipt_purge,
+        trigger="interval",
+        hours=1,
+        id="webhook_receipt_purge",
+        name="Webhook Receipt Purge",
+        replace_existing=True,
+    )
+
+    # --- Incremental Trello<->DB scan (every TRELLO_SCAN_INTERVAL_MINUTES) ---
+    # Keeps the standing mismatch report (/brain/trello-scanner/report) current by
+    # re-checking only cards with board activity and releases edited since the last
+    # run; a full board read happens every TRELLO_SCAN_FULL_EVERY_HOURS.
+    trello_scan_minutes = app.config.get("TRELLO_SCAN_INTERVAL_MINUTES", 5)
+
+    def trello_db_scan():
+        with app.app_context():
+            if not app.config.get("TRELLO_BOARD_ID") or app.config.get("TRELLO_MOCK"):
+                return
+            from app.trello.scanner import scan_trello_db_incremental
+            try:
+                result = scan_trello_db_incremental()
+                summary = result.get("summary") or {}
+                if summary.get("list_mismatches") or summary.get("trello_only"):
+                    logger.info("Trello/DB drift detected", **summary)
+            except Exception as e:
+                logger.error("Trello/DB scan failed", error=str(e), exc_info=True)
+
+    if trello_scan_minutes > 0:
+        scheduler.add_job(
+            func=trello_db_scan,
+            trigger="interval",
+            minutes=trello_scan_minutes,
+            id="trello_db_scan",
+            name="Trello/DB Incremental Scan",
+            replace_existing=True,
+        )
+
+    # --- Scheduling snapshot refresh (every SCHEDULING_SNAPSHOT_REFRESH_SECONDS) ---
+    # /brain/jobs and /brain/get-all-jobs only read release_schedules; this job is
+    # what persists it after a scheduling input changes or the day rolls over.
+    snapshot_refresh_seconds = app.config.get("SCHEDULING_SNAPSHOT_REFRESH_SECONDS", 60)
+
+    def scheduling_snapshot_refresh():
+        from app.brain.job_log.scheduling.snapshot import ensure_scheduling_snapshot
+
+        with app.app_context():
+            try:
+                ensure_scheduling_snapshot()
+            except Exception as e:
+                db.session.rollback()
+                logger.warning("Scheduling snapshot refresh failed", error=str(e))
+
+    if snapshot_refresh_seconds > 0:
+        scheduler.add_job(
+            func=scheduling_snapshot_refresh,
+            trigger="interval",
+            seconds=snapshot_refresh_seconds,
+            id="scheduling_snapshot_refresh",
+            name="Scheduling Snapshot Refresh",
+            replace_existing=True,
+        )
+
     # --- Optional heartbeat job to confirm scheduler alive ---
     scheduler.add_job(
         func=lambda: logger.info("scheduler_heartbeat"),
@@ -284,6 +393,24 @@ def init_scheduler(app):
             "schedule": "Every 5 minutes",
             "description": "Drain queued Trello events (when lock is free)",
         },
+        {
+            "id": "procore_queue_drainer",
+            "name": "Procore Queue Drainer",
+            "schedule": "Every 5 minutes",
+            "description": "Start this process's Procore webhook drain thread, release stale claims, purge completed rows",
+        },
+        {
+            "id": "webhook_receipt_purge",
+            "name": "Webhook Receipt Purge",
+            "schedule": "Every hour",
+            "description": "Delete Procore webhook dedup receipts past retention",
+        },
+        {
+            "id": "scheduling_snapshot_refresh",
+            "name": "Scheduling Snapshot Refresh",
+            "schedule": f"Every {snapshot_refresh_seconds} seconds",
+            "description": "Rebuild the job-log scheduling snapshot when its inputs changed or the day rolled over",
+        },
         {
             "id": "heartbeat",
             "name": "Scheduler Heartbeat",
@@ -346,6 +473,10 @@ def create_app():
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # orjson encoder for jsonify/get_json (the job-log payloads are the big ones)
+    from app.json_provider import install_json_provider
+    install_json_provider(app)
+
     # Cap multipart upload body size — used by the PDF markup endpoints. Flask
     # turns oversize requests into a 413 automatically.
     app.config.setdefault('MAX_CONTENT_LENGTH', 50 * 1024 * 1024)
@@ -397,8 +528,12 @@ def create_app():
     def apply_cache_headers(response):
         # The HTML shell must revalidate every load — without this, a tab cached pre-deploy
         # rides forever on stale bundle hashes (Render purges old chunks on each deploy).
+        # Polled reads tagged by app/http_cache.py may be revalidated (If-None-Match → 304)
+        # but never served from a cache without asking, and never from a shared one.
         path = request.path or ""
-        if path.startswith("/api/"):
+        if response.headers.get("ETag") and path.startswith("/brain/"):
+            response.headers["Cache-Control"] = "private, no-cache"
+        elif path.startswith("/api/"):
             response.headers["Cache-Control"] = "no-store"
         elif path.startswith("/assets/"):
             response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
@@ -466,6 +601,7 @@ def create_app():
                     with app.app_context():
                         # Process pending items that are ready for retry
                         processed = OutboxService.process_pending_items(limit=10)
+                        processed += OutboxService.process_pending_procore_items(limit=10)
                         # Process due Procore submittal reconciles (delayed re-fetch safety net)
                         reconciled = ProcoreReconcileService.process_due(limit=10)
                         if processed + reconciled == 0:
@@ -498,7 +498,7 @@ def add_scheduling_fields_to_jobs(
     Returns:
         list: List of job dictionaries with added scheduling fields
     """
-    from app.brain.job_log.scheduling import calculate_all_job_scheduling
+    from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
     
     if not jobs:
         return jobs
@@ -518,8 +518,10 @@ def add_scheduling_fields_to_jobs(
         }
         queue_job_dicts.append(job_dict)
     
-    # Calculate scheduling for all queue jobs
-    queue_jobs_with_scheduling = calculate_all_job_scheduling(queue_job_dicts, reference_date)
+    # Calculate scheduling for all queue jobs (columnar engine)
+    queue_jobs_with_scheduling = compute_scheduling(
+        SchedulingColumns.from_jobs(queue_job_dicts), reference_date
+    ).to_dicts()
     
     # Create a lookup map by (fab_order, stage, fab_hrs) for matching
     # This handles cases where the returned jobs list is a subset
@@ -11,12 +11,13 @@ exports:
   bump_submittal: POST endpoint for bumping submittals between urgency and ordered zones.
   drag_submittal_order: PUT endpoint for drag-and-drop reordering.
   update_submittal_procore_status: PUT endpoint for changing Procore status via API.
-imports_from: [flask, app.brain, app.brain.drafting_work_load.service, app.models, app.auth.utils, app.route_utils, app.procore.api, app.procore.client]
+imports_from: [flask, app.brain, app.brain.drafting_work_load.service, app.models, app.auth.utils, app.route_utils, app.http_cache, app.procore.api, app.services.outbox_service]
 imported_by: [app/brain/__init__.py]
 invariants:
   - All routes are registered on brain_bp under the /drafting-work-load prefix.
   - Every mutating endpoint creates a SubmittalEvent for the audit trail.
   - Order and bump endpoints require admin; notes and drafting-status require login; due-date requires drafter or admin.
+  - GET /drafting-work-load answers a matching If-None-Match with 304 before querying (ETag over Submittals, Carmen reviews and job sites).
 updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
 """
 from app.brain import brain_bp
@@ -29,21 +30,35 @@ from app.brain.drafting_work_load.service import (
     LocationService,
 )
 from app.logging_config import get_logger
-from app.models import Submittals, ProcoreOutbox, Notification, PendingStartInstall, CarmenDrawingReview, db, is_gc_approval_type
+from app.models import Submittals, Notification, PendingStartInstall, CarmenDrawingReview, Projects, db, is_gc_approval_type
 from app.brain.pdf_review.report import build_report
 from app.auth.utils import login_required, admin_required, drafter_or_admin_required, get_current_user
 from app.brain.mentions import parse_mentions, resolve_mentioned_users
 from app.route_utils import handle_errors, require_json, get_or_404
+from app.services.outbox_service import OutboxService
+from app.http_cache import conditional_get, table_versions, tracked_tables
 from app.procore.api import SUBMITTAL_STATUSES, VALID_SUBMITTAL_STATUS_IDS, SUBMITTAL_STATUS_ID_TO_NAME
-from app.procore.client import get_procore_client
 from app.procore.helpers import create_submittal_event
 from datetime import datetime
 
 logger = get_logger(__name__)
 
 
+# Projects carries the job-site geometry behind the lat/lng filter.
+_DWL_TABLES = tracked_tables(
+    (Submittals, Submittals.last_updated),
+    (CarmenDrawingReview, CarmenDrawingReview.completed_at),
+    (Projects, None),
+)
+
+
+def _dwl_version():
+    return table_versions(*_DWL_TABLES)
+
+
 @brain_bp.route('/drafting-work-load')
 @login_required
+@conditional_get(_dwl_version)
 @handle_errors("get drafting work load data")
 def drafting_work_load():
     """Return Drafting Work Load data from the db.
@@ -543,29 +558,30 @@ def update_submittal_procore_status():
     old_status = submittal.status
     new_status = SUBMITTAL_STATUS_ID_TO_NAME[status_id]
 
-    # Record outgoing API call in ProcoreOutbox BEFORE calling Procore.
-    # The webhook handler checks this table to identify echo webhooks.
-    outbox_entry = ProcoreOutbox(
-        submittal_id=submittal_id,
-        project_id=project_id,
-        action='update_status',
-        request_payload={'status_id': status_id},
-        status='processing',
+    # Queue the call in ProcoreOutbox and deliver it now through the outbox dispatcher,
+    # so a Procore outage is retried by the outbox thread instead of being lost.
+    outbox_entry = OutboxService.add_procore(
+        submittal_id, project_id, 'update_status', {'status_id': status_id},
     )
-    db.session.add(outbox_entry)
-    db.session.commit()  # commit before API call so webhook handler sees it immediately
+    db.session.commit()
+    outbox_status = OutboxService.deliver_procore_item(outbox_entry.id)
 
-    procore_client = get_procore_client()
-    try:
-        procore_client.update_submittal_status(project_id, int(submittal_id), status_id)
-    except Exception as api_exc:
-        outbox_entry.status = 'failed'
-        outbox_entry.error_message = str(api_exc)[:500]
-        db.session.commit()
-        raise
-
-    outbox_entry.status = 'completed'
-    outbox_entry.completed_at = datetime.utcnow()
+    if outbox_status == 'failed':
+        return jsonify({
+            "error": f"Procore rejected the status update: {outbox_entry.error_message}",
+            "outbox_id": outbox_entry.id,
+        }), 502
+    if outbox_status != 'completed':
+        # Queued behind an earlier call for this submittal, or retrying after an error;
+        # the Procore webhook syncs the local status once it lands.
+        return jsonify({
+            "success": True,
+            "queued": True,
+            "submittal_id": submittal_id,
+            "status_id": status_id,
+            "outbox_id": outbox_entry.id,
+            "error": outbox_entry.error_message,
+        }), 202
 
     # Create Brain event *before* committing submittal so we always record it;
     # otherwise a fast webhook can create the same payload and our create would be skipped as duplicate.
@@ -0,0 +1,144 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Apply a batch of stage changes (e.g. a whole shipment to Ship Complete) in one transaction, with one scheduling cascade and one Trello move per card.
+exports:
+  BULK_STAGE_MAX_ITEMS: Upper bound on items per request
+  StageChangeItem: One requested (job, release, stage) move
+  BulkUpdateStageCommand: Dataclass command that runs UpdateStageCommand per item and commits once
+imports_from: [app.models, app.logging_config, app.brain.job_log.features.stage.command, app.brain.job_log.scheduling.service]
+imported_by: [app/brain/job_log/routes.py]
+invariants:
+  - Each item runs the full UpdateStageCommand workflow inside its own SAVEPOINT; a failed item rolls back only its own writes and is reported, the rest still commit
+  - Exactly one commit and one recalculate_all_jobs_scheduling call per batch, after every item has run
+  - A release listed more than once is moved once, to its last requested stage; earlier entries report status 'superseded'
+  - Every primary event carries the same batch_id, so the outbox sorts each destination list once per pass rather than per card
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Bulk stage change.
+
+N calls to PATCH /update-stage/<job>/<release> meant N commits, N full
+FABRICATION scheduling recalcs and N outbox writes. This runs the same command
+per item with commit and cascade deferred, so fab_order tiering, the job_comp
+cascade and date discipline behave exactly as they do for a single move.
+"""
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.logging_config import get_logger
+from app.models import db
+from app.brain.job_log.features.stage.command import (
+    StagePhotoRequiredError,
+    UpdateStageCommand,
+)
+
+logger = get_logger(__name__)
+
+BULK_STAGE_MAX_ITEMS = 500
+
+
+@dataclass(frozen=True)
+class StageChangeItem:
+    job_id: int
+    release: str
+    stage: str
+
+
+@dataclass
+class BulkUpdateStageCommand:
+    """
+    Command to move many releases in one transaction.
+
+    1. Collapse repeated (job, release) entries to the last requested stage.
+    2. Run UpdateStageCommand(defer_commit, defer_cascade, batch_id) per item in a SAVEPOINT.
+    3. Commit once, then run the FABRICATION scheduling cascade once.
+    """
+    items: List[StageChangeItem]
+    source: str = "Brain"
+    source_of_update: str = "Brain"
+    batch_id: Optional[str] = None
+
+    def execute(self) -> List[dict]:
+        """Apply every item and return one result dict per input item, in order."""
+        if self.batch_id is None:
+            self.batch_id = uuid.uuid4().hex
+        batch_id = self.batch_id
+        last_index = {}
+        for index, item in enumerate(self.items):
+            last_index[(item.job_id, item.release)] = index
+
+        results = []
+        applied = 0
+        for index, item in enumerate(self.items):
+            base = {"job_id": item.job_id, "release": item.release, "requested_stage": item.stage}
+            if last_index[(item.job_id, item.release)] != index:
+                results.append({**base, "status": "superseded"})
+                continue
+            savepoint = db.session.begin_nested()
+            try:
+                result = UpdateStageCommand(
+                    job_id=item.job_id,
+                    release=item.release,
+                    stage=item.stage,
+                    source=self.source,
+                    source_of_update=self.source_of_update,
+                    defer_cascade=True,
+                    defer_commit=True,
+                    batch_id=batch_id,
+                ).execute()
+                savepoint.commit()
+            except StagePhotoRequiredError as e:
+                savepoint.rollback()
+                results.append({**base, "status": "error", "code": "photo_required", "error": str(e)})
+                continue
+            except ValueError as e:
+                savepoint.rollback()
+                msg = str(e)
+                if "not found" in msg.lower():
+                    code = "not_found"
+                elif "already exists" in msg.lower():
+                    code = "duplicate"
+                else:
+                    code = "invalid"
+                results.append({**base, "status": "error", "code": code, "error": msg})
+                continue
+            except Exception as e:
+                savepoint.rollback()
+                logger.error(
+                    "bulk_stage_item_failed",
+                    batch_id=batch_id,
+                    job=item.job_id,
+                    release=item.release,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    exc_info=True,
+                )
+                results.append({**base, "status": "error", "code": "error", "error": str(e)})
+                continue
+            applied += 1
+            results.append({**base, **result.to_dict()})
+
+        db.session.commit()
+
+        if applied:
+            try:
+                from app.brain.job_log.scheduling.service import recalculate_all_jobs_scheduling
+                recalculate_all_jobs_scheduling(stage_group='FABRICATION')
+            except Exception as cascade_err:
+                logger.error(
+                    "scheduling_recalc_failed",
+                    batch_id=batch_id,
+                    error=str(cascade_err),
+                    error_type=type(cascade_err).__name__,
+                    exc_info=True,
+                )
+
+        logger.info(
+            "bulk_stage_updated",
+            batch_id=batch_id,
+            requested=len(self.items),
+            applied=applied,
+            failed=sum(1 for r in results if r["status"] == "error"),
+        )
+        return results
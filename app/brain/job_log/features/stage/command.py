@@ -5,8 +5,9 @@ purpose: Encapsulate the full stage update workflow (DB write, stage_group sync,
 exports:
   UpdateStageCommand: Dataclass command that executes a stage update with all side effects
   StageUpdateResult: Dataclass result with event_id, job_comp/fab_order extras
+  StagePhotoRequiredError: Raised when a gated stage has no tagged photo
 imports_from: [app.models, app.services.outbox_service, app.services.job_event_service, app.api.helpers, app.brain.job_log.scheduling.service, app.brain.job_log.features.fab_order.tier, app.brain.job_log.features.start_install.neutralize_install_date_cascade, app.brain.job_log.features.start_install.shipping_stage_date_discipline]
-imported_by: [app/brain/job_log/routes.py]
+imported_by: [app/brain/job_log/routes.py, app/brain/job_log/features/stage/bulk.py]
 invariants:
   - fab_order re-tiering is delegated to features/fab_order/tier.py, shared with the Trello sync and job_comp paths
   - Setting stage='Complete' cascades job_comp='X'; leaving Complete clears job_comp='X'
@@ -14,6 +15,7 @@ invariants:
   - Ship Planning / Ship Complete apply N5 date discipline (formula blank or hard-date wash)
   - Deduplicated events raise ValueError (event_exists); caller decides whether to treat as success
   - Scheduling recalculation failure is logged but does not roll back the update
+  - defer_commit / defer_cascade leave the commit and the scheduling cascade to the caller (bulk and undo paths)
 """
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -105,6 +107,13 @@ class UpdateStageCommand:
     # audit trail rendering and (b) perturb the dedup hash so undo-the-undo within the
     # 30s bucket doesn't collide with the original event.
     undone_event_id: Optional[int] = None
+    # When True, flush instead of committing — used by BulkUpdateStageCommand so
+    # a whole batch lands in one transaction (each item in its own savepoint).
+    defer_commit: bool = False
+    # When set, merged into the primary event payload as `batch_id`. Tags the
+    # move_card so the outbox sorts its destination list once per pass, and
+    # groups a bulk move in the change log.
+    batch_id: Optional[str] = None
 
     def execute(self) -> StageUpdateResult:
         from app.api.helpers import get_stage_group_from_stage, STAGE_PROGRESSION_RANK
@@ -170,6 +179,8 @@ class UpdateStageCommand:
 
         if self.undone_event_id is not None:
             event_payload['undone_event_id'] = self.undone_event_id
+        if self.batch_id is not None:
+            event_payload['batch_id'] = self.batch_id
 
         event = JobEventService.create(
             job=self.job_id,
@@ -418,7 +429,10 @@ class UpdateStageCommand:
         if not outbox_item_created:
             JobEventService.close(event.id)
 
-        db.session.commit()
+        if self.defer_commit:
+            db.session.flush()
+        else:
+            db.session.commit()
 
         if not self.defer_cascade:
             try:
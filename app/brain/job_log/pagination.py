@@ -0,0 +1,153 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Keyset (cursor) pagination and cached totals for /brain/get-all-jobs, so every page is an index range scan instead of an ever-growing OFFSET plus a recount.
+exports:
+  ORDERINGS: Supported page orderings ('id', 'updated')
+  InvalidCursor: Raised for a cursor that can't be decoded or doesn't match the request
+  encode_cursor: Pack a page position into an opaque URL-safe token
+  decode_cursor: Unpack and validate a token from encode_cursor
+  fetch_keyset_page: Load one page after a cursor position
+  approximate_release_count: Cached row count for the page's filters
+imports_from: [app.models, sqlalchemy, flask]
+imported_by: [app/brain/job_log/routes.py]
+invariants:
+  - 'id' pages walk the primary key; 'updated' pages walk idx_releases_last_updated_at_id (last_updated_at, id), then the NULL-last_updated_at rows by id
+  - A cursor encodes the ordering, the archived flag, the last row's key, the page number and the first page's total, so later pages never recount
+  - has_more is exact (one extra row is fetched); total_count is advisory and may lag by up to RELEASE_COUNT_CACHE_SECONDS
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Keyset pagination for the job log bulk load.
+
+OFFSET pagination re-reads every skipped row, so page N costs O(N × limit), and
+the old endpoint also ran COUNT(*) on every page. Here each page continues
+strictly after the previous page's last key. The total is counted once, on the
+first page, served from a short per-app cache keyed on a cheap fingerprint
+(MAX(id), MAX(last_updated_at)), and carried forward inside the cursor.
+"""
+
+import base64
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import func, tuple_
+
+from app.models import Releases, db
+
+ORDERINGS = ('id', 'updated')
+
+_COUNT_CACHE_KEY = 'release_count_cache'
+
+
+class InvalidCursor(ValueError):
+    """The cursor is malformed or was issued for a different query."""
+
+
+def encode_cursor(order: str, archived: bool, row: Releases, page: int, total: int) -> str:
+    """
+    Pack the position after `row` into an opaque URL-safe token.
+
+    Args:
+        order: Page ordering ('id' or 'updated')
+        archived: Archived filter of the paged query
+        row: Last row of the current page
+        page: Page number the token fetches
+        total: Total carried forward from the first page
+    """
+    if order == 'updated':
+        key = [row.last_updated_at.isoformat() if row.last_updated_at else None, row.id]
+    else:
+        key = [row.id]
+    raw = json.dumps({'o': order, 'a': archived, 'k': key, 'p': page, 't': total}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str, order: str, archived: bool) -> Dict[str, Any]:
+    """
+    Unpack a token from encode_cursor.
+
+    Returns:
+        dict: {'key': [...], 'page': int, 'total': int}
+
+    Raises:
+        InvalidCursor: malformed token, or one issued for another ordering/filter
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_order, cursor_archived, key = data['o'], data['a'], data['k']
+        page, total = int(data['p']), int(data['t'])
+        if order == 'updated':
+            ts, last_id = key
+            key = [datetime.fromisoformat(ts) if ts is not None else None, int(last_id)]
+        else:
+            (last_id,) = key
+            key = [int(last_id)]
+    except (ValueError, TypeError, KeyError, json.JSONDecodeError) as e:
+        raise InvalidCursor(f"Malformed cursor: {e}") from e
+    if cursor_order != order or cursor_archived != archived:
+        raise InvalidCursor("Cursor was issued for a different order or archived filter")
+    return {'key': key, 'page': page, 'total': total}
+
+
+def fetch_keyset_page(query, order: str, key: Optional[List[Any]], limit: int) -> Tuple[List[Releases], bool]:
+    """
+    Load the page of `query` that follows `key`.
+
+    Args:
+        query: Filtered Releases query (no ORDER BY / LIMIT)
+        order: 'id' or 'updated'
+        key: Decoded cursor key, or None for the first page
+        limit: Page size
+
+    Returns:
+        (rows, has_more)
+    """
+    if order == 'id':
+        if key is not None:
+            query = query.filter(Releases.id > key[0])
+        rows = query.order_by(Releases.id.asc()).limit(limit + 1).all()
+        return rows[:limit], len(rows) > limit
+
+    # (last_updated_at, id) range scan first; rows never stamped with a
+    # last_updated_at follow, by id. Kept as two queries so the first one is a
+    # plain index range with no NULL handling in the predicate.
+    rows: List[Releases] = []
+    if key is None or key[0] is not None:
+        stamped = query.filter(Releases.last_updated_at.isnot(None))
+        if key is not None:
+            stamped = stamped.filter(
+                tuple_(Releases.last_updated_at, Releases.id) > tuple_(key[0], key[1])
+            )
+        rows = stamped.order_by(
+            Releases.last_updated_at.asc(), Releases.id.asc()
+        ).limit(limit + 1).all()
+    if len(rows) <= limit:
+        unstamped = query.filter(Releases.last_updated_at.is_(None))
+        if key is not None and key[0] is None:
+            unstamped = unstamped.filter(Releases.id > key[1])
+        rows += unstamped.order_by(Releases.id.asc()).limit(limit + 1 - len(rows)).all()
+    return rows[:limit], len(rows) > limit
+
+
+def approximate_release_count(query, archived: bool) -> int:
+    """
+    Row count for the paged query, cached per app for RELEASE_COUNT_CACHE_SECONDS.
+
+    The cache entry is also dropped as soon as MAX(id) or MAX(last_updated_at)
+    moves (an insert, or any edit/archive/soft-delete, all of which stamp
+    last_updated_at); both are single index lookups.
+    """
+    ttl = current_app.config.get('RELEASE_COUNT_CACHE_SECONDS', 30)
+    fingerprint = db.session.query(func.max(Releases.id), func.max(Releases.last_updated_at)).one()
+    cache = current_app.extensions.setdefault(_COUNT_CACHE_KEY, {})
+    cached = cache.get(archived)
+    now = time.monotonic()
+    if cached is not None and cached[1] == tuple(fingerprint) and now - cached[2] < ttl:
+        return cached[0]
+    count = query.order_by(None).count()
+    cache[archived] = (count, tuple(fingerprint), now)
+    return count
@@ -6,25 +6,30 @@ exports:
   get_list_id_by_stage: Resolve a DB stage to a Trello list ID via TrelloListMapper
   update_job_stage_fields: Apply stage and stage_group to a job record
   create_trello_card_for_job: Create a Trello card for a job from Excel data
-imports_from: [app.brain, app.models, app.trello.api, app.services.outbox_service, app.auth.utils, app.api.helpers, app.brain.job_log.utils, app.brain.job_log.scheduling]
+imports_from: [app.brain, app.models, app.trello.api, app.services.outbox_service, app.services.release_change_hub, app.auth.utils, app.api.helpers, app.brain.job_log.utils, app.brain.job_log.scheduling, app.brain.job_log.pagination, app.brain.job_log.row_cache, app.http_cache]
 imported_by: [app/brain/__init__.py, app/services/outbox_service.py]
 invariants:
   - All mutating routes require @login_required; admin routes require @admin_required
   - get_list_id_by_stage returns None (not an error) for unmapped stages
   - CSV import validates expected columns before processing rows
   - fab_order updates trigger scheduling recalculation for FABRICATION stage group
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - /jobs and /get-all-jobs read scheduling projections from the persisted snapshot (release_schedules) and never write it; only while it is stale (until the scheduler's refresh) is the queue recomputed in memory
+  - /get-all-jobs pages by keyset cursor (next_cursor); OFFSET is only used for legacy page>1 requests without a cursor
+  - /jobs/stream events carry exactly the /jobs?since= body, with latest_timestamp as the SSE event id (Last-Event-ID resume)
+  - /jobs answers a matching If-None-Match with 304 before querying; its ETag covers every table the payload is built from plus the scheduling generation
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Job Log route handlers for the brain Blueprint.
 
 Provides API endpoints for job data queries and CSV release data handling.
 """
 from app.brain import brain_bp
-from flask import jsonify, request, g
+from flask import Response, current_app, jsonify, request, g, stream_with_context
 from app.brain.job_log.utils import serialize_value
 from app.trello.api import get_list_by_name, update_trello_card
 from app.services.outbox_service import OutboxService
 from app.services.job_event_service import JobEventService
+from app.services.release_change_hub import release_change_hub
 from app.logging_config import get_logger
 from app.models import (
     Releases,
@@ -52,10 +57,22 @@ from app.brain.job_log.features.start_install.assign_installer import AssignInst
 from app.brain.job_log.features.start_install.neutralize_install_date_cascade import neutralize_install_date_cascade
 from app.brain.job_log.features.ship_date.command import UpdateShipDateCommand
 from app.brain.job_log.scheduling.calculator import calculate_install_complete_date
+from app.brain.job_log.scheduling.snapshot import read_scheduling_snapshot, scheduling_snapshot_version
+from app.brain.job_log.row_cache import release_row_cache
+from app.http_cache import conditional_get, table_versions, tracked_tables
+from app.brain.job_log.pagination import (
+    ORDERINGS,
+    InvalidCursor,
+    approximate_release_count,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+)
 from datetime import datetime, timedelta
 from sqlalchemy import or_
 import json
 import hashlib
+import time
 import re
 import csv
 import io
@@ -481,6 +498,37 @@ def _procore_submittal_refs_for_releases(releases):
     return refs
 
 
+def _apply_scheduling_snapshot(job_list):
+    """Patch the persisted scheduling projections onto serialized job rows.
+
+    hours_in_front depends on the whole queue, so it lives in release_schedules
+    (rebuilt by the scheduler when a scheduling input changes or the day rolls
+    over) and is joined here by release id; this read never writes. Returns the
+    snapshot generation so clients can tell when projections moved for rows
+    outside their delta.
+    """
+    generation, schedules = read_scheduling_snapshot([j['id'] for j in job_list])
+    for job in job_list:
+        schedule = schedules.get(job['id'])
+        if schedule is None:
+            continue
+        job['remaining_fab_hours'] = schedule['remaining_fab_hours']
+        job['hours_in_front'] = schedule['hours_in_front']
+        job['days_in_front'] = schedule['days_in_front']
+        for field in ('projected_fab_complete_date', 'install_start_date', 'install_complete_date'):
+            value = schedule[field]
+            job[field] = value.isoformat() if value else None
+        # Override displayed Start install with the calculated projection only
+        # when the row is NOT a hard date. The previous gate used Banana Color
+        # ('red') as a proxy and silently masked hard dates whose urgency
+        # banana was anything else.
+        if (job.get('start_install_formulaTF') is not False
+                and job.get('install_start_date')
+                and job.get('Stage Group') == 'FABRICATION'):
+            job['Start install'] = job['install_start_date']
+    return generation
+
+
 def _comp_eta_effective(job):
     """Resolve the effective completion ETA for a release row.
 
@@ -499,6 +547,184 @@ def _comp_eta_effective(job):
         job.start_install, install_hrs, job.num_guys
     ) or job.start_install
 
+def _serialize_release_row(job):
+    """Serialize the fields of one Releases row that depend only on the row itself.
+
+    Cached per (id, last_updated_at) by release_row_cache; the per-request joins
+    (drawings, photos, Procore refs, scheduling snapshot) are patched on by
+    _serialize_job_rows. serialize_value only emits JSON-safe values, so the row
+    is not test-encoded here; the response encoder sees it once.
+    """
+    # Get stage from database field (default to 'Released' if None)
+    stage = job.stage if job.stage else 'Released'
+    
+    # Recalculate stage_group from current stage to ensure it's always correct
+    # This ensures consistency even if database has stale values
+    from app.api.helpers import get_stage_group_from_stage
+    calculated_stage_group = get_stage_group_from_stage(stage)
+    
+    # Return all Excel fields (excluding Trello fields)
+    return {
+        'id': serialize_value(job.id),
+        'Job #': serialize_value(job.job),
+        'Release #': serialize_value(job.release),
+        'Job': serialize_value(job.job_name),
+        'Description': serialize_value(job.description),
+        'Fab Hrs': serialize_value(job.fab_hrs),
+        'Install HRS': serialize_value(job.install_hrs),
+        'Paint color': serialize_value(job.paint_color),
+        'PM': serialize_value(job.pm),
+        'BY': serialize_value(job.by),
+        'Released': serialize_value(job.released),
+        'Fab Order': serialize_value(job.fab_order),
+        'Stage': stage,  # Stage field from database
+        'Stage Group': serialize_value(calculated_stage_group),  # Recalculated from current stage
+        'Start install': serialize_value(job.start_install),
+        'start_install_formula': serialize_value(job.start_install_formula),
+        'start_install_formulaTF': serialize_value(job.start_install_formulaTF),
+        'start_install_asap': serialize_value(job.start_install_asap),
+        'start_install_no_color': serialize_value(job.start_install_no_color),
+        'Ship Date': serialize_value(job.ship_date),
+        'installer': serialize_value(job.installer),
+        'Comp. ETA': serialize_value(job.comp_eta),
+        'comp_eta_effective': serialize_value(_comp_eta_effective(job)),
+        'num_guys': serialize_value(job.num_guys),
+        'Job Comp': serialize_value(job.job_comp),
+        'Invoiced': serialize_value(job.invoiced),
+        'Notes': serialize_value(job.notes),
+        'release_tag': serialize_value(job.release_tag),
+        'last_updated_at': serialize_value(job.last_updated_at),
+        'source_of_update': serialize_value(job.source_of_update),
+        'viewer_url': serialize_value(job.viewer_url),
+        'has_drawing': False,  # patched in batch below
+        'cover_photo_id': None,  # patched in batch below
+        'photo_count': 0,        # patched in batch below
+        'trello_card_id': serialize_value(job.trello_card_id),
+        'is_active': serialize_value(job.is_active),
+        'is_archived': serialize_value(job.is_archived),
+    }
+
+
+def _serialize_job_rows(jobs):
+    """Serialize Releases rows into job-log row dicts.
+
+    The one row serializer behind /jobs, /jobs/stream and /get-all-jobs, so every
+    endpoint emits the same key set. Returns (job_list, warnings,
+    scheduling_generation); rows that fail to serialize are skipped and reported
+    in warnings.
+    """
+    job_list = []
+    warnings = []
+
+    for idx, job in enumerate(jobs):
+        try:
+            job_list.append(release_row_cache.get_or_build(job, _serialize_release_row))
+        except Exception as record_error:
+            # Log the problematic record but continue processing
+            job_id = f"{job.job}-{job.release}" if hasattr(job, 'job') else f"id:{job.id}"
+            warnings.append({
+                'record_index': idx,
+                'job_id': job_id,
+                'error': str(record_error),
+                'error_type': type(record_error).__name__
+            })
+            logger.warning("release_serialize_failed", record_index=idx, job_release=job_id, error=str(record_error), error_type=type(record_error).__name__, exc_info=True)
+            continue
+
+    # Patch has_drawing in one batched query (avoids N+1)
+    try:
+        ids_with_drawings = _release_ids_with_drawings([j['id'] for j in job_list])
+        for j in job_list:
+            j['has_drawing'] = j['id'] in ids_with_drawings
+    except Exception as drawing_lookup_error:
+        logger.warning(
+            "has_drawing_batch_failed",
+            error=str(drawing_lookup_error),
+            error_type=type(drawing_lookup_error).__name__,
+            exc_info=True,
+        )
+
+    # Patch cover_photo_id + photo_count in one batched query (avoids N+1). Powers the
+    # timeline day-bucket card thumbnails (manifest/cover sheet at close zoom).
+    try:
+        covers = _release_cover_photos([j['id'] for j in job_list])
+        for j in job_list:
+            cover = covers.get(j['id'])
+            j['cover_photo_id'] = cover['cover_photo_id'] if cover else None
+            j['photo_count'] = cover['photo_count'] if cover else 0
+    except Exception as cover_lookup_error:
+        logger.warning(
+            f"Error batching cover photos: {cover_lookup_error}",
+            exc_info=True,
+        )
+
+    # PM Board column: map each release's DB stage to its Trello list using the
+    # authoritative TrelloListMapper (Hold → None → hidden on the PM board).
+    from app.trello.list_mapper import TrelloListMapper
+    for j in job_list:
+        j['trello_list'] = TrelloListMapper.get_trello_list_for_stage(j.get('Stage'))
+
+    # Patch procore submittal refs (project + submittal IDs) for releases with viewer_url
+    try:
+        submittal_refs = _procore_submittal_refs_for_releases(jobs)
+        for j in job_list:
+            ref = submittal_refs.get(j['id'])
+            j['procore_submittal_id'] = ref['procore_submittal_id'] if ref else None
+            j['procore_project_id'] = ref['procore_project_id'] if ref else None
+    except Exception as procore_ref_error:
+        logger.warning(
+            "procore_submittal_refs_batch_failed",
+            error=str(procore_ref_error),
+            error_type=type(procore_ref_error).__name__,
+            exc_info=True,
+        )
+
+    # Join the persisted scheduling snapshot (hours_in_front depends on the whole
+    # queue; the scheduler rebuilds the snapshot when a scheduling input changed).
+    scheduling_generation = None
+    try:
+        scheduling_generation = _apply_scheduling_snapshot(job_list)
+    except Exception as scheduling_error:
+        db.session.rollback()
+        logger.warning(
+            "scheduling_fields_calc_failed",
+            error=str(scheduling_error),
+            error_type=type(scheduling_error).__name__,
+            exc_info=True
+        )
+        # Continue without scheduling fields if the snapshot is unavailable
+
+    return job_list, warnings, scheduling_generation
+
+
+def _jobs_payload(jobs):
+    """Serialize Releases rows into the /brain/jobs response body.
+
+    Shared by the polling endpoint and /jobs/stream so a streamed delta has
+    exactly the shape of a since= poll: jobs, returned_count, latest_timestamp
+    (the next cursor), scheduling_generation and, if any row failed, warnings.
+    """
+    job_list, warnings, scheduling_generation = _serialize_job_rows(jobs)
+
+    # Build response with latest timestamp for client to store
+    latest_timestamp = None
+    if jobs:
+        latest_job = jobs[-1]
+        latest_timestamp = latest_job.last_updated_at.isoformat() if latest_job.last_updated_at else None
+        logger.debug("cursor_latest_timestamp", latest=latest_timestamp)
+
+    # Build response
+    response_data = {
+        "jobs": job_list,
+        "returned_count": len(job_list),
+        "latest_timestamp": latest_timestamp,  # For client to store in localStorage
+        "scheduling_generation": scheduling_generation,
+    }
+    if warnings:
+        response_data['warnings'] = warnings
+    return response_data
+
+
 # ==============================================================================
 # Job Data Routes
 # ==============================================================================
@@ -565,8 +791,21 @@ def get_fab_hours_total():
     return jsonify({"total_fab_hrs": float(total or 0.0)})
 
 
+_JOBS_TABLES = tracked_tables(
+    (Releases, Releases.last_updated_at),
+    (ReleaseDrawingVersion, ReleaseDrawingVersion.uploaded_at),
+    (ReleasePhoto, ReleasePhoto.last_edited_at),
+)
+
+
+def _jobs_version():
+    """ETag inputs for /jobs: the tables _serialize_job_rows reads, plus the snapshot version."""
+    return table_versions(*_JOBS_TABLES), scheduling_snapshot_version()
+
+
 @brain_bp.route("/jobs")
 @login_required
+@conditional_get(_jobs_version)
 def get_jobs():
     """
     List jobs updated since a specific timestamp.
@@ -585,6 +824,7 @@ def get_jobs():
         
     Status Codes:
         - 200: Success
+        - 304: If-None-Match matches the current ETag (nothing changed)
         - 500: Server error
     """
     from app.models import Releases
@@ -631,177 +871,12 @@ def get_jobs():
         jobs = query.limit(limit).all()
         logger.debug("cursor_query_returned", count=len(jobs), limit=limit)
 
-        job_list = []
-        warnings = []
-
-        for idx, job in enumerate(jobs):
-            try:
-                # Get stage from database field (default to 'Released' if None)
-                stage = job.stage if job.stage else 'Released'
-                
-                # Recalculate stage_group from current stage to ensure it's always correct
-                # This ensures consistency even if database has stale values
-                from app.api.helpers import get_stage_group_from_stage
-                calculated_stage_group = get_stage_group_from_stage(stage)
-                
-                # Return all Excel fields (excluding Trello fields)
-                job_data = {
-                    'id': serialize_value(job.id),
-                    'Job #': serialize_value(job.job),
-                    'Release #': serialize_value(job.release),
-                    'Job': serialize_value(job.job_name),
-                    'Description': serialize_value(job.description),
-                    'Fab Hrs': serialize_value(job.fab_hrs),
-                    'Install HRS': serialize_value(job.install_hrs),
-                    'Paint color': serialize_value(job.paint_color),
-                    'PM': serialize_value(job.pm),
-                    'BY': serialize_value(job.by),
-                    'Released': serialize_value(job.released),
-                    'Fab Order': serialize_value(job.fab_order),
-                    'Stage': stage,  # Stage field from database
-                    'Stage Group': serialize_value(calculated_stage_group),  # Recalculated from current stage
-                    'Start install': serialize_value(job.start_install),
-                    'start_install_formula': serialize_value(job.start_install_formula),
-                    'start_install_formulaTF': serialize_value(job.start_install_formulaTF),
-                    'start_install_asap': serialize_value(job.start_install_asap),
-                    'start_install_no_color': serialize_value(job.start_install_no_color),
-                    'Ship Date': serialize_value(job.ship_date),
-                    'installer': serialize_value(job.installer),
-                    'Comp. ETA': serialize_value(job.comp_eta),
-                    'comp_eta_effective': serialize_value(_comp_eta_effective(job)),
-                    'num_guys': serialize_value(job.num_guys),
-                    'Job Comp': serialize_value(job.job_comp),
-                    'Invoiced': serialize_value(job.invoiced),
-                    'Notes': serialize_value(job.notes),
-                    'release_tag': serialize_value(job.release_tag),
-                    'last_updated_at': serialize_value(job.last_updated_at),
-                    'source_of_update': serialize_value(job.source_of_update),
-                    'viewer_url': serialize_value(job.viewer_url),
-                    'has_drawing': False,  # patched in batch below
-                    'cover_photo_id': None,  # patched in batch below
-                    'photo_count': 0,        # patched in batch below
-                    'trello_card_id': serialize_value(job.trello_card_id),
-                    'is_active': serialize_value(job.is_active),
-                    'is_archived': serialize_value(job.is_archived),
-                }
-                # Validate the job data
-                json.dumps(job_data)
-                job_list.append(job_data)
-
-            except Exception as record_error:
-                # Log the problematic record but continue processing
-                job_id = f"{job.job}-{job.release}" if hasattr(job, 'job') else f"id:{job.id}"
-                warnings.append({
-                    'record_index': idx,
-                    'job_id': job_id,
-                    'error': str(record_error),
-                    'error_type': type(record_error).__name__
-                })
-                logger.warning("release_serialize_failed", record_index=idx, job_release=job_id, error=str(record_error), error_type=type(record_error).__name__, exc_info=True)
-                continue
-
-        # Patch has_drawing in one batched query (avoids N+1)
-        try:
-            ids_with_drawings = _release_ids_with_drawings([j['id'] for j in job_list])
-            for j in job_list:
-                j['has_drawing'] = j['id'] in ids_with_drawings
-        except Exception as drawing_lookup_error:
-            logger.warning(
-                "has_drawing_batch_failed",
-                error=str(drawing_lookup_error),
-                error_type=type(drawing_lookup_error).__name__,
-                exc_info=True,
-            )
-
-        # Patch cover_photo_id + photo_count in one batched query (avoids N+1). Powers the
-        # timeline day-bucket card thumbnails (manifest/cover sheet at close zoom).
-        try:
-            covers = _release_cover_photos([j['id'] for j in job_list])
-            for j in job_list:
-                cover = covers.get(j['id'])
-                j['cover_photo_id'] = cover['cover_photo_id'] if cover else None
-                j['photo_count'] = cover['photo_count'] if cover else 0
-        except Exception as cover_lookup_error:
-            logger.warning(
-                f"Error batching cover photos: {cover_lookup_error}",
-                exc_info=True,
-            )
-
-        # PM Board column: map each release's DB stage to its Trello list using the
-        # authoritative TrelloListMapper (Hold → None → hidden on the PM board).
-        from app.trello.list_mapper import TrelloListMapper
-        for j in job_list:
-            j['trello_list'] = TrelloListMapper.get_trello_list_for_stage(j.get('Stage'))
-
-        # Patch procore submittal refs (project + submittal IDs) for releases with viewer_url
-        try:
-            submittal_refs = _procore_submittal_refs_for_releases(jobs)
-            for j in job_list:
-                ref = submittal_refs.get(j['id'])
-                j['procore_submittal_id'] = ref['procore_submittal_id'] if ref else None
-                j['procore_project_id'] = ref['procore_project_id'] if ref else None
-        except Exception as procore_ref_error:
-            logger.warning(
-                "procore_submittal_refs_batch_failed",
-                error=str(procore_ref_error),
-                error_type=type(procore_ref_error).__name__,
-                exc_info=True,
-            )
-
-        # Add scheduling fields to all jobs
-        # Note: hours_in_front requires ALL jobs in database for accurate queue calculation
-        from app.api.helpers import add_scheduling_fields_to_jobs
-        try:
-            # Fetch all jobs for queue calculation (regardless of filter/pagination)
-            all_jobs_for_queue = Releases.query.all()
-            all_jobs_dicts = []
-            for j in all_jobs_for_queue:
-                all_jobs_dicts.append({
-                    'Fab Hrs': serialize_value(j.fab_hrs),
-                    'Install HRS': serialize_value(j.install_hrs),
-                    'Fab Order': serialize_value(j.fab_order),
-                    'Stage': j.stage if j.stage else 'Released',
-                    'is_hard_date': j.start_install_formulaTF is False,
-                })
-            job_list = add_scheduling_fields_to_jobs(job_list, all_jobs_dicts)
-            # Override displayed Start install with the calculated projection only
-            # when the row is NOT a hard date. The previous gate used Banana Color
-            # ('red') as a proxy and silently masked hard dates whose urgency
-            # banana was anything else.
-            for job in job_list:
-                if (job.get('start_install_formulaTF') is not False
-                        and job.get('install_start_date')
-                        and job.get('Stage Group') == 'FABRICATION'):
-                    job['Start install'] = job['install_start_date']
-        except Exception as scheduling_error:
-            logger.warning(
-                "scheduling_fields_calc_failed",
-                error=str(scheduling_error),
-                error_type=type(scheduling_error).__name__,
-                exc_info=True
-            )
-            # Continue without scheduling fields if calculation fails
-
-        # Build response with latest timestamp for client to store
-        latest_timestamp = None
-        if jobs:
-            latest_job = jobs[-1]
-            latest_timestamp = latest_job.last_updated_at.isoformat() if latest_job.last_updated_at else None
-            logger.debug("cursor_latest_timestamp", latest=latest_timestamp)
+        response_data = _jobs_payload(jobs)
 
         # Delta polls that returned rows leave exactly one INFO breadcrumb; zero-row
         # delta polls stay silent so steady-state polling doesn't flood the logs.
         if since_param and len(jobs) > 0:
-            logger.info("cursor_delta_returned", count=len(jobs), latest=latest_timestamp)
-
-        # Build response
-        response_data = {
-            "jobs": job_list,
-            "returned_count": len(job_list),
-            "latest_timestamp": latest_timestamp,  # For client to store in localStorage
-        }
-        if warnings:
-            response_data['warnings'] = warnings
+            logger.info("cursor_delta_returned", count=len(jobs), latest=response_data['latest_timestamp'])
 
         return jsonify(response_data), 200
         
@@ -810,6 +885,124 @@ def get_jobs():
         return jsonify({'error': str(e), 'error_type': type(e).__name__}), 500
 
 
+STREAM_BATCH_LIMIT = 1000
+
+
+def _parse_stream_cursor(value):
+    """Parse a Last-Event-ID / since= value into a naive datetime cursor, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except (ValueError, TypeError):
+        logger.warning("stream_cursor_invalid", cursor=value)
+        return None
+
+
+def _stream_delta_events(cursor, generation):
+    """Run the since= cursor query until caught up, then check the scheduling generation.
+
+    Returns (events, cursor, generation): one SSE frame per batch of up to
+    STREAM_BATCH_LIMIT rows, each carrying the batch's latest_timestamp as its
+    event id, plus a `scheduling` frame when a snapshot rebuild moved the
+    generation without any release row changing (e.g. the day rolled over).
+    """
+    events = []
+    while True:
+        jobs = (
+            Releases.query
+            .filter(Releases.last_updated_at > cursor)
+            .order_by(Releases.last_updated_at.asc(), Releases.id.asc())
+            .limit(STREAM_BATCH_LIMIT)
+            .all()
+        )
+        if not jobs:
+            break
+        payload = _jobs_payload(jobs)
+        cursor = jobs[-1].last_updated_at
+        events.append(
+            f"id: {payload['latest_timestamp']}\n"
+            f"event: releases\n"
+            f"data: {current_app.json.dumps(payload)}\n\n"
+        )
+        logger.info("stream_delta_sent", count=len(jobs), latest=payload['latest_timestamp'])
+        if payload['scheduling_generation'] is not None:
+            generation = payload['scheduling_generation']
+        if len(jobs) < STREAM_BATCH_LIMIT:
+            break
+    current_generation, _ = read_scheduling_snapshot(())
+    if current_generation != generation:
+        generation = current_generation
+        events.append(
+            f"event: scheduling\n"
+            f"data: {current_app.json.dumps({'scheduling_generation': generation})}\n\n"
+        )
+        logger.info("stream_scheduling_generation_sent", generation=generation)
+    # Don't hold a pooled connection while the stream sleeps.
+    db.session.remove()
+    return events, cursor, generation
+
+
+@brain_bp.route("/jobs/stream")
+@login_required
+def stream_jobs():
+    """
+    Server-sent events stream of release deltas (replaces since= polling).
+
+    Each `releases` event's data is exactly a /brain/jobs?since= response body;
+    its event id is that body's latest_timestamp, so EventSource reconnects
+    resume from Last-Event-ID without gaps. A `scheduling` event
+    ({"scheduling_generation": n}) is sent when a scheduling snapshot rebuild
+    moved queue-wide projections; clients re-pull the full set on it. The
+    stream wakes on the release change hub (a committed ReleaseEvents
+    insert/apply, last_updated_at move or snapshot rebuild),
+    sends a heartbeat comment when idle, and ends after
+    RELEASE_STREAM_MAX_SECONDS so a worker thread is never held indefinitely.
+    Each open stream occupies one gthread worker thread (see gunicorn.conf.py).
+
+    Query Parameters / Headers:
+        Last-Event-ID (header) or since (string): ISO cursor to resume from.
+        Without either, the stream starts at the newest row (no backfill).
+    """
+    cursor = _parse_stream_cursor(request.headers.get('Last-Event-ID') or request.args.get('since'))
+    if cursor is None:
+        cursor = db.session.query(db.func.max(Releases.last_updated_at)).scalar() or datetime.min
+    # The generation the client already has; a later rebuild is pushed as a `scheduling` event.
+    generation, _ = read_scheduling_snapshot(())
+    heartbeat_seconds = current_app.config.get('RELEASE_STREAM_HEARTBEAT_SECONDS', 15)
+    max_seconds = current_app.config.get('RELEASE_STREAM_MAX_SECONDS', 300)
+    # Subscribe before the first catch-up query so a change committed in between
+    # still wakes the stream.
+    subscription = release_change_hub.subscribe(db.engine)
+    db.session.remove()
+
+    def generate():
+        nonlocal cursor, generation
+        deadline = time.monotonic() + max_seconds
+        try:
+            yield f"retry: {int(heartbeat_seconds * 1000)}\n\n"
+            while True:
+                events, cursor, generation = _stream_delta_events(cursor, generation)
+                for frame in events:
+                    yield frame
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Heartbeat timeouts also re-run the (indexed, usually empty)
+                # cursor query, covering any lost change signal.
+                if not subscription.wait(min(heartbeat_seconds, remaining)) and not events:
+                    yield ": heartbeat\n\n"
+        finally:
+            release_change_hub.unsubscribe(subscription)
+            db.session.remove()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Render/nginx must not buffer the stream.
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 def _validate_job_prefix(job_param):
     """Return (job_param or None, error_response). job_param must be 1–3 digits."""
     job_param = (job_param or '').strip().replace(' ', '')
@@ -954,26 +1147,37 @@ def _submittal_search_row(s):
 @login_required
 def get_all_jobs():
     """
-    Get all jobs from the database using simple offset-based pagination.
-    
+    Get all jobs from the database, one keyset page at a time.
+
     Query Parameters:
-        page (int): Page number (defaults to 1). Each page contains up to 100 jobs.
-    
+        per_page (int): Page size (default 100, capped at 2000, floored at 1).
+        order (str): 'id' (default) or 'updated' — pages walk (id) or
+            (last_updated_at, id), both index range scans.
+        cursor (str): Opaque next_cursor from the previous page; omit for the
+            first page.
+        page (int): Legacy offset paging, honored only when no cursor is sent
+            (page > 1 falls back to LIMIT/OFFSET for clients that predate
+            cursors).
+        archived (bool): Archived releases instead of active ones.
+
     Returns a JSON object with:
     - All Excel fields (Job #, Release #, Description, etc.)
     - A computed 'Stage' field determined from the 5 status columns
     - ISO-formatted date fields
-    - Pagination metadata (page, limit, total_count, has_more)
-    
+    - Pagination metadata (page, limit, total_count, returned_count, has_more,
+      next_cursor). has_more is exact; total_count is counted on the first page
+      (cached briefly) and carried in the cursor, so it may lag slightly.
+
     Returns:
         JSON object with 'jobs' array containing job data
-        
+
     Status Codes:
         - 200: Success
+        - 400: Invalid cursor or order
         - 500: Server error
     """
     from app.models import Releases
-    
+
     try:
         # Get page parameter from request (default to 1)
         page = request.args.get('page', 1, type=int)
@@ -988,10 +1192,10 @@ def get_all_jobs():
         per_page = request.args.get('per_page', 100, type=int)
         limit = min(max(per_page, 1), 2000)
 
-        # Calculate offset
-        offset = (page - 1) * limit
+        order = request.args.get('order', 'id')
+        if order not in ORDERINGS:
+            return jsonify({'error': f"order must be one of {', '.join(ORDERINGS)}"}), 400
 
-        # Base query - order by id for consistent pagination
         query = Releases.query
 
         # Apply archive filter
@@ -1005,172 +1209,30 @@ def get_all_jobs():
         # Exclude soft-deleted rows
         query = query.filter(db.or_(Releases.is_active == True, Releases.is_active == None))
 
-        query = query.order_by(Releases.id.asc())
-
-        # Get total count for pagination info
-        total_count = query.count()
-        
-        # Apply pagination
-        jobs = query.limit(limit).offset(offset).all()
-        
-        job_list = []
-        warnings = []
-        
-        for idx, job in enumerate(jobs):
+        cursor_param = request.args.get('cursor')
+        if cursor_param:
             try:
-                # Get stage from database field (default to 'Released' if None)
-                stage = job.stage if job.stage else 'Released'
-                
-                # Recalculate stage_group from current stage to ensure it's always correct
-                # This ensures consistency even if database has stale values
-                from app.api.helpers import get_stage_group_from_stage
-                calculated_stage_group = get_stage_group_from_stage(stage)
-                
-                # Return all Excel fields (excluding Trello fields)
-                job_data = {
-                    'id': serialize_value(job.id),
-                    'Job #': serialize_value(job.job),
-                    'Release #': serialize_value(job.release),
-                    'Job': serialize_value(job.job_name),
-                    'Description': serialize_value(job.description),
-                    'Fab Hrs': serialize_value(job.fab_hrs),
-                    'Install HRS': serialize_value(job.install_hrs),
-                    'Paint color': serialize_value(job.paint_color),
-                    'PM': serialize_value(job.pm),
-                    'BY': serialize_value(job.by),
-                    'Released': serialize_value(job.released),
-                    'Fab Order': serialize_value(job.fab_order),
-                    'Stage': stage,  # Stage field from database
-                    'Stage Group': serialize_value(calculated_stage_group),  # Recalculated from current stage
-                    'Start install': serialize_value(job.start_install),
-                    'start_install_formula': serialize_value(job.start_install_formula),
-                    'start_install_formulaTF': serialize_value(job.start_install_formulaTF),
-                    'start_install_asap': serialize_value(job.start_install_asap),
-                    'start_install_no_color': serialize_value(job.start_install_no_color),
-                    'Ship Date': serialize_value(job.ship_date),
-                    'installer': serialize_value(job.installer),
-                    'Comp. ETA': serialize_value(job.comp_eta),
-                    'comp_eta_effective': serialize_value(_comp_eta_effective(job)),
-                    'num_guys': serialize_value(job.num_guys),
-                    'Job Comp': serialize_value(job.job_comp),
-                    'Invoiced': serialize_value(job.invoiced),
-                    'Notes': serialize_value(job.notes),
-                    'release_tag': serialize_value(job.release_tag),
-                    'last_updated_at': serialize_value(job.last_updated_at),
-                    'source_of_update': serialize_value(job.source_of_update),
-                    'viewer_url': serialize_value(job.viewer_url),
-                    'has_drawing': False,  # patched in batch below
-                    'cover_photo_id': None,  # patched in batch below
-                    'photo_count': 0,        # patched in batch below
-                    'trello_card_id': serialize_value(job.trello_card_id),
-                    'is_active': serialize_value(job.is_active),
-                    'is_archived': serialize_value(job.is_archived),
-                }
-                # Validate the job data
-                json.dumps(job_data)
-                job_list.append(job_data)
-
-            except Exception as record_error:
-                # Log the problematic record but continue processing
-                job_id = f"{job.job}-{job.release}" if hasattr(job, 'job') else f"id:{job.id}"
-                warnings.append({
-                    'record_index': idx,
-                    'job_id': job_id,
-                    'error': str(record_error),
-                    'error_type': type(record_error).__name__
-                })
-                logger.warning("release_serialize_failed", record_index=idx, job_release=job_id, error=str(record_error), error_type=type(record_error).__name__, exc_info=True)
-                continue
-
-        # Patch has_drawing in one batched query (avoids N+1)
-        try:
-            ids_with_drawings = _release_ids_with_drawings([j['id'] for j in job_list])
-            for j in job_list:
-                j['has_drawing'] = j['id'] in ids_with_drawings
-        except Exception as drawing_lookup_error:
-            logger.warning(
-                "has_drawing_batch_failed",
-                error=str(drawing_lookup_error),
-                error_type=type(drawing_lookup_error).__name__,
-                exc_info=True,
-            )
-
-        # Patch cover_photo_id + photo_count in one batched query (avoids N+1). Powers the
-        # timeline day-bucket card thumbnails (manifest/cover sheet at close zoom).
-        try:
-            covers = _release_cover_photos([j['id'] for j in job_list])
-            for j in job_list:
-                cover = covers.get(j['id'])
-                j['cover_photo_id'] = cover['cover_photo_id'] if cover else None
-                j['photo_count'] = cover['photo_count'] if cover else 0
-        except Exception as cover_lookup_error:
-            logger.warning(
-                f"Error batching cover photos: {cover_lookup_error}",
-                exc_info=True,
-            )
-
-        # PM Board column: map each release's DB stage to its Trello list using the
-        # authoritative TrelloListMapper (Hold → None → hidden on the PM board).
-        from app.trello.list_mapper import TrelloListMapper
-        for j in job_list:
-            j['trello_list'] = TrelloListMapper.get_trello_list_for_stage(j.get('Stage'))
+                cursor = decode_cursor(cursor_param, order, archived)
+            except InvalidCursor as e:
+                logger.warning("all_jobs_cursor_invalid", error=str(e))
+                return jsonify({'error': str(e)}), 400
+            page = cursor['page']
+            total_count = cursor['total']
+            jobs, has_more = fetch_keyset_page(query, order, cursor['key'], limit)
+        elif page > 1:
+            # Legacy offset paging (clients that predate next_cursor).
+            total_count = approximate_release_count(query, archived)
+            sort = (Releases.last_updated_at.asc(), Releases.id.asc()) if order == 'updated' else (Releases.id.asc(),)
+            jobs = query.order_by(*sort).limit(limit + 1).offset((page - 1) * limit).all()
+            has_more = len(jobs) > limit
+            jobs = jobs[:limit]
+        else:
+            total_count = approximate_release_count(query, archived)
+            jobs, has_more = fetch_keyset_page(query, order, None, limit)
 
-        # Patch procore submittal refs (project + submittal IDs) for releases with viewer_url
-        try:
-            submittal_refs = _procore_submittal_refs_for_releases(jobs)
-            for j in job_list:
-                ref = submittal_refs.get(j['id'])
-                j['procore_submittal_id'] = ref['procore_submittal_id'] if ref else None
-                j['procore_project_id'] = ref['procore_project_id'] if ref else None
-        except Exception as procore_ref_error:
-            logger.warning(
-                "procore_submittal_refs_batch_failed",
-                error=str(procore_ref_error),
-                error_type=type(procore_ref_error).__name__,
-                exc_info=True,
-            )
+        next_cursor = encode_cursor(order, archived, jobs[-1], page + 1, total_count) if has_more else None
 
-        # Add scheduling fields to all jobs
-        # Note: hours_in_front requires ALL jobs in database for accurate queue calculation
-        from app.api.helpers import add_scheduling_fields_to_jobs
-        try:
-            # Fetch all jobs for queue calculation (regardless of pagination).
-            # Only 5 columns feed the queue math, so pull just those with
-            # with_entities to avoid hydrating full Releases objects.
-            all_jobs_for_queue = Releases.query.with_entities(
-                Releases.fab_hrs,
-                Releases.install_hrs,
-                Releases.fab_order,
-                Releases.stage,
-                Releases.start_install_formulaTF,
-            ).all()
-            all_jobs_dicts = []
-            for j in all_jobs_for_queue:
-                all_jobs_dicts.append({
-                    'Fab Hrs': serialize_value(j.fab_hrs),
-                    'Install HRS': serialize_value(j.install_hrs),
-                    'Fab Order': serialize_value(j.fab_order),
-                    'Stage': j.stage if j.stage else 'Released',
-                    'is_hard_date': j.start_install_formulaTF is False,
-                })
-            job_list = add_scheduling_fields_to_jobs(job_list, all_jobs_dicts)
-            # Override displayed Start install with the calculated projection only
-            # when the row is NOT a hard date. The previous gate used Banana Color
-            # ('red') as a proxy and silently masked hard dates whose urgency
-            # banana was anything else.
-            for job in job_list:
-                if (job.get('start_install_formulaTF') is not False
-                        and job.get('install_start_date')
-                        and job.get('Stage Group') == 'FABRICATION'):
-                    job['Start install'] = job['install_start_date']
-        except Exception as scheduling_error:
-            logger.warning(
-                "scheduling_fields_calc_failed",
-                error=str(scheduling_error),
-                error_type=type(scheduling_error).__name__,
-                exc_info=True
-            )
-            # Continue without scheduling fields if calculation fails
+        job_list, warnings, scheduling_generation = _serialize_job_rows(jobs)
 
         # Build response
         response_data = {
@@ -1178,16 +1240,19 @@ def get_all_jobs():
             "pagination": {
                 "page": page,
                 "limit": limit,
+                "order": order,
                 "total_count": total_count,
                 "returned_count": len(job_list),
-                "has_more": offset + len(job_list) < total_count
-            }
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+            },
+            "scheduling_generation": scheduling_generation,
         }
         if warnings:
             response_data['warnings'] = warnings
-        
+
         return jsonify(response_data), 200
-        
+
     except Exception as e:
         logger.error("all_jobs_fetch_failed", error=str(e), error_type=type(e).__name__, exc_info=True)
         return jsonify({'error': str(e), 'error_type': type(e).__name__}), 500
@@ -1383,6 +1448,69 @@ def update_stage(job, release):
         db.session.rollback()
         return jsonify({'error': str(e), 'error_type': type(e).__name__}), 500
 
+@brain_bp.route("/update-stage/bulk", methods=["POST"])
+@login_required
+def update_stage_bulk():
+    """
+    Move many releases in one transaction — see
+    app/brain/job_log/features/stage/bulk.py.
+
+    Request Body:
+        {"items": [{"job": 123, "release": "A", "stage": "Ship Complete"}, ...]}
+
+    Returns:
+        {"status": "success", "batch_id": str, "applied": int, "failed": int,
+         "results": [...]}  one result per input item, in order; failed items carry
+         status "error" and a code (not_found / duplicate / photo_required / invalid / error)
+
+    Status Codes:
+        - 200: Batch ran (check per-item results)
+        - 400: Malformed body
+        - 500: Server error
+    """
+    from app.brain.job_log.features.stage.bulk import (
+        BULK_STAGE_MAX_ITEMS,
+        BulkUpdateStageCommand,
+        StageChangeItem,
+    )
+
+    data = request.get_json(silent=True) or {}
+    raw_items = data.get('items')
+    if not isinstance(raw_items, list) or not raw_items:
+        return jsonify({'error': 'items must be a non-empty list'}), 400
+    if len(raw_items) > BULK_STAGE_MAX_ITEMS:
+        return jsonify({'error': f'At most {BULK_STAGE_MAX_ITEMS} items per request'}), 400
+
+    items = []
+    for index, raw in enumerate(raw_items):
+        try:
+            job = int(raw['job'])
+            release = str(raw['release']).strip()
+            stage = raw['stage']
+        except (KeyError, TypeError, ValueError):
+            return jsonify({'error': f'items[{index}] needs job (int), release and stage'}), 400
+        if not release or not stage:
+            return jsonify({'error': f'items[{index}] needs job (int), release and stage'}), 400
+        items.append(StageChangeItem(job_id=job, release=release, stage=stage))
+
+    command = BulkUpdateStageCommand(items=items)
+    try:
+        results = command.execute()
+    except Exception as e:
+        logger.error("bulk_stage_update_failed", batch_id=command.batch_id, count=len(items),
+                     error=str(e), error_type=type(e).__name__, exc_info=True)
+        db.session.rollback()
+        return jsonify({'error': str(e), 'error_type': type(e).__name__}), 500
+
+    failed = sum(1 for r in results if r['status'] == 'error')
+    return jsonify({
+        'status': 'success',
+        'batch_id': command.batch_id,
+        'applied': sum(1 for r in results if r['status'] == 'success'),
+        'failed': failed,
+        'results': results,
+    }), 200
+
 @brain_bp.route("/update-fab-order/<int:job>/<release>", methods=["PATCH"])
 @login_required
 def update_fab_order(job, release):
@@ -3450,6 +3578,42 @@ def trello_scanner():
         logger.error("trello_scan_failed", error=str(e), error_type=type(e).__name__, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
+
+@brain_bp.route("/trello-scanner/report")
+@login_required
+def trello_scanner_report():
+    """
+    Standing Trello/DB mismatch report kept current by the scheduled incremental scan.
+
+    Same shape as /trello-scanner plus a "scan" block (mode, scanned_at,
+    last_full_scan_at, cards/releases checked).
+
+    Query Parameters:
+        refresh (bool, optional): Run an incremental scan first (default: false)
+        full (bool, optional): With refresh, force a full board read (default: false)
+
+    Status Codes:
+        - 200: Success
+        - 404: No scan has run yet (call with refresh=true)
+        - 500: Server error
+    """
+    try:
+        from app.trello.scanner import scan_trello_db_incremental, get_trello_scan_report
+
+        if request.args.get('refresh', 'false').lower() == 'true':
+            results = scan_trello_db_incremental(
+                force_full=request.args.get('full', 'false').lower() == 'true'
+            )
+        else:
+            results = get_trello_scan_report()
+            if results is None:
+                return jsonify({"error": "No Trello scan has run yet"}), 404
+
+        return jsonify(results), 200
+    except Exception as e:
+        logger.error("trello_scan_report_failed", error=str(e), error_type=type(e).__name__, exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
 @brain_bp.route("/preview-scheduling", methods=["GET"])
 @login_required
 def preview_scheduling():
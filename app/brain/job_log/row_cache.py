@@ -0,0 +1,132 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Process-local cache of serialized job-log rows keyed by (release id, last_updated_at), so unchanged releases cost a dict lookup instead of ~35 serialize_value calls per request.
+exports:
+  ROW_CACHE_MAX_ROWS: LRU bound on cached rows
+  ROW_CACHE_TTL_SECONDS: Maximum age of a cached row
+  ReleaseRowCache: Thread-safe LRU keyed by release id, validated against last_updated_at
+  release_row_cache: Process-wide instance used by the job-log routes
+imports_from: [app.models, sqlalchemy]
+imported_by: [app/brain/job_log/routes.py]
+invariants:
+  - Only the release-derived base row is cached; per-request joins (drawings, photos, Procore refs, scheduling snapshot) are patched onto a copy by the caller
+  - Callers get a fresh dict per call; the cached row is never handed out for mutation
+  - Rows with a NULL last_updated_at are never cached
+  - ORM flushes/commits touching a Releases row in this process evict it, so writers that don't bump last_updated_at are still seen here; other workers see them within ROW_CACHE_TTL_SECONDS
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Serialized release row cache.
+
+/brain/jobs, /brain/jobs/stream and /brain/get-all-jobs serialize the same
+base fields for every release on every call. last_updated_at moves on every
+user-visible edit (the cursor poll depends on it), so (id, last_updated_at)
+identifies a row's serialized form. Some background writers (Trello card ids,
+Procore viewer urls) don't stamp last_updated_at; a session listener evicts
+rows they touch in this process and a TTL bounds how long another worker can
+serve the old form.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Releases
+
+ROW_CACHE_MAX_ROWS = 20000
+ROW_CACHE_TTL_SECONDS = 300
+
+_SESSION_KEY = 'row_cache_evict'
+
+
+class ReleaseRowCache:
+    """LRU of serialized rows: release_id -> (last_updated_at, stored_at, row)."""
+
+    def __init__(self, max_rows: int = ROW_CACHE_MAX_ROWS, ttl_seconds: float = ROW_CACHE_TTL_SECONDS):
+        self.max_rows = max_rows
+        self.ttl_seconds = ttl_seconds
+        self._rows: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, release: Releases, build: Callable[[Releases], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return a fresh copy of `release`'s serialized row, building it on a miss.
+
+        Args:
+            release: Releases row (id and last_updated_at are the cache key)
+            build: Serializer called on a miss; its result is cached as-is
+        """
+        version = release.last_updated_at
+        if version is None:
+            return build(release)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._rows.get(release.id)
+            if entry is not None and entry[0] == version and now - entry[1] < self.ttl_seconds:
+                self._rows.move_to_end(release.id)
+                self.hits += 1
+                return dict(entry[2])
+            self.misses += 1
+        row = build(release)
+        with self._lock:
+            self._rows[release.id] = (version, now, row)
+            self._rows.move_to_end(release.id)
+            while len(self._rows) > self.max_rows:
+                self._rows.popitem(last=False)
+        return dict(row)
+
+    def evict(self, release_ids: Iterable[int]) -> None:
+        with self._lock:
+            for release_id in release_ids:
+                self._rows.pop(release_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'rows': len(self._rows), 'hits': self.hits, 'misses': self.misses}
+
+
+release_row_cache = ReleaseRowCache()
+
+
+def _touched_release_ids(session):
+    for collection in (session.new, session.dirty, session.deleted):
+        for obj in collection:
+            if isinstance(obj, Releases) and obj.id is not None:
+                yield obj.id
+
+
+@event.listens_for(Session, 'after_flush')
+def _evict_flushed_releases(session, flush_context):
+    ids = list(_touched_release_ids(session))
+    if ids:
+        release_row_cache.evict(ids)
+        # Evict again after commit: a concurrent request may re-cache the
+        # pre-commit form under an unchanged last_updated_at in between.
+        session.info.setdefault(_SESSION_KEY, set()).update(ids)
+
+
+@event.listens_for(Session, 'after_commit')
+def _evict_committed_releases(session):
+    if session.in_nested_transaction():
+        return
+    ids = session.info.pop(_SESSION_KEY, None)
+    if ids:
+        release_row_cache.evict(ids)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _clear_pending_evictions(session):
+    if not session.in_nested_transaction():
+        session.info.pop(_SESSION_KEY, None)
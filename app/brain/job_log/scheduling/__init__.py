@@ -9,7 +9,12 @@ exports:
   calculate_total_install_hrs: Sum remaining install hours for post-fab jobs
   calculate_scheduling_fields: Compute all scheduling dates for one job
   calculate_all_job_scheduling: Batch-compute scheduling for all jobs
-imports_from: [app.brain.job_log.scheduling.config, app.brain.job_log.scheduling.hours_summary, app.brain.job_log.scheduling.calculator]
+  SchedulingColumns / compute_scheduling: Columnar (NumPy) scheduling engine over parallel arrays
+  ensure_scheduling_snapshot: Current persisted-snapshot generation, rebuilding if stale
+  read_scheduling_snapshot / scheduling_snapshot_version: Read-only snapshot access for GET handlers
+  get_release_schedules: Batch-load persisted scheduling rows by release id
+  mark_scheduling_snapshot_stale: Invalidate the snapshot after writes that bypass the ORM
+imports_from: [app.brain.job_log.scheduling.config, app.brain.job_log.scheduling.hours_summary, app.brain.job_log.scheduling.calculator, app.brain.job_log.scheduling.columnar, app.brain.job_log.scheduling.snapshot]
 imported_by: [app/brain/job_log/routes.py, app/api/helpers.py]
 updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
 
@@ -35,6 +40,14 @@ from app.brain.job_log.scheduling.calculator import (
     calculate_scheduling_fields,
     calculate_all_job_scheduling,
 )
+from app.brain.job_log.scheduling.columnar import SchedulingColumns, SchedulingResult, compute_scheduling
+from app.brain.job_log.scheduling.snapshot import (
+    ensure_scheduling_snapshot,
+    get_release_schedules,
+    mark_scheduling_snapshot_stale,
+    read_scheduling_snapshot,
+    scheduling_snapshot_version,
+)
 
 __all__ = [
     'SchedulingConfig',
@@ -49,5 +62,13 @@ __all__ = [
     'calculate_install_complete_date',
     'calculate_scheduling_fields',
     'calculate_all_job_scheduling',
+    'SchedulingColumns',
+    'SchedulingResult',
+    'compute_scheduling',
+    'ensure_scheduling_snapshot',
+    'get_release_schedules',
+    'mark_scheduling_snapshot_stale',
+    'read_scheduling_snapshot',
+    'scheduling_snapshot_version',
 ]
 
@@ -10,14 +10,15 @@ exports:
   calculate_install_start_date: Fab complete + buffer business days
   calculate_install_complete_date: Install start + ceil(install_hrs / capacity) business days
   calculate_scheduling_fields: Compute all scheduling fields for one job
-  calculate_all_job_scheduling: Two-pass batch calculation for all jobs
-imports_from: [app.brain.job_log.scheduling.config, app.trello.utils]
+  calculate_all_job_scheduling: Batch calculation for all jobs (dict API over the columnar engine)
+imports_from: [app.brain.job_log.scheduling.config, app.brain.job_log.scheduling.columnar, app.trello.utils]
 imported_by: [app/brain/job_log/scheduling/__init__.py, app/brain/job_log/scheduling/service.py, app/brain/job_log/scheduling/preview.py]
 invariants:
   - Hard-date jobs (is_hard_date=True) are excluded from hours_in_front sums
   - Fab projections use SHOP calendar (Mon–Thu); install uses FIELD (Mon–Fri) — N4
   - Unknown stages default to 100% remaining (conservative)
-updated_by_agent: 2026-08-09T00:00:00Z
+  - calculate_all_job_scheduling is O(n log n): it delegates to columnar.compute_scheduling (sorted cumulative sum), not per-job rescans
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Scheduling calculation module.
 
@@ -27,9 +28,10 @@ matching Excel behavior for all calculations.
 
 import math
 from datetime import date, datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Any
 
 from app.brain.job_log.scheduling.config import SchedulingConfig
+from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
 from app.trello.utils import CALENDAR_FIELD, CALENDAR_SHOP, add_business_days
 
 
@@ -345,38 +347,10 @@ def calculate_all_job_scheduling(
     Returns:
         list: List of job dictionaries with added scheduling fields
     """
-    if reference_date is None:
-        reference_date = date.today()
-    
-    # First pass: Calculate remaining_fab_hours for all jobs
-    jobs_with_remaining = []
-    for job in jobs:
-        remaining = calculate_remaining_fab_hours(
-            job.get('fab_hrs'),
-            job.get('stage')
-        )
-        jobs_with_remaining.append({
-            **job,
-            'remaining_fab_hours': remaining
-        })
-    
-    # Second pass: Calculate all scheduling fields for each job
-    # (hours_in_front requires all jobs to have remaining_fab_hours).
-    # The list index is passed as a tiebreaker so equal-fab_order releases
-    # (in particular the many DEFAULT_FAB_ORDER 80.555 sentinels) cascade
-    # through each other in a stable order rather than collapsing onto one date.
-    result = []
-    for i, job in enumerate(jobs_with_remaining):
-        scheduling_fields = calculate_scheduling_fields(
-            job,
-            jobs_with_remaining,
-            reference_date,
-            job_index=i
-        )
-        result.append({
-            **job,
-            **scheduling_fields
-        })
-
-    return result
-
+    # Columnar engine: one pass over parallel arrays (stage lookup, queue-order
+    # cumulative sum, vectorized ceil, calendar-index date math). Equal-fab_order
+    # releases (in particular the many DEFAULT_FAB_ORDER 80.555 sentinels) still
+    # cascade through each other in list order — same answer as
+    # calculate_scheduling_fields(job, jobs, job_index=i) for every i.
+    scheduling = compute_scheduling(SchedulingColumns.from_jobs(jobs), reference_date)
+    return [{**job, **fields} for job, fields in zip(jobs, scheduling.to_dicts())]
@@ -0,0 +1,285 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Columnar (NumPy) scheduling engine — the whole pipeline (remaining hours, hours/days in front, projected fab, install start/complete) over parallel arrays instead of one dict per release.
+exports:
+  SchedulingColumns: Parallel input columns (fab_hrs, install_hrs, fab_order, stage, num_guys, is_hard_date)
+  SchedulingResult: Parallel output arrays, with to_dicts() for callers that want per-release dicts
+  compute_scheduling: Run the pipeline over SchedulingColumns
+imports_from: [numpy, app.brain.job_log.scheduling.config, app.trello.utils]
+imported_by: [app/brain/job_log/scheduling/calculator.py, app/brain/job_log/scheduling/service.py, app/brain/job_log/scheduling/preview.py, app/brain/job_log/scheduling/snapshot.py, app/api/helpers.py]
+invariants:
+  - Output matches the scalar formulas in calculator.py: remaining hours, days_in_front and dates exactly; hours_in_front exactly when the hours sum without rounding error, otherwise to the last bits of the float sum
+  - hours_in_front is a queue-order running sum; rows whose value is within float summation error of a days_in_front boundary are re-summed in list order, as calculate_hours_in_front does, so summation order never flips a day
+  - Queue order: real fab_orders by (fab_order, index), then NaN fab_orders (which see nothing in front), then None fab_orders in index order
+  - NaN / non-numeric fab_hrs, install_hrs and num_guys are treated like None (the scalar formulas would raise on NaN install inputs)
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Columnar scheduling engine.
+
+calculate_all_job_scheduling() is the dict-per-release API; this module is the
+engine underneath it. Callers that already hold column data (query rows) can
+build SchedulingColumns directly and skip the dicts entirely.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.brain.job_log.scheduling.config import SchedulingConfig
+from app.trello.utils import CALENDAR_FIELD, CALENDAR_SHOP, add_business_days_array
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _to_float(value: Any) -> float:
+    """Float or NaN (for None / non-numeric)."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+@dataclass
+class SchedulingColumns:
+    """Parallel scheduling inputs, one element per release (index = queue tiebreaker)."""
+
+    fab_hrs: Sequence[Any]
+    install_hrs: Sequence[Any]
+    fab_order: Sequence[Any]
+    stage: Sequence[Optional[str]]
+    num_guys: Sequence[Any]
+    is_hard_date: Sequence[Any]
+
+    def __len__(self) -> int:
+        return len(self.fab_order)
+
+    @classmethod
+    def from_jobs(cls, jobs: Sequence[Dict[str, Any]]) -> 'SchedulingColumns':
+        """Build columns from calculator-style job dicts (fab_hrs, install_hrs, fab_order, stage, num_guys, is_hard_date)."""
+        return cls(
+            fab_hrs=[job.get('fab_hrs') for job in jobs],
+            install_hrs=[job.get('install_hrs') for job in jobs],
+            fab_order=[job.get('fab_order') for job in jobs],
+            stage=[job.get('stage') for job in jobs],
+            num_guys=[job.get('num_guys') for job in jobs],
+            is_hard_date=[job.get('is_hard_date') for job in jobs],
+        )
+
+    @classmethod
+    def from_releases(cls, releases: Sequence[Any]) -> 'SchedulingColumns':
+        """
+        Build columns from Releases rows (ORM objects or with_entities tuples).
+
+        Follows the DB-path conventions of service.py: a NaN fab_order (pandas
+        import residue) is treated as None, empty stage defaults to 'Released',
+        and start_install_formulaTF=False marks a hard date.
+        """
+        return cls(
+            fab_hrs=[r.fab_hrs for r in releases],
+            install_hrs=[r.install_hrs for r in releases],
+            fab_order=[None if _is_nan(r.fab_order) else r.fab_order for r in releases],
+            stage=[r.stage if r.stage else 'Released' for r in releases],
+            num_guys=[r.num_guys for r in releases],
+            is_hard_date=[r.start_install_formulaTF is False for r in releases],
+        )
+
+
+@dataclass
+class SchedulingResult:
+    """Parallel scheduling outputs; dates are datetime64[D] arrays (NaT = None)."""
+
+    remaining_fab_hours: np.ndarray
+    hours_in_front: np.ndarray
+    days_in_front: np.ndarray
+    projected_fab_complete_date: np.ndarray
+    install_start_date: np.ndarray
+    install_complete_date: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.remaining_fab_hours)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Per-release dicts with the calculator's keys and Python types (float/int/date/None)."""
+        columns = (
+            self.remaining_fab_hours.tolist(),
+            self.hours_in_front.tolist(),
+            self.days_in_front.tolist(),
+            self.projected_fab_complete_date.tolist(),
+            self.install_start_date.tolist(),
+            self.install_complete_date.tolist(),
+        )
+        return [
+            {
+                'remaining_fab_hours': remaining,
+                'hours_in_front': hours,
+                'days_in_front': days,
+                'projected_fab_complete_date': projected,
+                'install_start_date': install_start,
+                'install_complete_date': install_complete,
+            }
+            for remaining, hours, days, projected, install_start, install_complete in zip(*columns)
+        ]
+
+
+# Hours that are all multiples of 2**-16 (whole, half, quarter hours, ...) and
+# whose total stays below 2**37 add up without rounding, so every summation
+# order gives the same bits.
+_EXACT_HOURS_SCALE = 2.0 ** 16
+_EXACT_HOURS_LIMIT = 2.0 ** 53
+
+# Rows re-summed per block when reproducing the list-order sum (memory bound).
+_RESUM_BLOCK = 256
+
+
+def _sums_are_exact(values: np.ndarray) -> bool:
+    scaled = values * _EXACT_HOURS_SCALE
+    return bool(np.all(scaled == np.floor(scaled))) and float(scaled.sum()) < _EXACT_HOURS_LIMIT
+
+
+def _days_in_front(hours: np.ndarray) -> np.ndarray:
+    """≤ 0.1 h → 0, else ROUNDUP(hours / daily capacity); non-decreasing in hours."""
+    return np.where(
+        hours <= 0.1,
+        0,
+        np.ceil(hours / SchedulingConfig.FAB_HOURS_PER_DAY),
+    ).astype(np.int64)
+
+
+def _list_order_hours(contributions: np.ndarray, rank: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    hours_in_front for `rows` summed the way calculate_hours_in_front does: the
+    contributions of every job ranked ahead, added in list order. Adding the 0.0
+    left for jobs not in front is exact, so a sequential cumsum reproduces the sum.
+    """
+    out = np.empty(len(rows), dtype=np.float64)
+    for start in range(0, len(rows), _RESUM_BLOCK):
+        block = rows[start:start + _RESUM_BLOCK]
+        ahead = rank[None, :] < rank[block][:, None]
+        out[start:start + len(block)] = np.cumsum(np.where(ahead, contributions, 0.0), axis=1)[:, -1]
+    return out
+
+
+def _stage_percentages(stages: Sequence[Optional[str]]) -> np.ndarray:
+    # Encode stages to codes, then one lookup array of percentages per distinct stage.
+    codes: Dict[Optional[str], int] = {}
+    stage_codes = np.fromiter(
+        (codes.setdefault(stage, len(codes)) for stage in stages),
+        dtype=np.int64,
+        count=len(stages),
+    )
+    lookup = np.array(
+        [SchedulingConfig.get_stage_remaining_percentage(stage if stage else 'Released') for stage in codes],
+        dtype=np.float64,
+    )
+    if not len(lookup):
+        return np.zeros(0, dtype=np.float64)
+    return lookup[stage_codes]
+
+
+def _queue_order(fab_order: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (queue order indices, NaN-fab_order mask)."""
+    n = len(fab_order)
+    is_none = np.fromiter((value is None for value in fab_order), dtype=bool, count=n)
+    values = np.fromiter((_to_float(value) for value in fab_order), dtype=np.float64, count=n)
+    is_nan = np.isnan(values) & ~is_none
+    real = np.flatnonzero(~is_none & ~is_nan)
+    # Stable sort keeps equal fab_orders in index order (the sentinel cascade).
+    real = real[np.argsort(values[real], kind='stable')]
+    return np.concatenate([real, np.flatnonzero(is_nan), np.flatnonzero(is_none)]), is_nan
+
+
+def compute_scheduling(
+    columns: SchedulingColumns,
+    reference_date: Optional[date] = None
+) -> SchedulingResult:
+    """
+    Run the full scheduling pipeline over columnar inputs.
+
+    Args:
+        columns: Parallel input columns
+        reference_date: Reference date for calculations (defaults to today)
+
+    Returns:
+        SchedulingResult: Parallel output arrays
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    n = len(columns)
+    fab_hrs = np.fromiter((_to_float(v) for v in columns.fab_hrs), dtype=np.float64, count=n)
+    install_hrs = np.fromiter((_to_float(v) for v in columns.install_hrs), dtype=np.float64, count=n)
+    num_guys = np.fromiter((_to_float(v) for v in columns.num_guys), dtype=np.float64, count=n)
+    is_hard_date = np.fromiter((bool(v) for v in columns.is_hard_date), dtype=bool, count=n)
+
+    # Remaining fab hours: total × stage percentage; missing/non-positive totals → 0.
+    # (NaN > 0 is False, so NaN totals land on 0 too.)
+    with np.errstate(invalid='ignore'):
+        has_hours = fab_hrs > 0
+    remaining = np.where(has_hours, fab_hrs * _stage_percentages(columns.stage), 0.0)
+    remaining = np.maximum(remaining, 0.0)
+
+    # Hours in front: exclusive running sum in queue order. Hard dates contribute 0.
+    order, fab_order_is_nan = _queue_order(columns.fab_order)
+    contributions = np.where(is_hard_date, 0.0, remaining)
+    running = np.empty(n, dtype=np.float64)
+    if n:
+        running[0] = 0.0
+        np.cumsum(contributions[order][:-1], out=running[1:])
+    hours_in_front = np.empty(n, dtype=np.float64)
+    hours_in_front[order] = running
+    hours_in_front[fab_order_is_nan] = 0.0
+
+    # calculate_hours_in_front adds the same hours in list order. Unless the hours
+    # sum exactly, the two sums can differ by rounding (208.00000000000003 vs
+    # 208.0), which is enough to cross a day boundary. Both lie within 2 × the
+    # recursive-summation error bound of each other, and days_in_front is
+    # non-decreasing in hours, so only rows whose days differ across that margin
+    # can disagree; those few are re-summed in list order.
+    if n and not _sums_are_exact(contributions):
+        terms = int(np.count_nonzero(contributions))
+        gamma = terms * np.finfo(np.float64).eps / 2
+        margin = 2 * gamma / (1 - gamma) * float(contributions.sum())
+        uncertain = np.flatnonzero(
+            (_days_in_front(hours_in_front - margin) != _days_in_front(hours_in_front + margin))
+            & ~fab_order_is_nan
+        )
+        if len(uncertain):
+            rank = np.empty(n, dtype=np.int64)
+            rank[order] = np.arange(n)
+            hours_in_front[uncertain] = _list_order_hours(contributions, rank, uncertain)
+
+    days_in_front = _days_in_front(hours_in_front)
+
+    projected = add_business_days_array(reference_date, days_in_front, calendar=CALENDAR_SHOP)
+    install_start = add_business_days_array(
+        projected, SchedulingConfig.INSTALL_BUFFER_DAYS, calendar=CALENDAR_SHOP
+    )
+
+    # Install complete: start + (ceil(hours / (guys × 8)) - 1) field days.
+    # Missing/negative install hours → None; zero → the start date.
+    guys = np.where(np.isnan(num_guys) | (num_guys <= 0), SchedulingConfig.DEFAULT_NUM_GUYS, num_guys)
+    with np.errstate(invalid='ignore'):
+        has_install = install_hrs >= 0
+    safe_install = np.where(has_install, install_hrs, 0.0)
+    install_days = np.ceil(safe_install / (guys * SchedulingConfig.HOURS_PER_INSTALLER_DAY)).astype(np.int64)
+    install_complete = add_business_days_array(
+        install_start, np.maximum(install_days - 1, 0), calendar=CALENDAR_FIELD
+    )
+    install_complete = np.where(has_install, install_complete, np.datetime64('NaT'))
+
+    return SchedulingResult(
+        remaining_fab_hours=remaining,
+        hours_in_front=hours_in_front,
+        days_in_front=days_in_front,
+        projected_fab_complete_date=projected,
+        install_start_date=install_start,
+        install_complete_date=install_complete,
+    )
@@ -6,12 +6,12 @@ exports:
   preview_scheduling_changes: Compare DB dates against computed values, return structured diff
   print_preview: Emit the diff as structured debug log events
   run_preview_script: CLI entry point for running the preview
-imports_from: [app.models, app.brain.job_log.scheduling.calculator, app.logging_config]
+imports_from: [app.models, app.brain.job_log.scheduling.columnar, app.logging_config]
 imported_by: [app/brain/job_log/routes.py]
 invariants:
   - Never writes to the database
   - show_all=False filters to only jobs with date changes
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Preview script to show differences between current and computed scheduling dates.
 
@@ -22,7 +22,7 @@ and shows a diff against the current database values, without making any changes
 from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 from app.models import Releases, db
-from app.brain.job_log.scheduling.calculator import calculate_all_job_scheduling
+from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -73,18 +73,17 @@ def preview_scheduling_changes(
             'summary': {}
         }
     
-    # Convert to dictionaries for calculation
-    jobs_dicts = []
-    for job in all_jobs:
-        jobs_dicts.append({
-            'fab_hrs': job.fab_hrs,
-            'install_hrs': job.install_hrs,
-            'fab_order': job.fab_order,
-            'stage': job.stage if job.stage else 'Released',
-        })
-    
-    # Calculate scheduling for all jobs
-    jobs_with_scheduling = calculate_all_job_scheduling(jobs_dicts, reference_date)
+    # Calculate scheduling for all jobs (columnar engine, straight from the rows).
+    # The preview has always ignored num_guys and hard dates; keep that.
+    scheduling_columns = SchedulingColumns(
+        fab_hrs=[job.fab_hrs for job in all_jobs],
+        install_hrs=[job.install_hrs for job in all_jobs],
+        fab_order=[job.fab_order for job in all_jobs],
+        stage=[job.stage if job.stage else 'Released' for job in all_jobs],
+        num_guys=[None] * total_jobs,
+        is_hard_date=[False] * total_jobs,
+    )
+    jobs_with_scheduling = compute_scheduling(scheduling_columns, reference_date).to_dicts()
     
     # Compare current vs computed values
     preview_results = []
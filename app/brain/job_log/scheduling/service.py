@@ -4,14 +4,14 @@ schema_version: 1
 purpose: Persist computed scheduling dates (start_install, comp_eta) back to Job records, with single-job and batch-recalculation modes.
 exports:
   update_job_scheduling_fields: Calculate and save scheduling dates for one job
-  recalculate_all_jobs_scheduling: Batch recalculate and commit scheduling for all (or filtered) jobs
-imports_from: [app.models, app.brain.job_log.scheduling.calculator, app.logging_config]
+  recalculate_all_jobs_scheduling: Batch recalculate all (or filtered) jobs, writing only rows whose dates changed
+imports_from: [app.models, app.brain.job_log.scheduling.calculator, app.brain.job_log.scheduling.columnar, app.services.release_change_hub, app.logging_config]
 imported_by: [app/brain/job_log/routes.py, app/brain/job_log/features/fab_order/command.py]
 invariants:
   - Hard-date jobs (start_install_formulaTF=False) are never overwritten
-  - Batch commits every batch_size records to limit transaction size
+  - recalculate_all_jobs_scheduling writes only rows whose start_install/comp_eta changed (one bulk UPDATE in a savepoint, one commit); unchanged rows keep their last_updated_at, and a failed write rolls back only the savepoint, never the caller's pending changes
   - NaN floats are converted to None before calculation to prevent int() errors
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Scheduling service for updating Job model records with calculated scheduling fields.
 
@@ -23,7 +23,8 @@ import math
 from datetime import date, datetime
 from typing import List, Optional
 from app.models import Releases, db
-from app.brain.job_log.scheduling.calculator import calculate_all_job_scheduling
+from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+from app.services.release_change_hub import note_release_change
 from app.logging_config import get_logger
 
 
@@ -132,7 +133,7 @@ def update_job_scheduling_fields(
 
 def recalculate_all_jobs_scheduling(
     reference_date: Optional[date] = None,
-    batch_size: int = 100,
+    batch_size: int = 1000,
     stage_group: Optional[str] = None
 ) -> dict:
     """
@@ -141,16 +142,20 @@ def recalculate_all_jobs_scheduling(
     This function:
     1. Fetches jobs from the database (optionally filtered by stage_group)
     2. Calculates scheduling fields for those jobs
-    3. Updates start_install and comp_eta fields
-    4. Commits changes in batches
+    3. Diffs the calculated start_install/comp_eta against the stored values
+    4. Writes only the changed rows in one bulk UPDATE (executemany) and commits
+
+    Unchanged rows are not written, so their last_updated_at stays put and the
+    next cursor poll (/brain/jobs?since=) does not re-send them.
 
     Args:
         reference_date: Reference date for calculations (defaults to today)
-        batch_size: Number of jobs to commit in each batch (default: 100)
+        batch_size: Max rows per bulk UPDATE statement (default: 1000)
         stage_group: If set, only recalculate jobs in this stage group (e.g. 'FABRICATION')
 
     Returns:
-        dict: Summary of updates with counts and any errors
+        dict: Counts (examined / changed / written; 'updated' mirrors 'changed')
+              and any errors
     """
     if reference_date is None:
         reference_date = date.today()
@@ -185,97 +190,100 @@ def recalculate_all_jobs_scheduling(
         logger.debug("scheduling_recalculation_no_jobs", stage_group=stage_group, count=0)
         return {
             'total_jobs': 0,
+            'examined': 0,
+            'changed': 0,
+            'written': 0,
             'updated': 0,
             'errors': []
         }
     
     logger.debug("scheduling_recalculation_jobs_loaded", count=total_jobs)
     
-    # Convert to dictionaries for calculation
-    jobs_dicts = []
-    for job in all_jobs:
-        jobs_dicts.append({
-            'fab_hrs': _safe_float(job.fab_hrs),
-            'install_hrs': _safe_float(job.install_hrs),
-            'fab_order': _safe_float(job.fab_order),
-            'stage': job.stage if job.stage else 'Released',
-            'num_guys': _safe_float(job.num_guys),
-            'is_hard_date': job.start_install_formulaTF is False,
-        })
-    
-    # Calculate scheduling for all jobs
-    jobs_with_scheduling = calculate_all_job_scheduling(jobs_dicts, reference_date)
+    # Calculate scheduling for all jobs (columnar engine, straight from the rows)
+    scheduling = compute_scheduling(SchedulingColumns.from_releases(all_jobs), reference_date)
+    new_start_installs = scheduling.install_start_date.tolist()
+    new_comp_etas = scheduling.install_complete_date.tolist()
     
-    # Update jobs in batches
-    updated_count = 0
+    # Diff against stored values; collect one mapping per changed row
+    examined_count = 0
+    changes = []
     errors = []
-    
-    for i, (job, scheduling) in enumerate(zip(all_jobs, jobs_with_scheduling)):
-        try:
-            # Skip hard-date releases — their dates are user-set and must not be overwritten
-            if job.start_install_formulaTF is False:
-                continue
+    now = datetime.utcnow()
 
-            old_start_install = job.start_install
-            old_comp_eta = job.comp_eta
+    for job, new_start_install, new_comp_eta in zip(all_jobs, new_start_installs, new_comp_etas):
+        # Skip hard-date releases — their dates are user-set and must not be overwritten
+        if job.start_install_formulaTF is False:
+            continue
+        examined_count += 1
 
-            # Update calculated fields
-            job.start_install = scheduling.get('install_start_date')
-            job.comp_eta = scheduling.get('install_complete_date')
-            job.last_updated_at = datetime.utcnow()
-            if job.source_of_update != 'System':
-                job.source_of_update = job.source_of_update or 'System'
-            
-            # Track if anything changed
-            if old_start_install != job.start_install or old_comp_eta != job.comp_eta:
-                updated_count += 1
-            
-            # Commit in batches
-            if (i + 1) % batch_size == 0:
-                db.session.commit()
-                logger.debug("scheduling_batch_committed", count=i + 1, total_jobs=total_jobs)
-                
-        except Exception as e:
-            logger.error(
-                "scheduling_job_update_failed",
-                job=job.job,
-                release=job.release,
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
-            )
-            errors.append({
-                'job': f"{job.job}-{job.release}",
-                'error': str(e)
-            })
-            # Continue with next job
-    
-    # Final commit for remaining jobs
+        if job.start_install == new_start_install and job.comp_eta == new_comp_eta:
+            continue
+
+        changes.append((job, {
+            'id': job.id,
+            'start_install': new_start_install,
+            'comp_eta': new_comp_eta,
+            'last_updated_at': now,
+            'source_of_update': job.source_of_update or 'System',
+        }))
+
+    for job, mapping in changes:
+        logger.info(
+            "scheduling_updated",
+            job=job.job,
+            release=job.release,
+            from_start_install=job.start_install,
+            to_start_install=mapping['start_install'],
+            from_comp_eta=job.comp_eta,
+            to_comp_eta=mapping['comp_eta'],
+        )
+
+    # Write changed rows: one executemany per batch_size chunk inside a savepoint,
+    # then one commit (always issued — callers rely on it to commit their own
+    # pending changes). A failed write rolls back only the savepoint, so the
+    # caller's pending changes are still committed. bulk_update_mappings bypasses
+    # the unit of work, so the loaded objects are refreshed by the commit's
+    # expire-all. It also skips the flush listener, so flag the release-change
+    # publish for open job-log streams explicitly.
+    written_count = 0
     try:
-        db.session.commit()
+        with db.session.begin_nested():
+            for start in range(0, len(changes), batch_size):
+                db.session.bulk_update_mappings(
+                    Releases, [mapping for _, mapping in changes[start:start + batch_size]]
+                )
+        if changes:
+            note_release_change(db.session)
+        written_count = len(changes)
     except Exception as e:
         logger.error(
-            "scheduling_final_commit_failed",
+            "scheduling_bulk_update_failed",
+            rows=len(changes),
             error=str(e),
             error_type=type(e).__name__,
             exc_info=True,
         )
         errors.append({
-            'job': 'final_commit',
+            'job': 'bulk_update',
             'error': str(e)
         })
-    
+    db.session.commit()
+
     logger.info(
         "scheduling_recalculation_complete",
         total_jobs=total_jobs,
-        updated=updated_count,
+        examined=examined_count,
+        changed=len(changes),
+        written=written_count,
         error_count=len(errors),
         stage_group=stage_group,
     )
     
     return {
         'total_jobs': total_jobs,
-        'updated': updated_count,
+        'examined': examined_count,
+        'changed': len(changes),
+        'written': written_count,
+        'updated': len(changes),
         'errors': errors
     }
-
@@ -0,0 +1,356 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Maintain the persisted scheduling snapshot (release_schedules) so job-log read endpoints join against stored projections instead of recomputing the whole fab queue on every poll.
+exports:
+  SCHEDULING_INPUT_FIELDS: Releases columns whose change invalidates the snapshot
+  ensure_scheduling_snapshot: Return the current generation, rebuilding first if inputs changed or the day rolled over (commits; scheduler job)
+  rebuild_scheduling_snapshot: Recompute every release's schedule and persist only the rows that moved
+  read_scheduling_snapshot: Read-only — generation plus projections for a set of release ids, computed in memory while the snapshot is stale
+  scheduling_snapshot_version: Read-only ETag input that changes whenever the served projections can
+  get_release_schedules: Batch-load snapshot rows for a set of release ids
+  mark_scheduling_snapshot_stale: Explicitly invalidate (for bulk/raw-SQL writers that bypass the ORM)
+imports_from: [app.models, app.brain.job_log.scheduling.columnar, app.services.release_change_hub, app.logging_config, sqlalchemy]
+imported_by: [app/brain/job_log/scheduling/__init__.py, app/brain/job_log/routes.py, app/__init__.py]
+invariants:
+  - The snapshot is current iff computed_inputs_version == inputs_version and reference_date == today
+  - Read endpoints never write: only ensure/rebuild (scheduler job) persist, and a stale snapshot is served from an in-memory compute
+  - inputs_version is bumped on a separate connection AFTER the writer commits, so no release write ever waits on the state row
+  - generation only increments when a rebuild changed at least one stored value (or added/removed a row); that commit publishes on the release change hub so open streams push it
+  - Queue order for the snapshot is Releases.id, so ties between equal fab_orders are deterministic
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Scheduling snapshot.
+
+Every /brain/jobs and /brain/get-all-jobs call used to load all Releases rows and
+rerun the scheduling calculator, even for a zero-row `since=` delta poll. The
+calculator output only depends on a handful of columns, so it is stored in
+release_schedules and rebuilt by the scheduler's scheduling_snapshot_refresh job
+once one of those columns changed (or the reference date rolled over). Until that
+rebuild lands, reads compute the projections in memory rather than writing from a
+GET.
+
+Invalidation is automatic for ORM writes: a session listener notes flushes that
+touch a scheduling input and bumps inputs_version once the transaction commits.
+Writers that bypass the ORM (Query.update, raw SQL) must call
+mark_scheduling_snapshot_stale() themselves.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+from app.logging_config import get_logger
+from app.models import Releases, ReleaseSchedule, SchedulingSnapshotState, db
+from app.services.release_change_hub import note_release_change
+
+logger = get_logger(__name__)
+
+SNAPSHOT_STATE_ID = 1
+
+# Releases columns the calculator reads. A change to any of these (or a row being
+# added/removed) can move some release's projected dates.
+SCHEDULING_INPUT_FIELDS = (
+    'fab_order',
+    'stage',
+    'fab_hrs',
+    'install_hrs',
+    'num_guys',
+    'start_install_formulaTF',
+)
+
+_SESSION_FLAG = 'scheduling_inputs_changed'
+
+# ReleaseSchedule columns holding calculator output (the keys of
+# SchedulingResult.to_dicts()).
+_SCHEDULE_FIELDS = (
+    'remaining_fab_hours',
+    'hours_in_front',
+    'days_in_front',
+    'projected_fab_complete_date',
+    'install_start_date',
+    'install_complete_date',
+)
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+def _flush_touches_scheduling_inputs(session) -> bool:
+    for obj in session.new:
+        if isinstance(obj, Releases):
+            return True
+    for obj in session.deleted:
+        if isinstance(obj, Releases):
+            return True
+    for obj in session.dirty:
+        if not isinstance(obj, Releases):
+            continue
+        attrs = inspect(obj).attrs
+        for name in SCHEDULING_INPUT_FIELDS:
+            if attrs[name].history.has_changes():
+                return True
+    return False
+
+
+@event.listens_for(Session, 'after_flush')
+def _note_scheduling_input_changes(session, flush_context):
+    # new/dirty/deleted and attribute history still reflect the pre-flush state here.
+    if not session.info.get(_SESSION_FLAG) and _flush_touches_scheduling_inputs(session):
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_inputs_version_after_commit(session):
+    # Fires for SAVEPOINT releases too; bumping before the outer commit would let
+    # a concurrent rebuild mark the snapshot current without this write.
+    if session.in_nested_transaction() or not session.info.pop(_SESSION_FLAG, False):
+        return
+    # The session's transaction is over; bump on a short separate transaction so
+    # release writers never hold a lock on the single state row.
+    try:
+        with session.get_bind(mapper=SchedulingSnapshotState).begin() as conn:
+            conn.execute(
+                update(SchedulingSnapshotState)
+                .where(SchedulingSnapshotState.id == SNAPSHOT_STATE_ID)
+                .values(inputs_version=SchedulingSnapshotState.inputs_version + 1)
+            )
+    except SQLAlchemyError as e:
+        logger.warning(
+            "scheduling_snapshot_invalidate_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+@event.listens_for(Session, 'after_rollback')
+def _clear_flag_after_rollback(session):
+    # A rolled-back SAVEPOINT (e.g. a deduplicated event) leaves the outer writes pending.
+    if not session.in_nested_transaction():
+        session.info.pop(_SESSION_FLAG, None)
+
+
+def mark_scheduling_snapshot_stale(commit: bool = True) -> None:
+    """
+    Invalidate the snapshot explicitly.
+
+    The session listener covers ORM writes; call this after bulk Query.update(),
+    bulk_update_mappings or raw SQL that changes a SCHEDULING_INPUT_FIELDS column.
+
+    Args:
+        commit: Whether to commit the bump (default: True)
+    """
+    db.session.execute(
+        update(SchedulingSnapshotState)
+        .where(SchedulingSnapshotState.id == SNAPSHOT_STATE_ID)
+        .values(inputs_version=SchedulingSnapshotState.inputs_version + 1)
+    )
+    if commit:
+        db.session.commit()
+
+
+# ---------------------------------------------------------------------------
+# Build / read
+# ---------------------------------------------------------------------------
+
+def _get_or_create_state() -> SchedulingSnapshotState:
+    state = db.session.get(SchedulingSnapshotState, SNAPSHOT_STATE_ID)
+    if state is not None:
+        return state
+    state = SchedulingSnapshotState(id=SNAPSHOT_STATE_ID, generation=0, inputs_version=0)
+    db.session.add(state)
+    try:
+        db.session.flush()
+    except IntegrityError:
+        # Another worker created it first.
+        db.session.rollback()
+        state = db.session.get(SchedulingSnapshotState, SNAPSHOT_STATE_ID)
+    return state
+
+
+def _is_current(state: Optional[SchedulingSnapshotState], reference_date: date) -> bool:
+    return (
+        state is not None
+        and state.computed_inputs_version == state.inputs_version
+        and state.reference_date == reference_date
+    )
+
+
+def _compute_all(reference_date: date) -> Tuple[List, List[dict]]:
+    """Run the calculator over every release in queue order; returns (rows, values)."""
+    rows = db.session.query(
+        Releases.id,
+        Releases.fab_hrs,
+        Releases.install_hrs,
+        Releases.fab_order,
+        Releases.stage,
+        Releases.num_guys,
+        Releases.start_install_formulaTF,
+    ).order_by(Releases.id.asc()).all()
+    scheduling = compute_scheduling(SchedulingColumns.from_releases(rows), reference_date)
+    return rows, scheduling.to_dicts()
+
+
+def rebuild_scheduling_snapshot(reference_date: Optional[date] = None) -> int:
+    """
+    Recompute the scheduling snapshot for every release and persist it.
+
+    Only rows whose values moved are written. The state generation increments
+    when at least one row changed, was added, or was removed.
+
+    Args:
+        reference_date: Reference date for calculations (defaults to today)
+
+    Returns:
+        int: The snapshot generation after the rebuild
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    state = _get_or_create_state()
+    # Read the version BEFORE the inputs: a write that commits mid-rebuild bumps
+    # past this value and the next read rebuilds again.
+    inputs_version = state.inputs_version
+
+    rows, computed = _compute_all(reference_date)
+
+    existing = {s.release_id: s for s in ReleaseSchedule.query.all()}
+    next_generation = (state.generation or 0) + 1
+    changed = 0
+    for row, values in zip(rows, computed):
+        snapshot = existing.pop(row.id, None)
+        if snapshot is None:
+            db.session.add(ReleaseSchedule(release_id=row.id, generation=next_generation, **values))
+            changed += 1
+        elif any(getattr(snapshot, field) != value for field, value in values.items()):
+            for field, value in values.items():
+                setattr(snapshot, field, value)
+            snapshot.generation = next_generation
+            changed += 1
+    removed = len(existing)
+    for orphan in existing.values():
+        db.session.delete(orphan)
+
+    if changed or removed:
+        state.generation = next_generation
+        # Wake open /brain/jobs/stream connections; they push the new generation.
+        note_release_change(db.session)
+    state.computed_inputs_version = inputs_version
+    state.reference_date = reference_date
+    state.computed_at = datetime.utcnow()
+
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        # A concurrent rebuild inserted the same release_schedules rows first; its
+        # result is equivalent, so take whatever it committed.
+        db.session.rollback()
+        logger.info("scheduling_snapshot_rebuild_raced", error=str(e))
+        state = db.session.get(SchedulingSnapshotState, SNAPSHOT_STATE_ID)
+        return state.generation if state else 0
+
+    logger.info(
+        "scheduling_snapshot_rebuilt",
+        releases=len(rows),
+        changed=changed,
+        removed=removed,
+        generation=state.generation,
+        reference_date=reference_date.isoformat(),
+    )
+    return state.generation
+
+
+def ensure_scheduling_snapshot(reference_date: Optional[date] = None) -> int:
+    """
+    Return the current snapshot generation, rebuilding first if it is stale.
+
+    A current snapshot costs one primary-key read of the state row. A rebuild
+    commits, so this is for the scheduler job and write paths, not GET handlers
+    (they use read_scheduling_snapshot).
+
+    Args:
+        reference_date: Reference date for calculations (defaults to today)
+
+    Returns:
+        int: The snapshot generation
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    state = db.session.get(SchedulingSnapshotState, SNAPSHOT_STATE_ID)
+    if _is_current(state, reference_date):
+        return state.generation
+    return rebuild_scheduling_snapshot(reference_date)
+
+
+def read_scheduling_snapshot(
+    release_ids: Iterable[int], reference_date: Optional[date] = None
+) -> Tuple[int, Dict[int, dict]]:
+    """
+    Projections for a set of releases without writing anything.
+
+    A current snapshot is read from release_schedules. A stale (or never built)
+    one is recomputed in memory for this request only; the scheduler's refresh
+    job persists it and bumps the generation.
+
+    Args:
+        release_ids: Release ids to look up
+        reference_date: Reference date for calculations (defaults to today)
+
+    Returns:
+        (generation, {release_id: {field: value}}) — generation is the last
+        persisted one (0 before the first rebuild)
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    ids = {i for i in release_ids if i is not None}
+    state = db.session.get(SchedulingSnapshotState, SNAPSHOT_STATE_ID)
+    generation = (state.generation or 0) if state is not None else 0
+    if _is_current(state, reference_date):
+        stored = get_release_schedules(ids)
+        return generation, {
+            release_id: {field: getattr(row, field) for field in _SCHEDULE_FIELDS}
+            for release_id, row in stored.items()
+        }
+    if not ids:
+        return generation, {}
+    rows, computed = _compute_all(reference_date)
+    return generation, {row.id: values for row, values in zip(rows, computed) if row.id in ids}
+
+
+def scheduling_snapshot_version(reference_date: Optional[date] = None) -> Tuple:
+    """
+    ETag input for responses that join the snapshot (one primary-key read, no writes).
+
+    Changes when a rebuild moves the generation, when an input change makes the
+    served values in-memory ones, and when the reference date rolls over.
+    """
+    if reference_date is None:
+        reference_date = date.today()
+    state = db.session.get(SchedulingSnapshotState, SNAPSHOT_STATE_ID)
+    if state is None:
+        return (0, None, reference_date.isoformat())
+    return (state.generation, state.inputs_version, reference_date.isoformat())
+
+
+def get_release_schedules(release_ids: Iterable[int]) -> Dict[int, ReleaseSchedule]:
+    """
+    Batch-load snapshot rows keyed by release id (one query, avoids N+1).
+
+    Args:
+        release_ids: Release ids to look up
+
+    Returns:
+        dict: release_id -> ReleaseSchedule for ids that have a snapshot row
+    """
+    ids = [i for i in release_ids if i is not None]
+    if not ids:
+        return {}
+    rows = ReleaseSchedule.query.filter(ReleaseSchedule.release_id.in_(ids)).all()
+    return {row.release_id: row for row in rows}
@@ -330,6 +330,47 @@ def _outbox_delivery(model, start, end):
     }
 
 
+def _outbox_dispatch(model, start, end):
+    """How fast one outbox drains: throughput, queue-to-delivery lag, retries needed.
+
+    Throughput and lag cover rows completed in-window (lag = completed_at -
+    created_at, nearest-rank percentiles); the retry histogram covers rows created
+    in-window that reached a final status, keyed by retry_count.
+    """
+    lags = sorted(
+        (done - created).total_seconds()
+        for created, done in (
+            db.session.query(model.created_at, model.completed_at)
+            .filter(model.status == "completed",
+                    model.completed_at >= start, model.completed_at < end)
+            .all()
+        )
+    )
+    hours = max((end - start).total_seconds() / 3600.0, 1e-9)
+
+    def pct(p):
+        if not lags:
+            return None
+        return round(lags[min(len(lags) - 1, int(round(p * (len(lags) - 1))))], 2)
+
+    retries = {
+        int(n or 0): int(count)
+        for n, count in (
+            db.session.query(model.retry_count, func.count(model.id))
+            .filter(model.created_at >= start, model.created_at < end,
+                    model.status.in_(("completed", "failed")))
+            .group_by(model.retry_count)
+            .all()
+        )
+    }
+    return {
+        "delivered": len(lags),
+        "throughput_per_hour": round(len(lags) / hours, 2),
+        "lag_seconds": {"p50": pct(0.5), "p95": pct(0.95), "max": round(lags[-1], 2) if lags else None},
+        "retry_histogram": {str(k): retries[k] for k in sorted(retries)},
+    }
+
+
 def system(start, end):
     sync_by_status = _count_by(
         db.session.query(SyncOperation.status, func.count(SyncOperation.id))
@@ -363,12 +404,13 @@ def system(start, end):
         .scalar()
     )
     # Current backlog (all-time state) plus windowed delivery outcome.
-    backlog, delivery = {}, {}
+    backlog, delivery, dispatch = {}, {}, {}
     for name, model in (("trello", TrelloOutbox), ("procore", ProcoreOutbox)):
         backlog[name] = _count_by(
             db.session.query(model.status, func.count(model.id)).group_by(model.status)
         )
         delivery[name] = _outbox_delivery(model, start, end)
+        dispatch[name] = _outbox_dispatch(model, start, end)
 
     # Data freshness — how stale is the last successful sync / webhook (relative to now).
     last_sync = (
@@ -388,6 +430,7 @@ def system(start, end):
         "webhooks_received": int(webhooks or 0),
         "outbox_backlog": backlog,
         "outbox_delivery": delivery,
+        "outbox_dispatch": dispatch,
         "freshness": {
             "last_sync_at": last_sync.isoformat() + "Z" if last_sync else None,
             "last_sync_age_minutes": _age_minutes(last_sync),
@@ -8,23 +8,42 @@ exports:
   (routes registered on brain_bp)
     GET /brain/projects            -> {projects: [...]}   index with counts
     GET /brain/projects/<job_number> -> live project payload, or 404
-imports_from: [flask, app.brain, app.auth.utils, app.brain.projects.service, app.logging_config]
+imports_from: [flask, app.brain, app.auth.utils, app.brain.projects.service, app.http_cache, app.models, app.logging_config]
 imported_by: [app/brain/__init__.py]
 invariants:
   - Read-only. No writes; SELECTs only.
+  - The index answers a matching If-None-Match with 304 (ETag over Projects/PMs/Releases/Submittals and today's date).
 """
+from datetime import date
+
 from flask import jsonify
 
 from app.brain import brain_bp
 from app.auth.utils import login_required
 from app.brain.projects import service
+from app.http_cache import conditional_get, table_versions, tracked_tables
 from app.logging_config import get_logger
+from app.models import ProjectManager, Projects, Releases, Submittals
 
 logger = get_logger(__name__)
 
 
+_PROJECTS_INDEX_TABLES = tracked_tables(
+    (Projects, None),
+    (ProjectManager, None),
+    (Releases, Releases.last_updated_at),
+    (Submittals, Submittals.last_updated),
+)
+
+
+def _projects_index_version():
+    # Health score and the upcoming feed are relative to today.
+    return table_versions(*_PROJECTS_INDEX_TABLES), date.today().isoformat()
+
+
 @brain_bp.route("/projects", methods=["GET"])
 @login_required
+@conditional_get(_projects_index_version)
 def projects_index():
     """Every project + release/submittal counts and assigned PM."""
     return jsonify({"projects": service.list_projects()}), 200
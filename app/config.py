@@ -110,6 +110,82 @@ class Config:
     # inbound /trello/webhook POSTs are dropped. Lets dev exercise the outbox
     # plumbing for the ASAP cascade without touching the real Trello board.
     TRELLO_MOCK = os.environ.get("TRELLO_MOCK", "0") == "1"
+    # Outbound Trello REST (app/trello/client.py). Trello allows 100 requests per
+    # 10 seconds per token. Every process calls Trello with the same token (inbound
+    # drain, outbox, card pipeline, scanner) but the bucket lives in each process, so
+    # each one gets TRELLO_RATE_LIMIT_REQUESTS / TRELLO_RATE_LIMIT_PROCESSES per
+    # window, shared by its threads. Set TRELLO_RATE_LIMIT_PROCESSES to the number of
+    # processes calling Trello: gunicorn workers (WEB_CONCURRENCY) plus the scheduler
+    # (the default). The base URL is overridable so tests and local dev can point at a fake.
+    TRELLO_API_BASE_URL = os.environ.get("TRELLO_API_BASE_URL", "https://api.trello.com/1")
+    TRELLO_RATE_LIMIT_REQUESTS = float(os.environ.get("TRELLO_RATE_LIMIT_REQUESTS", "100"))
+    TRELLO_RATE_LIMIT_WINDOW_SECONDS = float(os.environ.get("TRELLO_RATE_LIMIT_WINDOW_SECONDS", "10"))
+    TRELLO_RATE_LIMIT_PROCESSES = int(
+        os.environ.get("TRELLO_RATE_LIMIT_PROCESSES", str(int(os.environ.get("WEB_CONCURRENCY", "1")) + 1))
+    )
+    TRELLO_MAX_RETRIES = int(os.environ.get("TRELLO_MAX_RETRIES", "3"))
+    TRELLO_REQUEST_TIMEOUT_SECONDS = float(os.environ.get("TRELLO_REQUEST_TIMEOUT_SECONDS", "30"))
+    # Batched card reads (app/trello/batch.py). GETs asked for within
+    # TRELLO_BATCH_WINDOW_SECONDS of each other (attachments, custom fields, members)
+    # go out together as GET /batch calls of up to TRELLO_BATCH_MAX_URLS urls, the
+    # most Trello accepts. Successful reads are kept for TRELLO_BATCH_CACHE_TTL_SECONDS
+    # (0 disables the cache); writes through app.trello.api drop the card's entries.
+    TRELLO_BATCH_MAX_URLS = int(os.environ.get("TRELLO_BATCH_MAX_URLS", "10"))
+    TRELLO_BATCH_WINDOW_SECONDS = float(os.environ.get("TRELLO_BATCH_WINDOW_SECONDS", "0.01"))
+    TRELLO_BATCH_CACHE_TTL_SECONDS = float(os.environ.get("TRELLO_BATCH_CACHE_TTL_SECONDS", "60"))
+    # Bulk card creation (app/trello/card_pipeline.py). Up to TRELLO_CARD_CREATE_WORKERS
+    # cards are built side by side, each card's calls (create, fab order, FC Drawing,
+    # notes, mirror) in order on one worker; all share the Trello rate limiter above.
+    TRELLO_CARD_CREATE_WORKERS = int(os.environ.get("TRELLO_CARD_CREATE_WORKERS", "4"))
+    # Inbound Trello webhooks (app/trello/inbound_queue.py). Every handled event is
+    # written to trello_inbound_events and drained by a worker thread in each web
+    # process: up to TRELLO_INBOUND_BATCH_SIZE events per claim (one per card), idling
+    # TRELLO_INBOUND_IDLE_SECONDS when the table is empty. Past
+    # TRELLO_INBOUND_MAX_DEPTH pending rows the webhook answers 429 so Trello backs
+    # off. A 'processing' claim older than TRELLO_INBOUND_STALE_CLAIM_SECONDS belonged
+    # to a worker that died and is handed back out.
+    TRELLO_INBOUND_BATCH_SIZE = int(os.environ.get("TRELLO_INBOUND_BATCH_SIZE", "10"))
+    TRELLO_INBOUND_IDLE_SECONDS = float(os.environ.get("TRELLO_INBOUND_IDLE_SECONDS", "1"))
+    TRELLO_INBOUND_MAX_DEPTH = int(os.environ.get("TRELLO_INBOUND_MAX_DEPTH", "5000"))
+    TRELLO_INBOUND_MAX_ATTEMPTS = int(os.environ.get("TRELLO_INBOUND_MAX_ATTEMPTS", "5"))
+    TRELLO_INBOUND_STALE_CLAIM_SECONDS = float(os.environ.get("TRELLO_INBOUND_STALE_CLAIM_SECONDS", "300"))
+    TRELLO_INBOUND_RETENTION_DAYS = float(os.environ.get("TRELLO_INBOUND_RETENTION_DAYS", "7"))
+    # One Trello drag fires several actions for the same card within a second. A new
+    # event becomes claimable TRELLO_COALESCE_WINDOW_SECONDS after it arrives, and the
+    # claim folds every pending event for that card (up to TRELLO_COALESCE_MAX_EVENTS)
+    # into one sync_from_trello call. 0 disables the wait (bursts still merge if they
+    # queued up behind a busy card).
+    TRELLO_COALESCE_WINDOW_SECONDS = float(os.environ.get("TRELLO_COALESCE_WINDOW_SECONDS", "1"))
+    TRELLO_COALESCE_MAX_EVENTS = int(os.environ.get("TRELLO_COALESCE_MAX_EVENTS", "50"))
+    # Standing Trello<->DB mismatch report (app/trello/scanner.py). Every
+    # TRELLO_SCAN_INTERVAL_MINUTES the scheduler re-checks only cards with board
+    # activity since the last scan and releases whose last_updated_at moved; a full
+    # board read still runs every TRELLO_SCAN_FULL_EVERY_HOURS. 0 disables the job.
+    TRELLO_SCAN_INTERVAL_MINUTES = int(os.environ.get("TRELLO_SCAN_INTERVAL_MINUTES", "5"))
+    TRELLO_SCAN_FULL_EVERY_HOURS = float(os.environ.get("TRELLO_SCAN_FULL_EVERY_HOURS", "24"))
+    # Scheduling snapshot (app/brain/job_log/scheduling/snapshot.py). Job-log GETs
+    # never write it; every SCHEDULING_SNAPSHOT_REFRESH_SECONDS the scheduler
+    # rebuilds it if a scheduling input changed or the day rolled over, and reads
+    # compute in memory until then. 0 disables the job.
+    SCHEDULING_SNAPSHOT_REFRESH_SECONDS = int(os.environ.get("SCHEDULING_SNAPSHOT_REFRESH_SECONDS", "60"))
+    # Outbound delivery (app/services/outbox_dispatcher.py). Each claim of due
+    # trello_outbox / procore_outbox rows is spread over OUTBOX_DISPATCH_WORKERS
+    # threads, one card (or submittal) per thread so its updates stay in order. A
+    # 'processing' claim older than OUTBOX_STALE_CLAIM_SECONDS belonged to a worker
+    # that died and is handed back out.
+    OUTBOX_DISPATCH_WORKERS = int(os.environ.get("OUTBOX_DISPATCH_WORKERS", "4"))
+    OUTBOX_STALE_CLAIM_SECONDS = float(os.environ.get("OUTBOX_STALE_CLAIM_SECONDS", "300"))
+
+    # Job log live updates (/brain/jobs/stream). Each open stream holds a gthread
+    # worker thread (GUNICORN_THREADS in gunicorn.conf.py), so a stream ends after RELEASE_STREAM_MAX_SECONDS and the browser's
+    # EventSource reconnects with Last-Event-ID (nothing is missed). The heartbeat
+    # keeps proxies from idling the connection out and doubles as a catch-up
+    # query in case a change signal was lost.
+    RELEASE_STREAM_HEARTBEAT_SECONDS = float(os.environ.get("RELEASE_STREAM_HEARTBEAT_SECONDS", "15"))
+    RELEASE_STREAM_MAX_SECONDS = float(os.environ.get("RELEASE_STREAM_MAX_SECONDS", "300"))
+    # /brain/get-all-jobs counts its total once per paging run (page 1) and
+    # reuses it for this long unless a release insert/edit moves the fingerprint.
+    RELEASE_COUNT_CACHE_SECONDS = float(os.environ.get("RELEASE_COUNT_CACHE_SECONDS", "30"))
     
     # Azure configuration
     AZURE_CLIENT_SECRET = os.environ.get("AZURE_CLIENT_SECRET")
@@ -225,6 +301,59 @@ class Config:
     # dedup or not yet propagated by Procore at the time the live webhook was processed.
     # 60s comfortably clears the 15s burst window plus Procore read-after-write lag.
     PROCORE_RECONCILE_DELAY_SECONDS = int(os.environ.get("PROCORE_RECONCILE_DELAY_SECONDS", "60"))
+    # A project with at least PROCORE_RECONCILE_BATCH_MIN_ROWS due reconciles is read
+    # with one submittal list call filtered on updated_at (from the oldest row's
+    # webhook minus PROCORE_RECONCILE_UPDATED_AT_SKEW_SECONDS); rows the list does not
+    # fully answer fall back to the per-submittal detail fetch.
+    PROCORE_RECONCILE_BATCH_MIN_ROWS = int(os.environ.get("PROCORE_RECONCILE_BATCH_MIN_ROWS", "2"))
+    PROCORE_RECONCILE_UPDATED_AT_SKEW_SECONDS = int(os.environ.get("PROCORE_RECONCILE_UPDATED_AT_SKEW_SECONDS", "300"))
+    # Procore API budget and concurrency (app/procore/api.py, app/procore/fetch.py).
+    # PROCORE_RATE_LIMIT_PER_HOUR is Procore's limit for the one OAuth token every
+    # process shares, but the bucket that enforces it lives in each process. So each
+    # process gets PROCORE_RATE_LIMIT_PER_HOUR / PROCORE_RATE_LIMIT_PROCESSES per hour,
+    # bursting to PROCORE_RATE_LIMIT_BURST / PROCORE_RATE_LIMIT_PROCESSES. Set
+    # PROCORE_RATE_LIMIT_PROCESSES to the number of processes calling Procore: gunicorn
+    # workers (WEB_CONCURRENCY) plus the scheduler (the default). A 429 pauses the bucket
+    # until X-Rate-Limit-Reset. Paginated submittal lists and per-project scans run on up
+    # to PROCORE_FETCH_WORKERS threads.
+    PROCORE_RATE_LIMIT_PER_HOUR = int(os.environ.get("PROCORE_RATE_LIMIT_PER_HOUR", "3600"))
+    PROCORE_RATE_LIMIT_BURST = int(os.environ.get("PROCORE_RATE_LIMIT_BURST", "100"))
+    PROCORE_RATE_LIMIT_PROCESSES = int(
+        os.environ.get("PROCORE_RATE_LIMIT_PROCESSES", str(int(os.environ.get("WEB_CONCURRENCY", "1")) + 1))
+    )
+    PROCORE_FETCH_WORKERS = int(os.environ.get("PROCORE_FETCH_WORKERS", "6"))
+    # Procore read cache (app/procore/response_cache.py). Submittal detail and
+    # workflow_data GETs are served from a per-process cache for
+    # PROCORE_RESPONSE_CACHE_TTL_SECONDS, then revalidated with ETag / Last-Modified
+    # (a 304 costs no body). The company project list is kept for
+    # PROCORE_PROJECTS_CACHE_TTL_SECONDS. A webhook drops its submittal's entries and
+    # the reconcile re-fetch always goes to Procore. 0 disables the cache.
+    PROCORE_RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("PROCORE_RESPONSE_CACHE_TTL_SECONDS", "60"))
+    PROCORE_PROJECTS_CACHE_TTL_SECONDS = float(os.environ.get("PROCORE_PROJECTS_CACHE_TTL_SECONDS", "600"))
+    PROCORE_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("PROCORE_RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+    # Burst dedup (app/procore/helpers.py). Each process remembers up to
+    # PROCORE_WEBHOOK_DEDUP_CACHE_SIZE receipt hashes of the current 15s window and
+    # rejects repeats without a DB round trip. Procore receipts older than
+    # PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS are purged hourly (the Brain metrics page
+    # counts recent receipts as webhook volume, so keep at least its longest range).
+    PROCORE_WEBHOOK_DEDUP_CACHE_SIZE = int(os.environ.get("PROCORE_WEBHOOK_DEDUP_CACHE_SIZE", "4096"))
+    PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS = float(os.environ.get("PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS", "30"))
+    # Inbound Procore webhooks (app/procore/inbound_queue.py). The endpoint validates,
+    # schedules the reconcile, runs burst dedup and writes the delivery to
+    # procore_inbound_events, answering 202 without calling Procore. Each web process
+    # drains the table on PROCORE_INBOUND_WORKERS threads (one submittal per thread at a
+    # time, each submittal's deliveries in arrival order), claiming up to
+    # PROCORE_INBOUND_BATCH_SIZE per pass and idling PROCORE_INBOUND_IDLE_SECONDS when
+    # empty. Past PROCORE_INBOUND_MAX_DEPTH pending rows the webhook answers 429 so
+    # Procore redelivers later. A 'processing' claim older than
+    # PROCORE_INBOUND_STALE_CLAIM_SECONDS belonged to a worker that died.
+    PROCORE_INBOUND_WORKERS = int(os.environ.get("PROCORE_INBOUND_WORKERS", "4"))
+    PROCORE_INBOUND_BATCH_SIZE = int(os.environ.get("PROCORE_INBOUND_BATCH_SIZE", "4"))
+    PROCORE_INBOUND_IDLE_SECONDS = float(os.environ.get("PROCORE_INBOUND_IDLE_SECONDS", "1"))
+    PROCORE_INBOUND_MAX_DEPTH = int(os.environ.get("PROCORE_INBOUND_MAX_DEPTH", "5000"))
+    PROCORE_INBOUND_MAX_ATTEMPTS = int(os.environ.get("PROCORE_INBOUND_MAX_ATTEMPTS", "5"))
+    PROCORE_INBOUND_STALE_CLAIM_SECONDS = float(os.environ.get("PROCORE_INBOUND_STALE_CLAIM_SECONDS", "300"))
+    PROCORE_INBOUND_RETENTION_DAYS = float(os.environ.get("PROCORE_INBOUND_RETENTION_DAYS", "7"))
     
     # CORS configuration
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*")
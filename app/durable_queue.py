@@ -0,0 +1,354 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: One durable, per-key-ordered work queue over a table (persist, claim with FOR UPDATE SKIP LOCKED, retry with backoff, stale-claim release, purge, metrics, drain thread), configured by the Trello and Procore inbound webhook queues.
+exports:
+  DurableQueue: Queue over one model, ordered per key column, with settings read from Config by prefix and this process's counters
+  QueueWorker: Daemon thread that calls a drain function back to back while it finds work
+imports_from: [sqlalchemy, app.models, app.config, app.logging_config]
+imported_by: [app/trello/inbound_queue.py, app/procore/inbound_queue.py]
+invariants:
+  - A row is claimable only when no earlier row with the same key is still pending or processing, so one key's rows are applied in arrival order across every worker and process.
+  - Claims use SELECT ... FOR UPDATE SKIP LOCKED on Postgres; SQLite (dev/tests) ignores the row lock and relies on the guarded UPDATE ... WHERE status = 'pending' plus a per-claim token, which is safe because SQLite serializes writers.
+  - A failed row uses an attempt and retries with min(300, 2**attempts) seconds of backoff; at <prefix>_MAX_ATTEMPTS it is kept as 'failed' and the key's later rows proceed.
+  - Settings are read from Config on every call (<prefix>_MAX_DEPTH, _MAX_ATTEMPTS, _STALE_CLAIM_SECONDS, _RETENTION_DAYS, _IDLE_SECONDS), so patching Config takes effect at once.
+  - The model needs id, status, attempts, available_at, claimed_by, claimed_at, error_message, created_at and completed_at columns.
+  - Methods need an app context and commit on db.session; the worker opens one per drain.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.orm import aliased
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+from app.models import db
+
+logger = get_logger(__name__)
+
+OPEN_STATUSES = ("pending", "processing")
+MAX_BACKOFF_SECONDS = 300.0
+THROUGHPUT_WINDOW_SECONDS = 300.0
+
+_BASE_COUNTERS = ("enqueued", "rejected_full", "claimed", "completed", "retried", "failed")
+
+
+def _worker_token() -> str:
+    return f"{socket.gethostname()[:32]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    return min(MAX_BACKOFF_SECONDS, 2.0 ** attempts)
+
+
+class DurableQueue:
+    """
+    Durable queue of rows of `model`, applied in id order per `key_column`.
+
+    Args:
+        model: The queue table's model
+        key_column: Column whose rows must be applied one at a time, in order (card, submittal)
+        name: Short name for log events and the worker thread ("trello", "procore")
+        config_prefix: Config prefix of the queue's settings ("TRELLO_INBOUND")
+        extra_counters: Counter names beyond enqueued / rejected_full / claimed / completed / retried / failed
+        track_lag: Report receipt-to-completion lag in metrics() (record_completions is given lags)
+    """
+
+    def __init__(self, model, key_column, name: str, config_prefix: str,
+                 extra_counters: Iterable[str] = (), track_lag: bool = False):
+        self.model = model
+        self.key_column = key_column
+        self.name = name
+        self.config_prefix = config_prefix
+        self.track_lag = track_lag
+        self._lock = threading.Lock()
+        self._counters = {counter: 0 for counter in (*_BASE_COUNTERS, *extra_counters)}
+        self._completions = deque()  # (monotonic stamp, receipt-to-completion seconds or None)
+
+    def setting(self, suffix: str):
+        return getattr(cfg, f"{self.config_prefix}_{suffix}")
+
+    # -- counters -------------------------------------------------------------------
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += n
+
+    def record_completions(self, lags: List[Optional[float]]) -> None:
+        """Note completed rows for throughput; one entry per row, its receipt-to-completion seconds or None."""
+        with self._lock:
+            stamp = time.monotonic()
+            self._completions.extend((stamp, lag) for lag in lags)
+            self._trim_completions(stamp)
+
+    def _trim_completions(self, now: float) -> None:
+        while self._completions and now - self._completions[0][0] > THROUGHPUT_WINDOW_SECONDS:
+            self._completions.popleft()
+
+    # -- enqueue / claim ------------------------------------------------------------
+
+    def pending_depth(self) -> int:
+        M = self.model
+        return db.session.execute(
+            select(func.count()).select_from(M).where(M.status == "pending")
+        ).scalar_one()
+
+    def is_full(self) -> bool:
+        """True (and counted as a rejection) when <prefix>_MAX_DEPTH rows are already pending."""
+        if self.pending_depth() >= self.setting("MAX_DEPTH"):
+            self.count("rejected_full")
+            return True
+        return False
+
+    def claim_heads(self, limit: int) -> Tuple[Optional[str], datetime]:
+        """
+        Mark up to `limit` due rows, each first in line for its key, 'processing'.
+
+        The transaction is left open so the caller can claim more rows under the same
+        token (e.g. a card's burst) before claimed_rows() reads them back and commits.
+
+        Returns:
+            (claim token, claim time); the token is None when nothing was claimable
+            (the transaction is then rolled back)
+        """
+        M = self.model
+        earlier = aliased(M)
+        key = getattr(M, self.key_column.key)
+        now = datetime.utcnow()
+        blocked = exists().where(
+            getattr(earlier, self.key_column.key) == key,
+            earlier.id < M.id,
+            earlier.status.in_(OPEN_STATUSES),
+        )
+        ids = db.session.execute(
+            select(M.id)
+            .where(M.status == "pending", M.available_at <= now, ~blocked)
+            .order_by(M.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=M)
+        ).scalars().all()
+        if not ids:
+            db.session.rollback()
+            return None, now
+        token = _worker_token()
+        self.mark_claimed(ids, token, now)
+        return token, now
+
+    def mark_claimed(self, ids, token: str, now: datetime) -> None:
+        M = self.model
+        db.session.execute(
+            update(M)
+            .where(M.id.in_(ids), M.status == "pending")
+            .values(status="processing", claimed_by=token, claimed_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+    def claimed_rows(self, token: str, *columns) -> list:
+        """Read back every row claimed under `token` (id order), commit the claim and count it."""
+        M = self.model
+        rows = db.session.execute(
+            select(*columns).where(M.claimed_by == token).order_by(M.id)
+        ).all()
+        db.session.commit()
+        self.count("claimed", len(rows))
+        return rows
+
+    # -- finish ---------------------------------------------------------------------
+
+    def finish(
+        self,
+        completed_ids: Iterable[int] = (),
+        failed: Iterable[Tuple[int, int, str]] = (),
+        released_ids: Iterable[int] = (),
+        deferred: Iterable[Tuple[Iterable[int], str, float]] = (),
+    ) -> Dict[str, int]:
+        """
+        Record a claimed batch's outcome in one commit.
+
+        Args:
+            completed_ids: rows that were applied
+            failed: (row id, attempts so far, error) — uses an attempt; retried with backoff
+                until <prefix>_MAX_ATTEMPTS, then kept as 'failed'
+            released_ids: rows handed back to 'pending' untouched
+            deferred: (row ids, reason, seconds) — back to 'pending' after `seconds`, no attempt used
+
+        Returns:
+            {"retried": n, "failed": n} for the failed rows
+        """
+        M = self.model
+        now = datetime.utcnow()
+        completed_ids = list(completed_ids)
+        if completed_ids:
+            db.session.execute(
+                update(M)
+                .where(M.id.in_(completed_ids))
+                .values(status="completed", completed_at=now, error_message=None, claimed_by=None)
+                .execution_options(synchronize_session=False)
+            )
+        released_ids = list(released_ids)
+        if released_ids:
+            db.session.execute(
+                update(M).where(M.id.in_(released_ids))
+                .values(status="pending", claimed_by=None)
+                .execution_options(synchronize_session=False)
+            )
+        retried = gave_up = 0
+        max_attempts = self.setting("MAX_ATTEMPTS")
+        for row_id, attempts, error in failed:
+            attempts += 1
+            if attempts >= max_attempts:
+                values = {"status": "failed", "completed_at": now}
+                gave_up += 1
+            else:
+                values = {"status": "pending", "available_at": now + timedelta(seconds=retry_delay_seconds(attempts))}
+                retried += 1
+            db.session.execute(
+                update(M).where(M.id == row_id)
+                .values(attempts=attempts, error_message=(error or "")[:2000], claimed_by=None, **values)
+                .execution_options(synchronize_session=False)
+            )
+        for ids, reason, seconds in deferred:
+            db.session.execute(
+                update(M).where(M.id.in_(list(ids)))
+                .values(status="pending", available_at=now + timedelta(seconds=seconds),
+                        error_message=reason, claimed_by=None)
+                .execution_options(synchronize_session=False)
+            )
+        db.session.commit()
+        with self._lock:
+            self._counters["completed"] += len(completed_ids)
+            self._counters["retried"] += retried
+            self._counters["failed"] += gave_up
+        return {"retried": retried, "failed": gave_up}
+
+    # -- housekeeping ---------------------------------------------------------------
+
+    def release_stale_claims(self, older_than_seconds: Optional[float] = None) -> int:
+        """Return 'processing' rows claimed longer ago than the stale cutoff to 'pending'."""
+        seconds = self.setting("STALE_CLAIM_SECONDS") if older_than_seconds is None else older_than_seconds
+        cutoff = datetime.utcnow() - timedelta(seconds=seconds)
+        M = self.model
+        released = db.session.execute(
+            update(M)
+            .where(M.status == "processing", M.claimed_at < cutoff)
+            .values(status="pending", claimed_by=None)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        if released:
+            logger.warning(f"{self.name}_inbound_stale_claims_released", count=released, source=self.name)
+        return released
+
+    def purge_completed(self, older_than_days: Optional[float] = None) -> int:
+        days = self.setting("RETENTION_DAYS") if older_than_days is None else older_than_days
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        M = self.model
+        purged = db.session.execute(
+            delete(M).where(M.status == "completed", M.completed_at < cutoff)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        return purged
+
+    def metrics(self) -> dict:
+        """Backlog across all processes (from the table) plus this process's counters, throughput and lag."""
+        M = self.model
+        by_status = dict(db.session.execute(
+            select(M.status, func.count()).where(M.status.in_(("pending", "processing", "failed")))
+            .group_by(M.status)
+        ).all())
+        oldest = db.session.execute(
+            select(func.min(M.created_at)).where(M.status == "pending")
+        ).scalar()
+        with self._lock:
+            counters = dict(self._counters)
+            now = time.monotonic()
+            self._trim_completions(now)
+            lags = [lag for _, lag in self._completions if lag is not None]
+            last_minute = sum(1 for stamp, _ in self._completions if now - stamp <= 60)
+            last_window = len(self._completions)
+        metrics = {
+            "depth": by_status.get("pending", 0),
+            "processing": by_status.get("processing", 0),
+            "failed": by_status.get("failed", 0),
+            "oldest_pending_age_seconds": (
+                round((datetime.utcnow() - oldest).total_seconds(), 1) if oldest else 0.0
+            ),
+        }
+        if self.track_lag:
+            metrics["lag_avg_seconds"] = round(sum(lags) / len(lags), 3) if lags else 0.0
+            metrics["lag_max_seconds"] = round(max(lags), 3) if lags else 0.0
+        metrics.update(
+            completed_last_minute=last_minute,
+            throughput_per_second=round(last_window / THROUGHPUT_WINDOW_SECONDS, 3),
+            max_depth=self.setting("MAX_DEPTH"),
+            **counters,
+        )
+        return metrics
+
+
+class QueueWorker:
+    """
+    Drains a DurableQueue on a daemon thread.
+
+    `drain` claims and runs one batch (returning how many rows it claimed); it is
+    called back to back while it finds work and otherwise every idle_seconds, or
+    sooner when wake() is called by the webhook that just enqueued.
+    """
+
+    def __init__(self, queue: DurableQueue, app, drain: Callable[[], int], idle_seconds: Optional[float] = None):
+        self.queue = queue
+        self.app = app
+        self.drain = drain
+        self.idle_seconds = queue.setting("IDLE_SECONDS") if idle_seconds is None else idle_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.queue.name}-inbound", daemon=True)
+        self._thread.start()
+        logger.info(f"{self.queue.name}_inbound_worker_started", source=self.queue.name)
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        name = self.queue.name
+        try:
+            with self.app.app_context():
+                self.queue.release_stale_claims()
+        except Exception as exc:
+            logger.warning(f"{name}_inbound_stale_release_failed", error=str(exc), source=name)
+        while not self._stop.is_set():
+            claimed = 0
+            try:
+                with self.app.app_context():
+                    claimed = self.drain()
+            except Exception as exc:
+                logger.error(f"{name}_inbound_drain_failed", error=str(exc),
+                             error_type=type(exc).__name__, source=name, exc_info=True)
+            if claimed:
+                continue
+            self._wake.wait(self.idle_seconds)
+            self._wake.clear()
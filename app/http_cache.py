@@ -0,0 +1,207 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Weak-ETag / 304 support for the polled read endpoints (/brain/jobs, /brain/drafting-work-load, /brain/projects), keyed on a cheap table version so an unchanged poll skips the query and serialization entirely.
+exports:
+  conditional_get: Route decorator — answers a matching If-None-Match with 304 before the view runs, tags 200s with a weak ETag
+  tracked_tables: Register (Model, stamp) pairs whose writes bump their shared generation row; returns the pairs for table_versions
+  table_versions: One round trip of (count, max id, max stamp, generation) per model
+imports_from: [flask, sqlalchemy, app.models, app.logging_config]
+imported_by: [app/brain/job_log/routes.py, app/brain/drafting_work_load/routes.py, app/brain/projects/routes.py]
+invariants:
+  - The version is read BEFORE the view's query, so a write racing the response can only make the next poll a 200, never a stale 304
+  - Every input of the ETag is shared database state (fingerprints plus model_generations rows), so all gunicorn workers compute the same ETag for the same data
+  - A committed write to a tracked model moves its generation, including writes that don't touch a fingerprinted column; SAVEPOINT release/rollback waits for the outermost transaction
+  - If the version can't be read, the view runs normally and the response is untagged
+  - Tagged responses are private, no-cache (set by apply_cache_headers in app/__init__.py)
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Conditional GET for polled endpoints.
+
+The job log, DWL and projects pages poll, and most polls return exactly the
+previous body. Each endpoint names the tables its payload is built from; the
+ETag hashes their (count, max id, max stamp) fingerprints, the endpoint's query
+string and any extra inputs (scheduling generation, today's date). A client
+that sends the last ETag back gets a bodiless 304 after one aggregate query.
+
+Some writers don't stamp the fingerprint column (soft-deleting a photo, Procore
+viewer urls). A session listener bumps the model's row in model_generations
+when such a write commits, on a short separate transaction, and the generation
+is read in the same SELECT as the fingerprints.
+"""
+
+import hashlib
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple
+
+from flask import current_app, make_response, request
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.logging_config import get_logger
+from app.models import ModelGeneration, db
+
+logger = get_logger(__name__)
+
+_SESSION_KEY = 'http_cache_touched'
+
+# Model class names whose commits bump model_generations (see tracked_tables).
+_tracked_models = set()
+
+
+def tracked_tables(*tables: Tuple[Any, Optional[Any]]) -> Tuple[Tuple[Any, Optional[Any]], ...]:
+    """
+    Register the (Model, stamp column or None) pairs an endpoint's ETag is built from.
+
+    Call at import time, so every worker bumps generations for these models from its
+    first write, whether or not it has served a poll yet.
+
+    Returns:
+        tuple: The pairs, unchanged, for table_versions(*pairs)
+    """
+    _tracked_models.update(model.__name__ for model, _ in tables)
+    return tables
+
+
+@event.listens_for(Session, 'after_flush')
+def _note_flushed_models(session, flush_context):
+    names = {type(obj).__name__ for collection in (session.new, session.dirty, session.deleted) for obj in collection}
+    names &= _tracked_models
+    if names:
+        session.info.setdefault(_SESSION_KEY, set()).update(names)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _note_bulk_writes(orm_execute_state):
+    # Query.update()/delete() and update(Model) statements skip the flush.
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper is not None:
+        name = orm_execute_state.bind_mapper.class_.__name__
+        if name in _tracked_models:
+            orm_execute_state.session.info.setdefault(_SESSION_KEY, set()).add(name)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_committed_models(session):
+    # Also fires when a SAVEPOINT is released; wait for the outermost commit.
+    if session.in_nested_transaction():
+        return
+    names = session.info.pop(_SESSION_KEY, None)
+    if not names:
+        return
+    # The session's transaction is over; bump on a short separate transaction so
+    # writers never hold the generation rows. Sorted so two workers lock in the same order.
+    try:
+        with session.get_bind(mapper=ModelGeneration).begin() as conn:
+            for name in sorted(names):
+                _bump_generation(conn, name)
+    except SQLAlchemyError as e:
+        logger.warning(
+            "http_cache_generation_bump_failed",
+            models=sorted(names),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+def _bump_generation(conn, name: str) -> None:
+    bumped = conn.execute(
+        update(ModelGeneration)
+        .where(ModelGeneration.name == name)
+        .values(generation=ModelGeneration.generation + 1)
+    ).rowcount
+    if bumped:
+        return
+    try:
+        with conn.begin_nested():
+            conn.execute(insert(ModelGeneration).values(name=name, generation=1))
+    except IntegrityError:
+        # Another worker created the row first; bump it instead.
+        conn.execute(
+            update(ModelGeneration)
+            .where(ModelGeneration.name == name)
+            .values(generation=ModelGeneration.generation + 1)
+        )
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_rolled_back_models(session):
+    if not session.in_nested_transaction():
+        session.info.pop(_SESSION_KEY, None)
+
+
+def table_versions(*tables: Tuple[Any, Optional[Any]]) -> Tuple:
+    """
+    Return a cheap version of each table in a single SELECT.
+
+    Args:
+        tables: (Model, stamp column or None) pairs; the stamp should move on
+            every user-visible edit (e.g. Releases.last_updated_at). Register
+            them with tracked_tables() so unstamped writes move the generation.
+
+    Returns:
+        tuple: (count, max id, max stamp, generation) per table, in order
+    """
+    columns = []
+    for model, stamp in tables:
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.id)).scalar_subquery())
+        if stamp is not None:
+            columns.append(select(func.max(stamp)).scalar_subquery())
+        columns.append(
+            select(ModelGeneration.generation)
+            .where(ModelGeneration.name == model.__name__)
+            .scalar_subquery()
+        )
+    row = iter(db.session.execute(select(*columns)).one())
+
+    versions = []
+    for model, stamp in tables:
+        count, max_id = next(row), next(row)
+        max_stamp = next(row) if stamp is not None else None
+        versions.append((count, max_id, max_stamp, next(row) or 0))
+    return tuple(versions)
+
+
+def _weak_etag(version: Any) -> str:
+    query = sorted(request.args.items(multi=True))
+    raw = repr((request.path, query, version)).encode()
+    return hashlib.sha1(raw).hexdigest()
+
+
+def conditional_get(version: Callable[[], Any]):
+    """
+    Decorator: weak ETag + 304 for a read-only GET route.
+
+    Apply beneath the auth decorator so unauthenticated requests never get a 304.
+
+    Args:
+        version: Zero-arg callable returning a hashable description of the
+            route's inputs, normally built from table_versions(...)
+    """
+    def decorator(view):
+        @wraps(view)
+        def decorated_function(*args, **kwargs):
+            try:
+                etag = _weak_etag(version())
+            except Exception as exc:
+                db.session.rollback()
+                logger.warning(
+                    "etag_version_failed",
+                    path=request.path,
+                    error=str(exc),
+                    error_type=type(exc).__name__,
+                )
+                return view(*args, **kwargs)
+
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+                response.set_etag(etag, weak=True)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag, weak=True)
+            return response
+        return decorated_function
+    return decorator
@@ -0,0 +1,87 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: orjson-backed Flask JSON provider so jsonify / request.get_json on the big job-log payloads skip the pure-Python encoder.
+exports:
+  OrjsonProvider: DefaultJSONProvider subclass that encodes/decodes with orjson
+  install_json_provider: Switch an app to OrjsonProvider when orjson is importable
+imports_from: [flask, orjson]
+imported_by: [app/__init__.py]
+invariants:
+  - Output matches DefaultJSONProvider's semantics: sorted keys, HTTP-date strings for date/datetime (via DefaultJSONProvider.default), trailing newline on responses, indented in debug
+  - Anything orjson can't encode (e.g. ints beyond 64 bits, custom kwargs like indent=) falls back to DefaultJSONProvider
+  - NaN/Infinity floats encode as null (valid JSON) instead of the stdlib's bare NaN
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+
+import json
+import typing as t
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.logging_config import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+logger = get_logger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding."""
+
+    def _options(self, indent: bool = False) -> int:
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            # Hand dates and dataclasses to DefaultJSONProvider.default so they
+            # serialize exactly as before (HTTP dates, dataclasses.asdict).
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def _encode(self, obj: t.Any, indent: bool = False) -> t.Optional[bytes]:
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options(indent))
+        except orjson.JSONEncodeError:
+            return None
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        if not kwargs:
+            encoded = self._encode(obj)
+            if encoded is not None:
+                return encoded.decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: t.Union[str, bytes], **kwargs: t.Any) -> t.Any:
+        if not kwargs:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # The stdlib also accepts NaN/Infinity literals; let it decide.
+                pass
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: t.Any, **kwargs: t.Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        encoded = self._encode(obj, indent=indent)
+        if encoded is None:
+            return super().response(obj)
+        return self._app.response_class(encoded + b"\n", mimetype=self.mimetype)
+
+
+def install_json_provider(app) -> None:
+    """Use OrjsonProvider for `app` (keeps Flask's default when orjson is missing)."""
+    if orjson is None:
+        logger.warning("orjson_unavailable_using_default_json_provider")
+        return
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
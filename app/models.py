@@ -4,6 +4,7 @@ schema_version: 1
 purpose: Central ORM module — defines every SQLAlchemy model and the shared db instance used across the application.
 exports:
   db: The shared SQLAlchemy instance (initialized in app factory via db.init_app)
+  in_memory_database: True on an in-memory SQLite database, where work must stay on the request's thread
   Releases: Job log entries (alias: Job as Releases in integration code)
   Submittals: Procore submittals (table renamed from procore_submittals in M2)
   ReleaseEvents: Audit event stream for job releases with payload-hash dedup
@@ -27,6 +28,12 @@ from sqlalchemy import cast, Integer, String
 db = SQLAlchemy()
 
 
+def in_memory_database() -> bool:
+    """True on an in-memory SQLite database (tests), which other threads' connections cannot see."""
+    url = db.engine.url
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
 def _dt(value):
     """Serialize a datetime/date to ISO format string, or None."""
     return value.isoformat() if value else None
@@ -673,6 +680,61 @@ def query_job_releases():
         ]
     )
 
+class ReleaseSchedule(db.Model):
+    """
+    Persisted scheduling snapshot for one release — the calculator's output
+    (remaining hours, queue position, projected dates) so the job-log read
+    endpoints join against it instead of recomputing the whole queue per poll.
+
+    Maintained by app.brain.job_log.scheduling.snapshot. `generation` is the
+    SchedulingSnapshotState.generation in which this row's values last changed.
+    """
+    __tablename__ = 'release_schedules'
+    release_id = db.Column(
+        db.Integer, db.ForeignKey('releases.id', ondelete='CASCADE'), primary_key=True
+    )
+    remaining_fab_hours = db.Column(db.Float, nullable=False, default=0.0)
+    hours_in_front = db.Column(db.Float, nullable=False, default=0.0)
+    days_in_front = db.Column(db.Integer, nullable=False, default=0)
+    projected_fab_complete_date = db.Column(db.Date, nullable=True)
+    install_start_date = db.Column(db.Date, nullable=True)
+    install_complete_date = db.Column(db.Date, nullable=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+
+
+class SchedulingSnapshotState(db.Model):
+    """
+    Single-row (id=1) bookkeeping for the release_schedules snapshot.
+
+    inputs_version is bumped after every commit that changes a scheduling input
+    on Releases (fab_order, stage, fab_hrs, install_hrs, num_guys,
+    start_install_formulaTF, or a row added/removed). The snapshot is current
+    while computed_inputs_version == inputs_version and reference_date is today.
+    generation increments only when a rebuild actually moved a value, so clients
+    can tell projected dates changed even though no release row was edited.
+    """
+    __tablename__ = 'scheduling_snapshot_state'
+    id = db.Column(db.Integer, primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+    inputs_version = db.Column(db.Integer, nullable=False, default=0)
+    computed_inputs_version = db.Column(db.Integer, nullable=True)
+    reference_date = db.Column(db.Date, nullable=True)
+    computed_at = db.Column(db.DateTime, nullable=True)
+
+
+class ModelGeneration(db.Model):
+    """
+    Write counter per model (class name) behind the conditional-GET ETags (app/http_cache.py).
+
+    Bumped after every outermost commit that wrote to a tracked model, so a write that
+    doesn't move a fingerprinted column (count / max id / max stamp) still changes the
+    ETag — on every worker, since the counter lives here rather than in process memory.
+    """
+    __tablename__ = 'model_generations'
+    name = db.Column(db.String(64), primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+
+
 class ReleaseEvents(db.Model):
     '''Table to track events for releases.'''
     __tablename__ = 'release_events'
@@ -714,11 +776,15 @@ class TrelloOutbox(db.Model):
     action = db.Column(db.String(50), nullable=False)  # 'move_card', 'update_card', etc.
     
     # Retry tracking
-    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, processing, completed, failed
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, processing, completed, failed, superseded
     retry_count = db.Column(db.Integer, default=0)
     max_retries = db.Column(db.Integer, default=5)
     next_retry_at = db.Column(db.DateTime, nullable=True)
     error_message = db.Column(db.Text, nullable=True)
+
+    # Set on a 'superseded' row: the later item for the same card that delivers its
+    # change together with its own (its event is closed when that item completes)
+    superseded_by_id = db.Column(db.Integer, db.ForeignKey('trello_outbox.id'), nullable=True, index=True)
     
     # Timestamps
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -727,6 +793,80 @@ class TrelloOutbox(db.Model):
     # Relationship
     event = db.relationship('ReleaseEvents', backref='trello_outbox_items')
 
+    __table_args__ = (
+        db.Index("idx_trello_outbox_status_next_retry", "status", "next_retry_at"),  # dispatcher claim scan
+    )
+
+
+class TrelloInboundEvent(db.Model):
+    """Durable queue of parsed Trello webhook events, drained by app/trello/inbound_queue.py."""
+    __tablename__ = "trello_inbound_events"
+    id = db.Column(db.Integer, primary_key=True)
+    action_id = db.Column(db.String(64), nullable=True, unique=True)  # Trello action id; redeliveries collide
+    card_id = db.Column(db.String(64), nullable=True)
+    payload = db.Column(db.JSON, nullable=False)  # parse_webhook_data() output
+
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, processing, completed, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    available_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # not claimable before this
+    claimed_by = db.Column(db.String(64), nullable=True)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("idx_trello_inbound_status_available", "status", "available_at"),  # claim scan
+        db.Index("idx_trello_inbound_card_status", "card_id", "status"),  # per-card ordering check
+    )
+
+
+class TrelloScanState(db.Model):
+    """
+    Single-row (id=1) state of the incremental Trello<->DB scanner (app/trello/scanner.py).
+
+    activity_watermark is the newest board action already folded in; db_watermark /
+    last_release_id bound the Releases rows already compared. cards is the board as of
+    the last scan ({card_id: {id, name, identifier, list_id, list_name, hash}}) and
+    report the standing mismatch report ({"in_both" | "db_only" | "trello_only" |
+    "list_mismatches": {identifier: entry}, "last_run": {mode, counts}}).
+    """
+    __tablename__ = "trello_scan_state"
+    id = db.Column(db.Integer, primary_key=True)
+    activity_watermark = db.Column(db.DateTime, nullable=True)
+    db_watermark = db.Column(db.DateTime, nullable=True)
+    last_release_id = db.Column(db.Integer, nullable=True)
+    cards = db.Column(db.JSON, nullable=True)
+    report = db.Column(db.JSON, nullable=True)
+    last_scan_at = db.Column(db.DateTime, nullable=True)
+    last_scan_mode = db.Column(db.String(20), nullable=True)  # full | incremental
+    last_full_scan_at = db.Column(db.DateTime, nullable=True)
+
+
+class TrelloCardBuild(db.Model):
+    """
+    Per-release checkpoint of a bulk card creation (app/trello/card_pipeline.py).
+
+    card_id is saved as soon as Trello returns it and steps lists the post-creation
+    steps already applied (card_creation.POST_CREATION_STEPS), each committed as it
+    finishes, so a run that died part-way resumes at the first missing step instead
+    of posting a second card, comment or link.
+    """
+    __tablename__ = "trello_card_builds"
+    id = db.Column(db.Integer, primary_key=True)
+    release_id = db.Column(db.Integer, db.ForeignKey("releases.id"), nullable=False, unique=True)
+    run_id = db.Column(db.String(64), nullable=True, index=True)
+    list_id = db.Column(db.String(64), nullable=True)
+    list_name = db.Column(db.String(128), nullable=True)
+    card_id = db.Column(db.String(64), nullable=True)
+    steps = db.Column(db.JSON, nullable=True)
+    status = db.Column(db.String(20), nullable=False, default="pending", index=True)  # pending | done | failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 
 class ProcoreOutbox(db.Model):
     """Outbox table for Procore API calls (e.g. submittal status update) with retry capabilities."""
@@ -749,6 +889,10 @@ class ProcoreOutbox(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     completed_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        db.Index("idx_procore_outbox_status_next_retry", "status", "next_retry_at"),  # dispatcher claim scan
+    )
+
 class WebhookReceipt(db.Model):
     """
     Deduplication log for incoming Procore webhook deliveries.
@@ -769,6 +913,31 @@ class WebhookReceipt(db.Model):
     received_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
 
 
+class ProcoreInboundEvent(db.Model):
+    """Durable queue of accepted Procore submittal webhooks, drained by app/procore/inbound_queue.py."""
+    __tablename__ = "procore_inbound_events"
+    id = db.Column(db.Integer, primary_key=True)
+    submittal_id = db.Column(db.String(255), nullable=False)  # Procore resource_id
+    project_id = db.Column(db.Integer, nullable=False)
+    event_type = db.Column(db.String(32), nullable=False)  # create, update
+    payload = db.Column(db.JSON, nullable=False)  # raw webhook body
+
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, processing, completed, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    available_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # not claimable before this
+    claimed_by = db.Column(db.String(64), nullable=True)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("idx_procore_inbound_status_available", "status", "available_at"),  # claim scan
+        db.Index("idx_procore_inbound_submittal_status", "submittal_id", "status"),  # per-submittal ordering check
+    )
+
+
 class SubmittalReconcile(db.Model):
     """
     Delayed reconcile queue for Procore submittals — the safety net for burst-dedup
@@ -1,34 +1,47 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Register the Procore blueprint and expose the webhook endpoint that receives submittal create/update events from Procore.
+purpose: Register the Procore blueprint and expose the webhook endpoint that accepts submittal create/update events from Procore into a durable queue, plus the pool that drains it.
 exports:
-  procore_bp: Flask blueprint handling Procore webhook ingestion, health scans, and admin PIN verification.
-imports_from: [flask, app.models, app.procore.procore, app.procore.helpers, app.procore.client, app.logging_config, app.config, app.trello.context, app.trello.logging]
+  procore_bp: Flask blueprint handling Procore webhook ingestion, inbound queue + dedup + read-cache stats, health scans, and admin PIN verification.
+  process_webhook_event: Apply one accepted submittal webhook (create, or diff-and-log update)
+  drain_procore_queue: Claims one batch from procore_inbound_events and runs it on the pool (inbound worker loop + APScheduler safety net)
+  ensure_procore_inbound_worker: Starts / wakes this process's continuous inbound drain thread (no-op under TESTING)
+imports_from: [flask, app.models, app.procore.procore, app.procore.helpers, app.procore.inbound_queue, app.procore.response_cache, app.procore.client, app.logging_config, app.config, app.trello.context, app.trello.logging, concurrent.futures]
 imported_by: [app/__init__.py]
 invariants:
-  - Burst dedup via is_duplicate_webhook() rejects repeated Procore deliveries within a 15-second window.
+  - The webhook makes no Procore API call: it validates, schedules the reconcile, runs burst dedup and commits the delivery to procore_inbound_events before answering 202.
+  - Reconcile scheduling still happens before the dedup check, so every create/update delivery (deduplicated or not) gets its reconcile row.
+  - Burst dedup via is_duplicate_webhook() rejects repeated Procore deliveries within a 15-second window; only the first delivery is queued.
+  - A full backlog (PROCORE_INBOUND_MAX_DEPTH) answers 429 before the dedup receipt is written, so Procore's redelivery is accepted.
+  - A create/update delivery drops the submittal's cached Procore reads on receipt, and again in the process that applies it.
   - Connector-originated webhooks (PROCORE_CONNECTOR_USER_ID) are still processed to catch Procore side-effect diffs.
   - Update events for missing submittals fall back to create_submittal_from_webhook to handle race conditions.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - process_webhook_event raises whenever the delivery was not applied (create error, unreadable submittal, missing record, failed update), so the queue retries it instead of marking it completed.
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 # Package
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
-from flask import Blueprint, request, jsonify
-from app.models import db, Submittals
+from flask import Blueprint, current_app, request, jsonify
+from app.models import db, in_memory_database, Submittals
 
 from app.procore.procore import (
     get_project_id_by_project_name,
     check_and_update_submittal,
     create_submittal_from_webhook,
     comprehensive_health_scan,
+    SubmittalApplyError,
 )
 
-from app.procore.helpers import resolve_webhook_user_ids, is_duplicate_webhook, create_submittal_event as _create_submittal_event_helper
+from app.procore.helpers import resolve_webhook_user_ids, is_duplicate_webhook, webhook_dedup_stats, create_submittal_event as _create_submittal_event_helper
 from app.procore.reconcile import ProcoreReconcileService
+from app.procore import inbound_queue
+from app.procore.response_cache import invalidate_submittal, response_cache_stats
 
 from app.logging_config import get_logger
 from app.config import Config as cfg
@@ -39,12 +52,20 @@ logger = get_logger(__name__)
 
 procore_bp = Blueprint("procore", __name__)
 
+# Inbound webhook drain for this process: a pool of PROCORE_INBOUND_WORKERS threads fed
+# by one worker thread (started lazily, never under TESTING).
+_POOL_SIZE = max(1, cfg.PROCORE_INBOUND_WORKERS)
+executor = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="procore-inbound-")
+_inbound_worker = None
+_inbound_worker_lock = threading.Lock()
+
 
 @procore_bp.route("/webhook", methods=["HEAD", "POST"])
 def procore_webhook():
     """
     Procore webhook endpoint to receive Submittals create and update events.
-    Handles both 'create' and 'update' event types:
+    Accepted 'create' and 'update' deliveries are queued (202) and applied by
+    process_webhook_event on the inbound worker:
     - 'create': Creates a new submittal record in the database
     - 'update': Updates existing submittal record (ball_in_court, status, etc.)
     """
@@ -128,6 +149,19 @@ def procore_webhook():
         # dedup or not yet propagated by Procore. Coalescing keeps a burst to one row.
         if event_type in ("create", "update"):
             ProcoreReconcileService.schedule(resource_id, project_id)
+            # Procore says this submittal changed: this process's cached reads of it are stale.
+            invalidate_submittal(resource_id)
+
+        # Backlog full: answer 429 before the dedup receipt is written, so Procore's
+        # redelivery is not mistaken for a burst duplicate. The reconcile above still runs.
+        if event_type in ("create", "update") and inbound_queue.is_full():
+            logger.warning(
+                "procore_queue_full",
+                submittal_id=resource_id,
+                project_id=project_id,
+                event_type=event_type,
+            )
+            return jsonify({"status": "overloaded"}), 429
 
         # Burst dedup: Procore sends 2-5 identical deliveries within ~7 seconds per update.
         # Write a receipt row for the first delivery in the 15s window; reject the rest.
@@ -140,255 +174,336 @@ def procore_webhook():
             )
             return jsonify({"status": "deduplicated"}), 200
 
-        # Connector detection: if the webhook was triggered by the connector service account,
-        # it's a bounce-back from our own Procore API call. We still process it to catch
-        # Procore side-effect changes (e.g. auto-ball_in_court on status→Closed).
-        # source stays 'Procore' — external_user_id='14554506' on the event identifies it
-        # as connector-triggered for UI filtering.
-        is_connector = (
-            external_user_id is not None
-            and str(external_user_id) == str(cfg.PROCORE_CONNECTOR_USER_ID)
+        if event_type not in ("create", "update"):
+            logger.warning(
+                "procore_webhook_unhandled_event_type",
+                event_type=event_type,
+                submittal_id=resource_id,
+                project_id=project_id,
+            )
+            return jsonify({"status": "ignored"}), 200
+
+        # Persist and answer; the create/update (and its Procore API calls) runs on the
+        # inbound worker pool, in arrival order per submittal.
+        event_id = inbound_queue.enqueue(resource_id, project_id, event_type, payload)
+        ensure_procore_inbound_worker(current_app._get_current_object())
+        logger.debug(
+            "procore_webhook_enqueued",
+            event_id=event_id,
+            submittal_id=resource_id,
+            project_id=project_id,
+            event_type=event_type,
         )
-        if is_connector:
-            logger.debug(
-                "procore_webhook_connector_detected",
-                external_user_id=external_user_id,
+        return jsonify({"status": "queued", "event_id": event_id}), 202
+
+
+def process_webhook_event(resource_id: int, project_id: int, event_type: str, payload: dict) -> None:
+    """
+    Apply one accepted submittal webhook: create the submittal, or diff it against
+    Procore and record what changed. Runs on the inbound worker; raises on failure
+    so the queue retries the delivery.
+    """
+    external_user_id, _ = resolve_webhook_user_ids(payload)
+    # The delivery may have been received by another process; drop this one's cached reads too.
+    invalidate_submittal(resource_id)
+
+    # Connector detection: if the webhook was triggered by the connector service account,
+    # it's a bounce-back from our own Procore API call. We still process it to catch
+    # Procore side-effect changes (e.g. auto-ball_in_court on status→Closed).
+    # source stays 'Procore' — external_user_id='14554506' on the event identifies it
+    # as connector-triggered for UI filtering.
+    is_connector = (
+        external_user_id is not None
+        and str(external_user_id) == str(cfg.PROCORE_CONNECTOR_USER_ID)
+    )
+    if is_connector:
+        logger.debug(
+            "procore_webhook_connector_detected",
+            external_user_id=external_user_id,
+            submittal_id=resource_id,
+            project_id=project_id,
+        )
+
+    if event_type == "create":
+        logger.debug(
+            "procore_webhook_create_processing",
+            submittal_id=resource_id,
+            project_id=project_id,
+        )
+        created, record, error_msg = create_submittal_from_webhook(project_id, resource_id, webhook_payload=payload, source='Procore')
+
+        if created and record:
+            with sync_operation_context(
+                operation_type="procore_submittal_create",
+                source_system="procore",
+                source_id=str(resource_id)
+            ) as sync_op:
+                if sync_op:
+                    safe_log_sync_event(
+                        sync_op.operation_id,
+                        "INFO",
+                        "Submittal created via webhook",
+                        submittal_id=resource_id,
+                        project_id=project_id,
+                        submittal_title=record.title if record else None,
+                        project_name=record.project_name if record else None
+                    )
+            logger.info(
+                "submittal_created",
                 submittal_id=resource_id,
                 project_id=project_id,
+                source="procore_webhook",
             )
+        elif error_msg:
+            raise SubmittalApplyError(f"Submittal create failed: {error_msg}")
+        elif record:
+            logger.info(
+                "submittal_create_skipped",
+                submittal_id=resource_id,
+                project_id=project_id,
+                status="skipped",
+                reason="already_exists",
+            )
+        else:
+            # created=False, record=None, error_msg=None should not happen; retry it.
+            raise SubmittalApplyError("Submittal create returned no record and no error")
 
-        # Process submittal create or update
-        try:
-            if event_type == "create":
-                logger.debug(
-                    "procore_webhook_create_processing",
+    # Handle update events - update existing submittal
+    elif event_type == "update":
+        # Check if record exists first
+        old_record = Submittals.query.filter_by(submittal_id=str(resource_id)).first()
+
+        # If record doesn't exist, try to create it (fallback for race conditions)
+        # This handles the case where update events arrive before create events
+        if not old_record:
+            logger.warning(
+                "submittal_update_record_missing",
+                submittal_id=resource_id,
+                project_id=project_id,
+            )
+            created, new_record, create_error = create_submittal_from_webhook(project_id, resource_id, webhook_payload=payload, source='Procore')
+            if created and new_record:
+                logger.info(
+                    "submittal_created",
                     submittal_id=resource_id,
                     project_id=project_id,
+                    source="procore_webhook",
+                    fallback=True,
                 )
-                try:
-                    created, record, error_msg = create_submittal_from_webhook(project_id, resource_id, webhook_payload=payload, source='Procore')
-                    
-                    if created and record:
-                        with sync_operation_context(
-                            operation_type="procore_submittal_create",
-                            source_system="procore",
-                            source_id=str(resource_id)
-                        ) as sync_op:
-                            if sync_op:
-                                safe_log_sync_event(
-                                    sync_op.operation_id,
-                                    "INFO",
-                                    "Submittal created via webhook",
-                                    submittal_id=resource_id,
-                                    project_id=project_id,
-                                    submittal_title=record.title if record else None,
-                                    project_name=record.project_name if record else None
-                                )
-                        logger.info(
-                            "submittal_created",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            source="procore_webhook",
-                        )
-                    elif error_msg:
-                        logger.error(
-                            "submittal_create_failed",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            error=error_msg,
-                            exc_info=True,
-                        )
-                    elif record:
-                        logger.info(
-                            "submittal_create_skipped",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            status="skipped",
-                            reason="already_exists",
-                        )
-                    else:
-                        # This case: created=False, record=None, error_msg=None
-                        # Should not happen, but log it
-                        logger.warning(
-                            "submittal_create_unexpected_state",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            created=created,
-                            record_exists=record is not None,
-                            error=error_msg,
-                        )
-                except Exception as create_exception:
-                    logger.error(
-                        "submittal_create_failed",
+                old_record = new_record
+            elif new_record:  # Record exists but wasn't newly created (already existed)
+                logger.info(
+                    "submittal_create_skipped",
+                    submittal_id=resource_id,
+                    project_id=project_id,
+                    status="skipped",
+                    reason="created_by_concurrent_process",
+                )
+                old_record = new_record
+            elif create_error:
+                logger.error(
+                    "submittal_create_failed",
+                    submittal_id=resource_id,
+                    project_id=project_id,
+                    error=create_error,
+                    fallback=True,
+                    exc_info=True,
+                )
+
+        old_ball_in_court = old_record.ball_in_court if old_record else None
+        old_status = old_record.status if old_record else None
+        old_title = old_record.title if old_record else None
+        old_manager = old_record.submittal_manager if old_record else None
+
+        ball_updated, status_updated, title_updated, manager_updated, record, ball_in_court, status = check_and_update_submittal(
+            project_id,
+            resource_id,
+            webhook_payload=payload,
+            source='Procore',
+            raise_errors=True,
+        )
+
+        # Log ball_in_court changes
+        if ball_updated:
+            with sync_operation_context(
+                operation_type="procore_ball_in_court",
+                source_system="procore",
+                source_id=str(resource_id)
+            ) as sync_op:
+                if sync_op:
+                    safe_log_sync_event(
+                        sync_op.operation_id,
+                        "INFO",
+                        "Ball in court updated via webhook",
                         submittal_id=resource_id,
                         project_id=project_id,
-                        error=str(create_exception),
-                        error_type=type(create_exception).__name__,
-                        exc_info=True,
+                        old_value=old_ball_in_court,
+                        new_value=ball_in_court,
+                        submittal_title=record.title if record else None,
+                        project_name=record.project_name if record else None
                     )
-            
-            # Handle update events - update existing submittal
-            elif event_type == "update":
-                # Check if record exists first
-                old_record = Submittals.query.filter_by(submittal_id=str(resource_id)).first()
-                
-                # If record doesn't exist, try to create it (fallback for race conditions)
-                # This handles the case where update events arrive before create events
-                if not old_record:
-                    logger.warning(
-                        "submittal_update_record_missing",
+
+        # Log status changes
+        if status_updated:
+            with sync_operation_context(
+                operation_type="procore_submittal_status",
+                source_system="procore",
+                source_id=str(resource_id)
+            ) as sync_op:
+                if sync_op:
+                    safe_log_sync_event(
+                        sync_op.operation_id,
+                        "INFO",
+                        "Submittal status updated via webhook",
                         submittal_id=resource_id,
                         project_id=project_id,
+                        old_value=old_status,
+                        new_value=status,
+                        submittal_title=record.title if record else None,
+                        project_name=record.project_name if record else None
                     )
-                    created, new_record, create_error = create_submittal_from_webhook(project_id, resource_id, webhook_payload=payload, source='Procore')
-                    if created and new_record:
-                        logger.info(
-                            "submittal_created",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            source="procore_webhook",
-                            fallback=True,
-                        )
-                        old_record = new_record
-                    elif new_record:  # Record exists but wasn't newly created (already existed)
-                        logger.info(
-                            "submittal_create_skipped",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            status="skipped",
-                            reason="created_by_concurrent_process",
-                        )
-                        old_record = new_record
-                    elif create_error:
-                        logger.error(
-                            "submittal_create_failed",
-                            submittal_id=resource_id,
-                            project_id=project_id,
-                            error=create_error,
-                            fallback=True,
-                            exc_info=True,
-                        )
-                
-                old_ball_in_court = old_record.ball_in_court if old_record else None
-                old_status = old_record.status if old_record else None
-                old_title = old_record.title if old_record else None
-                old_manager = old_record.submittal_manager if old_record else None
-                
-                ball_updated, status_updated, title_updated, manager_updated, record, ball_in_court, status = check_and_update_submittal(
-                    project_id,
-                    resource_id,
-                    webhook_payload=payload,
-                    source='Procore',
-                )
-                
-                # Log ball_in_court changes
-                if ball_updated:
-                    with sync_operation_context(
-                        operation_type="procore_ball_in_court",
-                        source_system="procore",
-                        source_id=str(resource_id)
-                    ) as sync_op:
-                        if sync_op:
-                            safe_log_sync_event(
-                                sync_op.operation_id,
-                                "INFO",
-                                "Ball in court updated via webhook",
-                                submittal_id=resource_id,
-                                project_id=project_id,
-                                old_value=old_ball_in_court,
-                                new_value=ball_in_court,
-                                submittal_title=record.title if record else None,
-                                project_name=record.project_name if record else None
-                            )
-                
-                # Log status changes
-                if status_updated:
-                    with sync_operation_context(
-                        operation_type="procore_submittal_status",
-                        source_system="procore",
-                        source_id=str(resource_id)
-                    ) as sync_op:
-                        if sync_op:
-                            safe_log_sync_event(
-                                sync_op.operation_id,
-                                "INFO",
-                                "Submittal status updated via webhook",
-                                submittal_id=resource_id,
-                                project_id=project_id,
-                                old_value=old_status,
-                                new_value=status,
-                                submittal_title=record.title if record else None,
-                                project_name=record.project_name if record else None
-                            )
-                
-                # Log title changes
-                if title_updated:
-                    with sync_operation_context(
-                        operation_type="procore_submittal_title",
-                        source_system="procore",
-                        source_id=str(resource_id)
-                    ) as sync_op:
-                        if sync_op:
-                            safe_log_sync_event(
-                                sync_op.operation_id,
-                                "INFO",
-                                "Submittal title updated via webhook",
-                                submittal_id=resource_id,
-                                project_id=project_id,
-                                old_value=old_title,
-                                new_value=record.title if record else None,
-                                submittal_title=record.title if record else None,
-                                project_name=record.project_name if record else None
-                            )
-                
-                # Log submittal manager changes
-                if manager_updated:
-                    with sync_operation_context(
-                        operation_type="procore_submittal_manager",
-                        source_system="procore",
-                        source_id=str(resource_id)
-                    ) as sync_op:
-                        if sync_op:
-                            safe_log_sync_event(
-                                sync_op.operation_id,
-                                "INFO",
-                                "Submittal manager updated via webhook",
-                                submittal_id=resource_id,
-                                project_id=project_id,
-                                old_value=old_manager,
-                                new_value=record.submittal_manager if record else None,
-                                submittal_title=record.title if record else None,
-                                project_name=record.project_name if record else None
-                            )
-
-                # Log when webhook resulted in no updates (DB already in sync)
-                if not (ball_updated or status_updated or title_updated or manager_updated):
-                    logger.debug(
-                        "submittal_update_skipped",
+
+        # Log title changes
+        if title_updated:
+            with sync_operation_context(
+                operation_type="procore_submittal_title",
+                source_system="procore",
+                source_id=str(resource_id)
+            ) as sync_op:
+                if sync_op:
+                    safe_log_sync_event(
+                        sync_op.operation_id,
+                        "INFO",
+                        "Submittal title updated via webhook",
                         submittal_id=resource_id,
                         project_id=project_id,
-                        status="skipped",
-                        reason="no_changes",
-                        connector=is_connector,
+                        old_value=old_title,
+                        new_value=record.title if record else None,
+                        submittal_title=record.title if record else None,
+                        project_name=record.project_name if record else None
                     )
-            else:
-                logger.warning(
-                    "procore_webhook_unhandled_event_type",
-                    event_type=event_type,
-                    submittal_id=resource_id,
-                    project_id=project_id,
-                )
-        except Exception as e:
-            logger.error(
-                "procore_webhook_processing_failed",
+
+        # Log submittal manager changes
+        if manager_updated:
+            with sync_operation_context(
+                operation_type="procore_submittal_manager",
+                source_system="procore",
+                source_id=str(resource_id)
+            ) as sync_op:
+                if sync_op:
+                    safe_log_sync_event(
+                        sync_op.operation_id,
+                        "INFO",
+                        "Submittal manager updated via webhook",
+                        submittal_id=resource_id,
+                        project_id=project_id,
+                        old_value=old_manager,
+                        new_value=record.submittal_manager if record else None,
+                        submittal_title=record.title if record else None,
+                        project_name=record.project_name if record else None
+                    )
+
+        # Log when webhook resulted in no updates (DB already in sync)
+        if not (ball_updated or status_updated or title_updated or manager_updated):
+            logger.debug(
+                "submittal_update_skipped",
                 submittal_id=resource_id,
                 project_id=project_id,
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
+                status="skipped",
+                reason="no_changes",
+                connector=is_connector,
             )
+    else:
+        logger.warning(
+            "procore_webhook_unhandled_event_type",
+            event_type=event_type,
+            submittal_id=resource_id,
+            project_id=project_id,
+        )
+
+
+def ensure_procore_inbound_worker(app):
+    """Start (once per process) the thread that drains procore_inbound_events, and wake it."""
+    global _inbound_worker
+    if os.environ.get("TESTING") or app.config.get("TESTING"):
+        return None
+    with _inbound_worker_lock:
+        if _inbound_worker is None:
+            _inbound_worker = inbound_queue.ProcoreInboundWorker(app, drain_procore_queue)
+        _inbound_worker.start()
+    _inbound_worker.wake()
+    return _inbound_worker
+
+
+def drain_procore_queue(max_items: Optional[int] = None) -> int:
+    """
+    Claim one batch from procore_inbound_events, run it on the pool, record the outcomes.
+
+    Returns the number of deliveries claimed.
+    """
+    limit = min(max_items or cfg.PROCORE_INBOUND_BATCH_SIZE, _POOL_SIZE)
+    events = inbound_queue.claim_batch(limit)
+    if not events:
+        return 0
+
+    # Each claimed delivery is a different submittal (per-submittal order is kept by
+    # the claim), so the batch can run side by side.
+    if len(events) == 1 or in_memory_database():
+        outcomes = [_run_event(evt) for evt in events]
+    else:
+        app = current_app._get_current_object()
+        futures = [executor.submit(_run_event_in_app, app, evt) for evt in events]
+        outcomes = [future.result() for future in futures]
+
+    completed, failed = [], []
+    for evt, error in zip(events, outcomes):
+        if error is None:
+            completed.append(evt)
+        else:
+            failed.append((evt, error))
+    inbound_queue.finish_batch(completed=completed, failed=failed)
+    logger.debug("procore_inbound_batch_drained", claimed=len(events),
+                 completed=len(completed), failed=len(failed), source="procore")
+    return len(events)
+
+
+def _run_event_in_app(app, evt) -> Optional[str]:
+    with app.app_context():
+        try:
+            return _run_event(evt)
+        finally:
+            db.session.remove()
+
+
+def _run_event(evt) -> Optional[str]:
+    """Process one claimed delivery; returns None on success, else the error message."""
+    try:
+        process_webhook_event(int(evt["submittal_id"]), evt["project_id"], evt["event_type"], evt["payload"])
+        return None
+    except Exception as e:
+        db.session.rollback()
+        logger.error(
+            "procore_webhook_processing_failed",
+            submittal_id=evt["submittal_id"],
+            project_id=evt["project_id"],
+            event_id=evt["id"],
+            attempts=evt["attempts"] + 1,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        return f"{type(e).__name__}: {e}"
+
+
+@procore_bp.route("/api/webhook/queue-stats", methods=["GET"])
+def webhook_queue_stats():
+    """Inbound webhook queue depth, lag and throughput, plus burst-dedup and read-cache counters, for this process."""
+    stats = inbound_queue.queue_metrics()
+    stats["worker_alive"] = bool(_inbound_worker and _inbound_worker.is_alive())
+    stats["dedup"] = webhook_dedup_stats()
+    stats["response_cache"] = response_cache_stats()
+    return jsonify(stats)
 
-        return jsonify({"status": "processed"}), 200
 
 @procore_bp.route("/api/webhook/deliveries", methods=["GET"])
 def webhook_deliveries():
@@ -1,32 +1,92 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Provide a typed HTTP client for the Procore REST API with retry logic, token refresh, and pagination.
+purpose: Provide a typed HTTP client for the Procore REST API with retry logic, token refresh, a shared rate-limit budget, parallel pagination and cached submittal / project reads.
 exports:
   ProcoreAPI: Session-based Procore API client with methods for users, projects, submittals, and webhooks.
+  procore_rate_budget: This process's TokenBucket (its share of the token's budget) every Procore call takes a token from.
+  pause_for_rate_limit: Hold every Procore caller after a 429 (Retry-After / X-Rate-Limit-Reset).
   SUBMITTAL_STATUSES: Coded mapping of company submittal status IDs to names.
   VALID_SUBMITTAL_STATUS_IDS: Set of allowed submittal status IDs for validation.
   SUBMITTAL_STATUS_ID_TO_NAME: Dict mapping status ID to human-readable name.
-imports_from: [requests, app.config, app.procore.procore_auth, app.logging_config]
-imported_by: [app/procore/client.py, app/brain/drafting_work_load/routes.py]
+imports_from: [requests, app.config, app.procore.fetch, app.procore.procore_auth, app.procore.response_cache, app.rate_limit, app.logging_config]
+imported_by: [app/procore/client.py, app/procore/procore.py, app/procore/fetch.py, app/brain/drafting_work_load/routes.py]
 invariants:
-  - Connection errors retry up to 3 times with exponential backoff; HTTP 4xx/5xx errors do not retry.
+  - Connection errors retry up to 3 times with exponential backoff; HTTP 4xx/5xx errors do not retry, except 429, which pauses the shared budget and retries.
   - A 401 response triggers a single forced token refresh before re-attempting the request.
+  - Every request takes a token from procore_rate_budget(), shared by every thread in the process. Procore's limit is per token, so each process gets PROCORE_RATE_LIMIT_PER_HOUR / PROCORE_RATE_LIMIT_PROCESSES (burst likewise divided).
+  - The Authorization header is sent per request, never stored on the shared session, so concurrent callers cannot race a token refresh.
+  - get_submittal_by_id and get_projects read through app.procore.response_cache (tagged by submittal / the project list); update_submittal_status drops the submittal's cached reads.
+  - get_submittals reads page 1, then fetches the remaining pages (known from `total`) side by side through fetch.fan_out and returns them in page order; any page error is raised.
   - update_submittal_status validates status_id against VALID_SUBMITTAL_STATUS_IDS before calling the API.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+updated_by_agent: 2026-10-16T00:00:00Z
 """
+import threading
 import time
 import requests
 from typing import Optional, Dict, List
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, RequestException
 from urllib3.exceptions import ProtocolError
 
 from app.config import Config as cfg
+from app.procore.fetch import fan_out
 from app.procore.procore_auth import get_access_token, get_access_token_force_refresh
+from app.procore.response_cache import PROJECTS_TAG, cache_key, cached_get, invalidate_submittal, submittal_tag
+from app.rate_limit import TokenBucket
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Longest a 429 may hold every Procore caller (Procore's budget window is an hour).
+MAX_RATE_LIMIT_PAUSE_SECONDS = 300.0
+
+_budget = None
+_budget_lock = threading.Lock()
+
+
+def procore_rate_budget() -> TokenBucket:
+    """
+    This process's token bucket for Procore calls, created on first use.
+
+    Procore counts requests per OAuth token, which every process shares, so the
+    bucket holds this process's share: the hourly limit and burst divided by
+    PROCORE_RATE_LIMIT_PROCESSES.
+    """
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            processes = max(1, cfg.PROCORE_RATE_LIMIT_PROCESSES)
+            _budget = TokenBucket(
+                max(1, cfg.PROCORE_RATE_LIMIT_BURST // processes),
+                max(1, cfg.PROCORE_RATE_LIMIT_PER_HOUR) / 3600.0 / processes,
+            )
+        return _budget
+
+
+def pause_for_rate_limit(response, attempt: int = 0) -> float:
+    """Pause the shared budget after a 429 and return the seconds paused."""
+    delay = None
+    retry_after = response.headers.get("Retry-After")
+    reset = response.headers.get("X-Rate-Limit-Reset")
+    try:
+        if retry_after:
+            delay = float(retry_after)
+        elif reset:
+            delay = float(reset) - time.time()
+    except ValueError:
+        delay = None
+    if delay is None or delay <= 0:
+        delay = 2.0 ** attempt
+    delay = min(delay, MAX_RATE_LIMIT_PAUSE_SECONDS)
+    procore_rate_budget().pause(delay)
+    logger.warning("procore_rate_limited", pause_seconds=round(delay, 1), attempt=attempt + 1)
+    return delay
+
+def _json_body(response):
+    return response.json() if response.text else None
+
+
 # Coded mapping of company submittal statuses (id -> name). Update when company adds new statuses.
 SUBMITTAL_STATUSES = [
     {"id": 203239, "name": "Closed", "status": "Closed", "is_default": True},
@@ -59,20 +119,19 @@ class ProcoreAPI:
         self.client_id = client_id
         self.client_secret = client_secret
         self.webhook_url = webhook_url
-        self.session = requests.Session()
 
         if not all([self.client_id, self.client_secret, self.webhook_url]):
             raise ValueError("Missing Procore configuration")
 
-        # Reusable HTTP session
+        # Reusable HTTP session, pooled wide enough for the concurrent fetch layer
         self.session = requests.Session()
+        pool_size = max(10, cfg.PROCORE_FETCH_WORKERS)
+        self.session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
 
-    def _update_auth_header(self):
-        """Adds the Authorization header to the session"""
-        token = get_access_token()
-        self.session.headers.update(
-            {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-        )
+    def _auth_headers(self, force_refresh: bool = False) -> Dict[str, str]:
+        """Authorization headers for one request (never stored on the shared session)."""
+        token = get_access_token_force_refresh() if force_refresh else get_access_token()
+        return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
     def _request(
         self,
@@ -80,6 +139,8 @@ class ProcoreAPI:
         endpoint: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        cache_tags: Optional[tuple] = None,
+        cache_ttl: Optional[float] = None,
         **kwargs,
     ):
         """
@@ -90,15 +151,41 @@ class ProcoreAPI:
             endpoint: API endpoint
             max_retries: Maximum number of retries for connection errors
             retry_delay: Initial delay between retries (exponential backoff)
+            cache_tags: For a GET, serve it through the response cache under these
+                invalidation tags (None = always go to Procore)
+            cache_ttl: Override PROCORE_RESPONSE_CACHE_TTL_SECONDS for this read
             **kwargs: Additional arguments for requests
         """
-        self._update_auth_header()
+        if method == "GET" and cache_tags is not None:
+            def send(validators):
+                headers = {**kwargs.get("headers", {}), **validators}
+                return self._send(method, endpoint, max_retries, retry_delay, **{**kwargs, "headers": headers})
+
+            return cached_get(
+                cache_key(endpoint, kwargs.get("params")),
+                send,
+                _json_body,
+                tags=cache_tags,
+                ttl=cache_ttl,
+            )
+        return _json_body(self._send(method, endpoint, max_retries, retry_delay, **kwargs))
+
+    def _send(self, method: str, endpoint: str, max_retries: int = 3, retry_delay: float = 1.0, **kwargs):
+        """Send one request (budget, 429 pause, 401 refresh, connection retries) and return the response."""
+        headers = {**self._auth_headers(), **kwargs.pop("headers", {})}
         url = f"{self.BASE_URL}{endpoint}"
+        budget = procore_rate_budget()
 
         last_exception = None
         for attempt in range(max_retries):
             try:
-                r = self.session.request(method, url, timeout=30, **kwargs)
+                budget.acquire()
+                r = self.session.request(method, url, headers=headers, timeout=30, **kwargs)
+
+                if r.status_code == 429 and attempt < max_retries - 1:
+                    # Procore rejected it unprocessed; hold every caller, then retry.
+                    pause_for_rate_limit(r, attempt)
+                    continue
 
                 # Handle 400 errors
                 if r.status_code == 400:
@@ -106,12 +193,12 @@ class ProcoreAPI:
 
                 if r.status_code == 401:
                     # Token expired or invalid, force refresh once
-                    get_access_token_force_refresh()
-                    self._update_auth_header()
-                    r = self.session.request(method, url, timeout=30, **kwargs)
+                    headers.update(self._auth_headers(force_refresh=True))
+                    budget.acquire()
+                    r = self.session.request(method, url, headers=headers, timeout=30, **kwargs)
 
                 r.raise_for_status()
-                return r.json() if r.text else None
+                return r
 
             except (ConnectionError, ProtocolError, Timeout) as e:
                 # Connection errors - retry with exponential backoff
@@ -136,10 +223,18 @@ class ProcoreAPI:
         if last_exception:
             raise last_exception
 
-    def _get(self, endpoint: str, params: Optional[Dict] = None):
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        cache_tags: Optional[tuple] = None,
+        cache_ttl: Optional[float] = None,
+    ):
         # Ensure params defaults to empty dict to avoid AttributeError when calling update
         if params is None:
             params = {}
+        if cache_tags is not None:
+            return self._request("GET", endpoint, params=params, cache_tags=cache_tags, cache_ttl=cache_ttl)
         return self._request("GET", endpoint, params=params)
 
     def _post(self, endpoint: str, data: Dict):
@@ -166,68 +261,87 @@ class ProcoreAPI:
     # Projects
     # -------------------------
     def get_projects(self, company_id: int) -> List[Dict]:
-        projects = self._get(f"/rest/v1.1/projects?company_id={company_id}")
+        projects = self._get(
+            f"/rest/v1.1/projects?company_id={company_id}",
+            cache_tags=(PROJECTS_TAG,),
+            cache_ttl=cfg.PROCORE_PROJECTS_CACHE_TTL_SECONDS,
+        )
         return projects
 
     # -------------------------
     # Submittals
     # -------------------------
-    def get_submittals(self, project_id: int) -> List[Dict]:
+    def get_submittals(self, project_id: int, workers: Optional[int] = None) -> List[Dict]:
         """
         Get all submittals for a project with pagination support.
         The v2.0 API returns paginated responses in the format:
         {"data": [...], "total": N, "per_page": M, "page": P}
+
+        Page 1 carries `total`; the remaining pages are then fetched side by side
+        on up to `workers` threads (default PROCORE_FETCH_WORKERS) and joined in
+        page order. A short page before the expected last one ends the list there.
         """
-        all_submittals = []
-        page = 1
         per_page = 100  # Max items per page
+        endpoint = f"/rest/v2.0/companies/{cfg.PROD_PROCORE_COMPANY_ID}/projects/{project_id}/submittals"
+        response = self._get(endpoint, params={"per_page": per_page, "page": 1})
+
+        # Handle v2.0 API response format
+        if isinstance(response, list):
+            # Direct list response (shouldn't happen with v2.0, but handle it)
+            return list(response)
+        if not isinstance(response, dict):
+            # Unexpected response type
+            logger.error(
+                "submittals_response_unexpected_type",
+                project_id=project_id,
+                response_type=type(response).__name__,
+            )
+            return []
+        if "data" not in response:
+            # Unexpected dict format, log and return empty list
+            logger.error(
+                "submittals_response_unexpected_format",
+                project_id=project_id,
+                response_keys=sorted(response.keys()),
+            )
+            return []
 
-        while True:
-            endpoint = f"/rest/v2.0/companies/{cfg.PROD_PROCORE_COMPANY_ID}/projects/{project_id}/submittals"
-            params = {"per_page": per_page, "page": page}
-            response = self._get(endpoint, params=params)
+        all_submittals = list(response["data"] or [])
+        total = response.get("total", 0) or 0
+        if len(all_submittals) >= total or len(all_submittals) < per_page:
+            return all_submittals
 
-            # Handle v2.0 API response format
-            if isinstance(response, dict):
-                # Check if it's the paginated format with "data" key
-                if "data" in response:
-                    page_submittals = response["data"] if response["data"] else []
-                    all_submittals.extend(page_submittals)
+        last_page = -(-total // per_page)
+        pages = list(range(2, last_page + 1))
 
-                    # Check if there are more pages
-                    total = response.get("total", 0)
-                    current_count = len(all_submittals)
+        def fetch(page):
+            page_response = self._get(endpoint, params={"per_page": per_page, "page": page})
+            if isinstance(page_response, dict):
+                return page_response.get("data") or []
+            return []
 
-                    if current_count >= total or len(page_submittals) < per_page:
-                        # We've fetched all submittals
-                        break
+        results = fan_out(fetch, pages, workers=workers, thread_name_prefix="procore-page-")
+        for _, error in results:
+            if error is not None:
+                raise error
 
-                    page += 1
-                else:
-                    # Unexpected dict format, log and return empty list
-                    logger.error(
-                        "submittals_response_unexpected_format",
-                        project_id=project_id,
-                        response_keys=sorted(response.keys()),
-                    )
-                    return []
-            elif isinstance(response, list):
-                # Direct list response (shouldn't happen with v2.0, but handle it)
-                all_submittals.extend(response)
+        for page_submittals, _ in results:
+            all_submittals.extend(page_submittals)
+            if len(page_submittals) < per_page:
                 break
-            else:
-                # Unexpected response type
-                logger.error(
-                    "submittals_response_unexpected_type",
-                    project_id=project_id,
-                    response_type=type(response).__name__,
-                )
-                return []
-
+        logger.debug(
+            "submittals_pages_fetched",
+            project_id=project_id,
+            pages=last_page,
+            count=len(all_submittals),
+        )
         return all_submittals
 
     def get_submittal_by_id(self, project_id: int, submittal_id: int) -> Dict:
-        return self._get(f"/rest/v1.1/projects/{project_id}/submittals/{submittal_id}")
+        return self._get(
+            f"/rest/v1.1/projects/{project_id}/submittals/{submittal_id}",
+            cache_tags=(submittal_tag(submittal_id),),
+        )
 
     def get_sub_filters_by_project_id(self, project_id: int) -> List[Dict]:
         return self._get(
@@ -256,10 +370,13 @@ class ProcoreAPI:
             raise ValueError(
                 f"Invalid status_id {status_id}; must be one of {sorted(VALID_SUBMITTAL_STATUS_IDS)}"
             )
-        return self._patch(
-            f"/rest/v1.1/projects/{project_id}/submittals/{submittal_id}",
-            {"status_id": status_id},
-        )
+        try:
+            return self._patch(
+                f"/rest/v1.1/projects/{project_id}/submittals/{submittal_id}",
+                {"status_id": status_id},
+            )
+        finally:
+            invalidate_submittal(submittal_id)
 
     # -------------------------
     # Webhooks
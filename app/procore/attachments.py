@@ -10,6 +10,8 @@ Feasibility findings (2026-07-10, scripts/procore_attachment_probe.py) drive the
     is ready. We then GET that URL for the bytes.
   - Our ProcoreAPI session client does NOT send the Procore-Company-Id header, so this module
     makes its own authenticated requests (mirroring app/procore/procore.py:get_workflow_data).
+    The submittal / workflow_data reads still share the Procore response cache
+    (app/procore/response_cache.py) with those paths.
 
 Public API:
   find_submittal_drawing_refs(project_id, submittal_id) -> [AttachmentRef, ...]
@@ -27,6 +29,7 @@ import requests
 
 from app.config import Config as cfg
 from app.procore.procore_auth import get_access_token
+from app.procore.response_cache import cache_key, cached_get, submittal_tag
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -135,6 +138,7 @@ def find_submittal_drawing_refs(project_id, submittal_id):
     sub = _request_json(
         f"{API_HOST}/rest/v1.1/projects/{project_id}/submittals/{submittal_id}",
         company_id=cfg.PROD_PROCORE_COMPANY_ID,
+        cache_tags=(submittal_tag(submittal_id),),
     )
     if isinstance(sub, dict):
         for att in sub.get("attachments") or []:
@@ -143,6 +147,7 @@ def find_submittal_drawing_refs(project_id, submittal_id):
     wf = _request_json(
         f"{API_HOST}/rest/v1.1/projects/{project_id}/submittals/{submittal_id}/workflow_data",
         company_id=cfg.PROD_PROCORE_COMPANY_ID,
+        cache_tags=(submittal_tag(submittal_id),),
     )
     if isinstance(wf, dict):
         for att in wf.get("attachments") or []:
@@ -156,11 +161,22 @@ def find_submittal_drawing_refs(project_id, submittal_id):
     return refs
 
 
-def _request_json(url, company_id=None):
-    try:
-        resp = requests.get(url, headers=_headers(company_id), timeout=_REQUEST_TIMEOUT_S)
+def _request_json(url, company_id=None, cache_tags=None):
+    """GET JSON (None on failure). With cache_tags the read shares the Procore
+    response cache with app/procore/api.py and procore.py (same path, same entry)."""
+    def send(validators):
+        resp = requests.get(url, headers={**_headers(company_id), **validators},
+                            timeout=_REQUEST_TIMEOUT_S)
         resp.raise_for_status()
+        return resp
+
+    def parse(resp):
         return resp.json() if resp.text else None
+
+    try:
+        if cache_tags is not None:
+            return cached_get(cache_key(url), send, parse, tags=cache_tags)
+        return parse(send({}))
     except requests.RequestException as exc:
         logger.error("procore_attachment_get_failed", url=url, error=str(exc),
                      error_type=type(exc).__name__, exc_info=True)
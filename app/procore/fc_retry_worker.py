@@ -11,7 +11,8 @@ re-open the gap; rows with no released date use last_updated_at instead.
 
 Procore calls are batched the same way `backfill_fc_drawing_viewer_urls.py`
 does: company_id once, project listing once, submittals once per unique
-project; per-submittal workflow_data / detail fetch is unavoidable.
+project (all projects fetched side by side on the Procore fetch pool);
+per-submittal workflow_data / detail fetch is unavoidable.
 """
 
 import time
@@ -26,7 +27,7 @@ from app.models import db, Releases, FcCollectionRun
 from app.procore.procore import (
     get_companies_list,
     fetch_all_projects,
-    fetch_all_submittals,
+    fetch_all_submittals_by_project,
     submittals_for_release,
     get_final_pdf_viewers,
 )
@@ -158,11 +159,13 @@ def _process_candidates(candidates, project_map, buckets):
         else:
             by_project[pid].append((release_id, job, release, card_id))
 
+    # Every project's submittal list up front, side by side; releases then run in order.
+    fetched = fetch_all_submittals_by_project(by_project)
     for project_id, group in by_project.items():
-        try:
-            all_submittals = fetch_all_submittals(project_id)
-        except Exception as exc:
-            logger.exception("fc_retry_submittals_fetch_failed", project_id=project_id)
+        all_submittals, exc = fetched[project_id]
+        if exc is not None:
+            logger.error("fc_retry_submittals_fetch_failed", project_id=project_id,
+                         error=str(exc), error_type=type(exc).__name__)
             for release_id, job, release, _ in group:
                 buckets["errored"].append({
                     "job": job, "release": release,
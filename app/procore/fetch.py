@@ -0,0 +1,66 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Bounded fan-out for Procore reads — run one call per page / project / submittal side by side, each worker in its own app context, results back in input order.
+exports:
+  fan_out: Run func(item) for every item on up to PROCORE_FETCH_WORKERS threads; returns [(result, error)] in input order
+imports_from: [flask, app.config, app.models, app.logging_config, concurrent.futures]
+imported_by: [app/procore/api.py, app/procore/procore.py, scripts/bench_procore_submittal_fetch.py]
+invariants:
+  - Concurrency is bounded here; the request rate is bounded separately by the process's share of the Procore budget (app.procore.api.procore_rate_budget), which every worker's calls go through.
+  - A worker opens the caller's app (the token lookup reads procore_tokens) and removes its session when done; without an app context workers run bare.
+  - One item's exception is returned, not raised, so callers keep their per-item error handling.
+  - A single item, workers <= 1, or an in-memory SQLite database (tests) runs inline on the caller's thread.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from flask import current_app, has_app_context
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+from app.models import db, in_memory_database
+
+logger = get_logger(__name__)
+
+
+def fan_out(
+    func: Callable,
+    items: Iterable,
+    workers: Optional[int] = None,
+    thread_name_prefix: str = "procore-fetch-",
+) -> List[Tuple[object, Optional[Exception]]]:
+    """
+    Call func(item) for every item, up to `workers` at a time.
+
+    Returns:
+        [(result, None) | (None, exception)] in the order of `items`
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = max(1, min(cfg.PROCORE_FETCH_WORKERS if workers is None else workers, len(items)))
+    app = current_app._get_current_object() if has_app_context() else None
+
+    if workers == 1 or (app is not None and in_memory_database()):
+        return [_call(func, item) for item in items]
+
+    def run(item):
+        if app is None:
+            return _call(func, item)
+        with app.app_context():
+            try:
+                return _call(func, item)
+            finally:
+                db.session.remove()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as pool:
+        return list(pool.map(run, items))
+
+
+def _call(func, item):
+    try:
+        return func(item), None
+    except Exception as exc:
+        return None, exc
@@ -8,25 +8,33 @@ exports:
   parse_ball_in_court_from_submittal: Extract ball-in-court user names from submittal webhook data.
   extract_procore_user_id_from_webhook: Pull the actor's Procore user ID from a webhook payload.
   resolve_webhook_user_ids: Map a webhook payload to (external_user_id, internal_user_id).
-  is_duplicate_webhook: Burst-dedup check using time-bucketed SHA-256 receipt hashes.
+  is_duplicate_webhook: Burst-dedup check using time-bucketed SHA-256 receipt hashes (in-memory LRU in front of webhook_receipts).
+  WebhookDedupCache: Process-local, time-bucketed LRU of receipt hashes the DB has already decided.
+  webhook_dedup_stats: Cache hits vs. DB inserts / rejects for this process.
+  purge_webhook_receipts: Delete Procore receipts past PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS.
   create_submittal_event: Create a SubmittalEvents audit record with user attribution.
 imports_from: [hashlib, json, sqlalchemy, app.models, app.config]
 imported_by: [app/procore/__init__.py, app/procore/procore.py, app/brain/drafting_work_load/routes.py, app/procore/scripts/sync_submittals.py]
 invariants:
   - is_duplicate_webhook uses a 15-second time bucket; the first delivery inserts a WebhookReceipt row, duplicates hit the unique constraint.
+  - The dedup cache only holds hashes the DB already accepted or rejected, so a cache hit is always a duplicate; a miss always asks the DB, which stays the cross-worker source of truth.
   - create_submittal_event is placed here (not in procore.py) to avoid circular imports between procore and brain.
   - Ball-in-court parsing prefers user name over login and skips email-only identifiers.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 import hashlib
 import json
+import threading
 import time
 import pandas as pd
 import re
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
 from sqlalchemy.exc import IntegrityError
 
+from app.config import Config as cfg
 from app.models import SubmittalEvents, WebhookReceipt, db
 from app.logging_config import get_logger
 
@@ -222,11 +230,67 @@ def resolve_webhook_user_ids(webhook_payload: Optional[dict]) -> Tuple[Optional[
     return external, internal
 
 
+class WebhookDedupCache:
+    """
+    Process-local LRU of receipt hashes already decided by webhook_receipts.
+
+    Keys carry their dedup bucket, so an entry only matches repeats inside the same
+    15s window; entries from older buckets are dropped as new ones arrive, and the
+    whole cache is capped at max_entries. Only hashes the DB has already seen go in,
+    so a hit is always a duplicate and the DB stays the cross-worker source of truth
+    for first deliveries.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max(1, cfg.PROCORE_WEBHOOK_DEDUP_CACHE_SIZE if max_entries is None else max_entries)
+        self._entries = OrderedDict()  # receipt_hash -> bucket
+        self._lock = threading.Lock()
+        self._stats = {"cache_hits": 0, "db_inserts": 0, "db_rejects": 0}
+
+    def seen(self, receipt_hash: str) -> bool:
+        with self._lock:
+            if receipt_hash in self._entries:
+                self._entries.move_to_end(receipt_hash)
+                self._stats["cache_hits"] += 1
+                return True
+            return False
+
+    def remember(self, receipt_hash: str, bucket: int, duplicate: bool) -> None:
+        with self._lock:
+            self._stats["db_rejects" if duplicate else "db_inserts"] += 1
+            self._entries[receipt_hash] = bucket
+            self._entries.move_to_end(receipt_hash)
+            while self._entries:
+                oldest_hash, oldest_bucket = next(iter(self._entries.items()))
+                if oldest_bucket >= bucket and len(self._entries) <= self.max_entries:
+                    break
+                del self._entries[oldest_hash]
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        checked = stats["cache_hits"] + stats["db_inserts"] + stats["db_rejects"]
+        stats["duplicates"] = stats["cache_hits"] + stats["db_rejects"]
+        stats["cache_hit_rate"] = round(stats["cache_hits"] / checked, 3) if checked else 0.0
+        return stats
+
+
+_dedup_cache = WebhookDedupCache()
+
+
+def webhook_dedup_stats() -> dict:
+    """This process's burst-dedup counters: cache hits vs. DB inserts / unique-key rejects."""
+    return _dedup_cache.stats()
+
+
 def is_duplicate_webhook(resource_id: int, project_id: int, event_type: str) -> bool:
     """
     Return True if this Procore webhook delivery is a burst duplicate of one already
     being processed within the current dedup window.
 
+    A repeat this process already saw in the window is rejected from the in-memory
+    cache without touching the DB. Otherwise:
     On first delivery in the window: inserts a WebhookReceipt row and returns False.
     On retry deliveries: the unique constraint fires (IntegrityError), rolls back, returns True.
 
@@ -236,6 +300,8 @@ def is_duplicate_webhook(resource_id: int, project_id: int, event_type: str) ->
     bucket = int(time.time() // WEBHOOK_DEDUP_WINDOW_SECONDS)
     raw = f"procore:{resource_id}:{project_id}:{event_type}:{bucket}"
     receipt_hash = hashlib.sha256(raw.encode()).hexdigest()
+    if _dedup_cache.seen(receipt_hash):
+        return True
     receipt = WebhookReceipt(
         receipt_hash=receipt_hash,
         provider='procore',
@@ -244,10 +310,25 @@ def is_duplicate_webhook(resource_id: int, project_id: int, event_type: str) ->
     db.session.add(receipt)
     try:
         db.session.commit()
-        return False
+        duplicate = False
     except IntegrityError:
         db.session.rollback()
-        return True
+        duplicate = True
+    _dedup_cache.remember(receipt_hash, bucket, duplicate)
+    return duplicate
+
+
+def purge_webhook_receipts(older_than_days: Optional[float] = None) -> int:
+    """Delete Procore receipts older than PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS; returns rows deleted."""
+    days = cfg.PROCORE_WEBHOOK_RECEIPT_RETENTION_DAYS if older_than_days is None else older_than_days
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    purged = (
+        WebhookReceipt.query
+        .filter(WebhookReceipt.provider == 'procore', WebhookReceipt.received_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.session.commit()
+    return purged
 
 
 def create_submittal_payload_hash(action: str, submittal_id: str, payload: dict) -> str:
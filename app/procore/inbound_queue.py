@@ -0,0 +1,131 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Durable inbound queue for Procore submittal webhooks — persist on receipt, claim in per-submittal order, drain continuously on a worker thread, report depth / lag / throughput. Configures the shared app.durable_queue over procore_inbound_events.
+exports:
+  is_full: True (and counted as a rejection) when PROCORE_INBOUND_MAX_DEPTH deliveries are already pending
+  enqueue: Persist an accepted webhook delivery; returns its id
+  claim_batch: Atomically move up to N submittals' next deliveries to 'processing'
+  finish_batch: Record a drained batch — completed, or retried with backoff / failed — in one commit
+  release_stale_claims: Hand 'processing' rows whose worker died back to 'pending'
+  purge_completed: Delete completed rows past PROCORE_INBOUND_RETENTION_DAYS
+  queue_metrics: Depth, oldest pending age, queue lag and this process's throughput counters
+  ProcoreInboundWorker: Daemon thread that calls a drain function back to back while it finds work
+imports_from: [app.durable_queue, app.models, app.config]
+imported_by: [app/procore/__init__.py, app/__init__.py]
+invariants:
+  - Deliveries are ordered per submittal_id; claiming, retry/backoff and stale-claim release are app.durable_queue's, read from the PROCORE_INBOUND_* settings.
+  - Only deliveries that passed burst dedup are enqueued; the reconcile row is scheduled by the endpoint before dedup, exactly as when the handler ran inline.
+  - A processing error uses an attempt and retries with backoff; after PROCORE_INBOUND_MAX_ATTEMPTS the row is kept as 'failed' and the submittal's later deliveries proceed.
+  - Functions here need an app context and commit on db.session; the worker opens one per drain.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from app.config import Config as cfg
+from app.durable_queue import DurableQueue, QueueWorker
+from app.models import ProcoreInboundEvent, db
+
+_queue = DurableQueue(
+    ProcoreInboundEvent,
+    ProcoreInboundEvent.submittal_id,
+    name="procore",
+    config_prefix="PROCORE_INBOUND",
+    track_lag=True,
+)
+
+
+def pending_depth() -> int:
+    return _queue.pending_depth()
+
+
+def is_full() -> bool:
+    """True when the backlog is at PROCORE_INBOUND_MAX_DEPTH (the webhook answers 429)."""
+    return _queue.is_full()
+
+
+def enqueue(submittal_id, project_id: int, event_type: str, payload: dict) -> int:
+    """Persist an accepted webhook delivery for the drain worker; returns the new row id."""
+    row = ProcoreInboundEvent(
+        submittal_id=str(submittal_id),
+        project_id=project_id,
+        event_type=event_type,
+        payload=payload,
+        status="pending",
+    )
+    db.session.add(row)
+    db.session.commit()
+    _queue.count("enqueued")
+    return row.id
+
+
+def claim_batch(limit: int) -> List[dict]:
+    """
+    Claim up to `limit` deliveries, each the first in line for its submittal.
+
+    Returns:
+        [{"id", "submittal_id", "project_id", "event_type", "payload", "attempts", "created_at"}]
+        in id order; all of them are now 'processing'
+    """
+    E = ProcoreInboundEvent
+    token, _ = _queue.claim_heads(limit)
+    if token is None:
+        return []
+    rows = _queue.claimed_rows(
+        token, E.id, E.submittal_id, E.project_id, E.event_type, E.payload, E.attempts, E.created_at
+    )
+    return [
+        {
+            "id": r.id,
+            "submittal_id": r.submittal_id,
+            "project_id": r.project_id,
+            "event_type": r.event_type,
+            "payload": r.payload,
+            "attempts": r.attempts or 0,
+            "created_at": r.created_at,
+        }
+        for r in rows
+    ]
+
+
+def finish_batch(completed: Iterable[dict] = (), failed: Iterable[Tuple[dict, str]] = ()) -> None:
+    """
+    Record the outcome of a claimed batch in one commit.
+
+    Args:
+        completed: claimed deliveries that were applied
+        failed: (claimed delivery, error) — uses an attempt and retries with backoff
+            until PROCORE_INBOUND_MAX_ATTEMPTS, then stays 'failed'
+    """
+    completed = list(completed)
+    _queue.finish(
+        completed_ids=[event["id"] for event in completed],
+        failed=[(event["id"], event["attempts"], error) for event, error in failed],
+    )
+    now = datetime.utcnow()
+    _queue.record_completions([
+        (now - event["created_at"]).total_seconds() if event.get("created_at") else 0.0
+        for event in completed
+    ])
+
+
+def release_stale_claims(older_than_seconds: Optional[float] = None) -> int:
+    """Return 'processing' rows claimed longer ago than the stale cutoff to 'pending'."""
+    return _queue.release_stale_claims(older_than_seconds)
+
+
+def purge_completed(older_than_days: Optional[float] = None) -> int:
+    return _queue.purge_completed(older_than_days)
+
+
+def queue_metrics() -> dict:
+    """Backlog across all processes (from the table) plus this process's counters and lag."""
+    return {**_queue.metrics(), "workers": cfg.PROCORE_INBOUND_WORKERS}
+
+
+class ProcoreInboundWorker(QueueWorker):
+    """Drains procore_inbound_events on a daemon thread (see QueueWorker)."""
+
+    def __init__(self, app, drain: Callable[[], int], idle_seconds: Optional[float] = None):
+        super().__init__(_queue, app, drain, idle_seconds)
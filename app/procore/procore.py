@@ -6,17 +6,22 @@ exports:
   get_project_id_by_project_name: Resolve a project name to its Procore project ID.
   create_submittal_from_webhook: Create a new Submittals DB record from a Procore webhook payload.
   check_and_update_submittal: Diff a webhook payload against the DB record and apply changes.
+  SubmittalApplyError: A webhook could not be applied (raised by check_and_update_submittal(raise_errors=True) and process_webhook_event).
   comprehensive_health_scan: Full audit comparing DB submittals against Procore API state.
   get_viewer_url_for_job: Look up the FC Drawing Viewer URL for a given job/release number.
   add_procore_link_to_trello_card: Attach the Procore viewer link to the corresponding Trello card.
   get_drafting_workload: Aggregate drafting-relevant submittals across all projects.
-imports_from: [requests, sqlalchemy, app.config, app.models, app.procore.procore_auth, app.procore.client, app.procore.helpers, app.brain.drafting_work_load.service]
+  fetch_all_submittals: Every submittal of one project (v1.1 list, optional query filters, remaining pages fetched side by side).
+  fetch_all_submittals_by_project: fetch_all_submittals for many projects on the bounded fetch pool.
+imports_from: [requests, sqlalchemy, app.config, app.models, app.procore.procore_auth, app.procore.client, app.procore.api, app.procore.fetch, app.procore.response_cache, app.procore.helpers, app.brain.drafting_work_load.service]
 imported_by: [app/procore/__init__.py, app/sync/sync.py, app/trello/card_creation.py, app/trello/sync.py, app/admin/__init__.py, app/__init__.py, app/procore/scripts/sync_submittals.py]
 invariants:
   - check_and_update_submittal uses a row-level lock (with_for_update) to prevent concurrent webhook races.
   - Submittal events are recorded via helpers.create_submittal_event to maintain the audit trail.
   - Connector-originated updates are tagged with is_system_echo=True in submittal events.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - get_submittal_by_id, get_workflow_data and get_project_info are served through app.procore.response_cache; only reconcile (via bypass) forces a fresh read.
+  - Raw GETs (_get_response) go through the ProcoreAPI session and the shared Procore rate budget; multi-project / multi-page reads fan out through app.procore.fetch and keep input order.
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 import re
 import json
@@ -34,6 +39,9 @@ from app.models import db, Releases, Submittals
 from app.trello.api import add_procore_link
 from app.procore.procore_auth import get_access_token
 from app.procore.client import get_procore_client
+from app.procore.api import pause_for_rate_limit, procore_rate_budget
+from app.procore.fetch import fan_out
+from app.procore.response_cache import cache_key, cached_get, submittal_tag
 from app.procore.helpers import (
     parse_ball_in_court_from_submittal,
     extract_procore_user_id_from_webhook,
@@ -64,6 +72,10 @@ def _to_int_or_none(value):
         return None
 
 
+class SubmittalApplyError(Exception):
+    """A Procore webhook could not be applied to the submittal; the inbound queue retries it."""
+
+
 class RelAssignmentError(Exception):
     """Raised when a manual Rel assignment is invalid.
 
@@ -251,14 +263,38 @@ def assign_rel_manual(submittal, desired_rel):
     return number
 
 
-def _request_json(url, headers, params=None):
+def _request_json(url, headers, params=None, cache_tags=None):
     """
     Wrapper around requests.get that adds logging and error handling.
-    Returns JSON data or None if the request fails.
+    Returns JSON data or None if the request fails. With cache_tags the read
+    goes through the Procore response cache under those tags.
     """
+    if cache_tags is not None:
+        return cached_get(
+            cache_key(url, params),
+            lambda validators: _get_response(url, {**headers, **validators}, params),
+            lambda response: _response_json(response, url, params),
+            tags=cache_tags,
+        )
+    response = _get_response(url, headers, params)
+    if response is None:
+        return None
+    return _response_json(response, url, params)
+
+
+def _get_response(url, headers, params=None, max_attempts=3):
+    """GET through the shared Procore session and rate budget; a 429 pauses the budget and retries."""
+    budget = procore_rate_budget()
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
+        session = get_procore_client().session
+        for attempt in range(max_attempts):
+            budget.acquire()
+            response = session.get(url, headers=headers, params=params, timeout=30)
+            if response.status_code == 429 and attempt < max_attempts - 1:
+                pause_for_rate_limit(response, attempt)
+                continue
+            response.raise_for_status()
+            return response
     except requests.RequestException as exc:
         logger.error(
             "procore_request_failed",
@@ -270,6 +306,8 @@ def _request_json(url, headers, params=None):
         )
         return None
 
+
+def _response_json(response, url, params=None):
     try:
         data = response.json()
     except ValueError:
@@ -357,33 +395,60 @@ def _is_for_construction(submittal):
     return name == "for construction" or name.startswith("for construction")
 
 
-def fetch_all_submittals(project_id):
+def fetch_all_submittals(project_id, workers=None, filters=None):
     """Fetch every submittal for a project with pagination.
 
     A single unpaginated GET only returns the first page; large projects then
     miss FC submittals and `viewer_url` stays empty (gray Procore on the job
     log — BUG-1). Prefer the paginated v1.1 list; fall back to the v2 client.
+
+    Page 1's `Total` header gives the page count, so the remaining pages are
+    fetched side by side (up to `workers`, default PROCORE_FETCH_WORKERS); without
+    it the pages are walked one at a time until a short page.
+
+    ``filters`` are extra query params (e.g. ``{"filters[updated_at]": "a...b"}``);
+    a filtered read that fails returns [] rather than the unfiltered v2 list.
     """
     url = f"{cfg.PROD_PROCORE_BASE_URL}/rest/v1.1/projects/{project_id}/submittals"
     headers = {"Authorization": f"Bearer {get_access_token()}"}
-    all_rows = []
-    page = 1
     per_page = 100
-    while True:
-        batch = _request_json(
-            url, headers=headers, params={"page": page, "per_page": per_page}
-        )
-        if not isinstance(batch, list):
-            # Unexpected shape — try the session client once if we have nothing.
-            if not all_rows:
-                try:
-                    client = get_procore_client()
-                    return client.get_submittals(project_id) or []
-                except Exception:
-                    logger.exception(
-                        "fetch_all_submittals_fallback_failed", project_id=project_id
-                    )
-                    return []
+    max_pages = 200  # hard stop — pathological project
+
+    def get_page(page):
+        response = _get_response(url, headers, params={"page": page, "per_page": per_page, **(filters or {})})
+        if response is None:
+            return None, None
+        return _response_json(response, url, {"page": page}), _to_int_or_none(response.headers.get("Total"))
+
+    batch, total = get_page(1)
+    if not isinstance(batch, list) and filters:
+        logger.warning("fetch_all_submittals_filtered_failed", project_id=project_id, filters=filters)
+        return []
+    if not isinstance(batch, list):
+        # Unexpected shape — try the session client once.
+        try:
+            client = get_procore_client()
+            return client.get_submittals(project_id) or []
+        except Exception:
+            logger.exception(
+                "fetch_all_submittals_fallback_failed", project_id=project_id
+            )
+            return []
+    all_rows = list(batch)
+    if len(batch) < per_page:
+        return all_rows
+
+    if total:
+        pages = list(range(2, min(-(-total // per_page), max_pages) + 1))
+        results = fan_out(lambda page: get_page(page)[0], pages, workers=workers,
+                          thread_name_prefix="procore-page-")
+    else:
+        pages, results = [], []
+
+    page = 1
+    for page_number, (batch, error) in zip(pages, results):
+        page = page_number
+        if error is not None or not isinstance(batch, list):
             # Mid-pagination failure: return what we have, but say so — a
             # silently truncated list reads as "no matching FC submittal".
             logger.warning(
@@ -392,12 +457,15 @@ def fetch_all_submittals(project_id):
                 page=page,
                 count=len(all_rows),
             )
-            break
+            return all_rows
         all_rows.extend(batch)
         if len(batch) < per_page:
-            break
+            return all_rows
+
+    # No Total header (or more rows than it promised): walk the rest in order.
+    while True:
         page += 1
-        if page > 200:  # hard stop — pathological project
+        if page > max_pages:
             logger.warning(
                 "fetch_all_submittals_page_cap",
                 project_id=project_id,
@@ -405,9 +473,33 @@ def fetch_all_submittals(project_id):
                 count=len(all_rows),
             )
             break
+        batch, _ = get_page(page)
+        if not isinstance(batch, list):
+            logger.warning(
+                "fetch_all_submittals_page_error",
+                project_id=project_id,
+                page=page,
+                count=len(all_rows),
+            )
+            break
+        all_rows.extend(batch)
+        if len(batch) < per_page:
+            break
     return all_rows
 
 
+def fetch_all_submittals_by_project(project_ids, workers=None, filters=None):
+    """
+    fetch_all_submittals for many projects side by side (same ``filters`` for each).
+
+    Returns:
+        {project_id: (submittals, None) | (None, exception)} for every project id
+    """
+    project_ids = list(dict.fromkeys(project_ids))
+    results = fan_out(lambda pid: fetch_all_submittals(pid, filters=filters), project_ids, workers=workers)
+    return dict(zip(project_ids, results))
+
+
 def submittals_for_release(all_submittals, job, release):
     """Filter a pre-fetched submittal list to the FC submittals matching one (job, release)."""
     identifier = f"{job}-{release}".strip().lower()
@@ -556,7 +648,7 @@ def get_workflow_data(project_id, submittal_id):
     """Fetch workflow data for a given submittal"""
     url = f"{cfg.PROD_PROCORE_BASE_URL}/rest/v1.1/projects/{project_id}/submittals/{submittal_id}/workflow_data"
     headers = {"Authorization": f"Bearer {get_access_token()}"}
-    workflow_data = _request_json(url, headers=headers)
+    workflow_data = _request_json(url, headers=headers, cache_tags=(submittal_tag(submittal_id),))
     if workflow_data is None:
         logger.debug("workflow_data_missing", project_id=project_id, submittal_id=submittal_id)
         return {}
@@ -746,13 +838,15 @@ def get_webhook_deliveries(company_id, project_id):
     return procore.get_deliveries(company_id, project_id, webhook_id)
 
 
-def handle_submittal_update(project_id, submittal_id):
+def handle_submittal_update(project_id, submittal_id, submittal_data=None):
     """
     Compare ball_in_court, status, title, and submittal_manager from submittal webhook data against DB record.
     
     Args:
         project_id: The Procore project ID
         submittal_id: The submittal ID (resource_id from webhook)
+        submittal_data: Submittal payload already read from Procore (e.g. a list row);
+            fetched by id when None
         
     Returns:
         tuple: (procore_submittal, ball_in_court, approvers, status, title, submittal_manager) or None if parsing fails
@@ -764,7 +858,7 @@ def handle_submittal_update(project_id, submittal_id):
         - submittal_manager: str or None - Submittal manager from Procore
     """
     # Collect submittal data and pass to parser function
-    submittal = get_submittal_by_id(project_id, submittal_id)
+    submittal = submittal_data if submittal_data is not None else get_submittal_by_id(project_id, submittal_id)
     if not isinstance(submittal, dict):
         return None
     
@@ -1142,7 +1236,8 @@ def create_submittal_from_webhook(project_id, submittal_id, webhook_payload=None
         return False, None, error_msg
 
 
-def check_and_update_submittal(project_id, submittal_id, webhook_payload=None, source='Procore'):
+def check_and_update_submittal(project_id, submittal_id, webhook_payload=None, source='Procore', submittal_data=None,
+                               raise_errors=False):
     """
     Check if ball_in_court, status, title, and submittal_manager from Procore differ from DB, update if needed.
 
@@ -1150,19 +1245,28 @@ def check_and_update_submittal(project_id, submittal_id, webhook_payload=None, s
         project_id: Procore project ID
         submittal_id: Procore submittal ID
         webhook_payload: Raw webhook payload dict (for extracting user who triggered the event)
+        submittal_data: Procore payload to diff against instead of fetching the submittal by id
+            (the batched reconcile passes the project list row)
         source: Event source string — 'Procore' for real user changes, 'Connector' for
                 bounce-backs from the connector service account. 'Connector' events are
                 still processed (to catch Procore side-effect changes like auto-ball_in_court)
                 but are tagged for filtering in the UI.
+        raise_errors: Raise instead of returning the all-False tuple when the submittal can't
+            be read, has no DB row, or the update fails (the inbound queue retries on raise)
 
     Returns:
         tuple: (ball_updated: bool, status_updated: bool, title_updated: bool, manager_updated: bool,
                 record: Submittals or None, ball_in_court: str or None, status: str or None)
+
+    Raises:
+        SubmittalApplyError, or the underlying error: only when raise_errors is True
     """
     try:
-        result = handle_submittal_update(project_id, submittal_id)
+        result = handle_submittal_update(project_id, submittal_id, submittal_data=submittal_data)
         if result is None:
             logger.warning("submittal_parse_failed", submittal_id=submittal_id, project_id=project_id)
+            if raise_errors:
+                raise SubmittalApplyError(f"Could not read submittal {submittal_id} from Procore")
             return False, False, False, False, None, None, None
         
         _, ball_in_court, approvers, status, title, submittal_manager = result
@@ -1175,6 +1279,8 @@ def check_and_update_submittal(project_id, submittal_id, webhook_payload=None, s
 
         if not record:
             logger.warning("submittal_record_missing", submittal_id=submittal_id)
+            if raise_errors:
+                raise SubmittalApplyError(f"Submittal {submittal_id} has no DB record")
             return False, False, False, False, None, ball_in_court, status
 
         ball_updated = False
@@ -1424,6 +1530,8 @@ def check_and_update_submittal(project_id, submittal_id, webhook_payload=None, s
         return ball_updated, status_updated, title_updated, manager_updated, record, ball_in_court, status
 
     except Exception as e:
+        if raise_errors:
+            raise
         logger.error(
             "submittal_update_failed",
             submittal_id=submittal_id,
@@ -1592,20 +1700,21 @@ def get_drafting_workload():
     '''
     Function to get submittals for drafting workload.
     Returns a list of dicts with submittal_id and project_id for each submittal.
+    Projects are queried side by side (fetch.fan_out); results keep project order.
     '''
     # Grab procore instance
     procore = get_procore_client()
     # Collect projects
-    projects = procore.get_projects(cfg.PROD_PROCORE_COMPANY_ID)
-    
-    # Iterate through projects collecting open submittals
+    projects = [p for p in procore.get_projects(cfg.PROD_PROCORE_COMPANY_ID) if p['id'] != 589044]
+
+    # Collect each project's open submittals
+    results = fan_out(lambda project: procore.get_submittals_for_drafting_workload(project['id']), projects)
     all_submittals = []
-    for project in projects:
-        if project['id'] == 589044:
-            continue
-        submittals = procore.get_submittals_for_drafting_workload(project['id'])
+    for project, (submittals, error) in zip(projects, results):
+        if error is not None:
+            raise error
         logger.debug("project_submittals_fetched", project_id=project['id'], count=len(submittals))
-        
+
         # Extract submittal_id and project_id for each submittal
         for submittal in submittals:
             if isinstance(submittal, dict) and 'id' in submittal:
@@ -1614,7 +1723,7 @@ def get_drafting_workload():
                     'project_id': project['id']
                 })
 
-    logger.debug("drafting_workload_fetched", count=len(all_submittals))
+    logger.debug("drafting_workload_fetched", count=len(all_submittals), projects=len(projects))
     return all_submittals
 
 
@@ -1840,10 +1949,31 @@ def check_webhook_health(project_ids=None):
     webhook_details = {}
     broken_webhooks = []
     
-    for project_id in project_ids:
+    def webhook_snapshot(project_id):
+        """This project's webhooks plus {hook_id: (details, triggers, error)}."""
+        webhooks = procore.list_project_webhooks(int(project_id), 'mile-high-metal-works')
+        hooks = {}
+        for webhook in webhooks or []:
+            hook_id = webhook.get('id')
+            if hook_id:
+                try:
+                    hooks[hook_id] = (
+                        procore.get_webhook_details(int(project_id), hook_id),
+                        procore.get_webhook_triggers(int(project_id), hook_id),
+                        None,
+                    )
+                except Exception as e:
+                    hooks[hook_id] = (None, None, e)
+        return webhooks, hooks
+
+    # Read every project's webhooks side by side, then evaluate them in order
+    snapshots = fan_out(webhook_snapshot, project_ids)
+
+    for project_id, (snapshot, snapshot_error) in zip(project_ids, snapshots):
         try:
-            # List webhooks for this project
-            webhooks = procore.list_project_webhooks(int(project_id), 'mile-high-metal-works')
+            if snapshot_error is not None:
+                raise snapshot_error
+            webhooks, hooks = snapshot
             
             if not webhooks or len(webhooks) == 0:
                 projects_without_webhooks.append(project_id)
@@ -1862,9 +1992,10 @@ def check_webhook_health(project_ids=None):
                     hook_id = webhook.get('id')
                     if hook_id:
                         try:
-                            # Get webhook details
-                            details = procore.get_webhook_details(int(project_id), hook_id)
-                            triggers = procore.get_webhook_triggers(int(project_id), hook_id)
+                            # Webhook details and triggers (read in webhook_snapshot)
+                            details, triggers, hook_error = hooks[hook_id]
+                            if hook_error is not None:
+                                raise hook_error
                             
                             # Check if webhook has the required triggers (create and update for Submittals)
                             has_create = any(
@@ -2016,14 +2147,18 @@ def comprehensive_health_scan(skip_user_prompt=False):
     deleted_submittals = []
     api_fetch_errors = []
     
-    for submittal in orphaned_submittals:
+    # Fetch full submittal data from API, side by side (keys read here, not on the workers)
+    keys = [(int(s.procore_project_id), int(s.submittal_id)) for s in orphaned_submittals]
+    fetched = fan_out(lambda key: get_submittal_by_id(*key), keys)
+
+    for submittal, (api_submittal_data, fetch_error) in zip(orphaned_submittals, fetched):
         submittal_id = submittal.submittal_id
         project_id = submittal.procore_project_id
         
         try:
-            # Fetch full submittal data from API
-            api_submittal_data = get_submittal_by_id(int(project_id), int(submittal_id))
-            
+            if fetch_error is not None:
+                raise fetch_error
+
             if not api_submittal_data or not isinstance(api_submittal_data, dict):
                 # Submittal doesn't exist in API - likely deleted/archived
                 deleted_submittals.append({
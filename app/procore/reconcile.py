@@ -1,26 +1,50 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Delayed reconcile safety net for Procore submittal webhooks — re-fetches a submittal a short while after a webhook to catch field changes dropped by burst dedup or not yet propagated by Procore at live-processing time.
+purpose: Delayed reconcile safety net for Procore submittal webhooks — re-fetches a submittal (batched per project) a short while after a webhook to catch field changes dropped by burst dedup or not yet propagated by Procore at live-processing time.
 exports:
   ProcoreReconcileService: schedule() enqueues a coalescing reconcile; process_due() runs due reconciles via the outbox worker.
-imports_from: [app.models, app.config, app.logging_config, app.procore.procore]
+imports_from: [app.models, app.config, app.logging_config, app.procore.procore, app.procore.response_cache]
 imported_by: [app/procore/__init__.py, app/__init__.py]
 invariants:
   - schedule() is coalescing: at most one 'pending' row per submittal_id, so a webhook burst produces a single reconcile read.
   - process_due() must never enqueue another reconcile (only the webhook route schedules), so there is no reconcile loop.
   - A reconcile that applies any field change is a 'rescue' — the live webhook missed it — and is surfaced via a structlog warning plus a SystemLogs WARNING row.
-updated_by_agent: 2026-05-23T00:00:00Z
+  - Projects with several due rows are read with one submittal list call filtered on updated_at; a submittal the list does not fully answer (absent, thin approvers, failed read) falls back to the by-id fetch, so rescue outcomes match the per-row path.
+  - The re-fetch runs under response_cache.bypass(): it never reads a cached Procore response (and refreshes the cache with what it sees).
+updated_by_agent: 2026-10-16T00:00:00Z
 """
+from collections import defaultdict
 from datetime import datetime, timedelta
 
 from app.logging_config import get_logger
+from app.procore import response_cache
 
 logger = get_logger(__name__)
 
 # Cap reconcile retries so a persistently failing submittal doesn't churn forever.
 MAX_RECONCILE_ATTEMPTS = 3
 
+# Fields check_and_update_submittal reads; a list row missing any of them is re-read by id.
+_DIFFED_FIELDS = ("title", "status", "ball_in_court", "approvers")
+# Approver fields parse_ball_in_court_from_submittal / the submitter-pending check read.
+_APPROVER_FIELDS = ("user", "response", "response_required", "distributed", "workflow_group_number")
+
+
+def _list_row_is_complete(item):
+    """True when a submittal list row carries everything the reconcile diff reads."""
+    if any(field not in item for field in _DIFFED_FIELDS):
+        return False
+    if "submittal_manager" not in item and "manager" not in item:
+        return False
+    approvers = item.get("approvers")
+    if not isinstance(approvers, list):
+        return False
+    return all(
+        isinstance(approver, dict) and all(field in approver for field in _APPROVER_FIELDS)
+        for approver in approvers
+    )
+
 
 class ProcoreReconcileService:
     """Schedule and run delayed re-fetches of Procore submittals."""
@@ -85,6 +109,8 @@ class ProcoreReconcileService:
 
         For each due row: flip to 'processing' (commit, so concurrent runs serialize),
         re-run check_and_update_submittal, and surface a rescue if any field changed.
+        Projects with several due rows are read with one filtered list call first
+        (_prefetch_by_project); every other row re-fetches its submittal by id.
         Returns the number of rows processed.
         """
         from app.models import SubmittalReconcile, db
@@ -102,10 +128,11 @@ class ProcoreReconcileService:
         if not due:
             return 0
 
+        prefetched = ProcoreReconcileService._prefetch_by_project(due)
         processed = 0
         for row in due:
             try:
-                ProcoreReconcileService._process_one(row)
+                ProcoreReconcileService._process_one(row, prefetched.get(str(row.submittal_id)))
                 processed += 1
             except Exception as e:
                 logger.error(
@@ -115,7 +142,65 @@ class ProcoreReconcileService:
         return processed
 
     @staticmethod
-    def _process_one(row):
+    def _prefetch_by_project(due):
+        """
+        Read the due submittals of busy projects with one list call per project.
+
+        Projects with at least PROCORE_RECONCILE_BATCH_MIN_ROWS due rows get a
+        submittal list filtered on updated_at (from the oldest row's webhook, less
+        PROCORE_RECONCILE_UPDATED_AT_SKEW_SECONDS, to now). Only list rows that carry
+        every field check_and_update_submittal diffs are returned; a row that is
+        missing, thin, or whose project read failed is left to the detail fetch, so
+        the outcome per submittal is the same as reading it by id. Never raises.
+
+        Returns:
+            {submittal_id (str): list row}
+        """
+        from app.config import Config as cfg
+        from app.procore.procore import fetch_all_submittals_by_project
+
+        by_project = defaultdict(list)
+        for row in due:
+            by_project[row.project_id].append(row)
+        batched = [
+            project_id for project_id, rows in by_project.items()
+            if len(rows) >= max(1, cfg.PROCORE_RECONCILE_BATCH_MIN_ROWS)
+        ]
+        if not batched:
+            return {}
+
+        wanted = {str(row.submittal_id) for project_id in batched for row in by_project[project_id]}
+        since = min(row.created_at or row.scheduled_for for project_id in batched for row in by_project[project_id])
+        since -= timedelta(seconds=cfg.PROCORE_RECONCILE_UPDATED_AT_SKEW_SECONDS)
+        until = datetime.utcnow() + timedelta(minutes=1)
+        window = f"{since:%Y-%m-%dT%H:%M:%SZ}...{until:%Y-%m-%dT%H:%M:%SZ}"
+
+        prefetched = {}
+        try:
+            fetched = fetch_all_submittals_by_project(batched, filters={"filters[updated_at]": window})
+        except Exception as e:
+            logger.warning("reconcile_batch_fetch_failed", projects=len(batched), error=str(e))
+            return {}
+        for project_id in batched:
+            rows, error = fetched.get(project_id, (None, None))
+            if error is not None:
+                logger.warning(
+                    "reconcile_batch_fetch_failed", project_id=project_id,
+                    error=str(error), error_type=type(error).__name__,
+                )
+                continue
+            for item in rows or []:
+                submittal_id = str(item.get("id")) if isinstance(item, dict) else None
+                if submittal_id in wanted and _list_row_is_complete(item):
+                    prefetched[submittal_id] = item
+        logger.info(
+            "reconcile_batch_prefetched", projects=len(batched), due=len(wanted),
+            from_list=len(prefetched), detail_fallbacks=len(wanted) - len(prefetched),
+        )
+        return prefetched
+
+    @staticmethod
+    def _process_one(row, submittal_data=None):
         from app.models import db
         from app.procore.procore import check_and_update_submittal
 
@@ -125,9 +210,15 @@ class ProcoreReconcileService:
         db.session.commit()
 
         try:
-            ball_updated, status_updated, title_updated, manager_updated, record, _bic, _status = (
-                check_and_update_submittal(row.project_id, row.submittal_id, source='Procore')
-            )
+            # Bypass the read cache: the point of the reconcile is what Procore says now.
+            with response_cache.bypass():
+                if submittal_data is not None:
+                    result = check_and_update_submittal(
+                        row.project_id, row.submittal_id, source='Procore', submittal_data=submittal_data,
+                    )
+                else:
+                    result = check_and_update_submittal(row.project_id, row.submittal_id, source='Procore')
+            ball_updated, status_updated, title_updated, manager_updated, record, _bic, _status = result
 
             rescued = [
                 name for name, changed in (
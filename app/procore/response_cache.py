@@ -0,0 +1,237 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Per-process read cache for Procore GETs that are asked for over and over (submittal detail, workflow_data, the company project list) — TTL first, then ETag / Last-Modified revalidation, dropped per submittal when a webhook says it changed.
+exports:
+  ProcoreResponseCache: TTL + conditional-request cache with tag invalidation, a per-thread bypass and hit/miss counters
+  cached_get: Serve one GET from the process cache, revalidating or fetching through a caller-supplied send()
+  cache_key: Host-independent key for a Procore URL plus query params
+  submittal_tag: Invalidation tag for every cached read of one submittal
+  PROJECTS_TAG: Invalidation tag for the company project list
+  invalidate_submittal: Drop every cached read of a submittal (webhook receipt / apply, our own PATCH)
+  bypass: Context manager — reads on this thread go to Procore and refresh the cache instead of reading it
+  response_cache_stats: This process's hits / revalidations / misses / bypasses / invalidations
+imports_from: [app.config, app.logging_config]
+imported_by: [app/procore/api.py, app/procore/procore.py, app/procore/attachments.py, app/procore/__init__.py, app/procore/reconcile.py]
+invariants:
+  - Only callers that pass tags are cached; every other Procore read and all writes go straight through.
+  - A fresh entry (younger than its TTL) is served without a request. A stale entry with an ETag or Last-Modified is revalidated (If-None-Match / If-Modified-Since); a 304 re-arms it, anything else replaces it.
+  - Callers get a deep copy, so mutating a returned payload never changes the cached one.
+  - A response whose fetch started before an invalidation of one of its tags is returned but not stored, so a webhook can never be undone by a slow in-flight read.
+  - Inside bypass() reads are unconditional, never served from the cache, and still refresh it; the reconcile re-fetch runs this way so late Procore propagation is always seen.
+  - The cache is per process; another process's entries for a changed submittal age out within PROCORE_RESPONSE_CACHE_TTL_SECONDS.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PROJECTS_TAG = "projects"
+
+
+def submittal_tag(submittal_id) -> str:
+    return f"submittal:{submittal_id}"
+
+
+def cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """Path plus sorted query, so the same read through api.py, procore.py or attachments.py shares an entry."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True) + [
+        (str(k), str(v)) for k, v in (params or {}).items()
+    ]
+    return parts.path + (f"?{urlencode(sorted(query))}" if query else "")
+
+
+class _Entry:
+    __slots__ = ("body", "etag", "last_modified", "expires_at", "tags")
+
+    def __init__(self, body, etag, last_modified, expires_at, tags):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.tags = tags
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ProcoreResponseCache:
+    """
+    Process-local LRU of parsed Procore GET bodies, keyed by cache_key().
+
+    Each entry carries the tags it was stored under; invalidate(tag) drops them all
+    and bumps the tag's generation so an older in-flight fetch cannot store over it.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max(1, cfg.PROCORE_RESPONSE_CACHE_MAX_ENTRIES if max_entries is None else max_entries)
+        self._entries = OrderedDict()  # key -> _Entry
+        self._keys_by_tag = {}  # tag -> {key}
+        self._generations = {}  # tag -> invalidation count
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "invalidated": 0,
+            "evicted": 0,
+        }
+
+    @contextmanager
+    def bypass(self):
+        depth = getattr(self._local, "bypass", 0)
+        self._local.bypass = depth + 1
+        try:
+            yield
+        finally:
+            self._local.bypass = depth
+
+    def bypassed(self) -> bool:
+        return getattr(self._local, "bypass", 0) > 0
+
+    def get(
+        self,
+        key: str,
+        send: Callable[[Dict[str, str]], object],
+        parse: Callable[[object], object],
+        tags: Iterable[str] = (),
+        ttl: Optional[float] = None,
+    ):
+        """
+        Return the body for `key`, from the cache when fresh.
+
+        Args:
+            send: send(extra_headers) performs the GET and returns the response (or None on a handled error)
+            parse: parse(response) returns the body to cache and return (None is not cached)
+            tags: invalidation tags for the stored entry
+            ttl: seconds an entry is served without a request (default PROCORE_RESPONSE_CACHE_TTL_SECONDS)
+        """
+        ttl = cfg.PROCORE_RESPONSE_CACHE_TTL_SECONDS if ttl is None else ttl
+        if ttl <= 0:
+            response = send({})
+            return None if response is None else parse(response)
+
+        tags = tuple(tags)
+        bypass = self.bypassed()
+        validators = {}
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not bypass:
+                if time.monotonic() < entry.expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return copy.deepcopy(entry.body)
+                validators = entry.validators()
+            generations = {tag: self._generations.get(tag, 0) for tag in tags}
+
+        response = send(validators)
+        if response is None:
+            return None
+        if validators and response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.expires_at = time.monotonic() + ttl
+                    entry.etag = response.headers.get("ETag") or entry.etag
+                    self._entries.move_to_end(key)
+                    self._stats["revalidated"] += 1
+                    return copy.deepcopy(entry.body)
+            # Invalidated while the revalidation was in flight: fetch the body outright.
+            response = send({})
+            if response is None:
+                return None
+
+        body = parse(response)
+        with self._lock:
+            self._stats["bypassed" if bypass else "misses"] += 1
+            current = all(self._generations.get(tag, 0) == gen for tag, gen in generations.items())
+            if body is not None and current:
+                self._store(key, body, response.headers, tags, ttl)
+        return copy.deepcopy(body)
+
+    def _store(self, key, body, headers, tags, ttl) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._untag(key, old.tags)
+        self._entries[key] = _Entry(
+            copy.deepcopy(body),
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+            time.monotonic() + ttl,
+            tags,
+        )
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest_key, oldest = self._entries.popitem(last=False)
+            self._untag(oldest_key, oldest.tags)
+            self._stats["evicted"] += 1
+
+    def _untag(self, key, tags) -> None:
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def invalidate(self, tag: str) -> int:
+        """Drop every entry stored under `tag`; returns how many were dropped."""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            keys = self._keys_by_tag.pop(tag, set())
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._untag(key, entry.tags)
+            self._stats["invalidated"] += len(keys)
+        return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        served = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["revalidated"]) / served, 3) if served else 0.0
+        stats["ttl_seconds"] = cfg.PROCORE_RESPONSE_CACHE_TTL_SECONDS
+        return stats
+
+
+_cache = ProcoreResponseCache()
+
+
+def cached_get(key, send, parse, tags=(), ttl=None):
+    return _cache.get(key, send, parse, tags=tags, ttl=ttl)
+
+
+def invalidate_submittal(submittal_id) -> int:
+    dropped = _cache.invalidate(submittal_tag(submittal_id))
+    if dropped:
+        logger.debug("procore_response_cache_invalidated", submittal_id=str(submittal_id), entries=dropped)
+    return dropped
+
+
+def bypass():
+    return _cache.bypass()
+
+
+def response_cache_stats() -> dict:
+    """This process's Procore read-cache counters."""
+    return _cache.stats()
@@ -0,0 +1,61 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Thread-safe blocking token bucket shared by the Trello and Procore API clients.
+exports:
+  TokenBucket: Blocking token bucket (capacity + refill rate), pausable on a 429
+imports_from: []
+imported_by: [app/trello/client.py, app/procore/api.py]
+invariants:
+  - acquire() blocks until a token is available (or a pause ends) and returns the seconds waited.
+  - pause() empties the bucket and holds every caller until it ends; overlapping pauses keep the later end.
+  - Limits one process only; callers sharing a budget across processes must size it per process.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """Blocking token bucket shared by every thread that calls one rate-limited API."""
+
+    def __init__(self, capacity, refill_per_second, clock=time.monotonic, sleep=time.sleep):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    wait = (1 - self._tokens) / self.refill_per_second
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds):
+        """Hold every caller for `seconds` and empty the bucket (the API answered 429)."""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = max(now, self._paused_until)
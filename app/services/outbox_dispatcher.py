@@ -0,0 +1,317 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Batch dispatcher shared by TrelloOutbox and ProcoreOutbox — claims due rows atomically, runs each card's (or submittal's) rows in order on a bounded worker pool, and hands stuck claims back.
+exports:
+  OutboxSpec: What the dispatcher needs to know about one outbox table (model, ordering key, per-item handler, group coalescing and post-batch hooks)
+  OutboxDispatcher: claim() / dispatch() / release_stale() / stats() for one OutboxSpec; claim/dispatch can be limited to given row ids
+  dispatcher_for: Process-wide OutboxDispatcher for a spec name ('trello' or 'procore'), built on first use
+imports_from: [sqlalchemy, flask, app.models, app.config, app.logging_config]
+imported_by: [app/services/outbox_service.py]
+invariants:
+  - A row is claimed only together with every earlier open row for its ordering key, so one card's updates reach Trello in the order they were written while different cards go out side by side.
+  - Claims use SELECT ... FOR UPDATE SKIP LOCKED on Postgres and a guarded UPDATE ... WHERE status = 'pending' RETURNING id, so two workers never take the same row; the claim sets next_retry_at to the claim time, which is what release_stale() ages.
+  - A spec's coalesce(ids) hook runs on each key's claimed rows before delivery and returns the ids still to send; rows it folds away count as 'superseded'.
+  - A handler that leaves its row 'pending' (retry scheduled) stops its group; the group's later rows go back to 'pending' untouched and wait behind it.
+  - Groups run on a pool of OUTBOX_DISPATCH_WORKERS threads, each in its own app context; with one worker, or on an in-memory SQLite database (tests) that other threads cannot see, they run inline.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from flask import current_app
+from sqlalchemy import and_, func, or_, select, tuple_, update
+from sqlalchemy.orm import aliased
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+from app.models import db, in_memory_database
+
+logger = get_logger(__name__)
+
+_OPEN_STATUSES = ("pending", "processing")
+_STALE_CHECK_INTERVAL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class OutboxSpec:
+    """
+    One outbox table as the dispatcher sees it.
+
+    key(model) returns (columns, joins) for the ordering key of rows of `model` (which
+    may be an alias): rows with equal non-null key columns are delivered strictly in id
+    order. joins are (target, onclause) pairs outer-joined to reach those columns.
+    handler(item_id) processes one claimed row and returns (final status, extra); extra
+    values of completed rows are passed to after_batch once the whole batch is done.
+    coalesce(ids) gets one key's claimed ids (in order) before they run and returns the
+    ids still to deliver, having folded the rest into them.
+    """
+    name: str
+    model: Any
+    key: Callable[[Any], Tuple[Sequence[Any], Sequence[Tuple[Any, Any]]]]
+    handler: Callable[[int], Tuple[str, Any]]
+    after_batch: Optional[Callable[[List[Any]], None]] = None
+    coalesce: Optional[Callable[[List[int]], List[int]]] = None
+
+
+class OutboxDispatcher:
+    """Claims and delivers one outbox table's due rows; safe to share across threads."""
+
+    def __init__(self, spec: OutboxSpec, max_workers: Optional[int] = None):
+        self.spec = spec
+        self.max_workers = max(1, max_workers if max_workers is not None else cfg.OUTBOX_DISPATCH_WORKERS)
+        self._executor = None
+        self._lock = threading.Lock()
+        self._last_stale_check = 0.0
+        self._stats = {
+            "batches": 0,
+            "claimed": 0,
+            "completed": 0,
+            "retried": 0,
+            "failed": 0,
+            "superseded": 0,
+            "held_back": 0,  # rows handed back because an earlier row for the card will retry
+            "stale_released": 0,
+            "max_parallel_groups": 0,
+            "last_batch_ms": None,
+        }
+
+    # -- claim -------------------------------------------------------------
+
+    def claim(self, limit: int, only_ids: Optional[Sequence[int]] = None) -> List[Tuple[int, tuple]]:
+        """
+        Move up to `limit` due rows to 'processing', keeping each key's rows in line.
+
+        A due row is taken only when every earlier open row for its key is taken with
+        it; an earlier row that is in flight, waiting out a retry, or locked by another
+        worker's claim holds it back. only_ids restricts the claim to those rows (a
+        writer delivering the row it just queued); earlier rows still hold them back.
+
+        Returns:
+            [(item_id, ordering key)] in id order; rows without a key get a key of their own
+        """
+        M = self.spec.model
+        earlier = aliased(M)
+        now = datetime.utcnow()
+        cols, joins = self.spec.key(M)
+        earlier_cols, earlier_joins = self.spec.key(earlier)
+
+        def with_joins(query, pairs, outer):
+            for target, onclause in pairs:
+                query = query.outerjoin(target, onclause) if outer else query.join(target, onclause)
+            return query
+
+        due = or_(M.next_retry_at.is_(None), M.next_retry_at <= now)
+        blocked = with_joins(select(earlier.id), earlier_joins, outer=False).where(
+            earlier.id < M.id,
+            or_(earlier.status == "processing",
+                and_(earlier.status == "pending", earlier.next_retry_at > now)),
+            *[a == b for a, b in zip(earlier_cols, cols)],
+        ).exists()
+        rows = db.session.execute(
+            with_joins(select(M.id, *cols).select_from(M), joins, outer=True)
+            .where(M.status == "pending", due, ~blocked,
+                   *([M.id.in_(list(only_ids))] if only_ids is not None else []))
+            .order_by(M.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=M)
+        ).all()
+        candidates = [
+            (r[0], tuple(r[1:]) if all(v is not None for v in r[1:]) else ("item", r[0]))
+            for r in rows
+        ]
+
+        # Earlier open rows this select did not return (past the limit's key prefix,
+        # or SKIP LOCKED under another worker's claim) hold their key's rows back.
+        keyed = {key for _, key in candidates if key[:1] != ("item",)}
+        if keyed:
+            ids = [item_id for item_id, _ in candidates]
+            first_open = dict(
+                (tuple(r[:-1]), r[-1]) for r in db.session.execute(
+                    with_joins(select(*cols, func.min(M.id)).select_from(M), joins, outer=True)
+                    .where(M.status.in_(_OPEN_STATUSES), M.id.notin_(ids),
+                           M.id < max(ids), tuple_(*cols).in_(list(keyed)))
+                    .group_by(*cols)
+                ).all()
+            )
+            candidates = [(i, k) for i, k in candidates if not (k in first_open and first_open[k] < i)]
+        if not candidates:
+            db.session.rollback()
+            return []
+
+        claimed = set(db.session.execute(
+            update(M)
+            .where(M.id.in_([item_id for item_id, _ in candidates]), M.status == "pending")
+            .values(status="processing", next_retry_at=now)
+            .returning(M.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all())
+        db.session.commit()
+        return [(item_id, key) for item_id, key in candidates if item_id in claimed]
+
+    # -- dispatch ----------------------------------------------------------
+
+    def dispatch(self, limit: int = 10, only_ids: Optional[Sequence[int]] = None) -> int:
+        """
+        Claim one batch (of only_ids, when given) and deliver it, one group per ordering key.
+
+        Returns the number of rows that completed.
+        """
+        self._maybe_release_stale()
+        started = time.monotonic()
+        claimed = self.claim(limit, only_ids)
+        if not claimed:
+            return 0
+
+        groups: Dict[tuple, List[int]] = {}
+        for item_id, key in claimed:
+            groups.setdefault(key, []).append(item_id)
+
+        if self.max_workers <= 1 or len(groups) == 1 or in_memory_database():
+            results = [self._run_group(ids) for ids in groups.values()]
+        else:
+            app = current_app._get_current_object()
+            futures = [self._pool().submit(self._run_group_in_app, app, ids) for ids in groups.values()]
+            results = [f.result() for f in futures]
+
+        outcomes = [outcome for group_outcomes, _ in results for outcome in group_outcomes]
+        held_back = [item_id for _, group_held in results for item_id in group_held]
+        if held_back:
+            M = self.spec.model
+            db.session.execute(
+                update(M)
+                .where(M.id.in_(held_back), M.status == "processing")
+                .values(status="pending", next_retry_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+
+        extras = [extra for _, status, extra in outcomes if status == "completed" and extra is not None]
+        if extras and self.spec.after_batch:
+            try:
+                self.spec.after_batch(extras)
+            except Exception as e:
+                logger.error("outbox_after_batch_failed", outbox=self.spec.name,
+                             error=str(e), error_type=type(e).__name__, exc_info=True)
+
+        counts = {"completed": 0, "pending": 0, "failed": 0, "superseded": 0}
+        for _, status, _ in outcomes:
+            if status in counts:
+                counts[status] += 1
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["claimed"] += len(claimed)
+            self._stats["completed"] += counts["completed"]
+            self._stats["retried"] += counts["pending"]
+            self._stats["failed"] += counts["failed"]
+            self._stats["superseded"] += counts["superseded"]
+            self._stats["held_back"] += len(held_back)
+            self._stats["max_parallel_groups"] = max(self._stats["max_parallel_groups"], len(groups))
+            self._stats["last_batch_ms"] = elapsed_ms
+        logger.debug(
+            "outbox_batch_dispatched",
+            outbox=self.spec.name,
+            claimed=len(claimed),
+            groups=len(groups),
+            completed=counts["completed"],
+            retried=counts["pending"],
+            failed=counts["failed"],
+            superseded=counts["superseded"],
+            held_back=len(held_back),
+            duration_ms=elapsed_ms,
+        )
+        return counts["completed"]
+
+    def _run_group(self, ids: List[int]):
+        """Process one key's rows in order; stop at the first row left to retry."""
+        outcomes = []
+        if self.spec.coalesce and len(ids) > 1:
+            try:
+                kept = self.spec.coalesce(ids)
+            except Exception as e:
+                db.session.rollback()
+                logger.error("outbox_coalesce_failed", outbox=self.spec.name, outbox_ids=ids,
+                             error=str(e), error_type=type(e).__name__, exc_info=True)
+                kept = ids
+            outcomes.extend((item_id, "superseded", None) for item_id in ids if item_id not in kept)
+            ids = kept
+        for index, item_id in enumerate(ids):
+            try:
+                status, extra = self.spec.handler(item_id)
+            except Exception as e:
+                db.session.rollback()
+                logger.error("outbox_batch_item_failed", outbox=self.spec.name, outbox_id=item_id,
+                             error=str(e), error_type=type(e).__name__, exc_info=True)
+                status, extra = _status_of(self.spec.model, item_id), None
+            outcomes.append((item_id, status, extra))
+            if status not in ("completed", "failed"):
+                return outcomes, ids[index + 1:]
+        return outcomes, []
+
+    def _run_group_in_app(self, app, ids: List[int]):
+        with app.app_context():
+            return self._run_group(ids)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"outbox-{self.spec.name}-"
+                )
+            return self._executor
+
+    # -- maintenance -------------------------------------------------------
+
+    def release_stale(self, older_than_seconds: Optional[float] = None) -> int:
+        """Hand 'processing' rows claimed more than `older_than_seconds` ago back to 'pending'."""
+        M = self.spec.model
+        seconds = cfg.OUTBOX_STALE_CLAIM_SECONDS if older_than_seconds is None else older_than_seconds
+        cutoff = datetime.utcnow() - timedelta(seconds=seconds)
+        result = db.session.execute(
+            update(M)
+            .where(M.status == "processing", M.next_retry_at.isnot(None), M.next_retry_at < cutoff)
+            .values(status="pending", next_retry_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        released = result.rowcount or 0
+        if released:
+            with self._lock:
+                self._stats["stale_released"] += released
+            logger.warning("outbox_stale_claims_released", outbox=self.spec.name, count=released)
+        return released
+
+    def _maybe_release_stale(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_stale_check < _STALE_CHECK_INTERVAL_SECONDS:
+                return
+            self._last_stale_check = now
+        self.release_stale()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"workers": self.max_workers, **self._stats}
+
+
+def _status_of(model, item_id) -> Optional[str]:
+    db.session.expire_all()
+    item = db.session.get(model, item_id)
+    return item.status if item else None
+
+
+_dispatchers: Dict[str, OutboxDispatcher] = {}
+_dispatchers_lock = threading.Lock()
+
+
+def dispatcher_for(name: str, spec_factory: Callable[[], OutboxSpec]) -> OutboxDispatcher:
+    """The process-wide dispatcher registered under `name`, built from spec_factory() on first use."""
+    with _dispatchers_lock:
+        if name not in _dispatchers:
+            _dispatchers[name] = OutboxDispatcher(spec_factory())
+        return _dispatchers[name]
@@ -1,22 +1,35 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Reliable outbound delivery queue — retries failed Trello API calls with exponential backoff so webhook processing can stay async.
+purpose: Reliable outbound delivery queue — retries failed Trello and Procore API calls with exponential backoff so webhook processing can stay async.
 exports:
-  OutboxService: Static methods add(), process_item(), process_pending_items() for outbox lifecycle
-imports_from: [app/models, app/services/job_event_service, app/trello/api, app/trello/utils, app/brain/job_log/routes, app/config, app/logging_config]
-imported_by: [app/__init__.py, app/brain/job_log/routes.py, app/brain/job_log/features/fab_order/command.py]
+  OutboxService: Static methods add(), process_item(), folded_items(), process_pending_items(), process_procore_item(), process_pending_procore_items(), add_procore(), deliver_procore_item() for outbox lifecycle
+imports_from: [app/models, app/services/job_event_service, app/services/outbox_dispatcher, app/trello/api, app/trello/utils, app/brain/job_log/routes, app/procore/client, app/config, app/logging_config]
+imported_by: [app/__init__.py, app/brain/job_log/routes.py, app/brain/job_log/features/fab_order/command.py, app/brain/drafting_work_load/routes.py]
 invariants:
-  - Outbox writes must go through OutboxService.add(), not direct DB inserts, so retry semantics are preserved.
+  - Outbox writes must go through OutboxService.add() / add_procore(), not direct DB inserts, so retry semantics are preserved; rows are written 'pending' so the dispatcher can claim them.
   - Exponential backoff is 2^retry_count seconds (2, 4, 8, 16, 32); max 5 retries per item.
-  - process_pending_items batches list sorts after fab_order updates to avoid redundant Trello API calls.
+  - process_pending_* hand batches to app/services/outbox_dispatcher.py: one card's (or submittal's) items are delivered in id order, different cards in parallel.
+  - A completed item and its closed event are written in one commit.
+  - Stage moves, fab_order and release-field updates for one card coalesce: add() (and the dispatcher, for a claimed group) marks the card's older such items 'superseded' with superseded_by_id pointing at the newest, which sends the latest state in one card PUT (plus the fab_order custom field) and closes every folded event. Notes and create_card never fold.
+  - process_pending_items batches list sorts after fab_order updates and bulk (batch_id-tagged) card moves to avoid redundant Trello API calls.
   - Uses lazy imports inside methods to avoid circular import chains with models and services.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 from datetime import datetime, timedelta
 from app.logging_config import get_logger
 logger = get_logger(__name__)
 
+# Trello actions whose outcome is "the card's current state" rather than an
+# append (comments) or a one-off (create): an older pending one is redundant once
+# a newer one for the same card is queued.
+_FOLDABLE_ACTIONS = ('move_card', 'update_fab_order', 'update_release_fields')
+
+# Releases fields that feed the card title / description (update_release_fields)
+_CARD_TITLE_FIELDS = {'job', 'release', 'job_name', 'description'}
+_CARD_DESCRIPTION_FIELDS = {'description', 'install_hrs', 'paint_color', 'pm', 'by', 'released'}
+
+
 class OutboxService:
     """Service for managing outbox items with retry capabilities"""
     
@@ -24,6 +37,10 @@ class OutboxService:
     def add(destination, action, event_id):
         """
         Add item to outbox for async processing.
+
+        Pending move_card / update_fab_order / update_release_fields items for the
+        same card are folded into the new one (marked 'superseded'), so the card
+        gets one update carrying the latest state.
         
         Args:
             destination: 'trello' or 'procore'
@@ -45,6 +62,10 @@ class OutboxService:
         
         db.session.add(outbox_item)
         db.session.flush()
+
+        folded = []
+        if destination == 'trello' and action in _FOLDABLE_ACTIONS:
+            folded = _fold_pending_into(outbox_item)
         
         logger.debug(
             "outbox_item_created",
@@ -52,8 +73,21 @@ class OutboxService:
             event_id=event_id,
             destination=destination,
             action=action,
+            superseded=folded or None,
         )
         return outbox_item
+
+    @staticmethod
+    def folded_items(outbox_item):
+        """Older items superseded by outbox_item (delivered with it), in id order."""
+        from app.models import TrelloOutbox
+
+        return (
+            TrelloOutbox.query
+            .filter(TrelloOutbox.superseded_by_id == outbox_item.id)
+            .order_by(TrelloOutbox.id)
+            .all()
+        )
     
     @staticmethod
     def process_item(outbox_item):
@@ -77,9 +111,11 @@ class OutboxService:
         from app.trello.api import update_trello_card
         from app.config import Config as cfg
 
-        # Mark as processing to prevent concurrent processing
-        outbox_item.status = 'processing'
-        db.session.commit()
+        # Mark as processing to prevent concurrent processing (the dispatcher's
+        # claim has already done this for the whole batch)
+        if outbox_item.status != 'processing':
+            outbox_item.status = 'processing'
+            db.session.commit()
         
         try:
             # Get the associated event
@@ -119,11 +155,18 @@ class OutboxService:
             # Stash list_id for batch sort in process_pending_items (not persisted)
             outbox_item._trello_list_id = job_record.trello_list_id
 
+            # Older updates for this card were folded into this item: send the
+            # combined latest state instead of this item's own action alone.
+            folded = OutboxService.folded_items(outbox_item) if outbox_item.destination == 'trello' else []
+            if folded:
+                return _process_folded_item(outbox_item, event, job_record, folded)
+
             # Process based on destination and action
             if outbox_item.destination == 'trello' and outbox_item.action == 'move_card':
-                # Derive stage from event payload
-                stage = event.payload.get('to')
-                if not stage:
+                # Derive stage and target list from event payload
+                try:
+                    stage, list_id = _move_card_target(event)
+                except _OutboxItemInvalid as invalid:
                     logger.error(
                         "outbox_payload_invalid",
                         outbox_id=outbox_item.id,
@@ -132,11 +175,11 @@ class OutboxService:
                         release=event.release,
                         destination=outbox_item.destination,
                         action=outbox_item.action,
-                        error="Event payload missing 'to' field",
+                        error=str(invalid),
                         status="error",
                     )
                     outbox_item.status = 'failed'
-                    outbox_item.error_message = "Event payload missing 'to' field"
+                    outbox_item.error_message = str(invalid)
                     db.session.commit()
                     return False
                 
@@ -157,40 +200,15 @@ class OutboxService:
                     outbox_item.error_message = "Job has no trello_card_id"
                     db.session.commit()
                     return False
-                
-                # Get list_id from stage name using the shared mapping
-                from app.brain.job_log.routes import get_list_id_by_stage
-                list_id = get_list_id_by_stage(stage)
-                if not list_id:
-                    logger.error(
-                        "outbox_stage_unmapped",
-                        outbox_id=outbox_item.id,
-                        event_id=event.id,
-                        job=event.job,
-                        release=event.release,
-                        stage=stage,
-                        destination=outbox_item.destination,
-                        action=outbox_item.action,
-                        status="error",
-                    )
-                    outbox_item.status = 'failed'
-                    outbox_item.error_message = f"Could not get list ID for stage: {stage}"
-                    db.session.commit()
-                    return False
 
-                # TRELLO_MOCK: simulate the move locally — write the target list onto
-                # Releases (mirroring what the inbound webhook would have done) and
-                # close the event as if Trello accepted the call.
+                # TRELLO_MOCK: simulate the move locally and close the event as if
+                # Trello accepted the call.
                 from flask import current_app
                 if current_app.config.get("TRELLO_MOCK"):
-                    from app.trello.list_mapper import TrelloListMapper
-                    target_list_name = TrelloListMapper.DB_STAGE_TO_TRELLO_LIST.get(stage)
-                    job_record.trello_list_id = list_id
-                    job_record.trello_list_name = target_list_name
+                    target_list_name = _apply_mocked_move(job_record, stage, list_id)
                     outbox_item.status = 'completed'
                     outbox_item.completed_at = datetime.utcnow()
                     outbox_item.error_message = None
-                    db.session.commit()
                     JobEventService.close(event.id)
                     db.session.commit()
                     logger.info(
@@ -211,12 +229,17 @@ class OutboxService:
                 # Execute the Trello API call
                 try:
                     update_trello_card(card_id, new_list_id=list_id)
+
+                    # Bulk stage moves sort each destination list once per pass
+                    # in process_pending_items instead of leaving the cards
+                    # wherever Trello dropped them (not persisted).
+                    if event.payload.get('batch_id'):
+                        outbox_item._sort_list_id = list_id
                     
                     # Success! Mark outbox item as completed
                     outbox_item.status = 'completed'
                     outbox_item.completed_at = datetime.utcnow()
                     outbox_item.error_message = None
-                    db.session.commit()
                     
                     # Close the associated event now that external API call succeeded
                     JobEventService.close(event.id)
@@ -304,80 +327,34 @@ class OutboxService:
                 
                 # Execute the Trello API call
                 try:
-                    from app.trello.api import update_card_custom_field_number
-                    from app.config import Config as cfg
-                    import math
+                    # NOTE: List sorting is deferred to process_pending_items()
+                    # to avoid redundant sorts when processing batches.
+                    # fab_order None: Trello API doesn't have a clear way to remove
+                    # custom field values, so it is marked done without a call.
+                    sent = _send_fab_order(card_id, fab_order)
+
+                    # Success! Mark outbox item as completed
+                    outbox_item.status = 'completed'
+                    outbox_item.completed_at = datetime.utcnow()
+                    outbox_item.error_message = None
                     
-                    if cfg.FAB_ORDER_FIELD_ID:
-                        # Convert fab_order to int if it's not None
-                        if fab_order is not None:
-                            if isinstance(fab_order, float):
-                                fab_order_int = math.ceil(fab_order)
-                            else:
-                                fab_order_int = int(fab_order)
-                            
-                            # Update custom field
-                            success = update_card_custom_field_number(
-                                card_id,
-                                cfg.FAB_ORDER_FIELD_ID,
-                                fab_order_int
-                            )
-                            
-                            if success:
-                                # NOTE: List sorting is deferred to process_pending_items()
-                                # to avoid redundant sorts when processing batches.
-
-                                # Success! Mark outbox item as completed
-                                outbox_item.status = 'completed'
-                                outbox_item.completed_at = datetime.utcnow()
-                                outbox_item.error_message = None
-                                db.session.commit()
-                                
-                                # Close the associated event now that external API call succeeded
-                                JobEventService.close(event.id)
-                                db.session.commit()
-                                
-                                logger.info(
-                                    "outbox_item_completed",
-                                    outbox_id=outbox_item.id,
-                                    event_id=event.id,
-                                    job=event.job,
-                                    release=event.release,
-                                    card_id=card_id,
-                                    destination=outbox_item.destination,
-                                    action=outbox_item.action,
-                                    retry_count=outbox_item.retry_count,
-                                    status="ok",
-                                )
-                                return True
-                            else:
-                                raise Exception("Failed to update Trello custom field")
-                        else:
-                            # fab_order is None - we could clear the field, but for now just mark as success
-                            # (Trello API doesn't have a clear way to remove custom field values)
-                            outbox_item.status = 'completed'
-                            outbox_item.completed_at = datetime.utcnow()
-                            outbox_item.error_message = None
-                            db.session.commit()
-                            
-                            JobEventService.close(event.id)
-                            db.session.commit()
-                            
-                            logger.info(
-                                "outbox_item_completed",
-                                outbox_id=outbox_item.id,
-                                event_id=event.id,
-                                job=event.job,
-                                release=event.release,
-                                card_id=card_id,
-                                destination=outbox_item.destination,
-                                action=outbox_item.action,
-                                retry_count=outbox_item.retry_count,
-                                status="skipped",
-                            )
-                            return True
-                    else:
-                        raise Exception("FAB_ORDER_FIELD_ID not configured")
+                    # Close the associated event now that external API call succeeded
+                    JobEventService.close(event.id)
+                    db.session.commit()
+                    
+                    logger.info(
+                        "outbox_item_completed",
+                        outbox_id=outbox_item.id,
+                        event_id=event.id,
+                        job=event.job,
+                        release=event.release,
+                        card_id=card_id,
+                        destination=outbox_item.destination,
+                        action=outbox_item.action,
+                        retry_count=outbox_item.retry_count,
+                        status="ok" if sent else "skipped",
+                    )
+                    return True
                     
                 except Exception as api_error:
                     # API call failed - handle retry logic
@@ -439,15 +416,17 @@ class OutboxService:
                     db.session.commit()
                     return False
                 
-                # Derive notes from event payload
-                notes = event.payload.get('to', '')
-                if not notes:
-                    # Empty notes - nothing to do in Trello (comments can't be deleted via API easily)
+                # Execute the Trello API call (empty notes: nothing to do in Trello,
+                # comments can't be deleted via API easily)
+                try:
+                    sent = _send_notes(card_id, event)
+
+                    # Success! Mark outbox item as completed
                     outbox_item.status = 'completed'
                     outbox_item.completed_at = datetime.utcnow()
                     outbox_item.error_message = None
-                    db.session.commit()
                     
+                    # Close the associated event now that external API call succeeded
                     JobEventService.close(event.id)
                     db.session.commit()
                     
@@ -461,51 +440,9 @@ class OutboxService:
                         destination=outbox_item.destination,
                         action=outbox_item.action,
                         retry_count=outbox_item.retry_count,
-                        status="skipped",
+                        status="ok" if sent else "skipped",
                     )
                     return True
-                
-                # Derive sender initials from the event's user
-                sender_initials = 'UNK'
-                if event.internal_user_id:
-                    from app.models import User, db
-                    user = db.session.get(User, event.internal_user_id)
-                    if user and user.first_name and user.last_name:
-                        sender_initials = (user.first_name[0] + user.last_name[0]).upper()
-
-                # Execute the Trello API call
-                try:
-                    from app.trello.api import add_comment_to_trello_card
-
-                    # Add comment to Trello card
-                    success = add_comment_to_trello_card(card_id, str(notes), sender_initials=sender_initials)
-                    
-                    if success:
-                        # Success! Mark outbox item as completed
-                        outbox_item.status = 'completed'
-                        outbox_item.completed_at = datetime.utcnow()
-                        outbox_item.error_message = None
-                        db.session.commit()
-                        
-                        # Close the associated event now that external API call succeeded
-                        JobEventService.close(event.id)
-                        db.session.commit()
-                        
-                        logger.info(
-                            "outbox_item_completed",
-                            outbox_id=outbox_item.id,
-                            event_id=event.id,
-                            job=event.job,
-                            release=event.release,
-                            card_id=card_id,
-                            destination=outbox_item.destination,
-                            action=outbox_item.action,
-                            retry_count=outbox_item.retry_count,
-                            status="ok",
-                        )
-                        return True
-                    else:
-                        raise Exception("Failed to add comment to Trello card")
                     
                 except Exception as api_error:
                     # API call failed - handle retry logic
@@ -571,7 +508,6 @@ class OutboxService:
                         outbox_item.status = 'completed'
                         outbox_item.completed_at = datetime.utcnow()
                         outbox_item.error_message = None
-                        db.session.commit()
 
                         JobEventService.close(event.id)
                         db.session.commit()
@@ -656,17 +592,13 @@ class OutboxService:
                 # Determine which parts of the card need regenerating from the
                 # set of Releases fields that changed (event.payload keys).
                 changed_fields = set(event.payload.keys()) if event.payload else set()
-                TITLE_FIELDS = {'job', 'release', 'job_name', 'description'}
-                DESCRIPTION_FIELDS = {'description', 'install_hrs', 'paint_color', 'pm', 'by', 'released'}
-                needs_title = bool(changed_fields & TITLE_FIELDS)
-                needs_description = bool(changed_fields & DESCRIPTION_FIELDS)
+                new_title, new_description = _release_fields_content(job_record, changed_fields)
 
-                if not needs_title and not needs_description:
+                if new_title is None and new_description is None:
                     # e.g. only fab_hrs changed — nothing on the card needs updating
                     outbox_item.status = 'completed'
                     outbox_item.completed_at = datetime.utcnow()
                     outbox_item.error_message = None
-                    db.session.commit()
 
                     JobEventService.close(event.id)
                     db.session.commit()
@@ -687,61 +619,18 @@ class OutboxService:
 
                 # Execute the Trello API call(s)
                 try:
-                    from app.trello.card_creation import build_card_title, build_card_description
-                    from app.trello.api import (
-                        update_trello_card_name,
-                        update_trello_card_description,
-                        update_mirror_card_content,
-                    )
-
-                    new_title = None
-                    new_description = None
+                    from app.trello.api import update_trello_card_name, update_trello_card_description
 
-                    if needs_title:
-                        new_title = build_card_title(
-                            job_record.job, job_record.release, job_record.job_name, job_record.description
-                        )
+                    if new_title is not None:
                         update_trello_card_name(card_id, new_title)
-
-                    if needs_description:
-                        new_description = build_card_description(
-                            description=job_record.description,
-                            install_hrs=job_record.install_hrs,
-                            paint_color=job_record.paint_color,
-                            pm=job_record.pm,
-                            by=job_record.by,
-                            released=job_record.released,
-                            num_guys=job_record.num_guys or 2,
-                        )
+                    if new_description is not None:
                         update_trello_card_description(card_id, new_description)
-
-                    # Best-effort: keep the mirror card's title/description in sync too
-                    # (it's a full clone of the primary at creation but nothing else
-                    # keeps them aligned afterward). A failure here doesn't fail the
-                    # primary sync, which already succeeded.
-                    try:
-                        update_mirror_card_content(
-                            card_id,
-                            new_title=new_title,
-                            new_description=new_description,
-                            mirror_card_id=job_record.mirror_trello_card_id,
-                        )
-                    except Exception as mirror_error:
-                        logger.warning(
-                            "mirror_card_sync_failed",
-                            outbox_id=outbox_item.id,
-                            event_id=event.id,
-                            card_id=card_id,
-                            error=str(mirror_error),
-                            error_type=type(mirror_error).__name__,
-                            exc_info=True,
-                        )
+                    _sync_mirror_content(outbox_item, event, card_id, job_record, new_title, new_description)
 
                     # Success! Mark outbox item as completed
                     outbox_item.status = 'completed'
                     outbox_item.completed_at = datetime.utcnow()
                     outbox_item.error_message = None
-                    db.session.commit()
 
                     # Close the associated event now that external API call succeeded
                     JobEventService.close(event.id)
@@ -845,77 +734,573 @@ class OutboxService:
     @staticmethod
     def process_pending_items(limit=10):
         """
-        Process pending outbox items that are ready for retry.
-        
-        This method queries for items that are:
-        - Status is 'pending'
-        - next_retry_at is in the past (or now)
-        
+        Process pending Trello outbox items that are ready for retry.
+
+        Claims up to `limit` items (status 'pending', next_retry_at in the past)
+        in one statement and runs them through the shared OutboxDispatcher: items
+        for different cards go out side by side, items for the same card strictly
+        in order. Lists touched by fab_order updates and bulk card moves are sorted
+        once after the batch.
+
         Args:
             limit: Maximum number of items to process in this batch
-            
+
         Returns:
-            int: Number of items processed
+            int: Number of items completed
         """
-        from app.models import TrelloOutbox, db
-        
-        # Query for pending items ready to process
-        now = datetime.utcnow()
-        pending_items = TrelloOutbox.query.filter(
-            TrelloOutbox.status == 'pending',
-            TrelloOutbox.next_retry_at <= now
-        ).limit(limit).all()
-        
-        if not pending_items:
-            return 0
-        
-        processed_count = 0
-        # Track lists that need sorting after fab_order batch updates
-        lists_to_sort = set()
-
-        for item in pending_items:
-            try:
-                if OutboxService.process_item(item):
-                    processed_count += 1
-                    # Collect list_id for deferred sort after fab_order updates
-                    if item.action == 'update_fab_order' and item.status == 'completed':
-                        list_id = getattr(item, '_trello_list_id', None)
-                        if list_id:
-                            lists_to_sort.add(list_id)
-            except Exception as e:
+        return _trello_dispatcher().dispatch(limit)
+
+    @staticmethod
+    def process_procore_item(outbox_item):
+        """
+        Send one ProcoreOutbox row to Procore, retrying with the same backoff as Trello items.
+
+        Returns:
+            bool: True if the call succeeded
+        """
+        from app.models import db
+        from app.procore.client import get_procore_client
+
+        if outbox_item.status != 'processing':
+            outbox_item.status = 'processing'
+            db.session.commit()
+
+        try:
+            if outbox_item.action != 'update_status':
                 logger.error(
-                    "outbox_batch_item_failed",
-                    outbox_id=item.id,
-                    event_id=item.event_id,
-                    destination=item.destination,
-                    action=item.action,
-                    retry_count=item.retry_count,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    exc_info=True,
+                    "outbox_action_unsupported",
+                    outbox_id=outbox_item.id,
+                    destination="procore",
+                    action=outbox_item.action,
+                    status="error",
                 )
+                outbox_item.status = 'failed'
+                outbox_item.error_message = f"Unsupported: procore/{outbox_item.action}"
+                db.session.commit()
+                return False
 
-        # Batch sort: sort each affected list once after all fab_order updates
-        if lists_to_sort:
-            from app.trello.utils import sort_list_if_needed
-            from app.config import Config as cfg
-            if cfg.FAB_ORDER_FIELD_ID:
-                for list_id in lists_to_sort:
-                    try:
-                        sort_list_if_needed(list_id, cfg.FAB_ORDER_FIELD_ID, None, "batch")
-                    except Exception as e:
-                        logger.error(
-                            "trello_list_sort_failed",
-                            list_id=list_id,
-                            error=str(e),
-                            error_type=type(e).__name__,
-                            exc_info=True,
-                        )
+            status_id = (outbox_item.request_payload or {}).get('status_id')
+            get_procore_client().update_submittal_status(
+                outbox_item.project_id, int(outbox_item.submittal_id), status_id
+            )
+            outbox_item.status = 'completed'
+            outbox_item.completed_at = datetime.utcnow()
+            outbox_item.error_message = None
+            db.session.commit()
+            logger.info(
+                "outbox_item_completed",
+                outbox_id=outbox_item.id,
+                submittal_id=outbox_item.submittal_id,
+                project_id=outbox_item.project_id,
+                destination="procore",
+                action=outbox_item.action,
+                retry_count=outbox_item.retry_count,
+                status="ok",
+            )
+            return True
+        except Exception as e:
+            db.session.rollback()
+            logger.error(
+                "outbox_process_failed",
+                outbox_id=outbox_item.id,
+                submittal_id=outbox_item.submittal_id,
+                destination="procore",
+                action=outbox_item.action,
+                retry_count=outbox_item.retry_count,
+                status="error",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            outbox_item.status = 'pending'
+            outbox_item.error_message = str(e)[:500]
+            outbox_item.retry_count = (outbox_item.retry_count or 0) + 1
+            if outbox_item.retry_count < (outbox_item.max_retries or 5):
+                outbox_item.next_retry_at = datetime.utcnow() + timedelta(seconds=2 ** outbox_item.retry_count)
+            else:
+                outbox_item.status = 'failed'
+            db.session.commit()
+            return False
+
+    @staticmethod
+    def process_pending_procore_items(limit=10):
+        """Process pending ProcoreOutbox rows; same dispatcher, ordered per submittal."""
+        return _procore_dispatcher().dispatch(limit)
+
+    @staticmethod
+    def add_procore(submittal_id, project_id, action, request_payload):
+        """
+        Queue a Procore call as a 'pending' ProcoreOutbox row. Flushes only — the caller commits.
+
+        Args:
+            submittal_id: Procore submittal id
+            project_id: Procore project id
+            action: 'update_status'
+            request_payload: e.g. {"status_id": 203238}
+        """
+        from app.models import ProcoreOutbox, db
+
+        outbox_item = ProcoreOutbox(
+            submittal_id=str(submittal_id),
+            project_id=project_id,
+            action=action,
+            request_payload=request_payload,
+            status='pending',
+            retry_count=0,
+            next_retry_at=datetime.utcnow(),
+        )
+        db.session.add(outbox_item)
+        db.session.flush()
+        logger.debug(
+            "outbox_item_created",
+            outbox_id=outbox_item.id,
+            submittal_id=outbox_item.submittal_id,
+            destination="procore",
+            action=action,
+        )
+        return outbox_item
+
+    @staticmethod
+    def deliver_procore_item(item_id):
+        """
+        Send a committed ProcoreOutbox row now instead of waiting for the retry thread.
+
+        The row is claimed by the same dispatcher as a batch, so it still waits behind
+        earlier open rows for its submittal; if it is not claimable now, or the call
+        fails, the retry thread delivers it later.
+
+        Returns:
+            str: The row's status afterwards ('completed', 'pending', 'processing' or 'failed')
+        """
+        from app.models import ProcoreOutbox, db
+
+        _procore_dispatcher().dispatch(1, only_ids=[item_id])
+        db.session.expire_all()
+        item = db.session.get(ProcoreOutbox, item_id)
+        return item.status if item else None
+
+
+def _trello_card_key(model):
+    """Trello items are ordered per release (= per card), reached through their event."""
+    from app.models import ReleaseEvents
+    from sqlalchemy.orm import aliased
+
+    event = aliased(ReleaseEvents)
+    return [event.job, event.release], [(event, event.id == model.event_id)]
+
+
+def _run_trello_item(item_id):
+    from app.models import TrelloOutbox, db
+
+    item = db.session.get(TrelloOutbox, item_id)
+    if item is None:
+        return None, None
+    OutboxService.process_item(item)
+    sort_list_id = None
+    if item.status == 'completed':
+        # Stashed by process_item (not persisted) for the post-batch sort
+        sort_list_id = getattr(item, '_sort_list_id', None)
+        if sort_list_id is None and item.action == 'update_fab_order':
+            sort_list_id = getattr(item, '_trello_list_id', None)
+    return item.status, sort_list_id
+
+
+def _supersede(head_id, older_ids, from_status):
+    """
+    Mark older_ids (still in from_status) superseded by head_id; rows they had already
+    folded in move over to head_id too. Flushes only — the caller commits.
+
+    Returns:
+        list: ids actually superseded
+    """
+    from app.models import TrelloOutbox, db
+    from sqlalchemy import update
+
+    if not older_ids:
+        return []
+    superseded = db.session.execute(
+        update(TrelloOutbox)
+        .where(TrelloOutbox.id.in_(older_ids), TrelloOutbox.status == from_status)
+        .values(status='superseded', superseded_by_id=head_id)
+        .returning(TrelloOutbox.id)
+    ).scalars().all()
+    if superseded:
+        db.session.execute(
+            update(TrelloOutbox)
+            .where(TrelloOutbox.superseded_by_id.in_(superseded))
+            .values(superseded_by_id=head_id)
+        )
+    return sorted(superseded)
+
+
+def _fold_pending_into(head):
+    """Supersede this card's older pending foldable items with the freshly added head."""
+    from app.models import ReleaseEvents, TrelloOutbox, db
+
+    event = db.session.get(ReleaseEvents, head.event_id)
+    if event is None:
+        return []
+    older = [
+        row_id for (row_id,) in (
+            db.session.query(TrelloOutbox.id)
+            .join(ReleaseEvents, TrelloOutbox.event_id == ReleaseEvents.id)
+            .filter(
+                ReleaseEvents.job == event.job,
+                ReleaseEvents.release == event.release,
+                TrelloOutbox.destination == 'trello',
+                TrelloOutbox.status == 'pending',
+                TrelloOutbox.action.in_(_FOLDABLE_ACTIONS),
+                TrelloOutbox.id < head.id,
+            )
+            .all()
+        )
+    ]
+    return _supersede(head.id, older, 'pending')
+
+
+def _fold_claimed_group(ids):
+    """
+    Dispatcher hook: fold a claimed card group's foldable items into its newest one.
+
+    Catches items queued before add() could fold them (or while an earlier item for
+    the card was in flight). Only moves deliveries later, never earlier, so anything
+    that depends on an earlier item still runs after it.
+    """
+    from app.models import TrelloOutbox, db
+
+    foldable = sorted(
+        row_id for row_id, action in (
+            db.session.query(TrelloOutbox.id, TrelloOutbox.action)
+            .filter(TrelloOutbox.id.in_(ids))
+            .all()
+        )
+        if action in _FOLDABLE_ACTIONS
+    )
+    if len(foldable) < 2:
+        return ids
+    folded = set(_supersede(foldable[-1], foldable[:-1], 'processing'))
+    db.session.commit()
+    return [item_id for item_id in ids if item_id not in folded]
+
+
+def _schedule_retry(outbox_item, api_error):
+    """Same backoff as process_item: 2^retry_count seconds, 'failed' after max_retries."""
+    outbox_item.retry_count = (outbox_item.retry_count or 0) + 1
+    outbox_item.error_message = str(api_error)
+    if outbox_item.retry_count < (outbox_item.max_retries or 5):
+        outbox_item.next_retry_at = datetime.utcnow() + timedelta(seconds=2 ** outbox_item.retry_count)
+        outbox_item.status = 'pending'
+        logger.debug(
+            "outbox_retry_scheduled",
+            outbox_id=outbox_item.id,
+            event_id=outbox_item.event_id,
+            destination=outbox_item.destination,
+            action=outbox_item.action,
+            retry_count=outbox_item.retry_count,
+            max_retries=outbox_item.max_retries,
+            error=str(api_error),
+            error_type=type(api_error).__name__,
+        )
+    else:
+        outbox_item.status = 'failed'
+        logger.error(
+            "outbox_delivery_failed",
+            outbox_id=outbox_item.id,
+            event_id=outbox_item.event_id,
+            destination=outbox_item.destination,
+            action=outbox_item.action,
+            retry_count=outbox_item.retry_count,
+            max_retries=outbox_item.max_retries,
+            status="error",
+            error=str(api_error),
+            error_type=type(api_error).__name__,
+        )
+
+
+class _OutboxItemInvalid(Exception):
+    """The item can never be delivered as written (bad payload, unmapped stage); fail it without retrying."""
+
+
+def _move_card_target(event):
+    """move_card: (stage, Trello list id) the event moves the card to."""
+    stage = (event.payload or {}).get('to')
+    if not stage:
+        raise _OutboxItemInvalid("Event payload missing 'to' field")
+    # Get list_id from stage name using the shared mapping
+    from app.brain.job_log.routes import get_list_id_by_stage
+    list_id = get_list_id_by_stage(stage)
+    if not list_id:
+        raise _OutboxItemInvalid(f"Could not get list ID for stage: {stage}")
+    return stage, list_id
+
+
+def _apply_mocked_move(job_record, stage, list_id):
+    """TRELLO_MOCK: write the target list onto Releases, mirroring what the inbound webhook would have done."""
+    from app.trello.list_mapper import TrelloListMapper
+
+    job_record.trello_list_id = list_id
+    job_record.trello_list_name = TrelloListMapper.DB_STAGE_TO_TRELLO_LIST.get(stage)
+    return job_record.trello_list_name
+
+
+def _release_fields_content(job_record, changed_fields):
+    """update_release_fields: (card title, card description) regenerated for changed_fields; None where untouched."""
+    from app.trello.card_creation import build_card_title, build_card_description
+
+    new_title = None
+    new_description = None
+    if changed_fields & _CARD_TITLE_FIELDS:
+        new_title = build_card_title(
+            job_record.job, job_record.release, job_record.job_name, job_record.description
+        )
+    if changed_fields & _CARD_DESCRIPTION_FIELDS:
+        new_description = build_card_description(
+            description=job_record.description,
+            install_hrs=job_record.install_hrs,
+            paint_color=job_record.paint_color,
+            pm=job_record.pm,
+            by=job_record.by,
+            released=job_record.released,
+            num_guys=job_record.num_guys or 2,
+        )
+    return new_title, new_description
+
+
+def _sync_mirror_content(outbox_item, event, card_id, job_record, new_title, new_description):
+    """
+    Best-effort: keep the mirror card's title/description in sync too (it's a full
+    clone of the primary at creation but nothing else keeps them aligned afterward).
+    A failure here doesn't fail the primary sync, which already succeeded.
+    """
+    from app.trello.api import update_mirror_card_content
+
+    try:
+        update_mirror_card_content(
+            card_id,
+            new_title=new_title,
+            new_description=new_description,
+            mirror_card_id=job_record.mirror_trello_card_id,
+        )
+    except Exception as mirror_error:
+        logger.warning(
+            "mirror_card_sync_failed",
+            outbox_id=outbox_item.id,
+            event_id=event.id,
+            card_id=card_id,
+            error=str(mirror_error),
+            error_type=type(mirror_error).__name__,
+            exc_info=True,
+        )
+
+
+def _send_fab_order(card_id, fab_order):
+    """
+    update_fab_order: set the card's Fab Order custom field (floats round up).
+
+    Returns:
+        bool: False when fab_order is None and nothing was sent
+    """
+    import math
+    from app.config import Config as cfg
+    from app.trello.api import update_card_custom_field_number
+
+    if not cfg.FAB_ORDER_FIELD_ID:
+        raise Exception("FAB_ORDER_FIELD_ID not configured")
+    if fab_order is None:
+        return False
+    fab_order_int = math.ceil(fab_order) if isinstance(fab_order, float) else int(fab_order)
+    if not update_card_custom_field_number(card_id, cfg.FAB_ORDER_FIELD_ID, fab_order_int):
+        raise Exception("Failed to update Trello custom field")
+    return True
+
+
+def _send_notes(card_id, event):
+    """
+    update_notes: post the event's notes as a card comment tagged with the author's initials.
+
+    Returns:
+        bool: False when the notes are empty and nothing was sent
+    """
+    from app.models import User, db
+    from app.trello.api import add_comment_to_trello_card
+
+    notes = (event.payload or {}).get('to', '')
+    if not notes:
+        return False
+    # Derive sender initials from the event's user
+    sender_initials = 'UNK'
+    if event.internal_user_id:
+        user = db.session.get(User, event.internal_user_id)
+        if user and user.first_name and user.last_name:
+            sender_initials = (user.first_name[0] + user.last_name[0]).upper()
+    if not add_comment_to_trello_card(card_id, str(notes), sender_initials=sender_initials):
+        raise Exception("Failed to add comment to Trello card")
+    return True
+
+
+def _process_folded_item(outbox_item, event, job_record, folded):
+    """
+    Deliver outbox_item together with the older items folded into it.
+
+    Rows are read in id order, so the newest stage move and fab_order win and every
+    update_release_fields row's changed fields count; each action then goes through
+    the same helper as its own process_item branch. List, title and description
+    then go out in one card PUT, fab_order (a custom field) in one more call. On
+    success every folded event is closed with the item's own.
+    """
+    from flask import current_app
+    from app.models import db
+    from app.services.job_event_service import JobEventService
+
+    rows = folded + [outbox_item]
+
+    def fail(message):
+        outbox_item.status = 'failed'
+        outbox_item.error_message = message
+        db.session.commit()
+        logger.error(
+            "outbox_folded_update_failed",
+            outbox_id=outbox_item.id,
+            event_id=event.id,
+            job=event.job,
+            release=event.release,
+            folded=[row.id for row in folded],
+            error=message,
+            status="error",
+        )
+        return False
+
+    card_id = job_record.trello_card_id
+    if not card_id:
+        return fail("Job has no trello_card_id")
+
+    move = fab_event = None
+    changed_fields = set()
+    for row in rows:
+        if row.event is None:
+            continue
+        if row.action == 'move_card':
+            move = row.event
+        elif row.action == 'update_fab_order':
+            fab_event = row.event
+        elif row.action == 'update_release_fields':
+            changed_fields |= set((row.event.payload or {}).keys())
+
+    stage = list_id = None
+    if move is not None:
+        try:
+            stage, list_id = _move_card_target(move)
+        except _OutboxItemInvalid as invalid:
+            return fail(str(invalid))
+
+    put_list_id = list_id
+    if list_id and current_app.config.get("TRELLO_MOCK"):
+        _apply_mocked_move(job_record, stage, list_id)
+        put_list_id = None
+
+    try:
+        from app.trello.api import update_trello_card
+
+        new_title, new_description = _release_fields_content(job_record, changed_fields)
+        if put_list_id or new_title is not None or new_description is not None:
+            update_trello_card(
+                card_id, new_list_id=put_list_id, new_name=new_title, new_description=new_description
+            )
+        if fab_event is not None:
+            _send_fab_order(card_id, (fab_event.payload or {}).get('to'))
+        if new_title is not None or new_description is not None:
+            _sync_mirror_content(outbox_item, event, card_id, job_record, new_title, new_description)
+    except Exception as api_error:
+        _schedule_retry(outbox_item, api_error)
+        db.session.commit()
+        return False
+
+    # Lists to re-sort once after the batch (not persisted)
+    if fab_event is not None:
+        outbox_item._sort_list_id = list_id or job_record.trello_list_id
+    elif move is not None and (move.payload or {}).get('batch_id'):
+        outbox_item._sort_list_id = list_id
+
+    now = datetime.utcnow()
+    outbox_item.status = 'completed'
+    outbox_item.completed_at = now
+    outbox_item.error_message = None
+    for row in rows:
+        if row is not outbox_item:
+            row.completed_at = now
+        JobEventService.close(row.event_id)
+    db.session.commit()
+
+    logger.info(
+        "outbox_item_completed",
+        outbox_id=outbox_item.id,
+        event_id=event.id,
+        job=event.job,
+        release=event.release,
+        card_id=card_id,
+        destination=outbox_item.destination,
+        action=outbox_item.action,
+        folded=[row.id for row in folded],
+        retry_count=outbox_item.retry_count,
+        status="ok",
+    )
+    return True
+
+
+def _sort_trello_lists(list_ids):
+    """Batch sort: sort each affected list once after all fab_order updates and bulk moves."""
+    from app.trello.utils import sort_list_if_needed
+    from app.config import Config as cfg
 
-        if processed_count > 0:
-            logger.debug(
-                "outbox_batch_processed",
-                count=processed_count,
-                batch_size=len(pending_items),
+    if not cfg.FAB_ORDER_FIELD_ID:
+        return
+    for list_id in dict.fromkeys(list_ids):
+        try:
+            sort_list_if_needed(list_id, cfg.FAB_ORDER_FIELD_ID, None, "batch")
+        except Exception as e:
+            logger.error(
+                "trello_list_sort_failed",
+                list_id=list_id,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
             )
-        return processed_count
+
+
+def _procore_submittal_key(model):
+    return [model.submittal_id], []
+
+
+def _run_procore_item(item_id):
+    from app.models import ProcoreOutbox, db
+
+    item = db.session.get(ProcoreOutbox, item_id)
+    if item is None:
+        return None, None
+    OutboxService.process_procore_item(item)
+    return item.status, None
+
+
+def _trello_dispatcher():
+    from app.models import TrelloOutbox
+    from app.services.outbox_dispatcher import OutboxSpec, dispatcher_for
+
+    return dispatcher_for("trello", lambda: OutboxSpec(
+        name="trello",
+        model=TrelloOutbox,
+        key=_trello_card_key,
+        handler=_run_trello_item,
+        after_batch=_sort_trello_lists,
+        coalesce=_fold_claimed_group,
+    ))
+
+
+def _procore_dispatcher():
+    from app.models import ProcoreOutbox
+    from app.services.outbox_dispatcher import OutboxSpec, dispatcher_for
+
+    return dispatcher_for("procore", lambda: OutboxSpec(
+        name="procore",
+        model=ProcoreOutbox,
+        key=_procore_submittal_key,
+        handler=_run_procore_item,
+    ))
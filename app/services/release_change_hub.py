@@ -0,0 +1,236 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Fan out "releases changed" signals to every open /brain/jobs/stream connection across gunicorn workers (Postgres LISTEN/NOTIFY; in-process stand-in under SQLite).
+exports:
+  RELEASE_CHANGES_CHANNEL: NOTIFY channel name
+  ReleaseChangeHub: Per-process subscriber registry + publisher + (Postgres) listener thread
+  release_change_hub: Process-wide hub instance
+  note_release_change: Flag the current session so its next commit publishes (for bulk writers that bypass flush tracking)
+imports_from: [app.models, app.logging_config, sqlalchemy]
+imported_by: [app/brain/job_log/routes.py, app/brain/job_log/scheduling/service.py, app/brain/job_log/scheduling/snapshot.py]
+invariants:
+  - Signals carry no row data; subscribers re-query Releases by their own last_updated_at cursor, so a missed or duplicated signal only costs latency, never correctness
+  - Publishing happens AFTER the writer commits, so a woken stream always sees the committed rows
+  - Under Postgres every worker (including the publisher) learns about changes via its own LISTEN connection; local subscribers are only woken by the listener thread
+  - The LISTEN connection is opened lazily on the first subscription, so workers that never serve a stream hold no extra connection
+updated_by_agent: 2026-10-16T00:00:00Z
+
+Release change hub.
+
+The job log used to poll /brain/jobs?since= on a timer. The stream endpoint
+instead blocks on a Subscription until something changed, then runs the same
+cursor query. A session listener flags flushes that insert/apply ReleaseEvents
+rows or move Releases.last_updated_at; once the transaction commits the hub
+publishes. Under Postgres that is a NOTIFY on RELEASE_CHANGES_CHANNEL (fan-out to
+every worker's LISTEN thread); elsewhere the local subscribers are woken
+directly, which is exact for a single-process dev server and the test suite.
+"""
+
+import select
+import threading
+import time
+from typing import Optional, Set
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from app.logging_config import get_logger
+from app.models import ReleaseEvents, Releases
+
+logger = get_logger(__name__)
+
+RELEASE_CHANGES_CHANNEL = 'release_changes'
+
+_SESSION_FLAG = 'release_changes_pending'
+
+# Seconds between select() wakeups on the LISTEN connection, and the backoff
+# after the connection drops.
+_LISTEN_POLL_SECONDS = 5.0
+_LISTEN_RECONNECT_SECONDS = 5.0
+
+
+class Subscription:
+    """One stream's wakeup flag. wait() returns True when a change was published since the last wait."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        fired = self._event.wait(timeout)
+        self._event.clear()
+        return fired
+
+
+class ReleaseChangeHub:
+    """Process-local subscriber registry with a cross-process transport."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Set[Subscription] = set()
+        self._engine = None
+        self._listener: Optional[threading.Thread] = None
+        self.stats = {
+            'published': 0,
+            'received': 0,
+            'publish_errors': 0,
+            'listener_reconnects': 0,
+        }
+
+    # -- subscribers --------------------------------------------------------
+
+    def subscribe(self, engine=None) -> Subscription:
+        """
+        Register a new subscription.
+
+        Args:
+            engine: SQLAlchemy engine; under Postgres the LISTEN thread is started
+                on it the first time anyone subscribes
+        """
+        subscription = Subscription()
+        with self._lock:
+            self._subscriptions.add(subscription)
+        if engine is not None and _is_postgres(engine):
+            self._ensure_listener(engine)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def dispatch_local(self) -> None:
+        """Wake every subscription in this process."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.notify()
+
+    # -- publishing ---------------------------------------------------------
+
+    def publish(self, engine) -> None:
+        """
+        Announce that releases changed.
+
+        Under Postgres this NOTIFYs every worker (this one included, via its
+        listener); otherwise the local subscribers are woken directly.
+        """
+        self.stats['published'] += 1
+        if not _is_postgres(engine):
+            self.dispatch_local()
+            return
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("SELECT pg_notify(:channel, '')"), {'channel': RELEASE_CHANGES_CHANNEL})
+        except Exception as e:
+            self.stats['publish_errors'] += 1
+            logger.warning("release_change_publish_failed", error=str(e), error_type=type(e).__name__)
+            # Still wake this worker's streams; the others catch up on their next heartbeat poll.
+            self.dispatch_local()
+
+    # -- Postgres listener --------------------------------------------------
+
+    def _ensure_listener(self, engine) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._engine = engine
+            self._listener = threading.Thread(
+                target=self._listen_forever, daemon=True, name="release-change-listener"
+            )
+            self._listener.start()
+
+    def _listen_forever(self) -> None:
+        while True:
+            try:
+                self._listen_once()
+            except Exception as e:
+                self.stats['listener_reconnects'] += 1
+                logger.warning("release_change_listener_failed", error=str(e), error_type=type(e).__name__)
+                # Streams may have missed a NOTIFY while disconnected; let them re-query.
+                self.dispatch_local()
+                time.sleep(_LISTEN_RECONNECT_SECONDS)
+
+    def _listen_once(self) -> None:
+        # A dedicated connection detached from the pool: LISTEN state is per
+        # connection, and a pooled connection would be handed to request code.
+        raw = self._engine.raw_connection()
+        raw.detach()
+        conn = raw.driver_connection
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {RELEASE_CHANGES_CHANNEL}")
+            logger.info("release_change_listener_started", channel=RELEASE_CHANGES_CHANNEL)
+            while True:
+                if select.select([conn], [], [], _LISTEN_POLL_SECONDS) == ([], [], []):
+                    continue
+                conn.poll()
+                if conn.notifies:
+                    self.stats['received'] += len(conn.notifies)
+                    conn.notifies.clear()
+                    self.dispatch_local()
+        finally:
+            raw.close()
+
+
+release_change_hub = ReleaseChangeHub()
+
+
+def _is_postgres(engine) -> bool:
+    return engine.dialect.name == 'postgresql'
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+def _flush_changes_releases(session) -> bool:
+    for obj in session.new:
+        if isinstance(obj, (Releases, ReleaseEvents)):
+            return True
+    for obj in session.dirty:
+        if isinstance(obj, Releases):
+            if inspect(obj).attrs.last_updated_at.history.has_changes():
+                return True
+        elif isinstance(obj, ReleaseEvents):
+            if inspect(obj).attrs.applied_at.history.has_changes():
+                return True
+    return False
+
+
+@event.listens_for(Session, 'after_flush')
+def _note_release_changes(session, flush_context):
+    if not session.info.get(_SESSION_FLAG) and _flush_changes_releases(session):
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_after_commit(session):
+    # Fires for SAVEPOINT releases too; only the outermost commit is visible to readers.
+    if session.in_nested_transaction() or not session.info.pop(_SESSION_FLAG, False):
+        return
+    release_change_hub.publish(session.get_bind(mapper=Releases))
+
+
+@event.listens_for(Session, 'after_rollback')
+def _clear_flag_after_rollback(session):
+    if not session.in_nested_transaction():
+        session.info.pop(_SESSION_FLAG, None)
+
+
+def note_release_change(session) -> None:
+    """
+    Publish a release change when `session` next commits.
+
+    The flush listener covers ORM writes; call this after bulk_update_mappings,
+    Query.update() or raw SQL that moves Releases.last_updated_at.
+    """
+    session.info[_SESSION_FLAG] = True
@@ -1,22 +1,32 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Module-level reentrant lock that serializes Trello webhook processing and the scheduled queue drainer.
+purpose: Process-wide sync locks for Trello — per-key locks (card, job-release, list) so unrelated cards sync in parallel, plus a board-wide exclusive mode for scanner/cleanup jobs.
 exports:
-  sync_lock_manager: Global SyncLockManager singleton used by Trello hook + queue paths
-  SyncLockManager: Reentrant lock with context-manager API, deadlock detection, and status introspection
-  synchronized_sync: Decorator that acquires the sync lock for any function
-imports_from: [threading]
-imported_by: [app/trello/__init__.py]
+  sync_lock_manager: Global SyncLockManager singleton used by Trello hook + queue paths and the scanner
+  SyncLockManager: Keyed FIFO locks (reserve / acquire_keys) plus the board-wide exclusive acquire_sync_lock, with contention stats
+  SyncLockUnavailable: RuntimeError raised when a lock is contended (board) or times out (keys)
+  LockTicket: A reserved place in line for a set of keys (taken in arrival order, acquired later on a worker thread)
+  card_key / release_key / list_key: Build lock keys
+  synchronized_sync: Decorator that holds the board-wide exclusive lock for any function
+imports_from: [threading, collections, app.logging_config]
+imported_by: [app/trello/__init__.py, app/trello/scanner.py]
 invariants:
-  - Uses threading.RLock so the same thread can re-enter (e.g., Trello webhook triggers a nested sync).
-  - Default lock timeout is 60 seconds; callers can override via timeout_seconds parameter.
-  - sync_lock_manager is a module-level singleton — do not instantiate a second SyncLockManager.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - Keyed waiters are served FIFO per key: a ticket acquires only when it is at the head of every one of its keys' queues, so events for one card run in the order they were reserved.
+  - A ticket takes all of its keys at once under one condition variable, so key order cannot deadlock.
+  - acquire_sync_lock is board-wide and exclusive: new keyed acquisitions wait while it is held or pending, and it waits (up to its timeout) for in-flight keyed holders to finish.
+  - A second exclusive request from another thread fails immediately with SyncLockUnavailable("Sync already in progress: ..."); the same thread re-enters (exclusive, or keyed inside exclusive) freely.
+  - is_locked() / get_current_operation() describe only the board-wide exclusive lock.
+  - sync_lock_manager is a module-level singleton — do not instantiate a second SyncLockManager for production paths.
+updated_by_agent: 2026-10-16T00:00:00Z
 """
+import itertools
 import threading
+import time
+from collections import deque
 from contextlib import contextmanager
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 from datetime import datetime
 
 from app.logging_config import get_logger
@@ -24,93 +34,308 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def card_key(card_id) -> tuple:
+    return ("card", str(card_id))
+
+
+def release_key(job, release) -> tuple:
+    return ("release", str(job), str(release))
+
+
+def list_key(list_id) -> tuple:
+    return ("list", str(list_id))
+
+
+class SyncLockUnavailable(RuntimeError):
+    """The board lock is held by another operation, or keys did not free up in time."""
+
+
+@dataclass(eq=False)
+class LockTicket:
+    """A place in line for `keys`; created by reserve(), consumed by acquire_keys()."""
+    operation: str
+    keys: Tuple[tuple, ...]
+    seq: int
+    reserved_at: float = field(default_factory=time.monotonic)
+    holder_thread_id: Optional[int] = None
+
+
 class SyncLockManager:
     """
-    Simple sync lock manager to prevent concurrent sync operations
-    Step 1: Basic locking only, no queue system yet
+    Keyed sync locks with a board-wide exclusive mode.
+
+    Webhook handlers reserve a ticket for (card, job-release, lists) when the
+    event arrives and acquire it on a worker thread, so events touching
+    different cards run side by side while events for one card keep their order.
+    Scanner and cleanup jobs take acquire_sync_lock, which drains and then
+    excludes every keyed holder.
     """
 
     def __init__(self):
-        self._lock = threading.RLock()  # Reentrant lock
+        self._cond = threading.Condition(threading.Lock())
+        self._seq = itertools.count(1)
+        self._queues = {}          # key -> deque[LockTicket], head is the holder / next in line
+        self._holding = set()      # tickets currently inside acquire_keys
+        self._local = threading.local()
+        # Board-wide exclusive state
         self._is_syncing = False
         self._current_operation = None
         self._holder_thread_id = None
+        self._exclusive_depth = 0
         self._acquired_at: Optional[datetime] = None
         self._timeout_seconds = 60  # default timeout for long-running locks
+        self._stats = {
+            "keyed_acquired": 0,
+            "keyed_contended": 0,
+            "keyed_timeouts": 0,
+            "keyed_wait_seconds_total": 0.0,
+            "keyed_wait_seconds_max": 0.0,
+            "exclusive_acquired": 0,
+            "exclusive_rejected": 0,
+            "exclusive_timeouts": 0,
+            "exclusive_wait_seconds_total": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Board-wide exclusive lock
+    # ------------------------------------------------------------------
 
     def is_locked(self) -> bool:
-        """Check if sync is currently locked"""
-        with self._lock:
+        """Check if the board-wide exclusive lock is held (or being drained for)"""
+        with self._cond:
             return self._is_syncing
 
     def get_current_operation(self) -> Optional[str]:
-        """Get the name of the current operation holding the lock"""
-        with self._lock:
+        """Get the name of the operation holding the board-wide lock"""
+        with self._cond:
             return self._current_operation if self._is_syncing else None
 
+    def _owns_exclusive(self) -> bool:
+        return self._is_syncing and self._holder_thread_id == threading.get_ident()
+
     @contextmanager
     def acquire_sync_lock(self, operation_name: str, timeout_seconds: Optional[int] = None):
         """
-        Context manager to acquire sync lock
+        Context manager to take the board-wide exclusive lock
 
         Args:
             operation_name: Name of the operation acquiring the lock
+            timeout_seconds: How long to wait for in-flight keyed syncs to finish
 
         Raises:
-            RuntimeError: If unable to acquire lock (another sync is running)
+            SyncLockUnavailable: If another operation holds the board lock, or keyed syncs did not drain in time
         """
-        acquired = False
         timeout = timeout_seconds or self._timeout_seconds
-        try:
-            # Attempt to acquire the manager's lock quickly to inspect/change state
-            if not self._lock.acquire(timeout=timeout):
-                raise RuntimeError(f"Lock acquisition timed out after {timeout}s for '{operation_name}'")
-            try:
-                # Deadlock detection: same thread trying to re-enter while marked busy by another op name
-                current_thread_id = threading.get_ident()
-                if self._is_syncing:
+        current_thread_id = threading.get_ident()
+        with self._cond:
+            if self._is_syncing:
+                if self._holder_thread_id == current_thread_id:
+                    self._exclusive_depth += 1
+                    logger.debug("sync_lock_reentered", operation=operation_name,
+                                 thread_id=current_thread_id)
+                    reentered = True
+                else:
                     current_op = self._current_operation
-                    # If the same thread holds it, allow reentrancy without error
-                    if self._holder_thread_id == current_thread_id:
-                        logger.debug("sync_lock_reentered", operation=operation_name,
-                                     thread_id=current_thread_id)
-                    else:
-                        logger.warning("sync_lock_contended", operation=operation_name,
-                                       held_by=current_op,
-                                       holder_thread_id=self._holder_thread_id,
-                                       thread_id=current_thread_id)
-                        raise RuntimeError(f"Sync already in progress: {current_op}")
-
+                    self._stats["exclusive_rejected"] += 1
+                    logger.warning("sync_lock_contended", operation=operation_name,
+                                   held_by=current_op,
+                                   holder_thread_id=self._holder_thread_id,
+                                   thread_id=current_thread_id)
+                    raise SyncLockUnavailable(f"Sync already in progress: {current_op}")
+            else:
+                reentered = False
+                # Claim the board first so no new keyed sync starts, then drain the in-flight ones.
                 self._is_syncing = True
                 self._current_operation = operation_name
                 self._holder_thread_id = current_thread_id
+                self._exclusive_depth = 1
+                started = time.monotonic()
+                deadline = started + timeout
+                while any(t.holder_thread_id != current_thread_id for t in self._holding):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._clear_exclusive()
+                        self._stats["exclusive_timeouts"] += 1
+                        self._cond.notify_all()
+                        raise SyncLockUnavailable(
+                            f"Lock acquisition timed out after {timeout}s for '{operation_name}'"
+                        )
+                    self._cond.wait(remaining)
                 self._acquired_at = datetime.now()
-                acquired = True
+                self._stats["exclusive_acquired"] += 1
+                self._stats["exclusive_wait_seconds_total"] += time.monotonic() - started
                 logger.debug("sync_lock_acquired", operation=operation_name,
                              thread_id=current_thread_id)
-            finally:
-                # Release the manager mutex so work can happen while state is busy
-                self._lock.release()
-
+        try:
             yield  # This is where the sync operation runs
-
         finally:
-            if acquired:
-                with self._lock:
-                    self._is_syncing = False
-                    self._current_operation = None
-                    self._holder_thread_id = None
-                    self._acquired_at = None
+            with self._cond:
+                self._exclusive_depth -= 1
+                if self._exclusive_depth <= 0:
+                    self._clear_exclusive()
+                    self._cond.notify_all()
                     logger.debug("sync_lock_released", operation=operation_name)
+                elif reentered:
+                    logger.debug("sync_lock_reentry_exited", operation=operation_name)
+
+    def _clear_exclusive(self):
+        self._is_syncing = False
+        self._current_operation = None
+        self._holder_thread_id = None
+        self._exclusive_depth = 0
+        self._acquired_at = None
+
+    # ------------------------------------------------------------------
+    # Keyed locks
+    # ------------------------------------------------------------------
+
+    def reserve(self, operation_name: str, keys) -> LockTicket:
+        """Take a place in line for `keys` now; acquire it later with acquire_keys(ticket=...)."""
+        keys = tuple(dict.fromkeys(k for k in keys if k))
+        with self._cond:
+            ticket = LockTicket(operation=operation_name, keys=keys, seq=next(self._seq))
+            for key in keys:
+                self._queues.setdefault(key, deque()).append(ticket)
+            return ticket
+
+    def cancel(self, ticket: LockTicket) -> None:
+        """Give up a reserved (not yet acquired) ticket so the next in line can run."""
+        with self._cond:
+            self._drop(ticket)
+            self._cond.notify_all()
+
+    def _drop(self, ticket):
+        self._holding.discard(ticket)
+        for key in ticket.keys:
+            queue = self._queues.get(key)
+            if not queue:
+                continue
+            try:
+                queue.remove(ticket)
+            except ValueError:
+                pass
+            if not queue:
+                del self._queues[key]
+
+    def _held_keys(self) -> set:
+        held = getattr(self._local, "keys", None)
+        if held is None:
+            held = self._local.keys = set()
+        return held
+
+    def _ready(self, ticket) -> bool:
+        if self._is_syncing and not self._owns_exclusive():
+            return False
+        for key in ticket.keys:
+            queue = self._queues.get(key)
+            if not queue or queue[0] is not ticket:
+                return False
+        return True
+
+    @contextmanager
+    def acquire_keys(self, operation_name: str, keys=(), ticket: Optional[LockTicket] = None,
+                     timeout_seconds: Optional[int] = None):
+        """
+        Hold every key in `keys` (or in a ticket from reserve()) for the duration of the block.
+
+        Raises:
+            SyncLockUnavailable: If the keys could not be acquired within timeout_seconds
+        """
+        timeout = timeout_seconds or self._timeout_seconds
+        held = self._held_keys()
+        with self._cond:
+            if self._owns_exclusive():
+                # The board lock already covers every key.
+                if ticket is not None:
+                    self._drop(ticket)
+                    self._cond.notify_all()
+                ticket = None
+            else:
+                if ticket is None:
+                    wanted = [k for k in dict.fromkeys(keys) if k and k not in held]
+                    ticket = LockTicket(operation=operation_name, keys=tuple(wanted), seq=next(self._seq))
+                    for key in ticket.keys:
+                        self._queues.setdefault(key, deque()).append(ticket)
+                elif any(k in held for k in ticket.keys):
+                    # Re-entry on this thread: keep only the keys we don't already hold.
+                    for key in [k for k in ticket.keys if k in held]:
+                        queue = self._queues.get(key)
+                        if queue is not None and ticket in queue:
+                            queue.remove(ticket)
+                            if not queue:
+                                del self._queues[key]
+                    ticket.keys = tuple(k for k in ticket.keys if k not in held)
+                    self._cond.notify_all()
+
+                started = time.monotonic()
+                deadline = started + timeout
+                contended = not self._ready(ticket)
+                while not self._ready(ticket):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._drop(ticket)
+                        self._stats["keyed_timeouts"] += 1
+                        self._cond.notify_all()
+                        blockers = sorted({
+                            self._queues[k][0].operation for k in ticket.keys
+                            if k in self._queues and self._queues[k]
+                        })
+                        logger.warning("sync_key_lock_timeout", operation=operation_name,
+                                       keys=[":".join(k) for k in ticket.keys], blocked_by=blockers)
+                        raise SyncLockUnavailable(
+                            f"Lock acquisition timed out after {timeout}s for '{operation_name}'"
+                        )
+                    self._cond.wait(remaining)
+                waited = time.monotonic() - started
+                ticket.holder_thread_id = threading.get_ident()
+                self._holding.add(ticket)
+                self._stats["keyed_acquired"] += 1
+                if contended:
+                    self._stats["keyed_contended"] += 1
+                    self._stats["keyed_wait_seconds_total"] += waited
+                    self._stats["keyed_wait_seconds_max"] = max(self._stats["keyed_wait_seconds_max"], waited)
+        added = set(ticket.keys) if ticket is not None else set()
+        held.update(added)
+        try:
+            yield
+        finally:
+            held.difference_update(added)
+            if ticket is not None:
+                with self._cond:
+                    self._drop(ticket)
+                    self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        """Contention counters plus what is held / queued right now."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["keys_held"] = sum(len(t.keys) for t in self._holding)
+            stats["keyed_holders"] = len(self._holding)
+            stats["keys_with_waiters"] = sum(1 for q in self._queues.values() if len(q) > 1)
+            stats["waiting_tickets"] = len({
+                t for q in self._queues.values() for t in q if t not in self._holding
+            })
+            stats["exclusive_operation"] = self._current_operation if self._is_syncing else None
+        stats["keyed_wait_seconds_total"] = round(stats["keyed_wait_seconds_total"], 3)
+        stats["keyed_wait_seconds_max"] = round(stats["keyed_wait_seconds_max"], 3)
+        stats["exclusive_wait_seconds_total"] = round(stats["exclusive_wait_seconds_total"], 3)
+        return stats
 
     def get_status(self) -> dict:
-        """Get current status of the lock manager"""
+        """Get current status of the board-wide lock"""
+        with self._cond:
+            acquired_at = self._acquired_at
+            holder = self._holder_thread_id
         return {
             "is_locked": self.is_locked(),
             "current_operation": self.get_current_operation(),
             "timestamp": datetime.now().isoformat(),
-            "held_by_thread": self._holder_thread_id,
-            "held_for_seconds": (datetime.now() - self._acquired_at).total_seconds() if self._acquired_at else 0,
+            "held_by_thread": holder,
+            "held_for_seconds": (datetime.now() - acquired_at).total_seconds() if acquired_at else 0,
             "timeout_seconds": self._timeout_seconds,
         }
 
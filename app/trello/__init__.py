@@ -1,31 +1,38 @@
 """
 @milehigh-header
 schema_version: 1
-purpose: Drains the Trello webhook queue on a thread pool, holding the sync lock to serialize webhook handlers against the scheduled queue drainer.
+purpose: Receives Trello webhooks, persists them to the durable inbound queue, and drains that queue on a thread pool under per-card / per-release / per-list keyed locks.
 exports:
-  trello_bp: Flask blueprint for /trello routes (webhook receiver, thread stats)
-  drain_trello_queue: Processes queued events when the sync lock is free (called by APScheduler every 5 min)
-  trello_event_queue: Bounded in-memory queue (maxsize=1000) buffering events while lock is held
+  trello_bp: Flask blueprint for /trello routes (webhook receiver, thread stats + lock contention + Trello API client + inbound queue stats)
+  trello_event_lock_keys: Keyed-lock keys (card, job-release, lists) for a parsed webhook event
+  drain_trello_queue: Claims one batch from trello_inbound_events and runs it on the pool (inbound worker loop + APScheduler safety net)
+  ensure_inbound_worker: Starts / wakes this process's continuous inbound drain thread (no-op under TESTING)
+  run_sync_event: Applies one event under its keyed locks; returns completed / deferred / failed
   ThreadTracker: Tracks thread pool utilization stats (started, completed, failed, rejected)
   thread_tracker: Module-level ThreadTracker singleton
-imports_from: [app/trello/utils, app/trello/sync, app/sync_lock, flask, concurrent.futures]
+imports_from: [app/trello/utils, app/trello/sync, app/trello/client, app/trello/inbound_queue, app/sync_lock, flask, concurrent.futures]
 imported_by: [app/__init__.py]
 invariants:
-  - Must hold sync_lock before calling sync_from_trello — webhook handler and queue drainer cannot run concurrently.
-  - When lock is held, events are queued (HTTP 202) not dropped; queue full returns 429.
-  - drain_trello_queue is a scheduler job — get_current_user() will return None; do not call it here.
-  - executor is a 10-worker ThreadPoolExecutor; increasing workers risks sync lock contention.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - A handled webhook is committed to trello_inbound_events before the 200/202 goes back; a full backlog (TRELLO_INBOUND_MAX_DEPTH) returns 429 so Trello retries later.
+  - While the board-wide exclusive lock is held nothing is claimed; the webhook answers 202 "queued" and the rows wait in the table.
+  - sync_from_trello runs inside acquire_keys for the event's card, job-release and lists; tickets are reserved in claim order, and a claim holds one (coalesced) event per card.
+  - A reserved ticket is always consumed or cancelled, or it would block its keys until timeout.
+  - drain_trello_queue runs off-request (worker thread / scheduler) — get_current_user() will return None; do not call it here.
+  - executor is a 10-worker ThreadPoolExecutor; a batch is never larger than the pool, which is the drain's backpressure.
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 from flask import Blueprint, request, current_app, jsonify
-from app.trello.utils import parse_webhook_data
+from app.trello.utils import parse_webhook_data, extract_identifier
 from app.trello.sync import sync_from_trello
-from app.sync_lock import sync_lock_manager
+from app.trello.client import get_trello_client
+from app.trello import inbound_queue
+from app.sync_lock import sync_lock_manager, SyncLockUnavailable, card_key, release_key, list_key
+from app.config import Config as cfg
 from app.logging_config import get_logger
+import os
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from collections import defaultdict
-from queue import Queue, Full, Empty
+from typing import Optional
 import time
 
 logger = get_logger(__name__)
@@ -75,14 +82,44 @@ class ThreadTracker:
 
 # Global tracker and thread pool
 thread_tracker = ThreadTracker()
-executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="sync-")
-# Bounded in-memory queue to buffer Trello events when lock is busy
-trello_event_queue: Queue = Queue(maxsize=1000)
+_POOL_SIZE = 10
+executor = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="sync-")
+# Continuous drain of trello_inbound_events for this process (started lazily, never under TESTING)
+_inbound_worker = None
+_inbound_worker_lock = threading.Lock()
 
 # Blueprint for Trello routes
 trello_bp = Blueprint("trello", __name__)
 
 
+def trello_event_lock_keys(event_info):
+    """Keyed-lock keys for a parsed webhook: its card, its job-release, and every list it touches."""
+    keys = []
+    if event_info.get("card_id"):
+        keys.append(card_key(event_info["card_id"]))
+    identifier = extract_identifier(event_info.get("card_name"))
+    if identifier:
+        job, release = identifier.split("-", 1)
+        keys.append(release_key(job, release.upper()))
+    for field in ("list_id", "list_id_before", "list_id_after"):
+        if event_info.get(field):
+            keys.append(list_key(event_info[field]))
+    return keys
+
+
+def ensure_inbound_worker(app):
+    """Start (once per process) the thread that drains trello_inbound_events, and wake it."""
+    global _inbound_worker
+    if os.environ.get("TESTING") or app.config.get("TESTING"):
+        return None
+    with _inbound_worker_lock:
+        if _inbound_worker is None:
+            _inbound_worker = inbound_queue.InboundEventWorker(app, drain_trello_queue)
+        _inbound_worker.start()
+    _inbound_worker.wake()
+    return _inbound_worker
+
+
 @trello_bp.route("/webhook", methods=["HEAD", "POST"])
 def trello_webhook():
     if request.method == "HEAD":
@@ -95,7 +132,6 @@ def trello_webhook():
 
         data = request.json
         event_info = parse_webhook_data(data)
-        app = current_app._get_current_object()
 
         # Skip unhandled webhooks
         if not event_info.get("handled"):
@@ -103,123 +139,36 @@ def trello_webhook():
             logger.debug("trello_webhook_skipped", action_type=action_type, source="trello")
             return "", 200
 
-        # If locked, enqueue the event for later processing and return 202
-        if sync_lock_manager.is_locked():
-            current_op = sync_lock_manager.get_current_operation()
-            try:
-                trello_event_queue.put_nowait(event_info)
-                thread_tracker.thread_rejected()
-                logger.info(
-                    "trello_webhook_queued",
-                    lock_holder=current_op,
-                    card_id=event_info.get("card_id"),
-                    source="trello",
-                    status="queued",
-                )
-                return jsonify({"status": "queued", "reason": f"lock_held_by_{current_op}"}), 202
-            except Full:
-                thread_tracker.thread_rejected()
-                logger.warning(
-                    "trello_queue_full",
-                    card_id=event_info.get("card_id"),
-                    source="trello",
-                    status="skipped",
-                )
-                return jsonify({"status": "overloaded"}), 429
-
-        def run_sync():
-            thread_id = threading.current_thread().ident
-            thread_tracker.thread_started(thread_id)
+        # Persist before answering so a deploy or restart cannot lose the event;
+        # the inbound worker applies it in per-card order.
+        action_id = ((data or {}).get("action") or {}).get("id")
+        try:
+            event_id = inbound_queue.enqueue(event_info, action_id=action_id)
+        except inbound_queue.InboundQueueFull:
+            thread_tracker.thread_rejected()
+            logger.warning(
+                "trello_queue_full",
+                card_id=event_info.get("card_id"),
+                source="trello",
+                status="skipped",
+            )
+            return jsonify({"status": "overloaded"}), 429
 
-            try:
-                with app.app_context():
-                    # Double-check lock status before attempting acquisition
-                    # This handles race conditions where another operation started
-                    # between the initial check and thread execution
-                    if sync_lock_manager.is_locked():
-                        current_op = sync_lock_manager.get_current_operation()
-                        logger.info(
-                            "trello_webhook_requeued",
-                            lock_holder=current_op,
-                            card_id=event_info.get("card_id"),
-                            source="trello",
-                            status="queued",
-                        )
-                        try:
-                            trello_event_queue.put_nowait(event_info)
-                        except Full:
-                            logger.warning(
-                                "trello_event_requeue_failed",
-                                reason="queue_full",
-                                card_id=event_info.get("card_id"),
-                                source="trello",
-                            )
-                        duration = thread_tracker.thread_completed(thread_id, success=False)
-                        thread_tracker.thread_rejected()
-                        return
-
-                    # Try to acquire the sync lock in the thread
-                    try:
-                        with sync_lock_manager.acquire_sync_lock("Trello-Hook"):
-                            logger.debug("trello_sync_started", card_id=event_info.get("card_id"), source="trello")
-                            sync_from_trello(event_info)
-                            logger.debug("trello_sync_finished", card_id=event_info.get("card_id"), source="trello")
-
-                        duration = thread_tracker.thread_completed(
-                            thread_id, success=True
-                        )
-                        logger.info(
-                            "trello_sync_completed",
-                            duration_ms=int(duration * 1000),
-                            card_id=event_info.get("card_id"),
-                            source="trello",
-                            status="ok",
-                        )
-
-                    except RuntimeError as lock_error:
-                        # Lock acquisition failed - this shouldn't happen since we checked above
-                        # but it's possible another sync started between the check and thread execution
-                        logger.warning(
-                            "trello_sync_lock_failed",
-                            error=str(lock_error),
-                            error_type=type(lock_error).__name__,
-                            card_id=event_info.get("card_id"),
-                            source="trello",
-                        )
-                        duration = thread_tracker.thread_completed(
-                            thread_id, success=False
-                        )
-                        thread_tracker.thread_rejected()  # Count as rejected
-
-            except Exception as e:
-                duration = thread_tracker.thread_completed(thread_id, success=False)
-                logger.error(
-                    "trello_sync_failed",
-                    duration_ms=int(duration * 1000) if duration is not None else None,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    card_id=event_info.get("card_id"),
-                    source="trello",
-                    status="error",
-                    exc_info=True,
-                )
+        ensure_inbound_worker(current_app._get_current_object())
 
-        # Submit to thread pool and attach error callback
-        future = executor.submit(run_sync)
-        def _log_future(f):
-            try:
-                _ = f.result()
-            except Exception as e:
-                logger.error(
-                    "trello_sync_task_failed",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    source="trello",
-                    status="error",
-                    exc_info=True,
-                )
-        future.add_done_callback(_log_future)
-        logger.debug("trello_webhook_submitted", card_id=event_info.get("card_id"), source="trello")
+        if sync_lock_manager.is_locked():
+            current_op = sync_lock_manager.get_current_operation()
+            logger.info(
+                "trello_webhook_queued",
+                lock_holder=current_op,
+                event_id=event_id,
+                card_id=event_info.get("card_id"),
+                source="trello",
+                status="queued",
+            )
+            return jsonify({"status": "queued", "reason": f"lock_held_by_{current_op}"}), 202
+        logger.debug("trello_webhook_enqueued", event_id=event_id,
+                     card_id=event_info.get("card_id"), source="trello")
 
     return "", 200
 
@@ -229,81 +178,115 @@ def thread_stats():
     """Get thread statistics including sync lock info"""
     with thread_tracker.lock:
         stats = thread_tracker.stats.copy()
+    stats["locks"] = sync_lock_manager.stats()
+    stats["api"] = get_trello_client().stats()
+    stats["inbound"] = inbound_queue.queue_metrics()
+    stats["inbound"]["worker_alive"] = bool(_inbound_worker and _inbound_worker.is_alive())
 
     return jsonify(stats)
 
 
-def drain_trello_queue(max_items: int = 5):
-    """Drain up to max_items from the Trello event queue when lock is free."""
+def run_sync_event(app, evt, ticket):
+    """
+    Apply one queued event under its keyed locks on a pool thread.
+
+    Returns:
+        ("completed" | "deferred" | "failed", error message or None)
+    """
+    thread_id = threading.current_thread().ident
+    thread_tracker.thread_started(thread_id)
+    try:
+        with app.app_context():
+            # A board-wide operation may have started since the batch was claimed.
+            if sync_lock_manager.is_locked():
+                sync_lock_manager.cancel(ticket)
+                current_op = sync_lock_manager.get_current_operation()
+                thread_tracker.thread_completed(thread_id, success=False)
+                thread_tracker.thread_rejected()
+                return "deferred", f"lock_held_by_{current_op}"
+            try:
+                with sync_lock_manager.acquire_keys("Trello-Queue", ticket=ticket):
+                    logger.debug("trello_sync_started", card_id=evt.get("card_id"), source="trello")
+                    sync_from_trello(evt)
+                    logger.debug("trello_sync_finished", card_id=evt.get("card_id"), source="trello")
+            except SyncLockUnavailable as lock_error:
+                # Timed out behind a long card sync or a board-wide operation; retry shortly.
+                logger.warning(
+                    "trello_sync_lock_failed",
+                    error=str(lock_error),
+                    error_type=type(lock_error).__name__,
+                    card_id=evt.get("card_id"),
+                    source="trello",
+                )
+                thread_tracker.thread_completed(thread_id, success=False)
+                thread_tracker.thread_rejected()
+                return "deferred", str(lock_error)
+            duration = thread_tracker.thread_completed(thread_id, success=True)
+            logger.info(
+                "trello_sync_completed",
+                duration_ms=int(duration * 1000),
+                card_id=evt.get("card_id"),
+                source="trello",
+                status="ok",
+            )
+            return "completed", None
+    except Exception as e:
+        sync_lock_manager.cancel(ticket)
+        duration = thread_tracker.thread_completed(thread_id, success=False)
+        logger.error(
+            "trello_sync_failed",
+            duration_ms=int(duration * 1000) if duration is not None else None,
+            error=str(e),
+            error_type=type(e).__name__,
+            card_id=evt.get("card_id"),
+            source="trello",
+            status="error",
+            exc_info=True,
+        )
+        return "failed", f"{type(e).__name__}: {e}"
+
+
+def drain_trello_queue(max_items: Optional[int] = None):
+    """
+    Claim one batch from trello_inbound_events, run it on the pool, record the outcomes.
+
+    Returns the number of merged events claimed (0 while the board-wide lock is held).
+    """
     app = current_app._get_current_object()
 
     if sync_lock_manager.is_locked():
         return 0
 
-    drained = 0
+    limit = min(max_items or cfg.TRELLO_INBOUND_BATCH_SIZE, _POOL_SIZE)
+    events = inbound_queue.claim_batch(limit)
+    if not events:
+        return 0
 
-    while drained < max_items:
+    # Reserve in claim (= arrival) order, then run side by side; each claimed entry is one
+    # card's burst already merged into a single event.
+    submitted = []
+    for evt in events:
+        ticket = sync_lock_manager.reserve("Trello-Queue", trello_event_lock_keys(evt["payload"]))
         try:
-            event_info = trello_event_queue.get_nowait()
-        except Empty:
-            break
-
-        def run_sync_event(evt):
-            thread_id = threading.current_thread().ident
-            thread_tracker.thread_started(thread_id)
-            try:
-                with app.app_context():
-                    try:
-                        with sync_lock_manager.acquire_sync_lock("Trello-Queue"):
-                            logger.info("trello_drain_sync_started", card_id=evt.get("card_id"), source="trello")
-                            sync_from_trello(evt)
-                            logger.info("trello_drain_sync_finished", card_id=evt.get("card_id"), source="trello")
-                        duration = thread_tracker.thread_completed(thread_id, success=True)
-                        logger.info(
-                            "trello_drain_sync_completed",
-                            duration_ms=int(duration * 1000),
-                            card_id=evt.get("card_id"),
-                            source="trello",
-                            status="ok",
-                        )
-                    except RuntimeError as lock_error:
-                        # Could not acquire (race); requeue and stop draining
-                        logger.info(
-                            "trello_drain_lock_contention",
-                            error=str(lock_error),
-                            error_type=type(lock_error).__name__,
-                            card_id=evt.get("card_id"),
-                            source="trello",
-                            status="queued",
-                        )
-                        try:
-                            trello_event_queue.put_nowait(evt)
-                        except Full:
-                            logger.warning(
-                                "trello_drain_requeue_failed",
-                                reason="queue_full",
-                                card_id=evt.get("card_id"),
-                                source="trello",
-                            )
-                        thread_tracker.thread_completed(thread_id, success=False)
-                        return False
-            except Exception as e:
-                duration = thread_tracker.thread_completed(thread_id, success=False)
-                logger.error(
-                    "trello_drain_sync_failed",
-                    duration_ms=int(duration * 1000) if duration is not None else None,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    card_id=evt.get("card_id"),
-                    source="trello",
-                    status="error",
-                    exc_info=True,
-                )
-                return True
-            return True
-
-        # Execute drained event in the pool to keep behavior consistent
-        future = executor.submit(run_sync_event, event_info)
-        drained += 1
-
-    return drained
+            submitted.append((evt, executor.submit(run_sync_event, app, evt["payload"], ticket)))
+        except Exception as e:
+            sync_lock_manager.cancel(ticket)
+            submitted.append((evt, e))
+
+    completed, failed, deferred = [], [], []
+    for evt, future in submitted:
+        if isinstance(future, Exception):
+            failed.append((evt, f"submit failed: {future}"))
+            continue
+        outcome, error = future.result()
+        if outcome == "completed":
+            completed.append(evt)
+        elif outcome == "deferred":
+            deferred.append((evt, error))
+        else:
+            failed.append((evt, error))
+    inbound_queue.finish_batch(completed=completed, failed=failed, deferred=deferred)
+    logger.debug("trello_inbound_batch_drained", claimed=len(events),
+                 events=sum(len(evt["ids"]) for evt in events), completed=len(completed),
+                 failed=len(failed), deferred=len(deferred), source="trello")
+    return len(events)
@@ -8,18 +8,26 @@ exports:
   get_list_by_name: Look up a Trello list ID by name.
   get_trello_card_by_id: Fetch full card JSON from the Trello API.
   get_all_trello_cards: Retrieve every card on the configured board.
+  get_board_card_activity_since: Card ids touched by board actions after a watermark, split into still-on-board and deleted/archived/moved-off (incremental scanner).
+  get_trello_cards_by_ids: Light fetch (name, list, closed) of specific cards, batched; None for deleted ones.
+  get_cards_attachments: Attachments for many cards via the batch reader (cached).
+  get_cards_custom_field_items: Custom field items for many cards via the batch reader (uncached).
+  get_cards_members: Members of many cards via the batch reader.
+  resolve_mirror_short_links: Mirror shortLink for many primary cards from their "Linked card" attachments.
   create_trello_card_from_excel_data: Build and POST a new card from an Excel/DB row.
-  sort_list_by_fab_order: Reorder cards in a list by their Fab Order custom field.
+  sort_list_by_fab_order: Reorder cards in a list by their Fab Order custom field, moving only cards that are out of order.
   add_comment_to_trello_card: POST a comment to a card.
   update_card_custom_field_number: Set a numeric custom field value on a card.
   calculate_installation_duration: Derive install-day count from hours and crew size.
-imports_from: [app.config, app.trello.utils, app.models, app.api.helpers, requests, pandas]
+imports_from: [app.config, app.trello.client, app.trello.batch, app.trello.utils, app.models, app.api.helpers, requests, pandas]
 imported_by: [app/trello/sync.py, app/trello/card_creation.py, app/trello/scanner.py, app/trello/utils.py, app/services/outbox_service.py, app/brain/job_log/routes.py, app/procore/procore.py, app/onedrive/api.py]
 invariants:
   - Board-list cache (_BOARD_LISTS_CACHE) auto-refreshes; callers should not bypass it.
   - All date params sent to Trello are converted to 6 pm Mountain via mountain_due_datetime.
   - Card creation always returns a dict with 'success' key.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - Every HTTP call goes through get_trello_client() (shared pool, rate limiter, retries); never call requests directly here.
+  - Card reads that bulk callers need (attachments, custom field items, members, light card fetch) go through app.trello.batch; writes that change what it caches call invalidate_card.
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 
 import requests
@@ -28,7 +36,9 @@ import os
 import time as _time
 import threading
 from app.config import Config as cfg
-from app.trello.utils import mountain_due_datetime, mountain_start_datetime
+from app.trello.utils import mountain_due_datetime, mountain_start_datetime, plan_fab_order_positions
+from app.trello.client import get_trello_client
+from app.trello.batch import batch_get, invalidate_card
 from app.models import Releases, db
 from app.api.helpers import DEFAULT_FAB_ORDER
 from flask import current_app
@@ -43,18 +53,21 @@ logger = get_logger(__name__)
 
 # Main function for updating trello card information
 def update_trello_card(
-    card_id, new_list_id=None, new_due_date=None, clear_due_date=False
+    card_id, new_list_id=None, new_due_date=None, clear_due_date=False,
+    new_name=None, new_description=None,
 ):
     """
-    Updates a Trello card\'s list and/or due date in a single API call.
+    Updates a Trello card\'s list, due date, name and/or description in a single API call.
 
     Args:
         card_id: Trello card ID
         new_list_id: New list ID (optional)
         new_due_date: New due date as datetime object (optional)
         clear_due_date: If True, explicitly clear the due date even if new_due_date is None
+        new_name: New card title (optional)
+        new_description: New card description (optional)
     """
-    url = f"https://api.trello.com/1/cards/{card_id}"
+    url = f"/cards/{card_id}"
 
     payload = {
         "key": cfg.TRELLO_API_KEY,
@@ -63,6 +76,10 @@ def update_trello_card(
 
     if new_list_id:
         payload["idList"] = new_list_id
+    if new_name is not None:
+        payload["name"] = new_name
+    if new_description is not None:
+        payload["desc"] = new_description
 
     # Handle due date
     if new_due_date:
@@ -88,12 +105,13 @@ def update_trello_card(
             # Use JSON to properly send null values for clearing
             auth_params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
             json_payload = {"due": None}
-            if new_list_id:
-                json_payload["idList"] = new_list_id
-            response = requests.put(url, params=auth_params, json=json_payload)
+            for field in ("idList", "name", "desc"):
+                if field in payload:
+                    json_payload[field] = payload[field]
+            response = get_trello_client().put(url, params=auth_params, json=json_payload)
         else:
             # Use URL params for normal updates
-            response = requests.put(url, params=payload)
+            response = get_trello_client().put(url, params=payload)
 
         response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
 
@@ -144,10 +162,10 @@ def _refresh_board_lists_cache():
     if not board_id:
         return
 
-    url = f"https://api.trello.com/1/boards/{board_id}/lists"
+    url = f"/boards/{board_id}/lists"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
     try:
-        response = requests.get(url, params=params)
+        response = get_trello_client().get(url, params=params)
         response.raise_for_status()
         lists = response.json()
     except Exception as e:
@@ -193,9 +211,9 @@ def get_list_name_by_id(list_id):
         return entry["name"]
 
     # Cache miss for this ID — fall back to single-list fetch and update cache
-    url = f"https://api.trello.com/1/lists/{list_id}"
+    url = f"/lists/{list_id}"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    response = requests.get(url, params=params)
+    response = get_trello_client().get(url, params=params)
     if response.status_code == 200:
         data = response.json()
         name = data.get("name")
@@ -223,14 +241,14 @@ def get_board_info(board_id=None):
     bid = board_id or cfg.TRELLO_BOARD_ID
     if not bid:
         return None
-    url = f"https://api.trello.com/1/boards/{bid}"
+    url = f"/boards/{bid}"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
         "fields": "name,url",
     }
     try:
-        response = requests.get(url, params=params)
+        response = get_trello_client().get(url, params=params)
         response.raise_for_status()
         data = response.json()
         return {"id": data.get("id"), "name": data.get("name"), "url": data.get("url")}
@@ -256,9 +274,9 @@ def get_trello_card_by_id(card_id):
     """
     Fetches the full card data from Trello API by card ID.
     """
-    url = f"https://api.trello.com/1/cards/{card_id}"
+    url = f"/cards/{card_id}"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    response = requests.get(url, params=params)
+    response = get_trello_client().get(url, params=params)
     if response.status_code == 200:
         return response.json()
     else:
@@ -279,13 +297,13 @@ def find_card_in_list_by_name(list_id, card_name):
     Raises requests.HTTPError if the GET itself fails — caller should treat
     that as "unknown" and fall through to the create path.
     """
-    url = f"https://api.trello.com/1/lists/{list_id}/cards"
+    url = f"/lists/{list_id}/cards"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
         "fields": "id,name,url,idList,idBoard,shortLink,shortUrl",
     }
-    response = requests.get(url, params=params, timeout=10)
+    response = get_trello_client().get(url, params=params, timeout=10)
     response.raise_for_status()
     for card in response.json() or []:
         if card.get("name") == card_name:
@@ -309,10 +327,10 @@ def get_trello_cards_from_subset():
 
     # Get all lists on the board
     url_lists = url_lists = (
-        f"https://api.trello.com/1/boards/{cfg.TRELLO_BOARD_ID}/lists"
+        f"/boards/{cfg.TRELLO_BOARD_ID}/lists"
     )
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    response = requests.get(url_lists, params=params)
+    response = get_trello_client().get(url_lists, params=params)
     response.raise_for_status()
     lists = response.json()
 
@@ -323,14 +341,14 @@ def get_trello_cards_from_subset():
     # print(f"Target List IDs: {target_list_ids}")
 
     # Get all cards on the board
-    url_cards = f"https://api.trello.com/1/boards/{cfg.TRELLO_BOARD_ID}/cards"
+    url_cards = f"/boards/{cfg.TRELLO_BOARD_ID}/cards"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
         "fields": "id,name,desc,idList,due,labels",
         "filter": "open",
     }
-    response = requests.get(url_cards, params=params)
+    response = get_trello_client().get(url_cards, params=params)
     response.raise_for_status()
     cards = response.json()
 
@@ -362,9 +380,9 @@ def get_all_trello_cards():
         list: List of card dictionaries with id, name, desc, idList, due, labels, and list_name
     """
     # Get all lists on the board
-    url_lists = f"https://api.trello.com/1/boards/{cfg.TRELLO_BOARD_ID}/lists"
+    url_lists = f"/boards/{cfg.TRELLO_BOARD_ID}/lists"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    response = requests.get(url_lists, params=params)
+    response = get_trello_client().get(url_lists, params=params)
     response.raise_for_status()
     lists = response.json()
 
@@ -372,14 +390,14 @@ def get_all_trello_cards():
     list_id_to_name = {lst["id"]: lst["name"] for lst in lists}
 
     # Get all cards on the board
-    url_cards = f"https://api.trello.com/1/boards/{cfg.TRELLO_BOARD_ID}/cards"
+    url_cards = f"/boards/{cfg.TRELLO_BOARD_ID}/cards"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
         "fields": "id,name,desc,idList,due,labels",
         "filter": "open",
     }
-    response = requests.get(url_cards, params=params)
+    response = get_trello_client().get(url_cards, params=params)
     response.raise_for_status()
     cards = response.json()
 
@@ -399,6 +417,124 @@ def get_all_trello_cards():
     return relevant_data
 
 
+# Board actions that can change which cards exist, their names or their lists
+_CARD_ACTIVITY_ACTION_TYPES = (
+    "createCard,updateCard,deleteCard,copyCard,moveCardToBoard,moveCardFromBoard,"
+    "convertToCardFromCheckItem"
+)
+
+
+def _parse_trello_timestamp(value):
+    """Trello ISO timestamp ('2026-10-16T20:52:52.123Z') -> naive UTC datetime, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value.rstrip("Z"), "%Y-%m-%dT%H:%M:%S.%f")
+    except ValueError:
+        return None
+
+
+def _card_removal_state(action_type, data):
+    """True if the action took the card off the board, False if it put it on, None if neither."""
+    if action_type in ("deleteCard", "moveCardFromBoard"):
+        return True
+    if action_type in ("createCard", "copyCard", "moveCardToBoard", "convertToCardFromCheckItem"):
+        return False
+    if action_type == "updateCard" and "closed" in (data.get("old") or {}):
+        # updateCard:closed — archived (closed=True) or restored from the archive
+        return bool((data.get("card") or {}).get("closed"))
+    return None
+
+
+def get_board_card_activity_since(since, limit=1000):
+    """
+    Find the cards touched on the board after `since` (naive UTC) from its action log.
+
+    Args:
+        since: Only actions newer than this are returned
+        limit: Page size; Trello caps board actions at 1000 per request
+
+    Returns:
+        dict: {"card_ids": set, "removed_card_ids": set, "latest": newest action datetime
+        or None, "truncated": bool}. removed_card_ids are cards whose newest lifecycle
+        action deleted, archived or moved them off the board (they can't be fetched
+        back); card_ids are the other touched cards. truncated means a full page came
+        back, so older actions may be missing and the caller should fall back to a full read.
+    """
+    url = f"/boards/{cfg.TRELLO_BOARD_ID}/actions"
+    params = {
+        "key": cfg.TRELLO_API_KEY,
+        "token": cfg.TRELLO_TOKEN,
+        "filter": _CARD_ACTIVITY_ACTION_TYPES,
+        "since": since.strftime("%Y-%m-%dT%H:%M:%S.") + f"{since.microsecond // 1000:03d}Z",
+        "limit": limit,
+        "fields": "date,type,data",
+        "memberCreator": "false",
+        "member": "false",
+    }
+    response = get_trello_client().get(url, params=params)
+    response.raise_for_status()
+    actions = response.json() or []
+
+    card_ids = set()
+    lifecycle = {}  # card id -> (date, removed) of its newest create/delete/archive/move action
+    latest = None
+    for action in actions:
+        data = action.get("data") or {}
+        card = data.get("card") or {}
+        when = _parse_trello_timestamp(action.get("date"))
+        if when and (latest is None or when > latest):
+            latest = when
+        if not card.get("id"):
+            continue
+        card_ids.add(card["id"])
+        removed = _card_removal_state(action.get("type"), data)
+        if removed is None:
+            continue
+        seen = lifecycle.get(card["id"])
+        if seen is None or (when and (seen[0] is None or when >= seen[0])):
+            lifecycle[card["id"]] = (when, removed)
+    removed_ids = {card_id for card_id, (_, removed) in lifecycle.items() if removed}
+    return {
+        "card_ids": card_ids - removed_ids,
+        "removed_card_ids": removed_ids,
+        "latest": latest,
+        "truncated": len(actions) >= limit,
+    }
+
+
+def get_trello_cards_by_ids(card_ids):
+    """
+    Fetch the name, list and open/closed state of specific cards, ten per /batch call.
+
+    Returns:
+        dict: {card_id: card dict (id, name, list_id, list_name, board_id, closed,
+        date_last_activity) or None when Trello no longer has the card}
+    """
+    fields = "id,name,idList,idBoard,closed,dateLastActivity"
+    paths = {card_id: f"/cards/{card_id}?fields={fields}" for card_id in card_ids}
+    results = batch_get(paths.values(), use_cache=False)
+    cards = {}
+    for card_id, path in paths.items():
+        result = results[path]
+        if result.status == 404:
+            cards[card_id] = None
+            continue
+        if not result.ok:
+            raise requests.exceptions.HTTPError(f"Trello card read for {card_id} failed: {result.status}")
+        card = result.body
+        cards[card_id] = {
+            "id": card["id"],
+            "name": card.get("name") or "",
+            "list_id": card.get("idList"),
+            "list_name": get_list_name_by_id(card.get("idList")) or "Unknown",
+            "board_id": card.get("idBoard"),
+            "closed": bool(card.get("closed")),
+            "date_last_activity": _parse_trello_timestamp(card.get("dateLastActivity")),
+        }
+    return cards
+
+
 def check_job_exists_in_db(job_number, release_number, job_name=None):
     """
     Check if a (job #, release #, project name) triple already exists.
@@ -788,7 +924,7 @@ def create_trello_card_from_excel_data(excel_data, list_name=None):
         card_description = "\n".join(description_parts)
 
         # Create the card
-        url = "https://api.trello.com/1/cards"
+        url = "/cards"
 
         payload = {
             "key": cfg.TRELLO_API_KEY,
@@ -806,7 +942,7 @@ def create_trello_card_from_excel_data(excel_data, list_name=None):
             list_id=list_id,
         )
 
-        response = requests.post(url, params=payload)
+        response = get_trello_client().post(url, params=payload)
         response.raise_for_status()
 
         card_data = response.json()
@@ -977,6 +1113,26 @@ def create_trello_card_from_excel_data(excel_data, list_name=None):
         }
 
 
+def _read_cards(card_ids, suffix, failure_event, use_cache=True):
+    """
+    GET /cards/<id><suffix> for many cards through the batch reader.
+
+    Returns:
+        dict: {card_id: parsed body, or None when that card's read failed}
+    """
+    paths = {card_id: f"/cards/{card_id}{suffix}" for card_id in dict.fromkeys(card_ids) if card_id}
+    results = batch_get(paths.values(), use_cache=use_cache)
+    out = {}
+    for card_id, path in paths.items():
+        result = results[path]
+        if result.ok:
+            out[card_id] = result.body
+        else:
+            logger.error(failure_event, card_id=card_id, status=result.status, error=str(result.body)[:200])
+            out[card_id] = None
+    return out
+
+
 def get_card_custom_field_items(card_id):
     """
     Retrieves all custom field items for a Trello card.
@@ -987,31 +1143,29 @@ def get_card_custom_field_items(card_id):
     Returns:
         List of custom field items or None if error
     """
-    url = f"https://api.trello.com/1/cards/{card_id}/customFieldItems"
-    params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
+    return get_cards_custom_field_items([card_id]).get(card_id)
 
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as http_err:
-        logger.error(
-            "custom_field_items_fetch_failed",
-            card_id=card_id,
-            error=str(http_err),
-            error_type=type(http_err).__name__,
-            exc_info=True,
-        )
-        return None
-    except Exception as err:
-        logger.error(
-            "custom_field_items_fetch_failed",
-            card_id=card_id,
-            error=str(err),
-            error_type=type(err).__name__,
-            exc_info=True,
-        )
-        return None
+
+def get_cards_custom_field_items(card_ids):
+    """
+    Custom field items for many cards in as few /batch calls as possible.
+
+    Never served from the read cache: Fab Order values are compared against these.
+
+    Returns:
+        dict: {card_id: list of custom field items, or None if that read failed}
+    """
+    return _read_cards(card_ids, "/customFieldItems", "custom_field_items_fetch_failed", use_cache=False)
+
+
+def get_cards_members(card_ids):
+    """
+    Members assigned to each of many cards, batched.
+
+    Returns:
+        dict: {card_id: list of member dicts, or None if that read failed}
+    """
+    return _read_cards(card_ids, "/members", "card_members_fetch_failed")
 
 
 def update_card_custom_field(card_id, custom_field_id, text_value):
@@ -1026,7 +1180,7 @@ def update_card_custom_field(card_id, custom_field_id, text_value):
     Returns:
         True if successful, False otherwise
     """
-    url = f"https://api.trello.com/1/cards/{card_id}/customField/{custom_field_id}/item"
+    url = f"/cards/{card_id}/customField/{custom_field_id}/item"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
     data = {"value": {"text": text_value}}
 
@@ -1036,8 +1190,9 @@ def update_card_custom_field(card_id, custom_field_id, text_value):
             card_id=card_id,
             custom_field_id=custom_field_id,
         )
-        response = requests.put(url, params=params, json=data)
+        response = get_trello_client().put(url, params=params, json=data)
         response.raise_for_status()
+        invalidate_card(card_id)
         logger.debug("custom_field_updated", card_id=card_id, custom_field_id=custom_field_id)
         return True
     except requests.exceptions.HTTPError as http_err:
@@ -1077,11 +1232,11 @@ def get_board_custom_fields(board_id):
     Returns:
         List of custom field definitions or None if error
     """
-    url = f"https://api.trello.com/1/boards/{board_id}/customFields"
+    url = f"/boards/{board_id}/customFields"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
 
     try:
-        response = requests.get(url, params=params)
+        response = get_trello_client().get(url, params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -1135,7 +1290,7 @@ def update_card_custom_field_number(card_id, custom_field_id, number_value):
     Returns:
         True if successful, False otherwise
     """
-    url = f"https://api.trello.com/1/cards/{card_id}/customField/{custom_field_id}/item"
+    url = f"/cards/{card_id}/customField/{custom_field_id}/item"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
     data = {
         "value": {"number": str(number_value)}  # Trello API expects number as string
@@ -1148,8 +1303,9 @@ def update_card_custom_field_number(card_id, custom_field_id, number_value):
             custom_field_id=custom_field_id,
             value=number_value,
         )
-        response = requests.put(url, params=params, json=data)
+        response = get_trello_client().put(url, params=params, json=data)
         response.raise_for_status()
+        invalidate_card(card_id)
         logger.debug("custom_field_updated", card_id=card_id, custom_field_id=custom_field_id)
         return True
     except requests.exceptions.HTTPError as http_err:
@@ -1191,13 +1347,15 @@ def sort_list_by_fab_order(list_id, fab_order_field_id):
     Returns:
         dict with keys:
             - success: bool
-            - cards_sorted: int (number of cards that were sorted)
+            - cards_sorted: int (number of cards that were moved)
             - cards_failed: int (number of cards that failed to update)
             - total_cards: int (total cards in list)
+            - api_calls_saved: int (position PUTs skipped vs. rewriting every card)
+            - renormalized: bool (gaps ran out, the list was renumbered)
             - error: str (if success is False)
     """
     # Get all cards in the list with custom field items
-    url = f"https://api.trello.com/1/lists/{list_id}/cards"
+    url = f"/lists/{list_id}/cards"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
@@ -1206,7 +1364,7 @@ def sort_list_by_fab_order(list_id, fab_order_field_id):
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = get_trello_client().get(url, params=params)
         response.raise_for_status()
         cards = response.json()
 
@@ -1217,6 +1375,8 @@ def sort_list_by_fab_order(list_id, fab_order_field_id):
                 "cards_sorted": 0,
                 "cards_failed": 0,
                 "total_cards": 0,
+                "api_calls_saved": 0,
+                "renormalized": False,
             }
 
         # Extract Fab Order for each card
@@ -1246,58 +1406,30 @@ def sort_list_by_fab_order(list_id, fab_order_field_id):
                 }
             )
 
-        # Sort by fab_order (None values go to end)
-        # Cards with lower fab_order come first
-        card_data.sort(key=lambda x: (x["fab_order"] is None, x["fab_order"] or 0))
-
-        # Calculate new positions
-        # Trello positions can be:
-        # - "top" (string)
-        # - "bottom" (string)
-        # - numeric (float) - cards are ordered by position value
-
-        position_updates = []
-
-        if len(card_data) == 1:
-            # Only one card - use "top"
-            position_updates.append(
-                {"card_id": card_data[0]["card_id"], "new_pos": "top"}
-            )
-        else:
-            # Multiple cards - calculate positions
-            # Start with a base position and increment
-            base_position = 16384  # Standard starting position in Trello
-
-            for index, card_info in enumerate(card_data):
-                new_pos = base_position + (index * 16384)
-                position_updates.append(
-                    {
-                        "card_id": card_info["card_id"],
-                        "new_pos": new_pos,
-                        "fab_order": card_info["fab_order"],
-                    }
-                )
+        # Only cards off the longest already-ordered run get a new (fractional) pos;
+        # the rest stay put. Falls back to a full renumber when gaps run out.
+        position_updates, renormalized = plan_fab_order_positions(card_data)
 
         # Update card positions
         updated_count = 0
         failed_count = 0
 
-        for update in position_updates:
-            update_url = f"https://api.trello.com/1/cards/{update['card_id']}"
+        for card_id, new_pos in position_updates:
+            update_url = f"/cards/{card_id}"
             update_params = {
                 "key": cfg.TRELLO_API_KEY,
                 "token": cfg.TRELLO_TOKEN,
-                "pos": update["new_pos"],
+                "pos": new_pos,
             }
 
             try:
-                update_response = requests.put(update_url, params=update_params)
+                update_response = get_trello_client().put(update_url, params=update_params)
                 update_response.raise_for_status()
                 updated_count += 1
             except requests.exceptions.HTTPError as http_err:
                 logger.error(
                     "card_position_update_failed",
-                    card_id=update["card_id"],
+                    card_id=card_id,
                     error=str(http_err),
                     error_type=type(http_err).__name__,
                     exc_info=True,
@@ -1306,13 +1438,14 @@ def sort_list_by_fab_order(list_id, fab_order_field_id):
             except Exception as err:
                 logger.error(
                     "card_position_update_failed",
-                    card_id=update["card_id"],
+                    card_id=card_id,
                     error=str(err),
                     error_type=type(err).__name__,
                     exc_info=True,
                 )
                 failed_count += 1
 
+        api_calls_saved = len(card_data) - len(position_updates)
         if failed_count > 0:
             logger.warning(
                 "list_sort_completed_with_failures",
@@ -1321,13 +1454,22 @@ def sort_list_by_fab_order(list_id, fab_order_field_id):
                 count=len(position_updates),
             )
         else:
-            logger.debug("list_sorted", list_id=list_id, count=updated_count)
+            logger.debug(
+                "list_sorted",
+                list_id=list_id,
+                count=updated_count,
+                total_cards=len(card_data),
+                api_calls_saved=api_calls_saved,
+                renormalized=renormalized,
+            )
 
         return {
             "success": True,
             "cards_sorted": updated_count,
             "cards_failed": failed_count,
             "total_cards": len(card_data),
+            "api_calls_saved": api_calls_saved,
+            "renormalized": renormalized,
         }
 
     except requests.exceptions.HTTPError as http_err:
@@ -1392,7 +1534,7 @@ def add_comment_to_trello_card(card_id, comment_text, operation_id=None, sender_
     sender_tag = f" ({sender_initials})" if sender_initials else ""
     formatted_comment = f"[{timestamp}]{sender_tag} {comment_text.strip()}"
 
-    url = f"https://api.trello.com/1/cards/{card_id}/actions/comments"
+    url = f"/cards/{card_id}/actions/comments"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
@@ -1406,7 +1548,7 @@ def add_comment_to_trello_card(card_id, comment_text, operation_id=None, sender_
             operation_id=operation_id,
             comment_length=len(formatted_comment),
         )
-        response = requests.post(url, params=params)
+        response = get_trello_client().post(url, params=params)
         response.raise_for_status()
         logger.debug("comment_added", card_id=card_id, operation_id=operation_id)
         return True
@@ -1475,13 +1617,13 @@ def get_card_attachments_by_job_release(job_number, release_number):
             }
 
         # Get attachments from Trello API
-        url = f"https://api.trello.com/1/cards/{job_record.trello_card_id}/attachments"
+        url = f"/cards/{job_record.trello_card_id}/attachments"
 
         headers = {"Accept": "application/json"}
 
         query = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
 
-        response = requests.get(url, headers=headers, params=query)
+        response = get_trello_client().get(url, headers=headers, params=query)
 
         if response.status_code == 200:
             attachments = response.json()
@@ -1621,57 +1763,63 @@ def get_card_attachments_by_card_id(trello_card_id):
     Returns:
         dict: Dictionary containing success status and attachments data
     """
-    try:
-        logger.debug("attachments_lookup_started", card_id=trello_card_id)
+    logger.debug("attachments_lookup_started", card_id=trello_card_id)
+    path = f"/cards/{trello_card_id}/attachments"
+    result = batch_get([path])[path]
 
-        # Get attachments from Trello API
-        url = f"https://api.trello.com/1/cards/{trello_card_id}/attachments"
-
-        headers = {"Accept": "application/json"}
-
-        query = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-
-        response = requests.get(url, headers=headers, params=query)
-
-        if response.status_code == 200:
-            attachments = response.json()
-            logger.debug(
-                "attachments_fetched",
-                card_id=trello_card_id,
-                count=len(attachments),
-            )
-            return {
-                "success": True,
-                "trello_card_id": trello_card_id,
-                "attachments": attachments,
-            }
-        else:
-            logger.warning(
-                "attachments_fetch_failed",
-                card_id=trello_card_id,
-                status=response.status_code,
-            )
-            logger.debug(
-                "attachments_fetch_error_response",
-                card_id=trello_card_id,
-                body=response.text,
-            )
-            return {
-                "success": False,
-                "error": f"Trello API error: {response.status_code} {response.text}",
-                "attachments": [],
-            }
+    if result.ok:
+        attachments = result.body
+        logger.debug(
+            "attachments_fetched",
+            card_id=trello_card_id,
+            count=len(attachments),
+        )
+        return {
+            "success": True,
+            "trello_card_id": trello_card_id,
+            "attachments": attachments,
+        }
 
-    except Exception as e:
-        error_msg = f"Error getting attachments for card {trello_card_id}: {str(e)}"
+    if result.status is None:
         logger.error(
             "attachments_fetch_failed",
             card_id=trello_card_id,
-            error=str(e),
-            error_type=type(e).__name__,
-            exc_info=True,
+            error=str(result.body),
         )
-        return {"success": False, "error": error_msg, "attachments": []}
+        return {
+            "success": False,
+            "error": f"Error getting attachments for card {trello_card_id}: {result.body}",
+            "attachments": [],
+        }
+
+    logger.warning(
+        "attachments_fetch_failed",
+        card_id=trello_card_id,
+        status=result.status,
+    )
+    logger.debug(
+        "attachments_fetch_error_response",
+        card_id=trello_card_id,
+        body=result.body,
+    )
+    return {
+        "success": False,
+        "error": f"Trello API error: {result.status} {result.body}",
+        "attachments": [],
+    }
+
+
+def get_cards_attachments(card_ids):
+    """
+    Attachments for many cards in as few /batch calls as possible.
+
+    Reads are served from the batch reader's TTL cache when fresh; link_cards
+    drops a card's entry when it adds an attachment.
+
+    Returns:
+        dict: {card_id: list of attachments, or None if that read failed}
+    """
+    return _read_cards(card_ids, "/attachments", "attachments_fetch_failed")
 
 
 def calculate_installation_duration(install_hrs, num_guys=2):
@@ -2000,7 +2148,7 @@ def update_trello_card_description(card_id, new_description):
     Returns:
         dict: Response from Trello API, or None if update fails
     """
-    url = f"https://api.trello.com/1/cards/{card_id}"
+    url = f"/cards/{card_id}"
 
     params = {
         "key": cfg.TRELLO_API_KEY,
@@ -2010,7 +2158,7 @@ def update_trello_card_description(card_id, new_description):
 
     try:
         logger.debug("card_description_update_requested", card_id=card_id)
-        response = requests.put(url, params=params)
+        response = get_trello_client().put(url, params=params)
         response.raise_for_status()
 
         logger.debug("card_description_updated", card_id=card_id)
@@ -2053,13 +2201,13 @@ def update_trello_card_name(card_id, new_name):
     Returns:
         dict: Response from Trello API, or None if update fails
     """
-    url = f"https://api.trello.com/1/cards/{card_id}"
+    url = f"/cards/{card_id}"
 
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN, "name": new_name}
 
     try:
         logger.debug("card_name_update_requested", card_id=card_id)
-        response = requests.put(url, params=params)
+        response = get_trello_client().put(url, params=params)
         response.raise_for_status()
 
         logger.debug("card_name_updated", card_id=card_id)
@@ -2157,7 +2305,7 @@ def update_card_date_range(card_short_link, start_date, due_date):
         start_date_str = mountain_start_datetime(start_date)
         due_date_str = mountain_due_datetime(due_date)
 
-        url = f"https://api.trello.com/1/cards/{card_short_link}"
+        url = f"/cards/{card_short_link}"
 
         payload = {
             "key": cfg.TRELLO_API_KEY,
@@ -2173,7 +2321,7 @@ def update_card_date_range(card_short_link, start_date, due_date):
             due_date=due_date_str,
         )
 
-        response = requests.put(url, params=payload)
+        response = get_trello_client().put(url, params=payload)
 
         if response.status_code == 200:
             logger.debug("mirror_card_date_range_updated", card_id=card_short_link)
@@ -2227,7 +2375,7 @@ def add_procore_link(card_id, procore_url, link_name=None):
         logger.debug("procore_link_skipped", card_id=card_id, reason="empty url")
         return {"success": False, "error": "Procore URL is required"}
 
-    url = f"https://api.trello.com/1/cards/{card_id}/attachments"
+    url = f"/cards/{card_id}/attachments"
 
     params = {
         "key": cfg.TRELLO_API_KEY,
@@ -2242,8 +2390,9 @@ def add_procore_link(card_id, procore_url, link_name=None):
 
     try:
         logger.debug("procore_link_add_requested", card_id=card_id)
-        response = requests.post(url, params=params)
+        response = get_trello_client().post(url, params=params)
         response.raise_for_status()
+        invalidate_card(card_id)
 
         attachment_data = response.json()
         logger.debug(
@@ -2296,7 +2445,7 @@ def add_procore_link(card_id, procore_url, link_name=None):
 # Copy Card to Unassigned and Link
 ########################################################
 def copy_trello_card(card_id, target_list_id, pos="bottom"):
-    url = "https://api.trello.com/1/cards"
+    url = "/cards"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN,
@@ -2305,17 +2454,18 @@ def copy_trello_card(card_id, target_list_id, pos="bottom"):
         "keepFromSource": "all",
         "pos": pos,
     }
-    resp = requests.post(url, params=params)
+    resp = get_trello_client().post(url, params=params)
     resp.raise_for_status()
     return resp.json()
 
 
 def card_has_link_to(card_id):
-    url = f"https://api.trello.com/1/cards/{card_id}/attachments"
-    params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return any(att.get("name") == "Linked card" for att in resp.json())
+    # Uncached: this guards link_cards, and another process may have linked meanwhile.
+    path = f"/cards/{card_id}/attachments"
+    result = batch_get([path], use_cache=False)[path]
+    if not result.ok:
+        raise requests.exceptions.HTTPError(f"Trello attachments read for {card_id} failed: {result.status}")
+    return any(att.get("name") == "Linked card" for att in result.body)
 
 
 def _mirror_short_link_from_attachments(attachments):
@@ -2455,6 +2605,17 @@ def resolve_mirror_card_id(primary_card_id, mirror_card_id_hint=None):
     return _mirror_short_link_from_attachments(attachments_result.get("attachments"))
 
 
+def resolve_mirror_short_links(primary_card_ids):
+    """Bulk resolve_mirror_card_id without hints: {primary card id: mirror shortLink or None}.
+
+    One /batch call per ten primaries instead of one attachments GET each.
+    """
+    return {
+        card_id: _mirror_short_link_from_attachments(attachments)
+        for card_id, attachments in get_cards_attachments(primary_card_ids).items()
+    }
+
+
 def update_mirror_card_content(primary_card_id, new_title=None, new_description=None, mirror_card_id=None):
     """Push the primary card's regenerated title/description onto its mirror card.
 
@@ -2483,28 +2644,29 @@ def update_mirror_card_content(primary_card_id, new_title=None, new_description=
 def link_cards(primary_id, secondary_id):
     base = "https://trello.com/c/"
     for src, dst in ((primary_id, secondary_id), (secondary_id, primary_id)):
-        url = f"https://api.trello.com/1/cards/{src}/attachments"
+        url = f"/cards/{src}/attachments"
         params = {
             "key": cfg.TRELLO_API_KEY,
             "token": cfg.TRELLO_TOKEN,
             "url": f"{base}{dst}",
             "name": "Linked card",
         }
-        resp = requests.post(url, params=params)
+        resp = get_trello_client().post(url, params=params)
         resp.raise_for_status()
+        invalidate_card(src)
 
 
 def get_member_by_id(member_id):
-    url = f"https://api.trello.com/1/members/{member_id}"
+    url = f"/members/{member_id}"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    resp = requests.get(url, params=params)
+    resp = get_trello_client().get(url, params=params)
     resp.raise_for_status()
     return resp.json()
 
 
 def get_membership_by_board():
-    url = f"https://api.trello.com/1/boards/{cfg.TRELLO_BOARD_ID}/memberships"
+    url = f"/boards/{cfg.TRELLO_BOARD_ID}/memberships"
     params = {"key": cfg.TRELLO_API_KEY, "token": cfg.TRELLO_TOKEN}
-    resp = requests.get(url, params=params)
+    resp = get_trello_client().get(url, params=params)
     resp.raise_for_status()
     return resp.json()
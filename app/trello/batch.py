@@ -0,0 +1,264 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Batch read layer over Trello's GET /batch — coalesces card GETs from every thread into calls of up to ten urls and keeps recent card snapshots in a short TTL cache.
+exports:
+  BatchResult: status + parsed body of one url's response inside a batch
+  TrelloBatchReader: get_many(paths) / get(path) / invalidate_card(card_id) / stats() over one TrelloClient
+  get_batch_reader: Returns the process-wide TrelloBatchReader, creating it on first call
+  batch_get: Shorthand for get_batch_reader().get_many(...)
+  invalidate_card: Drop every cached read for one card (call after writing to it)
+imports_from: [app.config, app.trello.client, app.logging_config]
+imported_by: [app/trello/api.py]
+invariants:
+  - Only GETs go through here; paths are API-relative ("/cards/<id>/attachments") without key/token, which the outer /batch call carries.
+  - A path already in flight is never requested twice: later callers wait on the first request's result.
+  - The first caller with queued paths leads the flush: it waits TRELLO_BATCH_WINDOW_SECONDS for others to join, then sends every queued path in chunks of TRELLO_BATCH_MAX_URLS until the queue is empty.
+  - A chunk of one path is sent as a plain GET (same single round trip, clearer endpoint stats).
+  - Only 200 responses are cached; a failed /batch call fails every path in its chunk with that status, and an exception fails them with status None.
+  - invalidate_card bumps the card's generation; a read queued before the bump still answers its waiters but is not cached, so a pre-write body never outlives the write.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+from app.trello.client import get_trello_client
+
+logger = get_logger(__name__)
+
+# Expired cache entries are swept once the cache holds more than this many paths.
+_CACHE_SWEEP_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """One url's outcome: HTTP status (None when the request never completed) and parsed body."""
+    status: Optional[int]
+    body: Any
+
+    @property
+    def ok(self):
+        return self.status == 200
+
+
+class _Pending:
+    def __init__(self, generation=0):
+        self.event = threading.Event()
+        self.result = None
+        self.generation = generation
+
+    def resolve(self, result):
+        self.result = result
+        self.event.set()
+
+
+def _parse_entry(entry):
+    """One element of a /batch response -> BatchResult.
+
+    Trello answers {"200": body} per url on success and an error object carrying
+    statusCode (e.g. {"name": "NotFoundError", ..., "statusCode": 404}) otherwise.
+    """
+    if isinstance(entry, dict):
+        if len(entry) == 1:
+            (key, value), = entry.items()
+            if str(key).isdigit():
+                return BatchResult(int(key), value)
+        if entry.get("statusCode"):
+            return BatchResult(int(entry["statusCode"]), entry)
+    return BatchResult(500, entry)
+
+
+def _card_prefixes(card_id):
+    base = f"/cards/{card_id}"
+    return (base + "/", base + "?")
+
+
+def _card_of(path):
+    """Card id a /cards/<id>... path reads, else None."""
+    if not path.startswith("/cards/"):
+        return None
+    return re.split(r"[/?]", path[len("/cards/"):], maxsplit=1)[0] or None
+
+
+class TrelloBatchReader:
+    """Coalescing, caching reader of Trello GETs, batched through /batch."""
+
+    def __init__(self, client=None, max_urls=None, window_seconds=None, cache_ttl_seconds=None, clock=time.monotonic):
+        self._client = client
+        self.max_urls = max(1, int(cfg.TRELLO_BATCH_MAX_URLS if max_urls is None else max_urls))
+        self.window_seconds = float(cfg.TRELLO_BATCH_WINDOW_SECONDS if window_seconds is None else window_seconds)
+        self.cache_ttl_seconds = float(
+            cfg.TRELLO_BATCH_CACHE_TTL_SECONDS if cache_ttl_seconds is None else cache_ttl_seconds
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._inflight = {}
+        self._generations = {}  # card id -> invalidation count
+        self._queue = []
+        self._leading = False
+        self._totals = {"paths": 0, "cache_hits": 0, "coalesced": 0, "requests": 0, "batches": 0}
+
+    @property
+    def client(self):
+        return self._client or get_trello_client()
+
+    def get(self, path, use_cache=True):
+        """BatchResult for one path, sharing a /batch call with any concurrent readers."""
+        return self.get_many([path], use_cache=use_cache)[path]
+
+    def get_many(self, paths: Iterable[str], use_cache=True) -> Dict[str, BatchResult]:
+        """{path: BatchResult} for every path, fetching misses in as few /batch calls as possible.
+
+        use_cache=False skips the TTL cache for this read (the fresh result still
+        refreshes it) but still joins a request for the same path already in flight.
+        """
+        results = {}
+        waits = {}
+        lead = False
+        now = self._clock()
+        with self._lock:
+            for path in dict.fromkeys(paths):
+                self._totals["paths"] += 1
+                if use_cache:
+                    cached = self._cache.get(path)
+                    if cached and cached[0] > now:
+                        results[path] = cached[1]
+                        self._totals["cache_hits"] += 1
+                        continue
+                pending = self._inflight.get(path)
+                if pending is None:
+                    pending = _Pending(self._generations.get(_card_of(path), 0))
+                    self._inflight[path] = pending
+                    self._queue.append(path)
+                else:
+                    self._totals["coalesced"] += 1
+                waits[path] = pending
+            if self._queue and not self._leading:
+                self._leading = True
+                lead = True
+
+        if lead:
+            self._lead()
+        for path, pending in waits.items():
+            pending.event.wait()
+            results[path] = pending.result
+        return results
+
+    def invalidate_card(self, card_id):
+        """Forget cached reads of /cards/<card_id> and everything under it.
+
+        Also bumps the card's generation so a read already in flight (which may
+        carry the pre-write body) is handed to its waiters but not cached.
+        """
+        if not card_id:
+            return
+        base = f"/cards/{card_id}"
+        prefixes = _card_prefixes(card_id)
+        with self._lock:
+            self._generations[card_id] = self._generations.get(card_id, 0) + 1
+            for path in [p for p in self._cache if p == base or p.startswith(prefixes)]:
+                del self._cache[path]
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        with self._lock:
+            totals = dict(self._totals)
+            totals["cached_paths"] = len(self._cache)
+            totals["inflight"] = len(self._inflight)
+        return totals
+
+    def _lead(self):
+        if self.window_seconds > 0:
+            time.sleep(self.window_seconds)
+        while True:
+            with self._lock:
+                queued, self._queue = self._queue, []
+                if not queued:
+                    self._leading = False
+                    return
+            for start in range(0, len(queued), self.max_urls):
+                chunk = queued[start:start + self.max_urls]
+                try:
+                    fetched = self._fetch(chunk)
+                except Exception as e:
+                    logger.warning(
+                        "trello_batch_failed",
+                        urls=len(chunk),
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    fetched = {path: BatchResult(None, str(e)) for path in chunk}
+                self._settle(fetched)
+
+    def _fetch(self, chunk):
+        client = self.client
+        if len(chunk) == 1:
+            path = chunk[0]
+            response = client.get(path)
+            with self._lock:
+                self._totals["requests"] += 1
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            return {path: BatchResult(response.status_code, body)}
+
+        # Commas separate urls, so a comma inside one (fields=id,name) travels as %2C.
+        urls = ",".join(path.replace(",", "%2C") for path in chunk)
+        response = client.get("/batch", params={"urls": urls})
+        with self._lock:
+            self._totals["requests"] += 1
+            self._totals["batches"] += 1
+        if response.status_code != 200:
+            logger.warning("trello_batch_rejected", urls=len(chunk), status=response.status_code)
+            return {path: BatchResult(response.status_code, response.text) for path in chunk}
+        entries = response.json()
+        return {
+            path: _parse_entry(entries[i]) if i < len(entries) else BatchResult(None, "missing from batch response")
+            for i, path in enumerate(chunk)
+        }
+
+    def _settle(self, fetched):
+        now = self._clock()
+        with self._lock:
+            for path, result in fetched.items():
+                pending = self._inflight.pop(path, None)
+                current = pending is not None and pending.generation == self._generations.get(_card_of(path), 0)
+                if result.ok and current and self.cache_ttl_seconds > 0:
+                    self._cache[path] = (now + self.cache_ttl_seconds, result)
+                if pending is not None:
+                    pending.resolve(result)
+            if len(self._cache) > _CACHE_SWEEP_SIZE:
+                for path in [p for p, (expires, _) in self._cache.items() if expires <= now]:
+                    del self._cache[path]
+
+
+_reader = None
+_reader_lock = threading.Lock()
+
+
+def get_batch_reader():
+    """Returns the process-wide TrelloBatchReader instance"""
+    global _reader
+    if _reader is None:
+        with _reader_lock:
+            if _reader is None:
+                _reader = TrelloBatchReader()
+    return _reader
+
+
+def batch_get(paths, use_cache=True):
+    return get_batch_reader().get_many(paths, use_cache=use_cache)
+
+
+def invalidate_card(card_id):
+    get_batch_reader().invalidate_card(card_id)
@@ -6,13 +6,16 @@ exports:
   build_card_title: Assemble a standardised "job-release name description" card title.
   build_card_description: Assemble a Markdown card description with install hours, paint, team, etc.
   create_trello_card_core: POST a new card to a Trello list (shared low-level call).
+  build_release_card_content: (title, description) for a Releases row, as the scanner and bulk pipeline create it.
   apply_card_post_creation_features: Set Fab Order, FC Drawing link, notes comment, and mirror card after creation.
-imports_from: [app.trello.api, app.trello.utils, app.logging_config, app.config, app.models, requests]
-imported_by: [app/brain/job_log/routes.py, app/trello/scanner.py]
+  POST_CREATION_STEPS: Step names apply_card_post_creation_features reports through on_step, in run order.
+imports_from: [app.trello.api, app.trello.client, app.trello.utils, app.logging_config, app.config, app.models]
+imported_by: [app/brain/job_log/routes.py, app/trello/scanner.py, app/trello/card_pipeline.py]
 invariants:
   - create_trello_card_core always returns a dict with a 'success' boolean key.
   - apply_card_post_creation_features uses deferred imports to avoid circular deps with api.py.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - apply_card_post_creation_features calls on_step(name) only once a step has been applied or had nothing to do; steps named in skip_steps are not run again (bulk-pipeline resume).
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Shared Trello card creation functionality.
 
@@ -20,14 +23,16 @@ This module provides a unified interface for creating Trello cards from various
 with support for all features including mirror cards, FC Drawing links, Fab Order, etc.
 """
 
-from typing import Dict, Optional, Any
+from typing import Any, Callable, Collection, Dict, Optional, Tuple
 from app.logging_config import get_logger
 from app.config import Config as cfg
-import requests
+from app.trello.client import get_trello_client
 import math
 
 logger = get_logger(__name__)
 
+POST_CREATION_STEPS = ("fab_order", "fc_drawing", "notes", "mirror")
+
 
 def build_card_title(job_number: int, release: str, job_name: str, description: str) -> str:
     """
@@ -104,6 +109,28 @@ def build_card_description(
     return "\n".join(description_parts) if description_parts else ""
 
 
+def build_release_card_content(job: Any) -> Tuple[str, str]:
+    """
+    Card title and description for a Releases row.
+
+    Args:
+        job: Releases record
+
+    Returns:
+        (card_title, card_description)
+    """
+    card_title = build_card_title(job.job, job.release, job.job_name, job.description)
+    card_description = build_card_description(
+        description=job.description,
+        install_hrs=job.install_hrs,
+        paint_color=job.paint_color,
+        pm=job.pm,
+        by=job.by,
+        released=job.released
+    )
+    return card_title, card_description
+
+
 def create_trello_card_core(
     card_title: str,
     card_description: str,
@@ -162,7 +189,7 @@ def create_trello_card_core(
                     error_type=type(scan_err).__name__,
                 )
 
-        url = "https://api.trello.com/1/cards"
+        url = "/cards"
         payload = {
             "key": cfg.TRELLO_API_KEY,
             "token": cfg.TRELLO_TOKEN,
@@ -173,7 +200,7 @@ def create_trello_card_core(
         }
 
         logger.debug("trello_card_create_started", list_id=list_id)
-        response = requests.post(url, params=payload)
+        response = get_trello_client().post(url, params=payload)
         response.raise_for_status()
 
         card_data = response.json()
@@ -209,7 +236,10 @@ def apply_card_post_creation_features(
     viewer_url: Optional[str] = None,
     notes: Optional[str] = None,
     create_mirror: bool = False,
-    operation_id: Optional[str] = None
+    operation_id: Optional[str] = None,
+    sort_list: bool = True,
+    skip_steps: Collection[str] = (),
+    on_step: Optional[Callable[[str], None]] = None,
 ) -> Dict[str, Any]:
     """
     Apply post-creation features to a Trello card.
@@ -229,6 +259,9 @@ def apply_card_post_creation_features(
         notes: Notes to add as comment (optional)
         create_mirror: Whether to create mirror card (default: False)
         operation_id: Operation ID for logging (optional)
+        sort_list: Re-sort list_id by Fab Order after setting it (bulk callers sort once at the end)
+        skip_steps: POST_CREATION_STEPS already applied to this card; they are not run again
+        on_step: Called with each step's name once it is applied (or had nothing to do)
     
     Returns:
         Dictionary with results of each operation
@@ -252,13 +285,18 @@ def apply_card_post_creation_features(
         "notes_added": False,
         "mirror_card_id": None
     }
-    
+
+    def step_done(name):
+        if on_step is not None:
+            on_step(name)
+
     # Get viewer_url from job_record if not provided
     if not viewer_url and job_record and hasattr(job_record, 'viewer_url'):
         viewer_url = job_record.viewer_url
     
     # If viewer_url is still missing and we have a job_record, try to fetch from Procore
-    if not viewer_url and job_record and hasattr(job_record, 'job') and hasattr(job_record, 'release'):
+    if (not viewer_url and "fc_drawing" not in skip_steps
+            and job_record and hasattr(job_record, 'job') and hasattr(job_record, 'release')):
         try:
             from app.procore.procore import get_viewer_url_for_job
             from app.models import db
@@ -304,7 +342,11 @@ def apply_card_post_creation_features(
         fab_order = job_record.fab_order
     
     # Handle Fab Order custom field
-    if fab_order is not None:
+    if "fab_order" in skip_steps:
+        pass
+    elif fab_order is None:
+        step_done("fab_order")
+    else:
         try:
             # Convert to int (round up if float)
             if isinstance(fab_order, float):
@@ -321,20 +363,23 @@ def apply_card_post_creation_features(
                 if fab_order_success:
                     results["fab_order_set"] = True
                     logger.info("fab_order_field_set", card_id=card_id, fab_order=fab_order_int)
-                    
+                    step_done("fab_order")
+
                     # Sort the list if it's one of the target lists
-                    sort_success = sort_list_if_needed(
-                        list_id,
-                        cfg.FAB_ORDER_FIELD_ID,
-                        operation_id,
-                        "list"
-                    )
-                    if sort_success:
-                        results["fab_order_sorted"] = True
+                    if sort_list:
+                        sort_success = sort_list_if_needed(
+                            list_id,
+                            cfg.FAB_ORDER_FIELD_ID,
+                            operation_id,
+                            "list"
+                        )
+                        if sort_success:
+                            results["fab_order_sorted"] = True
                 else:
                     logger.warning("fab_order_field_set_failed", card_id=card_id, fab_order=fab_order_int)
             else:
                 logger.debug("fab_order_field_skipped", card_id=card_id)
+                step_done("fab_order")
         except (ValueError, TypeError) as e:
             logger.error(
                 "fab_order_conversion_failed",
@@ -346,12 +391,17 @@ def apply_card_post_creation_features(
             )
     
     # Add FC Drawing link if viewer_url exists
-    if viewer_url:
+    if "fc_drawing" in skip_steps:
+        pass
+    elif not viewer_url:
+        step_done("fc_drawing")
+    else:
         try:
             link_result = add_procore_link(card_id, viewer_url, link_name="FC Drawing")
             if link_result.get("success"):
                 results["fc_drawing_added"] = True
                 logger.info("fc_drawing_link_added", card_id=card_id)
+                step_done("fc_drawing")
             else:
                 logger.warning(
                     "fc_drawing_link_add_failed",
@@ -367,7 +417,11 @@ def apply_card_post_creation_features(
             )
     
     # Handle notes field - append as comment if not empty
-    if notes is not None:
+    if "notes" in skip_steps:
+        pass
+    elif notes is None:
+        step_done("notes")
+    else:
         # Check if notes value is valid (not None, not NaN, not empty string, not 'nan'/'NaN')
         if (not pd.isna(notes) and 
             str(notes).strip() and
@@ -377,6 +431,7 @@ def apply_card_post_creation_features(
                 if comment_success:
                     results["notes_added"] = True
                     logger.info("notes_comment_added", card_id=card_id)
+                    step_done("notes")
             except Exception as comment_err:
                 logger.warning(
                     "notes_comment_add_failed",
@@ -384,9 +439,15 @@ def apply_card_post_creation_features(
                     error=str(comment_err),
                     error_type=type(comment_err).__name__,
                 )
+        else:
+            step_done("notes")
     
     # Create mirror card in unassigned list if configured
-    if create_mirror and cfg.UNASSIGNED_CARDS_LIST_ID:
+    if "mirror" in skip_steps:
+        pass
+    elif not (create_mirror and cfg.UNASSIGNED_CARDS_LIST_ID):
+        step_done("mirror")
+    else:
         try:
             # Check if card already has a link (to avoid duplicates)
             if not card_has_link_to(card_id):
@@ -417,8 +478,10 @@ def apply_card_post_creation_features(
                             error_type=type(persist_err).__name__,
                         )
                         db.session.rollback()
+                step_done("mirror")
             else:
                 logger.debug("mirror_card_create_skipped", card_id=card_id)
+                step_done("mirror")
         except Exception as mirror_err:
             logger.warning(
                 "mirror_card_create_failed",
@@ -0,0 +1,348 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Bulk Trello card creation — builds many releases' cards side by side on a bounded worker pool, checkpointing each card's progress so an interrupted run resumes instead of duplicating.
+exports:
+  create_cards_for_releases: Create (or resume) cards for a set of Releases rows; returns per-release results plus counts
+  unfinished_release_ids: Release ids whose last bulk build stopped part-way (card created, steps missing)
+imports_from: [app.models, app.config, app.trello.api, app.trello.card_creation, app.trello.utils, app.logging_config, flask, concurrent.futures]
+imported_by: [app/trello/scanner.py, app/trello/scripts/create_missing_cards.py]
+invariants:
+  - One card's calls (create, Fab Order, FC Drawing, notes, mirror) run in order on one worker; different cards run side by side on TRELLO_CARD_CREATE_WORKERS threads, all behind the shared Trello rate limiter.
+  - Each release has at most one trello_card_builds row; the card id is committed the moment Trello returns it, in the same commit that writes trello_card_id and the list onto the release, and every post-creation step is committed as it completes, so a resumed build never re-posts a card, comment or link.
+  - A build whose release update fails ends 'failed'; a resumed build whose release lacks the card id re-links it before the remaining steps.
+  - A resumed build that has no card id yet creates with idempotency_check=True (adopts a same-titled card a lost response already created).
+  - Per-card list sorting is skipped; each list that got a Fab Order is sorted once after the whole run.
+  - Workers open their own app context and reload rows by id; on an in-memory SQLite database (tests) the builds run inline.
+  - This module takes no locks itself; the scanner entry points call it under the board-wide sync lock (_board_exclusive).
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from flask import current_app
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+from app.models import Releases, TrelloCardBuild, db, in_memory_database
+from app.trello.card_creation import POST_CREATION_STEPS
+
+logger = get_logger(__name__)
+
+# Progress is logged at info every this many finished cards (and at the end).
+_PROGRESS_LOG_EVERY = 10
+
+
+def unfinished_release_ids(release_ids: Optional[Iterable[int]] = None) -> List[int]:
+    """Release ids with a build that is not done (optionally limited to release_ids)."""
+    query = db.session.query(TrelloCardBuild.release_id).filter(TrelloCardBuild.status != "done")
+    if release_ids is not None:
+        release_ids = list(release_ids)
+        if not release_ids:
+            return []
+        query = query.filter(TrelloCardBuild.release_id.in_(release_ids))
+    return [row[0] for row in query.all()]
+
+
+def create_cards_for_releases(
+    releases: Iterable[Releases],
+    list_names: Optional[Dict[int, str]] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int, Dict], None]] = None,
+) -> Dict:
+    """
+    Create Trello cards for many releases at once, resuming any unfinished builds.
+
+    A release that already has a card is skipped unless its last build stopped
+    part-way, in which case the missing steps are applied to that card.
+
+    Args:
+        releases: Releases rows to build cards for
+        list_names: {release.id: Trello list name}; missing entries follow the release's stage
+        workers: Pool size (defaults to TRELLO_CARD_CREATE_WORKERS)
+        progress: Called as progress(done, total, result) after each card finishes
+
+    Returns:
+        Dictionary with run_id, total, created, resumed, skipped, failed, results
+        (one dict per release, in completion order) and lists_sorted
+    """
+    from app.trello.api import get_list_by_name
+    from app.trello.scanner import get_expected_trello_list_from_stage
+
+    run_id = uuid4().hex[:12]
+    list_names = list_names or {}
+    workers = max(1, int(cfg.TRELLO_CARD_CREATE_WORKERS if workers is None else workers))
+    releases = list(releases)
+    started = time.monotonic()
+
+    summary = {
+        "run_id": run_id,
+        "total": len(releases),
+        "created": 0,
+        "resumed": 0,
+        "skipped": 0,
+        "failed": 0,
+        "results": [],
+        "lists_sorted": [],
+    }
+
+    existing = {
+        b.release_id: b
+        for b in TrelloCardBuild.query.filter(
+            TrelloCardBuild.release_id.in_([r.id for r in releases])
+        ).all()
+    } if releases else {}
+
+    list_ids = {}
+    build_ids = []
+    for rec in releases:
+        build = existing.get(rec.id)
+        if rec.trello_card_id and (build is None or build.status == "done"):
+            summary["skipped"] += 1
+            summary["results"].append(_result(rec, False, error="Card already exists", card_id=rec.trello_card_id))
+            continue
+
+        if build is None:
+            list_name = (
+                list_names.get(rec.id)
+                or get_expected_trello_list_from_stage(rec.stage)
+                or "Released"
+            )
+            if list_name not in list_ids:
+                target = get_list_by_name(list_name)
+                list_ids[list_name] = target["id"] if target else cfg.NEW_TRELLO_CARD_LIST_ID
+                if not target:
+                    logger.warning("trello_list_not_found", list_name=list_name, job=str(rec.job), release=rec.release)
+            build = TrelloCardBuild(
+                release_id=rec.id,
+                list_name=list_name,
+                list_id=list_ids[list_name],
+                steps=[],
+                status="pending",
+                attempts=0,
+            )
+            db.session.add(build)
+        build.run_id = run_id
+        db.session.flush()
+        build_ids.append(build.id)
+    db.session.commit()
+
+    logger.info(
+        "card_pipeline_started",
+        run_id=run_id,
+        total=len(releases),
+        to_build=len(build_ids),
+        skipped=summary["skipped"],
+        workers=workers,
+    )
+
+    done = summary["skipped"]
+    sort_lists = set()
+
+    def finish(result):
+        nonlocal done
+        done += 1
+        if result.get("success"):
+            summary["resumed" if result.get("resumed") else "created"] += 1
+            if result.get("fab_order_set"):
+                sort_lists.add(result["list_id"])
+        else:
+            summary["failed"] += 1
+        summary["results"].append(result)
+        if done % _PROGRESS_LOG_EVERY == 0 or done == summary["total"]:
+            logger.info(
+                "card_pipeline_progress",
+                run_id=run_id,
+                done=done,
+                total=summary["total"],
+                created=summary["created"],
+                resumed=summary["resumed"],
+                failed=summary["failed"],
+            )
+        if progress is not None:
+            progress(done, summary["total"], result)
+
+    if workers <= 1 or len(build_ids) <= 1 or in_memory_database():
+        for build_id in build_ids:
+            finish(_build_card(build_id))
+    else:
+        app = current_app._get_current_object()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trello-card-build-") as pool:
+            futures = [pool.submit(_build_card_in_app, app, build_id) for build_id in build_ids]
+            for future in as_completed(futures):
+                finish(future.result())
+        db.session.expire_all()
+
+    for list_id in sorted(sort_lists):
+        if _sort_list(list_id):
+            summary["lists_sorted"].append(list_id)
+
+    logger.info(
+        "card_pipeline_complete",
+        run_id=run_id,
+        total=summary["total"],
+        created=summary["created"],
+        resumed=summary["resumed"],
+        skipped=summary["skipped"],
+        failed=summary["failed"],
+        lists_sorted=len(summary["lists_sorted"]),
+        duration_ms=int((time.monotonic() - started) * 1000),
+    )
+    return summary
+
+
+def _build_card_in_app(app, build_id: int) -> Dict:
+    with app.app_context():
+        try:
+            return _build_card(build_id)
+        finally:
+            db.session.remove()
+
+
+def _build_card(build_id: int) -> Dict:
+    """Run (or resume) one release's build: card, then each missing post-creation step."""
+    from app.trello.api import update_job_record_with_trello_data
+    from app.trello.card_creation import (
+        apply_card_post_creation_features,
+        build_release_card_content,
+        create_trello_card_core,
+    )
+
+    build = db.session.get(TrelloCardBuild, build_id)
+    rec = db.session.get(Releases, build.release_id)
+    if rec is None:
+        build.status = "failed"
+        build.error = "Release no longer exists"
+        db.session.commit()
+        return {"success": False, "release_id": build.release_id, "error": build.error}
+
+    resumed = bool(build.card_id or build.steps or build.attempts)
+    build.attempts = (build.attempts or 0) + 1
+    build.status = "pending"
+    build.error = None
+    db.session.commit()
+
+    try:
+        card_name = rec.trello_card_name
+        card_url = ""
+        if not build.card_id and rec.trello_card_id:
+            # The release was updated but the checkpoint write was lost; trust the release.
+            build.card_id = rec.trello_card_id
+            db.session.commit()
+        elif build.card_id and not rec.trello_card_id:
+            # Checkpointed before the release carried its card (older builds); link it now.
+            _link_release(rec, build)
+            db.session.commit()
+        if not build.card_id:
+            card_title, card_description = build_release_card_content(rec)
+            create_result = create_trello_card_core(
+                card_title=card_title,
+                card_description=card_description,
+                list_id=build.list_id,
+                position="top",
+                idempotency_check=build.attempts > 1,
+            )
+            if not create_result["success"]:
+                return _fail(build, rec, create_result.get("error", "Failed to create card"), resumed)
+            # Checkpoint and release link in one commit: a build can never hold a
+            # card id the release does not know about.
+            build.card_id = create_result["card_id"]
+            _link_release(rec, build)
+            db.session.commit()
+            card_name = create_result["card_data"].get("name", "")
+            card_url = create_result["card_data"].get("url", "")
+            if not update_job_record_with_trello_data(rec, create_result["card_data"]):
+                return _fail(build, rec, "Failed to update release with Trello card data", resumed)
+
+        def record_step(name):
+            build.steps = list(build.steps or []) + [name]
+            db.session.commit()
+
+        post = apply_card_post_creation_features(
+            card_id=build.card_id,
+            list_id=build.list_id,
+            job_record=rec,
+            notes=rec.notes,
+            create_mirror=True,
+            operation_id=None,
+            sort_list=False,
+            skip_steps=set(build.steps or []),
+            on_step=record_step,
+        )
+
+        missing = [step for step in POST_CREATION_STEPS if step not in (build.steps or [])]
+        if missing:
+            return _fail(build, rec, f"Incomplete post-creation steps: {', '.join(missing)}", resumed)
+
+        build.status = "done"
+        db.session.commit()
+        return _result(
+            rec,
+            True,
+            card_id=build.card_id,
+            card_name=card_name or "",
+            card_url=card_url,
+            list_id=build.list_id,
+            list_name=build.list_name,
+            mirror_card_id=post.get("mirror_card_id") or rec.mirror_trello_card_id,
+            fab_order_set=post.get("fab_order_set", False),
+            resumed=resumed,
+        )
+    except Exception as err:
+        db.session.rollback()
+        logger.error(
+            "card_build_failed",
+            build_id=build_id,
+            job=str(rec.job),
+            release=rec.release,
+            error=str(err),
+            error_type=type(err).__name__,
+            exc_info=True,
+        )
+        return _fail(db.session.get(TrelloCardBuild, build_id), rec, str(err), resumed)
+
+
+def _link_release(rec, build) -> None:
+    """Point the release at the build's card and list (the caller commits)."""
+    rec.trello_card_id = build.card_id
+    rec.trello_list_id = build.list_id
+    rec.trello_list_name = build.list_name
+
+
+def _fail(build, rec, error, resumed):
+    build.status = "failed"
+    build.error = error
+    db.session.commit()
+    logger.error("card_build_incomplete", job=str(rec.job), release=rec.release, card_id=build.card_id, error=error)
+    return _result(rec, False, error=error, card_id=build.card_id, list_name=build.list_name, resumed=resumed)
+
+
+def _result(rec, success, **fields):
+    return {
+        "success": success,
+        "release_id": rec.id,
+        "job": rec.job,
+        "release": rec.release,
+        "identifier": f"{rec.job}-{rec.release}",
+        "stage": rec.stage,
+        **fields,
+    }
+
+
+def _sort_list(list_id) -> bool:
+    from app.trello.utils import sort_list_if_needed
+
+    if not cfg.FAB_ORDER_FIELD_ID:
+        return False
+    try:
+        return bool(sort_list_if_needed(list_id, cfg.FAB_ORDER_FIELD_ID, None, "list"))
+    except Exception as err:
+        logger.warning(
+            "card_pipeline_sort_failed",
+            list_id=list_id,
+            error=str(err),
+            error_type=type(err).__name__,
+        )
+        return False
@@ -0,0 +1,250 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Own every outbound Trello REST call through one pooled keep-alive session with a shared rate limiter, 429/5xx retry and per-endpoint latency stats.
+exports:
+  TrelloClient: Session-based Trello client; request/get/put/post/delete return requests.Response
+  get_trello_client: Returns the process-wide TrelloClient, creating it on first call
+  endpoint_key: Normalise a path to "METHOD /cards/:id/..." for latency stats
+imports_from: [requests, app.config, app.rate_limit, app.logging_config]
+imported_by: [app/trello/api.py, app/trello/card_creation.py, app/trello/scanner.py, app/trello/__init__.py, app/trello/scripts/*]
+invariants:
+  - Every request takes a token first; the bucket is this process's share of Trello's per-token budget (100 requests / 10 s split across TRELLO_RATE_LIMIT_PROCESSES) and is shared by all threads in the process.
+  - A 429 pauses the whole bucket for Retry-After (or a jittered backoff), then retries — for every method, since Trello rejected it unprocessed.
+  - 5xx and connection errors retry only for GET/PUT/DELETE; a POST is never replayed (POST /cards can succeed behind a 5xx, see card_creation idempotency_check).
+  - Responses are returned as-is after retries run out; callers keep calling raise_for_status() / checking status_code.
+  - key/token are read from Config on every call and only filled in when the caller did not pass them.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import Config as cfg
+from app.logging_config import get_logger
+from app.rate_limit import TokenBucket
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# 24-hex object ids, and any segment carrying a digit (short links, board ids).
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F]{24}|[A-Za-z0-9]*\d[A-Za-z0-9]*)$")
+
+
+def _retry_delay_seconds(attempt):
+    """Full-jitter exponential backoff: uniform(0, 0.5 * 2**attempt), capped at 8 s."""
+    return random.uniform(0, min(8.0, 0.5 * (2 ** attempt)))
+
+
+def _retry_after_seconds(response):
+    """Seconds to wait from a Retry-After header (delta or HTTP date), or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, min(float(value), MAX_RETRY_AFTER_SECONDS))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    delta = (when - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, min(delta, MAX_RETRY_AFTER_SECONDS))
+
+
+def endpoint_key(method, path):
+    """'GET', '/cards/5f0c.../attachments' -> 'GET /cards/:id/attachments'."""
+    path = path.split("?", 1)[0]
+    segments = [":id" if _ID_SEGMENT.match(seg) else seg for seg in path.strip("/").split("/") if seg]
+    return f"{method.upper()} /{'/'.join(segments)}"
+
+
+class TrelloClient:
+    """Trello REST client over a pooled requests.Session.
+
+    `path` is relative to `base_url` ("/cards/<id>"); absolute URLs are passed through
+    unchanged so attachment downloads and the like still share the pool and limiter.
+    """
+
+    def __init__(
+        self,
+        base_url=None,
+        rate_limit_requests=None,
+        rate_limit_window_seconds=None,
+        max_retries=None,
+        timeout=None,
+        pool_maxsize=16,
+        bucket=None,
+    ):
+        self.base_url = (base_url or cfg.TRELLO_API_BASE_URL).rstrip("/")
+        self.max_retries = int(cfg.TRELLO_MAX_RETRIES if max_retries is None else max_retries)
+        self.timeout = float(cfg.TRELLO_REQUEST_TIMEOUT_SECONDS if timeout is None else timeout)
+        if bucket is None:
+            if rate_limit_requests is None:
+                # This process's share of the per-token limit (see TRELLO_RATE_LIMIT_PROCESSES).
+                capacity = max(1.0, cfg.TRELLO_RATE_LIMIT_REQUESTS / max(1, cfg.TRELLO_RATE_LIMIT_PROCESSES))
+            else:
+                capacity = rate_limit_requests
+            window = (
+                cfg.TRELLO_RATE_LIMIT_WINDOW_SECONDS
+                if rate_limit_window_seconds is None
+                else rate_limit_window_seconds
+            )
+            bucket = TokenBucket(capacity, float(capacity) / float(window))
+        self.bucket = bucket
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self._endpoints = {}
+        self._totals = {"requests": 0, "retries": 0, "rate_limited": 0, "throttle_wait_seconds": 0.0}
+
+    def _url(self, path):
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _record(self, key, elapsed, status):
+        with self._stats_lock:
+            entry = self._endpoints.setdefault(
+                key, {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            entry["count"] += 1
+            entry["total_seconds"] += elapsed
+            entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+            if status is None or status >= 400:
+                entry["errors"] += 1
+            self._totals["requests"] += 1
+
+    def _bump(self, name, amount=1):
+        with self._stats_lock:
+            self._totals[name] += amount
+
+    def request(self, method, path, params=None, json=None, headers=None, timeout=None, **kwargs):
+        """Send one Trello request with rate limiting and retries; returns the final Response."""
+        method = method.upper()
+        url = self._url(path)
+        key = endpoint_key(method, url[len(self.base_url):] if url.startswith(self.base_url) else urlparse(url).path)
+        params = dict(params or {})
+        params.setdefault("key", cfg.TRELLO_API_KEY)
+        params.setdefault("token", cfg.TRELLO_TOKEN)
+        retry_transient = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            waited = self.bucket.acquire()
+            if waited:
+                self._bump("throttle_wait_seconds", waited)
+            started = time.monotonic()
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=self.timeout if timeout is None else timeout,
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(key, time.monotonic() - started, None)
+                if not retry_transient or attempt >= self.max_retries:
+                    raise
+                delay = _retry_delay_seconds(attempt)
+                logger.warning(
+                    "trello_request_retry",
+                    endpoint=key,
+                    attempt=attempt + 1,
+                    reason=type(e).__name__,
+                    delay_seconds=round(delay, 3),
+                )
+            else:
+                self._record(key, time.monotonic() - started, response.status_code)
+                status = response.status_code
+                if status == 429 and attempt < self.max_retries:
+                    delay = _retry_after_seconds(response)
+                    if delay is None:
+                        delay = _retry_delay_seconds(attempt)
+                    self._bump("rate_limited")
+                    self.bucket.pause(delay)
+                    logger.warning(
+                        "trello_rate_limited",
+                        endpoint=key,
+                        attempt=attempt + 1,
+                        retry_after_seconds=round(delay, 3),
+                    )
+                    delay = 0.0  # the bucket pause already holds this thread back
+                elif status in RETRYABLE_STATUSES and retry_transient and attempt < self.max_retries:
+                    delay = _retry_delay_seconds(attempt)
+                    logger.warning(
+                        "trello_request_retry",
+                        endpoint=key,
+                        attempt=attempt + 1,
+                        reason=status,
+                        delay_seconds=round(delay, 3),
+                    )
+                else:
+                    return response
+            attempt += 1
+            self._bump("retries")
+            if delay:
+                time.sleep(delay)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def stats(self):
+        """Process-lifetime totals plus per-endpoint count/errors/avg_ms/max_ms."""
+        with self._stats_lock:
+            totals = dict(self._totals)
+            endpoints = {
+                key: {
+                    "count": e["count"],
+                    "errors": e["errors"],
+                    "avg_ms": round(1000 * e["total_seconds"] / e["count"], 1) if e["count"] else 0.0,
+                    "max_ms": round(1000 * e["max_seconds"], 1),
+                }
+                for key, e in self._endpoints.items()
+            }
+        totals["throttle_wait_seconds"] = round(totals["throttle_wait_seconds"], 3)
+        return {**totals, "endpoints": endpoints}
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_trello_client():
+    """Returns the process-wide TrelloClient instance"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TrelloClient()
+                logger.info("Trello client initialised", base_url=_client.base_url)
+    return _client
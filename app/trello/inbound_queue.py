@@ -0,0 +1,192 @@
+"""
+@milehigh-header
+schema_version: 1
+purpose: Durable inbound queue for Trello webhook events — persist on receipt, claim in per-card order, coalesce each card's burst, drain continuously on a worker thread, report depth / throughput. Configures the shared app.durable_queue over trello_inbound_events.
+exports:
+  InboundQueueFull: Raised by enqueue() when the pending backlog is at TRELLO_INBOUND_MAX_DEPTH
+  enqueue: Persist a parsed webhook event; returns its id, or None for a redelivered Trello action
+  claim_batch: Atomically move up to N cards' claimable events to 'processing', coalescing each card's burst into one merged event
+  finish_batch: Record a drained batch — completed, retried with backoff, deferred, or failed — in one commit
+  release_stale_claims: Hand 'processing' rows whose worker died back to 'pending'
+  purge_completed: Delete completed rows past TRELLO_INBOUND_RETENTION_DAYS
+  queue_metrics: Depth, oldest pending age, and this process's throughput / syncs-saved counters
+  InboundEventWorker: Daemon thread that calls a drain function back to back while it finds work
+imports_from: [sqlalchemy, app.durable_queue, app.models, app.config, app.trello.utils, app.logging_config]
+imported_by: [app/trello/__init__.py, app/__init__.py]
+invariants:
+  - Events are ordered per card_id; claiming, retry/backoff and stale-claim release are app.durable_queue's, read from the TRELLO_INBOUND_* settings.
+  - A new event waits TRELLO_COALESCE_WINDOW_SECONDS before it is claimable; the claim then takes every pending event for the head's card and runs them as one merge_webhook_events() result, so a drag's burst costs one sync.
+  - Lock contention (deferred) does not use up an attempt; a sync error does, and the row is kept as 'failed' after TRELLO_INBOUND_MAX_ATTEMPTS.
+  - Functions here need an app context and commit on db.session; the worker opens one per drain.
+updated_by_agent: 2026-10-16T00:00:00Z
+"""
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.config import Config as cfg
+from app.durable_queue import DurableQueue, QueueWorker
+from app.logging_config import get_logger
+from app.models import TrelloInboundEvent, db
+from app.trello.utils import merge_webhook_events
+
+logger = get_logger(__name__)
+
+_DEFER_SECONDS = 5.0
+
+_queue = DurableQueue(
+    TrelloInboundEvent,
+    TrelloInboundEvent.card_id,
+    name="trello",
+    config_prefix="TRELLO_INBOUND",
+    # syncs_saved: events folded into another event's sync_from_trello call
+    extra_counters=("duplicates", "syncs", "syncs_saved", "deferred"),
+)
+
+
+class InboundQueueFull(Exception):
+    """The pending backlog is at TRELLO_INBOUND_MAX_DEPTH; the webhook answers 429."""
+
+
+def pending_depth() -> int:
+    return _queue.pending_depth()
+
+
+def enqueue(event_info: dict, action_id: Optional[str] = None) -> Optional[int]:
+    """
+    Persist a handled webhook event for the drain worker.
+
+    Returns:
+        The new row id, or None when action_id was already received (Trello redelivery)
+
+    Raises:
+        InboundQueueFull: If TRELLO_INBOUND_MAX_DEPTH events are already pending
+    """
+    if _queue.is_full():
+        raise InboundQueueFull(f"{cfg.TRELLO_INBOUND_MAX_DEPTH} Trello events already pending")
+    row = TrelloInboundEvent(
+        action_id=action_id,
+        card_id=event_info.get("card_id"),
+        payload=event_info,
+        status="pending",
+        # Hold it for the coalescing window so the rest of a drag's burst can join it.
+        available_at=datetime.utcnow() + timedelta(seconds=cfg.TRELLO_COALESCE_WINDOW_SECONDS),
+    )
+    db.session.add(row)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        _queue.count("duplicates")
+        logger.info("trello_inbound_duplicate", action_id=action_id,
+                    card_id=event_info.get("card_id"), source="trello")
+        return None
+    _queue.count("enqueued")
+    return row.id
+
+
+def claim_batch(limit: int) -> List[dict]:
+    """
+    Claim up to `limit` cards' worth of events: each due event that is first in line
+    for its card, plus every later pending event for that card, merged into one.
+
+    Returns:
+        [{"id", "ids", "card_id", "payload", "attempts"}] in id order; "id" is the head
+        row, "ids" every row folded into "payload"; all of them are now 'processing'
+    """
+    E = TrelloInboundEvent
+    token, now = _queue.claim_heads(limit)
+    if token is None:
+        return []
+    heads = db.session.execute(
+        select(E.id, E.card_id).where(E.claimed_by == token)
+    ).all()
+    # Fold the rest of each card's burst into its head. Every other pending row for
+    # the card is later than the head (the head is first in line), due or not.
+    card_ids = [r.card_id for r in heads if r.card_id]
+    if card_ids and cfg.TRELLO_COALESCE_MAX_EVENTS > 1:
+        followers = db.session.execute(
+            select(E.id, E.card_id)
+            .where(E.card_id.in_(card_ids), E.status == "pending")
+            .order_by(E.id)
+            .with_for_update(skip_locked=True, of=E)
+        ).all()
+        per_card = {}
+        follower_ids = []
+        for r in followers:
+            per_card[r.card_id] = per_card.get(r.card_id, 0) + 1
+            if per_card[r.card_id] < cfg.TRELLO_COALESCE_MAX_EVENTS:
+                follower_ids.append(r.id)
+        if follower_ids:
+            _queue.mark_claimed(follower_ids, token, now)
+    rows = _queue.claimed_rows(token, E.id, E.card_id, E.payload, E.attempts)
+
+    head_ids = {r.id for r in heads}
+    groups, by_card = [], {}
+    for r in rows:
+        if r.id in head_ids:
+            group = {"id": r.id, "ids": [r.id], "card_id": r.card_id,
+                     "payloads": [r.payload], "attempts": r.attempts or 0}
+            groups.append(group)
+            if r.card_id:
+                by_card[r.card_id] = group
+        else:
+            by_card[r.card_id]["ids"].append(r.id)
+            by_card[r.card_id]["payloads"].append(r.payload)
+    for group in groups:
+        payloads = group.pop("payloads")
+        group["payload"] = merge_webhook_events(payloads) if len(payloads) > 1 else payloads[0]
+        if len(payloads) > 1:
+            logger.info("trello_inbound_coalesced", card_id=group["card_id"],
+                        events=len(payloads), head_id=group["id"], source="trello")
+    return groups
+
+
+def finish_batch(completed: Iterable[dict] = (), failed: Iterable[Tuple[dict, str]] = (),
+                 deferred: Iterable[Tuple[dict, str]] = ()) -> None:
+    """
+    Record the outcome of a claimed batch in one commit.
+
+    Args:
+        completed: claimed events that synced (every row folded into them is done)
+        failed: (claimed event, error) — the head uses an attempt and retries with backoff
+            until TRELLO_INBOUND_MAX_ATTEMPTS; rows folded into it go back to pending untouched
+        deferred: (claimed event, reason) — lock contention; back to pending shortly, attempt not used
+    """
+    completed = list(completed)
+    failed = list(failed)
+    deferred = list(deferred)
+    completed_ids = [i for event in completed for i in event["ids"]]
+    _queue.finish(
+        completed_ids=completed_ids,
+        failed=[(event["id"], event["attempts"], error) for event, error in failed],
+        released_ids=[i for event, _ in failed for i in event["ids"][1:]],
+        deferred=[(event["ids"], reason, _DEFER_SECONDS) for event, reason in deferred],
+    )
+    _queue.count("syncs", len(completed))
+    _queue.count("syncs_saved", len(completed_ids) - len(completed))
+    _queue.count("deferred", len(deferred))
+    _queue.record_completions([None] * len(completed_ids))
+
+
+def release_stale_claims(older_than_seconds: Optional[float] = None) -> int:
+    """Return 'processing' rows claimed longer ago than the stale cutoff to 'pending'."""
+    return _queue.release_stale_claims(older_than_seconds)
+
+
+def purge_completed(older_than_days: Optional[float] = None) -> int:
+    return _queue.purge_completed(older_than_days)
+
+
+def queue_metrics() -> dict:
+    """Backlog across all processes (from the table) plus this process's counters."""
+    return _queue.metrics()
+
+
+class InboundEventWorker(QueueWorker):
+    """Drains trello_inbound_events on a daemon thread (see QueueWorker)."""
+
+    def __init__(self, app, drain: Callable[[], int], idle_seconds: Optional[float] = None):
+        super().__init__(_queue, app, drain, idle_seconds)
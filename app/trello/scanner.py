@@ -4,15 +4,21 @@ schema_version: 1
 purpose: Scans and reconciles the Trello board against the DB so admins can find missing cards, orphan cards, and stage/list mismatches in one report.
 exports:
   scan_trello_db_comparison: Full diff between DB jobs and Trello cards.
+  scan_trello_db_incremental: Update the standing mismatch report from cards active and releases changed since the last scan.
+  get_trello_scan_report: The standing mismatch report as of the last scan (no API calls).
   create_trello_card_for_db_job: Create a card for a DB job that is missing from Trello.
   sync_trello_with_db: Batch-create missing cards and optionally fix mismatches (dry-run supported).
+  scan_and_create_cards_for_all_jobs: Create cards for every release without one (concurrent, resumable).
   sync_releases_to_trello: Push a filtered set of releases to Trello with card creation and post-creation features.
-imports_from: [app.models, app.trello.api, app.trello.utils, app.trello.list_mapper, app.trello.card_creation, app.logging_config]
-imported_by: [app/brain/job_log/routes.py]
+imports_from: [app.models, app.config, app.sync_lock, app.trello.api, app.trello.client, app.trello.utils, app.trello.list_mapper, app.trello.card_creation, app.trello.card_pipeline, app.logging_config]
+imported_by: [app/brain/job_log/routes.py, app/__init__.py]
 invariants:
   - All mutating functions accept a dry_run flag; when True no Trello API calls are made.
+  - Non-dry-run sync/create/clear runs hold the board-wide exclusive sync lock; Trello webhooks queue (202) until they finish.
+  - The incremental scan keeps its board copy, watermarks and report in the single trello_scan_state row; an identifier is re-classified only when one of its cards' name/list hash changed, the card was deleted/archived/moved off the board (read from deleteCard, updateCard:closed and moveCardFromBoard actions), its release's last_updated_at reached the watermark less _ACTIVITY_OVERLAP, or its release row is gone. A truncated action page or TRELLO_SCAN_FULL_EVERY_HOURS forces a full read.
   - Card identifier parsing expects "NNN-NNN" or "NNN-VNNN" at the start of the card name.
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+  - Bulk card creation goes through app.trello.card_pipeline (bounded pool, per-card checkpoints); create_trello_card_for_db_job stays the single-card path.
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Trello-DB Scanner: Compare database jobs with Trello cards.
 
@@ -23,14 +29,36 @@ This module provides scanning functionality to identify:
 - List mismatches (DB stage doesn't match Trello list)
 """
 
+import copy
+import functools
+import hashlib
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from app.models import Releases, db
-from app.trello.api import get_all_trello_cards
+from sqlalchemy import func, or_, tuple_
+from app.config import Config as cfg
+from app.models import Releases, TrelloScanState, db
+from app.sync_lock import sync_lock_manager
+from app.trello.api import get_all_trello_cards, get_board_card_activity_since, get_trello_cards_by_ids
 from app.trello.utils import extract_identifier
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+
+def _board_exclusive(operation_name):
+    """Hold the board-wide sync lock for a mutating run (dry runs don't lock), so webhooks queue meanwhile."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            dry_run = kwargs.get("dry_run", args[0] if args else False)
+            if dry_run:
+                return func(*args, **kwargs)
+            with sync_lock_manager.acquire_sync_lock(operation_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
 def get_expected_trello_list_from_stage(stage: Optional[str]) -> Optional[str]:
     """
     Map a database stage to the expected Trello list name.
@@ -73,6 +101,53 @@ def parse_identifier(identifier: str) -> Optional[Tuple[int, str]]:
         return None
 
 
+def _in_both_entry(identifier: str, job: Releases, card: Dict) -> Dict:
+    """Comparison row for a release that has a card; list_mismatch only if the stage is tracked in Trello."""
+    trello_list = card.get("list_name", "Unknown")
+    expected_list = get_expected_trello_list_from_stage(job.stage)
+    return {
+        "job": job.job,
+        "release": job.release,
+        "identifier": identifier,
+        "db_stage": job.stage,
+        "trello_list": trello_list,
+        "trello_card_id": card.get("id"),
+        "trello_card_name": card.get("name", ""),
+        "list_mismatch": expected_list is not None and trello_list != expected_list,
+        "expected_list": expected_list,
+    }
+
+
+def _list_mismatch_entry(in_both_entry: Dict) -> Dict:
+    return {
+        key: in_both_entry[key]
+        for key in ("job", "release", "identifier", "db_stage", "trello_list",
+                    "expected_list", "trello_card_id", "trello_card_name")
+    }
+
+
+def _db_only_entry(identifier: str, job: Releases) -> Dict:
+    return {
+        "job": job.job,
+        "release": job.release,
+        "identifier": identifier,
+        "stage": job.stage,
+        "job_name": job.job_name,
+    }
+
+
+def _trello_only_entry(identifier: str, card: Dict) -> Dict:
+    parsed = parse_identifier(identifier)
+    return {
+        "identifier": identifier,
+        "trello_card_id": card.get("id"),
+        "trello_card_name": card.get("name", ""),
+        "trello_list": card.get("list_name", "Unknown"),
+        "job": parsed[0] if parsed else None,
+        "release": parsed[1] if parsed else None,
+    }
+
+
 def scan_trello_db_comparison() -> Dict:
     """
     Scan and compare database jobs with Trello cards.
@@ -211,66 +286,18 @@ def scan_trello_db_comparison() -> Dict:
     
     # Find jobs in both
     for identifier in db_identifiers & trello_identifiers:
-        job = db_jobs_by_identifier[identifier]
-        card = trello_cards_by_identifier[identifier]
-        
-        db_stage = job.stage
-        trello_list = card.get("list_name", "Unknown")
-        expected_list = get_expected_trello_list_from_stage(db_stage)
-        
-        # Check for list mismatch (only if stage is tracked in Trello)
-        list_mismatch = False
-        if expected_list is not None and trello_list != expected_list:
-            list_mismatch = True
-        
-        in_both.append({
-            "job": job.job,
-            "release": job.release,
-            "identifier": identifier,
-            "db_stage": db_stage,
-            "trello_list": trello_list,
-            "trello_card_id": card.get("id"),
-            "trello_card_name": card.get("name", ""),
-            "list_mismatch": list_mismatch,
-            "expected_list": expected_list
-        })
-        
-        if list_mismatch:
-            list_mismatches.append({
-                "job": job.job,
-                "release": job.release,
-                "identifier": identifier,
-                "db_stage": db_stage,
-                "trello_list": trello_list,
-                "expected_list": expected_list,
-                "trello_card_id": card.get("id"),
-                "trello_card_name": card.get("name", "")
-            })
+        entry = _in_both_entry(identifier, db_jobs_by_identifier[identifier], trello_cards_by_identifier[identifier])
+        in_both.append(entry)
+        if entry["list_mismatch"]:
+            list_mismatches.append(_list_mismatch_entry(entry))
     
     # Find jobs in DB only
     for identifier in db_identifiers - trello_identifiers:
-        job = db_jobs_by_identifier[identifier]
-        db_only.append({
-            "job": job.job,
-            "release": job.release,
-            "identifier": identifier,
-            "stage": job.stage,
-            "job_name": job.job_name
-        })
+        db_only.append(_db_only_entry(identifier, db_jobs_by_identifier[identifier]))
     
     # Find cards in Trello only
     for identifier in trello_identifiers - db_identifiers:
-        card = trello_cards_by_identifier[identifier]
-        parsed = parse_identifier(identifier)
-        
-        trello_only.append({
-            "identifier": identifier,
-            "trello_card_id": card.get("id"),
-            "trello_card_name": card.get("name", ""),
-            "trello_list": card.get("list_name", "Unknown"),
-            "job": parsed[0] if parsed else None,
-            "release": parsed[1] if parsed else None
-        })
+        trello_only.append(_trello_only_entry(identifier, trello_cards_by_identifier[identifier]))
     
     # Build summary
     summary = {
@@ -294,6 +321,239 @@ def scan_trello_db_comparison() -> Dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Incremental scan: standing mismatch report kept in trello_scan_state
+# ---------------------------------------------------------------------------
+
+_REPORT_CATEGORIES = ("in_both", "db_only", "trello_only", "list_mismatches")
+# Re-read board actions and release edits this far behind their watermarks (clock skew
+# between us and Trello; a release stamped before, but committed after, the last scan)
+_ACTIVITY_OVERLAP = timedelta(seconds=60)
+
+
+def _card_state(card: Dict) -> Dict:
+    """What the scan remembers about a card; hash covers the fields the comparison reads."""
+    name = (card.get("name") or "").strip()
+    list_id = card.get("list_id")
+    return {
+        "id": card.get("id"),
+        "name": name,
+        "identifier": extract_identifier(name) if name else None,
+        "list_id": list_id,
+        "list_name": card.get("list_name", "Unknown"),
+        "hash": hashlib.sha1(f"{name}\x1f{list_id}".encode()).hexdigest()[:16],
+    }
+
+
+def _cards_by_identifier(cards: Dict) -> Dict:
+    """First card per identifier, as scan_trello_db_comparison keeps it."""
+    by_identifier = {}
+    for card in cards.values():
+        if card.get("identifier") and card["identifier"] not in by_identifier:
+            by_identifier[card["identifier"]] = card
+    return by_identifier
+
+
+def _releases_by_identifier(identifiers) -> Dict:
+    pairs = [parsed for parsed in map(parse_identifier, identifiers) if parsed]
+    if not pairs:
+        return {}
+    rows = (
+        Releases.query
+        .filter(tuple_(Releases.job, Releases.release).in_(pairs))
+        .order_by(Releases.id)
+        .all()
+    )
+    return {f"{job.job}-{job.release}": job for job in rows}
+
+
+def _classify(report: Dict, identifier: str, job: Optional[Releases], card: Optional[Dict]) -> None:
+    """Move identifier into the report category its current release/card pair belongs to."""
+    for category in _REPORT_CATEGORIES:
+        report[category].pop(identifier, None)
+    if job is not None and card is not None:
+        entry = _in_both_entry(identifier, job, card)
+        report["in_both"][identifier] = entry
+        if entry["list_mismatch"]:
+            report["list_mismatches"][identifier] = _list_mismatch_entry(entry)
+    elif job is not None:
+        report["db_only"][identifier] = _db_only_entry(identifier, job)
+    elif card is not None:
+        report["trello_only"][identifier] = _trello_only_entry(identifier, card)
+
+
+def _load_scan_state() -> TrelloScanState:
+    state = TrelloScanState.query.filter_by(id=1).with_for_update().first()
+    if state is None:
+        state = TrelloScanState(id=1)
+        db.session.add(state)
+        db.session.flush()
+    return state
+
+
+def _full_scan_into(state: TrelloScanState, started: datetime) -> Dict:
+    cards = {card["id"]: _card_state(card) for card in get_all_trello_cards()}
+    jobs = {f"{job.job}-{job.release}": job for job in Releases.query.order_by(Releases.id).all()}
+    by_identifier = _cards_by_identifier(cards)
+
+    report = {category: {} for category in _REPORT_CATEGORIES}
+    for identifier in set(jobs) | set(by_identifier):
+        _classify(report, identifier, jobs.get(identifier), by_identifier.get(identifier))
+
+    state.cards = cards
+    state.activity_watermark = started
+    state.db_watermark = max((job.last_updated_at for job in jobs.values() if job.last_updated_at), default=None)
+    state.last_release_id = max((job.id for job in jobs.values()), default=None)
+    state.last_full_scan_at = started
+    return {"report": report, "cards_checked": len(cards), "releases_checked": len(jobs)}
+
+
+def _incremental_scan_into(state: TrelloScanState) -> Optional[Dict]:
+    """Apply board activity and release edits since the watermarks; None when a full read is needed."""
+    activity = get_board_card_activity_since(state.activity_watermark - _ACTIVITY_OVERLAP)
+    if activity["truncated"]:
+        return None
+
+    cards = dict(state.cards or {})
+    affected = set()
+    cards_changed = 0
+    # Deleted / archived / moved-off cards come straight from the action log; a
+    # deleted card can't be fetched back, and the full read only lists open cards.
+    for card_id in activity.get("removed_card_ids") or ():
+        old = cards.pop(card_id, None)
+        if old is not None:
+            affected.add(old["identifier"])
+            cards_changed += 1
+    fetched = get_trello_cards_by_ids(sorted(activity["card_ids"])) if activity["card_ids"] else {}
+    for card_id, card in fetched.items():
+        old = cards.get(card_id)
+        if card is None or card.get("closed"):
+            if old is not None:
+                del cards[card_id]
+                affected.add(old["identifier"])
+                cards_changed += 1
+            continue
+        new = _card_state(card)
+        if old is not None and old["hash"] == new["hash"]:
+            continue  # activity that doesn't touch name or list (comments, due dates, ...)
+        cards[card_id] = new
+        affected.update((new["identifier"], old["identifier"] if old else None))
+        cards_changed += 1
+
+    release_filter = [Releases.id > (state.last_release_id or 0)]
+    if state.db_watermark is not None:
+        release_filter.append(Releases.last_updated_at >= state.db_watermark - _ACTIVITY_OVERLAP)
+    changed_jobs = Releases.query.filter(or_(*release_filter)).all()
+    affected.update(f"{job.job}-{job.release}" for job in changed_jobs)
+    affected.discard(None)
+
+    report = copy.deepcopy(state.report) if state.report else {}
+    for category in _REPORT_CATEGORIES:
+        report.setdefault(category, {})
+    # A deleted release leaves no row for the watermarks to find: diff the report's
+    # DB side against the identifiers still in the table.
+    db_identifiers = {f"{job}-{release}" for job, release in db.session.query(Releases.job, Releases.release)}
+    releases_removed = (set(report["in_both"]) | set(report["db_only"])) - db_identifiers
+    affected |= releases_removed
+    jobs = _releases_by_identifier(affected)
+    by_identifier = _cards_by_identifier(cards)
+    for identifier in affected:
+        _classify(report, identifier, jobs.get(identifier), by_identifier.get(identifier))
+
+    state.cards = cards
+    if activity["latest"] and activity["latest"] > state.activity_watermark:
+        state.activity_watermark = activity["latest"]
+    for job in changed_jobs:
+        if job.last_updated_at and (state.db_watermark is None or job.last_updated_at > state.db_watermark):
+            state.db_watermark = job.last_updated_at
+        state.last_release_id = max(state.last_release_id or 0, job.id)
+    return {
+        "report": report,
+        "cards_checked": len(fetched),
+        "cards_changed": cards_changed,
+        "releases_checked": len(changed_jobs),
+        "releases_removed": len(releases_removed),
+        "identifiers_reclassified": len(affected),
+    }
+
+
+def _render_report(state: TrelloScanState) -> Dict:
+    report = state.report or {}
+    categories = {category: list((report.get(category) or {}).values()) for category in _REPORT_CATEGORIES}
+    cards = state.cards or {}
+    summary = {
+        "db_total": db.session.query(func.count(Releases.id)).scalar() or 0,
+        "trello_total": len(cards),
+        "trello_with_identifiers": len(_cards_by_identifier(cards)),
+        **{category: len(entries) for category, entries in categories.items()},
+    }
+    return {
+        "summary": summary,
+        **categories,
+        "scan": {
+            **(report.get("last_run") or {}),
+            "scanned_at": state.last_scan_at.isoformat() + "Z" if state.last_scan_at else None,
+            "last_full_scan_at": state.last_full_scan_at.isoformat() + "Z" if state.last_full_scan_at else None,
+        },
+    }
+
+
+def scan_trello_db_incremental(force_full: bool = False) -> Dict:
+    """
+    Bring the standing Trello<->DB mismatch report up to date and return it.
+
+    Reads only the board actions since the last scan's activity watermark, fetches
+    just those cards, and re-classifies only identifiers whose card name/list hash
+    changed, whose release's last_updated_at moved, or whose release was deleted. Falls back to a full board read
+    on the first run, when Trello truncates the action page, when force_full is set,
+    or TRELLO_SCAN_FULL_EVERY_HOURS after the last full read.
+
+    Returns:
+        Same shape as scan_trello_db_comparison(), plus "scan": {mode, scanned_at,
+        last_full_scan_at, cards_checked, releases_checked, ...}
+    """
+    started = datetime.utcnow()
+    state = _load_scan_state()
+    full_due = (
+        force_full
+        or state.activity_watermark is None
+        or state.last_full_scan_at is None
+        or started - state.last_full_scan_at >= timedelta(hours=cfg.TRELLO_SCAN_FULL_EVERY_HOURS)
+    )
+    try:
+        result = None if full_due else _incremental_scan_into(state)
+        mode = "incremental"
+        if result is None:
+            result, mode = _full_scan_into(state, started), "full"
+    except Exception as e:
+        db.session.rollback()
+        logger.error("trello_db_incremental_scan_failed", error=str(e), error_type=type(e).__name__, exc_info=True)
+        report = get_trello_scan_report() or {}
+        return {**report, "error": f"Failed to scan Trello: {str(e)}"}
+
+    result["report"]["last_run"] = {
+        "mode": mode,
+        "duration_ms": int((datetime.utcnow() - started).total_seconds() * 1000),
+        **{key: value for key, value in result.items() if key != "report"},
+    }
+    state.report = result["report"]
+    state.last_scan_at = started
+    state.last_scan_mode = mode
+    db.session.commit()
+
+    rendered = _render_report(state)
+    logger.info("trello_db_incremental_scan_complete", **rendered["summary"], **result["report"]["last_run"])
+    return rendered
+
+
+def get_trello_scan_report() -> Optional[Dict]:
+    """The standing mismatch report from the last scan, or None if no scan has run yet."""
+    state = db.session.get(TrelloScanState, 1)
+    if state is None or state.report is None:
+        return None
+    return _render_report(state)
+
+
 def delete_trello_card(card_id: str) -> Dict:
     """
     Delete a Trello card by card ID.
@@ -306,8 +566,9 @@ def delete_trello_card(card_id: str) -> Dict:
     """
     from app.config import Config as cfg
     import requests
+    from app.trello.client import get_trello_client
     
-    url = f"https://api.trello.com/1/cards/{card_id}"
+    url = f"/cards/{card_id}"
     params = {
         "key": cfg.TRELLO_API_KEY,
         "token": cfg.TRELLO_TOKEN
@@ -315,7 +576,7 @@ def delete_trello_card(card_id: str) -> Dict:
     
     try:
         logger.debug("trello_card_delete_started", card_id=card_id)
-        response = requests.delete(url, params=params)
+        response = get_trello_client().delete(url, params=params)
         response.raise_for_status()
         logger.info("trello_card_deleted", card_id=card_id)
         return {"success": True, "card_id": card_id}
@@ -352,8 +613,7 @@ def create_trello_card_for_db_job(job: Releases, list_name: Optional[str] = None
     """
     from app.trello.api import get_list_by_name, update_job_record_with_trello_data
     from app.trello.card_creation import (
-        build_card_title,
-        build_card_description,
+        build_release_card_content,
         create_trello_card_core,
         apply_card_post_creation_features
     )
@@ -387,21 +647,7 @@ def create_trello_card_for_db_job(job: Releases, list_name: Optional[str] = None
             list_id = target_list["id"]
         
         # Build card title and description using shared functions
-        card_title = build_card_title(
-            job.job,
-            job.release,
-            job.job_name,
-            job.description
-        )
-        
-        card_description = build_card_description(
-            description=job.description,
-            install_hrs=job.install_hrs,
-            paint_color=job.paint_color,
-            pm=job.pm,
-            by=job.by,
-            released=job.released
-        )
+        card_title, card_description = build_release_card_content(job)
         
         # Create the card using shared core function
         create_result = create_trello_card_core(
@@ -477,6 +723,7 @@ def create_trello_card_for_db_job(job: Releases, list_name: Optional[str] = None
         }
 
 
+@_board_exclusive("Trello-Scanner-Sync")
 def sync_trello_with_db(dry_run: bool = False) -> Dict:
     """
     Sync Trello board with database:
@@ -613,6 +860,7 @@ def sync_trello_with_db(dry_run: bool = False) -> Dict:
     
     # 3. Create cards for DB-only jobs
     logger.debug("db_only_card_creation_started", count=len(scan_results['db_only']))
+    to_create = []
     for job_info in scan_results['db_only']:
         # Get the job from database
         job = Releases.resolve(job_info['job'], job_info['release'])
@@ -629,7 +877,13 @@ def sync_trello_with_db(dry_run: bool = False) -> Dict:
                 "expected_list": expected_list
             })
         else:
-            create_result = create_trello_card_for_db_job(job)
+            to_create.append(job)
+
+    if to_create:
+        from app.trello.card_pipeline import create_cards_for_releases
+
+        pipeline = create_cards_for_releases(to_create)
+        for create_result in pipeline["results"]:
             if create_result["success"]:
                 results["created"]["success"].append(create_result)
             else:
@@ -657,6 +911,7 @@ def sync_trello_with_db(dry_run: bool = False) -> Dict:
     return results
 
 
+@_board_exclusive("Trello-Scanner-Create")
 def scan_and_create_cards_for_all_jobs(dry_run: bool = False, limit: Optional[int] = None) -> Dict:
     """
     Scan all jobs in the database and create Trello cards for jobs that don't have them.
@@ -666,6 +921,7 @@ def scan_and_create_cards_for_all_jobs(dry_run: bool = False, limit: Optional[in
     - Filters out jobs that already have trello_card_id (duplicates)
     - Determines the appropriate list for each job based on stage
     - Creates cards with all standard features (notes, fab order, FC drawing, num guys, etc.)
+      side by side through card_pipeline, resuming any build that stopped part-way
     - Works across all tracked lists
     
     Args:
@@ -675,11 +931,15 @@ def scan_and_create_cards_for_all_jobs(dry_run: bool = False, limit: Optional[in
     Returns:
         Dictionary with scan and creation results
     """
+    from app.trello.card_pipeline import create_cards_for_releases, unfinished_release_ids
+
     logger.debug("scan_and_create_started", dry_run=dry_run)
     
     try:
-        # Query all jobs that don't have Trello cards
-        query = Releases.query.filter(Releases.trello_card_id.is_(None))
+        # Query all jobs that don't have Trello cards (or whose bulk build stopped part-way)
+        missing_card = Releases.trello_card_id.is_(None)
+        unfinished = [] if dry_run else unfinished_release_ids()
+        query = Releases.query.filter(or_(missing_card, Releases.id.in_(unfinished)) if unfinished else missing_card)
         
         if limit:
             query = query.limit(limit)
@@ -711,83 +971,58 @@ def scan_and_create_cards_for_all_jobs(dry_run: bool = False, limit: Optional[in
             "failed_details": []
         }
         
-        # Process each job
-        for idx, job in enumerate(jobs_without_cards, 1):
-            job_id = f"{job.job}-{job.release}"
-            
-            try:
-                # Determine expected list from stage
-                expected_list = get_expected_trello_list_from_stage(job.stage)
-                if not expected_list:
-                    expected_list = "Released"  # Default fallback
-                
-                if dry_run:
-                    logger.debug("card_create_dry_run", job_release=job_id, list_name=expected_list)
+        # Determine each job's expected list from its stage
+        expected_lists = {
+            job.id: get_expected_trello_list_from_stage(job.stage) or "Released"  # Default fallback
+            for job in jobs_without_cards
+        }
+
+        if dry_run:
+            for job in jobs_without_cards:
+                job_id = f"{job.job}-{job.release}"
+                expected_list = expected_lists[job.id]
+                logger.debug("card_create_dry_run", job_release=job_id, list_name=expected_list)
+                results["created"] += 1
+                results["created_details"].append({
+                    "job": job.job,
+                    "release": job.release,
+                    "identifier": job_id,
+                    "expected_list": expected_list,
+                    "stage": job.stage
+                })
+        else:
+            # Cards are built side by side (card_pipeline handles all features and checkpoints)
+            pipeline = create_cards_for_releases(jobs_without_cards, list_names=expected_lists)
+            results["pipeline_run_id"] = pipeline["run_id"]
+            for created in pipeline["results"]:
+                job_id = created["identifier"]
+                if created.get("success"):
                     results["created"] += 1
                     results["created_details"].append({
-                        "job": job.job,
-                        "release": job.release,
+                        "job": created["job"],
+                        "release": created["release"],
                         "identifier": job_id,
-                        "expected_list": expected_list,
-                        "stage": job.stage
+                        "card_id": created.get("card_id"),
+                        "mirror_card_id": created.get("mirror_card_id"),
+                        "list_name": created.get("list_name"),
+                        "stage": created.get("stage")
                     })
+                    logger.debug("trello_card_created", job_release=job_id, card_id=created.get("card_id"))
                 else:
-                    logger.debug(
-                        "card_create_started",
-                        job_release=job_id,
-                        list_name=expected_list,
-                        index=idx,
-                        total=len(jobs_without_cards),
-                    )
-                    
-                    # Create card using the standard function (handles all features)
-                    create_result = create_trello_card_for_db_job(job, list_name=expected_list)
-                    
-                    if create_result.get("success"):
-                        results["created"] += 1
-                        results["created_details"].append({
-                            "job": job.job,
-                            "release": job.release,
+                    error = created.get("error", "Unknown error")
+                    if "already exists" in error.lower():
+                        results["skipped"] += 1
+                        logger.debug("card_create_skipped", job_release=job_id, status="skipped", reason=error)
+                    else:
+                        results["failed"] += 1
+                        results["failed_details"].append({
+                            "job": created["job"],
+                            "release": created["release"],
                             "identifier": job_id,
-                            "card_id": create_result.get("card_id"),
-                            "mirror_card_id": create_result.get("mirror_card_id"),
-                            "list_name": create_result.get("list_name"),
-                            "stage": job.stage
+                            "error": error,
+                            "stage": created.get("stage")
                         })
-                        logger.debug("trello_card_created", job_release=job_id, card_id=create_result.get("card_id"))
-                    else:
-                        error = create_result.get("error", "Unknown error")
-                        if "already exists" in error.lower():
-                            results["skipped"] += 1
-                            logger.debug("card_create_skipped", job_release=job_id, status="skipped", reason=error)
-                        else:
-                            results["failed"] += 1
-                            results["failed_details"].append({
-                                "job": job.job,
-                                "release": job.release,
-                                "identifier": job_id,
-                                "error": error,
-                                "stage": job.stage
-                            })
-                            logger.error("card_create_failed", job_release=job_id, error=error)
-            
-            except Exception as err:
-                error_msg = str(err)
-                logger.error(
-                    "card_processing_failed",
-                    job_release=job_id,
-                    error=error_msg,
-                    error_type=type(err).__name__,
-                    exc_info=True,
-                )
-                results["failed"] += 1
-                results["failed_details"].append({
-                    "job": job.job,
-                    "release": job.release,
-                    "identifier": job_id,
-                    "error": error_msg,
-                    "stage": job.stage if hasattr(job, 'stage') else None
-                })
+                        logger.error("card_create_failed", job_release=job_id, error=error)
         
         logger.info(
             "scan_and_create_complete",
@@ -816,6 +1051,7 @@ def scan_and_create_cards_for_all_jobs(dry_run: bool = False, limit: Optional[in
         }
 
 
+@_board_exclusive("Trello-Scanner-Clear")
 def clear_trello_board(dry_run: bool = False) -> Dict:
     """
     Delete all cards from the Trello board and clear Trello fields from DB.
@@ -902,6 +1138,7 @@ def clear_trello_board(dry_run: bool = False) -> Dict:
         }
 
 
+@_board_exclusive("Trello-Scanner-Releases")
 def sync_releases_to_trello(
     dry_run: bool = False,
     limit: Optional[int] = None,
@@ -915,7 +1152,8 @@ def sync_releases_to_trello(
     Create and/or update Trello cards relative to releases in the DB.
 
     Fills in missing Trello data for releases:
-    - Creates Trello cards for releases without trello_card_id
+    - Creates Trello cards for releases without trello_card_id (concurrently, via
+      card_pipeline; a release whose last bulk build stopped part-way is resumed)
     - Refreshes Trello data in DB for releases that have cards (fetches from API)
 
     Args:
@@ -932,6 +1170,7 @@ def sync_releases_to_trello(
         Dictionary with sync results
     """
     from app.trello.api import get_trello_card_by_id, update_job_record_with_trello_data
+    from app.trello.card_pipeline import create_cards_for_releases, unfinished_release_ids
 
     logger.debug(
         "sync_releases_to_trello_started",
@@ -990,10 +1229,15 @@ def sync_releases_to_trello(
         if clear_board_first:
             results["clear_result"] = clear_result
 
+        unfinished = set()
+        if not dry_run and not update_only:
+            unfinished = set(unfinished_release_ids([r.id for r in releases]))
+        to_create = []
+
         for idx, rec in enumerate(releases, 1):
             identifier = f"{rec.job}-{rec.release}"
             try:
-                if rec.trello_card_id is None:
+                if rec.trello_card_id is None or rec.id in unfinished:
                     # CREATE: no card yet
                     if update_only:
                         results["skipped"] += 1
@@ -1007,33 +1251,7 @@ def sync_releases_to_trello(
                             "action": "would_create",
                         })
                         continue
-                    create_result = create_trello_card_for_db_job(rec)
-                    if create_result.get("success"):
-                        results["created"] += 1
-                        results["created_details"].append({
-                            "job": rec.job,
-                            "release": rec.release,
-                            "identifier": identifier,
-                            "card_id": create_result.get("card_id"),
-                            "list_name": create_result.get("list_name"),
-                        })
-                        logger.debug(
-                            "trello_card_created",
-                            job_release=identifier,
-                            card_id=create_result.get("card_id"),
-                            index=idx,
-                            total=len(releases),
-                        )
-                    else:
-                        error = create_result.get("error", "Unknown error")
-                        results["failed"] += 1
-                        results["failed_details"].append({
-                            "job": rec.job,
-                            "release": rec.release,
-                            "identifier": identifier,
-                            "error": error,
-                        })
-                        logger.error("card_create_failed", job_release=identifier, error=error)
+                    to_create.append(rec)
                 else:
                     # UPDATE: refresh DB from Trello
                     if create_only:
@@ -1105,6 +1323,29 @@ def sync_releases_to_trello(
                     "error": error_msg,
                 })
 
+        if to_create:
+            pipeline = create_cards_for_releases(to_create)
+            results["pipeline_run_id"] = pipeline["run_id"]
+            for created in pipeline["results"]:
+                if created.get("success"):
+                    results["created"] += 1
+                    results["created_details"].append({
+                        "job": created["job"],
+                        "release": created["release"],
+                        "identifier": created["identifier"],
+                        "card_id": created.get("card_id"),
+                        "list_name": created.get("list_name"),
+                        "resumed": created.get("resumed", False),
+                    })
+                else:
+                    results["failed"] += 1
+                    results["failed_details"].append({
+                        "job": created["job"],
+                        "release": created["release"],
+                        "identifier": created["identifier"],
+                        "error": created.get("error", "Unknown error"),
+                    })
+
         logger.info(
             "sync_releases_to_trello_complete",
             created=results['created'],
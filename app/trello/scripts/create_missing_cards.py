@@ -5,20 +5,21 @@ purpose: Interactively create Trello cards for releases that have no card anywhe
 exports:
   run: Find truly missing releases and interactively create cards with CSV report.
   _find_truly_missing: Return Releases rows with no Trello card anywhere on the board.
-  _create_card_for_release: Create a Trello card for a Release and update the DB row.
-imports_from: [app, app.models, app.trello.api, app.trello.card_creation, app.trello.scanner, dotenv, argparse, csv]
+  _card_report_row: CSV row for one card the bulk pipeline created.
+imports_from: [app, app.models, app.trello.api, app.trello.card_pipeline, app.trello.scanner, dotenv, argparse, csv]
 imported_by: []
 invariants:
-  - Interactive script; prompts user for y/n/q per card unless --dry-run.
+  - Interactive script; prompts user for y/n/q per card unless --dry-run. Approved cards are created together afterwards by app.trello.card_pipeline (concurrent, checkpointed; re-running resumes a half-built card).
   - Writes both to Trello (card creation) and the local DB (release update).
   - Requires Flask app context (created via create_app at __main__).
   - Invoked directly: python -m app.trello.scripts.create_missing_cards [--dry-run]
-updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
+updated_by_agent: 2026-10-16T00:00:00Z
 
 Interactively create Trello cards for releases missing from the board.
 
 Scans active Releases against all Trello cards to find "truly missing"
-releases (no card anywhere on the board), then prompts to create each one.
+releases (no card anywhere on the board), then prompts for each one and
+creates the approved cards side by side, printing progress as each finishes.
 Logs created cards to a CSV for client reporting.
 
 Usage:
@@ -36,18 +37,8 @@ load_dotenv()
 
 from app import create_app
 from app.models import Releases, db
-from app.trello.api import (
-    get_all_trello_cards,
-    get_list_by_name,
-    get_trello_card_by_id,
-    update_job_record_with_trello_data,
-)
-from app.trello.card_creation import (
-    build_card_title,
-    build_card_description,
-    create_trello_card_core,
-    apply_card_post_creation_features,
-)
+from app.trello.api import get_all_trello_cards, get_trello_cards_by_ids
+from app.trello.card_pipeline import create_cards_for_releases
 from app.trello.scanner import get_expected_trello_list_from_stage
 
 
@@ -127,73 +118,17 @@ def _find_truly_missing():
     return truly_missing
 
 
-def _create_card_for_release(rel):
-    """Create a Trello card for a Release and update the DB row.
-
-    Returns dict with card info on success, or None on failure.
-    """
-    # Determine target list
-    list_name = get_expected_trello_list_from_stage(rel.stage)
-    if not list_name:
-        list_name = "Released"  # fallback
-
-    target_list = get_list_by_name(list_name)
-    if not target_list:
-        print(f"    ERROR: List '{list_name}' not found on board")
-        return None
-    list_id = target_list["id"]
-
-    # Build card
-    card_title = build_card_title(rel.job, rel.release, rel.job_name, rel.description)
-    card_desc = build_card_description(
-        description=rel.description,
-        install_hrs=rel.install_hrs,
-        paint_color=rel.paint_color,
-        pm=rel.pm,
-        by=rel.by,
-        released=rel.released,
-    )
-
-    # Create card
-    result = create_trello_card_core(card_title, card_desc, list_id)
-    if not result["success"]:
-        print(f"    ERROR: {result['error']}")
-        return None
-
-    card_id = result["card_id"]
-    card_data = result["card_data"]
-    card_url = card_data.get("url", "")
-    print(f"    Card created: {card_id}")
-
-    # Post-creation features (fab_order, notes, FC Drawing, mirror for all)
-    apply_card_post_creation_features(
-        card_id=card_id,
-        list_id=list_id,
-        job_record=rel,
-        fab_order=rel.fab_order,
-        notes=rel.notes,
-        create_mirror=True,
-    )
-
-    # Update DB — use the same function as the normal Excel→Trello flow
-    update_job_record_with_trello_data(rel, card_data)
-
-    # Confirm card exists
-    verify = get_trello_card_by_id(card_id)
-    if verify:
-        print(f"    Confirmed on board in list: {list_name}")
-    else:
-        print(f"    WARNING: Could not verify card {card_id}")
-
+def _card_report_row(rel, result):
+    """CSV row for one card the bulk pipeline created."""
     return {
         "job": rel.job,
         "release": rel.release,
         "job_name": rel.job_name or "",
         "description": rel.description or "",
         "stage": rel.stage or "",
-        "trello_list": list_name,
-        "trello_card_id": card_id,
-        "trello_card_url": card_url,
+        "trello_list": result.get("list_name") or "",
+        "trello_card_id": result.get("card_id"),
+        "trello_card_url": result.get("card_url") or "",
         "created_at": datetime.now().isoformat(timespec="seconds"),
     }
 
@@ -231,8 +166,8 @@ def run(dry_run=False):
         print(f"{'=' * 70}\n")
         return
 
-    # Interactive loop
-    created = []
+    # Interactive loop: collect approvals, then create them all together
+    approved = []
     skipped = 0
     print(f"\n  Ready to create {len(truly_missing)} cards. [y]es / [n]o / [q]uit\n")
 
@@ -257,9 +192,26 @@ def run(dry_run=False):
             print("    Skipped.")
             continue
 
-        info = _create_card_for_release(rel)
-        if info:
-            created.append(info)
+        approved.append(rel)
+
+    created = []
+    if approved:
+        print(f"\n  Creating {len(approved)} cards...\n")
+        by_id = {rel.id: rel for rel in approved}
+
+        def report(done, total, result):
+            status = "created" if result.get("success") else f"ERROR: {result.get('error')}"
+            print(f"    [{done}/{total}] {result['identifier']}: {status}")
+
+        pipeline = create_cards_for_releases(approved, progress=report)
+        created_results = [r for r in pipeline["results"] if r.get("success")]
+        created = [_card_report_row(by_id[r["release_id"]], r) for r in created_results]
+
+        # Confirm the cards exist (one /batch read per ten cards)
+        on_board = get_trello_cards_by_ids([r["card_id"] for r in created_results]) if created_results else {}
+        for r in created_results:
+            if not on_board.get(r["card_id"]):
+                print(f"    WARNING: Could not verify card {r['card_id']} ({r['identifier']})")
 
     # Write CSV report
     if created:
@@ -280,7 +232,8 @@ def run(dry_run=False):
 
     # Summary
     print(f"\n  Created: {len(created)}  Skipped: {skipped}  "
-          f"Remaining: {len(truly_missing) - len(created) - skipped}")
+          f"Failed: {len(approved) - len(created)}  "
+          f"Remaining: {len(truly_missing) - len(approved) - skipped}")
     print(f"{'=' * 70}\n")
 
 
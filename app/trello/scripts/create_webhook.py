@@ -5,7 +5,7 @@ purpose: Register a new Trello webhook so the app receives board-change events a
 exports:
   create_webhook: Create a webhook for a Trello board via the Trello API.
   main: CLI entry point with --callback-url, --board-id, --description args.
-imports_from: [requests, dotenv, argparse]
+imports_from: [app.trello.client, requests, dotenv, argparse]
 imported_by: []
 invariants:
   - Does NOT require Flask app context; reads credentials from env vars directly.
@@ -22,6 +22,7 @@ Creates a webhook that will POST events to the specified callback URL when cards
 
 import argparse
 import requests
+from app.trello.client import get_trello_client
 from dotenv import load_dotenv
 import os
 
@@ -37,7 +38,7 @@ def create_webhook(callback_url, board_id, description):
         print("Error: TRELLO_API_KEY and TRELLO_TOKEN must be set in .env")
         return False
 
-    url = "https://api.trello.com/1/webhooks/"
+    url = "/webhooks/"
 
     payload = {
         "key": api_key,
@@ -53,7 +54,7 @@ def create_webhook(callback_url, board_id, description):
         print(f"  Description: {description}")
         print("-" * 60)
 
-        response = requests.post(url, json=payload)
+        response = get_trello_client().post(url, json=payload)
         response.raise_for_status()
 
         webhook = response.json()
@@ -8,7 +8,7 @@ exports:
   delete_all_webhooks: Delete all webhooks for the token with interactive confirmation.
   get_all_webhooks: Fetch all webhooks for the current token.
   main: CLI entry point with --webhook-id or --all args.
-imports_from: [requests, dotenv, argparse]
+imports_from: [app.trello.client, requests, dotenv, argparse]
 imported_by: []
 invariants:
   - Interactive script; requires user confirmation before deletion.
@@ -30,6 +30,7 @@ Requires confirmation before deleting to prevent accidental deletion.
 
 import argparse
 import requests
+from app.trello.client import get_trello_client
 from dotenv import load_dotenv
 import os
 
@@ -45,14 +46,14 @@ def get_all_webhooks():
         print("Error: TRELLO_API_KEY and TRELLO_TOKEN must be set in .env")
         return None
 
-    url = f"https://api.trello.com/1/tokens/{token}/webhooks"
+    url = f"/tokens/{token}/webhooks"
     params = {
         "key": api_key,
         "token": token,
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = get_trello_client().get(url, params=params)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -69,14 +70,14 @@ def delete_webhook(webhook_id):
         print("Error: TRELLO_API_KEY and TRELLO_TOKEN must be set in .env")
         return False
 
-    url = f"https://api.trello.com/1/webhooks/{webhook_id}"
+    url = f"/webhooks/{webhook_id}"
     params = {
         "key": api_key,
         "token": token,
     }
 
     try:
-        response = requests.delete(url, params=params)
+        response = get_trello_client().delete(url, params=params)
         response.raise_for_status()
         return True
     except requests.exceptions.HTTPError as e:
@@ -5,7 +5,7 @@ purpose: Display all registered Trello webhooks so operators can verify webhook
 exports:
   list_webhooks: List all webhooks for the current Trello token.
   main: CLI entry point.
-imports_from: [requests, dotenv]
+imports_from: [app.trello.client, requests, dotenv]
 imported_by: []
 invariants:
   - Read-only; never modifies webhooks.
@@ -22,6 +22,7 @@ Lists all webhooks with ID, description, callbackURL, active status, and idModel
 """
 
 import requests
+from app.trello.client import get_trello_client
 from dotenv import load_dotenv
 import os
 
@@ -37,14 +38,14 @@ def list_webhooks():
         print("Error: TRELLO_API_KEY and TRELLO_TOKEN must be set in .env")
         return
 
-    url = f"https://api.trello.com/1/tokens/{token}/webhooks"
+    url = f"/tokens/{token}/webhooks"
     params = {
         "key": api_key,
         "token": token,
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = get_trello_client().get(url, params=params)
         response.raise_for_status()
 
         webhooks = response.json()
@@ -8,7 +8,7 @@ exports:
   sync_releases_for_job: Ensure a Releases record exists and mirrors the Job record.
   archive_completed_releases: Archive Releases rows where job_comp='X' AND invoiced='X'.
   main: CLI entry point with --dry-run and --verbose flags.
-imports_from: [app, app.models, app.config, app.trello.api, app.trello.utils, app.sync.services.trello_list_mapper, app.api.helpers, requests, argparse]
+imports_from: [app.trello.client, app, app.models, app.config, app.trello.api, app.trello.utils, app.sync.services.trello_list_mapper, app.api.helpers, requests, argparse]
 imported_by: []
 invariants:
   - Writes both to Trello (card creation) and the local DB.
@@ -33,6 +33,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import requests
+from app.trello.client import get_trello_client
 from app import create_app
 from app.config import Config as cfg
 from app.models import Job, Releases, db
@@ -158,7 +159,7 @@ def create_card_for_job(job, list_name, list_id, dry_run=False, verbose=False):
         "pos": "top",
     }
 
-    response = requests.post("https://api.trello.com/1/cards", params=payload)
+    response = get_trello_client().post("/cards", params=payload)
     response.raise_for_status()
     card_data = response.json()
 
@@ -7,7 +7,7 @@ exports:
 imports_from: [app.trello.api, app.trello.utils, app.trello.operations, app.trello.context, app.trello.logging, app.trello.list_mapper, app.models, app.services.job_event_service, app.brain.job_log.features.fab_order.tier, app.config]
 imported_by: [app/trello/__init__.py]
 invariants:
-  - Echo webhooks from Brain's own outbox calls are detected and skipped (90-second window, content-matched).
+  - Echo webhooks from Brain's own outbox calls are detected and skipped (90-second window, content-matched, including a move folded into a later outbox item); in a coalesced burst only the echoed list move is dropped.
   - All DB changes are committed only after JobEvents are created; on failure the context manager rolls back everything.
   - Duplicate events (same or older timestamp) are silently dropped.
 updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
@@ -133,6 +133,17 @@ def _is_brain_echo_webhook(rec, event_info):
     # Content match: only skip if webhook change matches what we sent
     our_action = recent_outbox.action
     our_payload = recent_outbox.event.payload or {}
+    if our_action != "move_card":
+        # A move may have gone out folded into a later update for the card
+        folded_move = (
+            db.session.query(TrelloOutbox)
+            .filter(TrelloOutbox.superseded_by_id == recent_outbox.id,
+                    TrelloOutbox.action == "move_card")
+            .order_by(TrelloOutbox.id.desc())
+            .first()
+        )
+        if folded_move is not None and folded_move.event:
+            our_action, our_payload = "move_card", folded_move.event.payload or {}
 
     if our_action == "move_card":
         if not event_info.get("has_list_move"):
@@ -350,6 +361,7 @@ def sync_from_trello(event_info):
             event_type=event_info.get("event"),
             change_types=event_info.get("change_types", []),
             trello_user_id=event_info.get("trello_user_id"),
+            coalesced_actions=event_info.get("coalesced"),
         )
         
         # Fetch card data
@@ -404,15 +416,29 @@ def sync_from_trello(event_info):
         # Cross-reference with Outbox by card (job/release) and change content so we don't
         # skip legitimate user changes (e.g. Brain moves to A, user moves to B).
         if _is_brain_echo_webhook(rec, event_info):
+            other_changes = [t for t in event_info.get("change_types", []) if t != "list_move"]
+            if not (event_info.get("coalesced") and other_changes):
+                safe_log_sync_event(
+                    sync_op.operation_id,
+                    "INFO",
+                    "Skipping webhook echo from Brain's Trello API call (matched outbox for card)",
+                    job=rec.job,
+                    release=rec.release,
+                    card_id=card_id,
+                )
+                return
+            # A coalesced burst: only its list move is our echo; apply the user's other changes.
+            event_info = {**event_info, "change_types": other_changes,
+                          "has_list_move": False, "needs_excel_update": False}
             safe_log_sync_event(
                 sync_op.operation_id,
                 "INFO",
-                "Skipping webhook echo from Brain's Trello API call (matched outbox for card)",
+                "Dropping echoed list move from coalesced webhook burst",
                 job=rec.job,
                 release=rec.release,
                 card_id=card_id,
+                change_types=other_changes,
             )
-            return
 
         # Check for duplicate updates (Trello-originated changes)
         if rec.source_of_update == "Trello" and event_time <= rec.last_updated_at:
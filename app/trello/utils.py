@@ -4,26 +4,39 @@ schema_version: 1
 purpose: Pure-logic utilities (webhook parsing, date math, identifier extraction, Fab-Order sorting) shared across the Trello package with no DB writes.
 exports:
   parse_webhook_data: Parse raw Trello webhook JSON into a normalised event dict.
+  merge_webhook_events: Coalesce several parsed events for one card into one net event (keeps a per-action audit list).
   parse_trello_datetime: Convert Trello ISO-8601 strings to naive Python datetimes.
   extract_identifier: Pull the "NNN-NNN" job-release prefix from a card name.
   mountain_due_datetime: Convert a local date to 6 pm Mountain ISO string for Trello due dates.
   CALENDAR_FIELD / CALENDAR_SHOP / is_business_day: N4 two-calendar model.
   add_business_days / calculate_business_days_before: working-day math with calendar=.
+  BusinessDayIndex / business_day_index: precomputed business-day ordinals (O(1) add/subtract/count).
+  add_business_days_array: NumPy-vectorized add_business_days over arrays of dates and offsets.
+  business_days_between: count business days in (start, end].
+  set_calendar_holidays: configure per-calendar holidays (rebuilds the indexes).
+  POSITION_STEP / MIN_POSITION_GAP: Trello position spacing and the smallest gap a fractional insert may leave.
+  plan_fab_order_positions: Minimal set of (card_id, pos) PUTs that puts a list in Fab Order (LIS-based).
   should_sort_list_by_fab_order: Decide whether a list needs Fab-Order re-sorting.
   sort_list_if_needed: Sort a list by Fab Order if it is a target list, with logging.
-imports_from: [app.config, app.trello.api, app.trello.logging, app.logging_config, zoneinfo, re]
+imports_from: [app.config, app.trello.api, app.trello.logging, app.logging_config, zoneinfo, re, numpy]
 imported_by: [app/trello/sync.py, app/trello/scanner.py, app/trello/card_creation.py, app/trello/api.py, app/brain/job_log/routes.py, app/services/outbox_service.py]
 invariants:
   - parse_webhook_data never raises; errors return {"event": "error", "handled": False}.
+  - merge_webhook_events keeps the latest non-null value per field, unions change_types, spans list moves first-from → last-to (dropping a move that nets out) and records every input under "coalesced".
   - All Mountain-time conversions are DST-aware via ZoneInfo.
   - Default calendar is FIELD (Mon–Fri); SHOP is Mon–Thu (fab + paint).
-updated_by_agent: 2026-08-09T00:00:00Z
+  - Business-day math goes through the cached index; results match the day-by-day walk, which remains the out-of-window fallback.
+  - plan_fab_order_positions only moves cards off the longest already-ordered run; it renumbers the whole list only when fractional gaps run out.
+updated_by_agent: 2026-10-16T00:00:00Z
 """
 
+import math
 import re
 from datetime import datetime, date, timezone, time, timedelta
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -42,17 +55,42 @@ _CALENDAR_MAX_WEEKDAY = {
     CALENDAR_SHOP: 3,   # Mon–Thu (weekday 0–3)
 }
 
+# Non-working dates per calendar. Empty until the shop publishes a holiday
+# schedule; set via set_calendar_holidays() so the cached indexes are rebuilt.
+_CALENDAR_HOLIDAYS = {
+    CALENDAR_FIELD: frozenset(),
+    CALENDAR_SHOP: frozenset(),
+}
 
-def is_business_day(d, calendar=CALENDAR_FIELD) -> bool:
-    """True if ``d`` is a working day on the given calendar (no holiday table yet)."""
-    if isinstance(d, datetime):
-        d = d.date()
-    max_wd = _CALENDAR_MAX_WEEKDAY.get(calendar)
-    if max_wd is None:
+
+def _check_calendar(calendar):
+    if calendar not in _CALENDAR_MAX_WEEKDAY:
         raise ValueError(
             f"unknown calendar {calendar!r}; use CALENDAR_FIELD or CALENDAR_SHOP"
         )
-    return d.weekday() <= max_wd
+
+
+def is_business_day(d, calendar=CALENDAR_FIELD) -> bool:
+    """True if ``d`` is a working day on the given calendar (weekday and not a holiday)."""
+    if isinstance(d, datetime):
+        d = d.date()
+    _check_calendar(calendar)
+    return d.weekday() <= _CALENDAR_MAX_WEEKDAY[calendar] and d not in _CALENDAR_HOLIDAYS[calendar]
+
+
+def set_calendar_holidays(holidays, calendar=None):
+    """
+    Replace the holiday set for one calendar (or both when calendar is None).
+
+    Holidays are non-working days on top of the weekday mask. Cached business-day
+    indexes are dropped so the next lookup rebuilds with the new set.
+    """
+    dates = frozenset(h.date() if isinstance(h, datetime) else h for h in (holidays or ()))
+    calendars = [calendar] if calendar is not None else list(_CALENDAR_MAX_WEEKDAY)
+    for cal in calendars:
+        _check_calendar(cal)
+        _CALENDAR_HOLIDAYS[cal] = dates
+        _BUSINESS_DAY_INDEXES.pop(cal, None)
 
 
 def parse_webhook_data(data):
@@ -171,6 +209,61 @@ def parse_webhook_data(data):
         return {"event": "error", "handled": False, "error": str(e)}
 
 
+_MERGED_FLAGS = (
+    "has_list_move",
+    "has_due_date_change",
+    "has_start_date_change",
+    "has_description_change",
+    "needs_excel_update",
+)
+_AUDIT_FIELDS = ("event", "time", "change_types", "from", "to", "username", "trello_user_id")
+
+
+def merge_webhook_events(events):
+    """
+    Merge parse_webhook_data results for ONE card, oldest first, into a single net event.
+
+    sync_from_trello re-reads the card from Trello, so only the event's "what changed"
+    part needs merging: fields take their latest non-null value, change_types and the
+    has_* flags are unioned, and a chain of list moves becomes one move from the first
+    list to the last (none at all if the card ended where it started). Each input is
+    kept, trimmed to its audit fields, under "coalesced".
+    """
+    events = [e for e in events if e]
+    if len(events) <= 1:
+        return events[0] if events else None
+
+    merged = {}
+    for event in events:
+        merged.update({k: v for k, v in event.items() if v is not None})
+    if any(e.get("event") == "card_created" for e in events):
+        merged["event"] = "card_created"
+    change_types = list(dict.fromkeys(t for e in events for t in e.get("change_types") or []))
+    for flag in _MERGED_FLAGS:
+        merged[flag] = any(e.get(flag) for e in events)
+
+    moves = [e for e in events if e.get("has_list_move")]
+    if moves:
+        merged["from"] = moves[0].get("from")
+        merged["list_id_before"] = moves[0].get("list_id_before")
+        merged["to"] = moves[-1].get("to")
+        merged["list_id_after"] = moves[-1].get("list_id_after")
+        if merged["list_id_before"] and merged["list_id_before"] == merged["list_id_after"]:
+            # Dragged away and back inside the window: no net move.
+            for key in ("from", "to", "list_id_before", "list_id_after"):
+                merged.pop(key, None)
+            merged["has_list_move"] = merged["needs_excel_update"] = False
+            change_types = [t for t in change_types if t != "list_move"]
+    if any("change_types" in e for e in events):
+        merged["change_types"] = change_types
+    merged["coalesced"] = [
+        audit
+        for e in events
+        for audit in e.get("coalesced") or [{k: e[k] for k in _AUDIT_FIELDS if e.get(k) is not None}]
+    ]
+    return merged
+
+
 def parse_trello_datetime(dt_str):
     # Trello gives ISO8601 string with trailing Z for UTC or with offset
     if not dt_str:
@@ -251,6 +344,138 @@ def mountain_start_datetime(local_date):
     return dt_utc.isoformat().replace("+00:00", "Z")
 
 
+# ---------------------------------------------------------------------------
+# Business-day calendar index
+# ---------------------------------------------------------------------------
+# Years either side of today covered by the precomputed index. Dates outside the
+# window fall back to walking the calendar one day at a time.
+_INDEX_YEARS_BACK = 5
+_INDEX_YEARS_FORWARD = 10
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_BUSINESS_DAY_INDEXES = {}
+
+
+class BusinessDayIndex:
+    """
+    Precomputed business-day ordinals for one calendar over a fixed date window.
+
+    ``_cumulative[i]`` is the number of business days in [start, start + i], and
+    ``_business_days[k]`` is the (k+1)-th business day of the window as a date
+    ordinal, so adding, subtracting and counting business days are two list lookups.
+    Methods return None when the answer falls outside the window; callers fall back
+    to walking the calendar.
+    """
+
+    def __init__(self, calendar, start, end, holidays=frozenset()):
+        _check_calendar(calendar)
+        max_weekday = _CALENDAR_MAX_WEEKDAY[calendar]
+        self.calendar = calendar
+        self.start = start
+        self.end = end
+        self._start_ordinal = start.toordinal()
+        self._end_ordinal = end.toordinal()
+
+        cumulative = []
+        business_days = []
+        count = 0
+        for ordinal in range(self._start_ordinal, self._end_ordinal + 1):
+            d = date.fromordinal(ordinal)
+            if d.weekday() <= max_weekday and d not in holidays:
+                count += 1
+                business_days.append(ordinal)
+            cumulative.append(count)
+        self._cumulative = cumulative
+        self._business_days = business_days
+        self._cumulative_np = np.asarray(cumulative, dtype=np.int64)
+        # Stored as days since the Unix epoch so results view directly as datetime64[D].
+        self._business_days_np = np.asarray(business_days, dtype=np.int64) - _EPOCH_ORDINAL
+
+    def _position(self, d):
+        ordinal = d.toordinal()
+        if ordinal < self._start_ordinal or ordinal > self._end_ordinal:
+            return None
+        return ordinal - self._start_ordinal
+
+    def add(self, d, business_days):
+        """The business_days-th business day strictly after d (business_days > 0)."""
+        i = self._position(d)
+        if i is None:
+            return None
+        k = self._cumulative[i] - 1 + business_days
+        if k >= len(self._business_days):
+            return None
+        return date.fromordinal(self._business_days[k])
+
+    def subtract(self, d, business_days):
+        """The business_days-th business day strictly before d (business_days > 0)."""
+        i = self._position(d)
+        if i is None:
+            return None
+        k = (self._cumulative[i - 1] if i > 0 else 0) - business_days
+        if k < 0:
+            return None
+        return date.fromordinal(self._business_days[k])
+
+    def count_between(self, start, end):
+        """Business days in (start, end]; negative when end is before start."""
+        i = self._position(start)
+        j = self._position(end)
+        if i is None or j is None:
+            return None
+        return self._cumulative[j] - self._cumulative[i]
+
+    def add_array(self, start_days, business_days):
+        """
+        Vectorized add over int64 days-since-epoch arrays.
+
+        Returns (result_days, in_window) where result_days holds the answer for
+        every element with in_window True; non-positive offsets return the start.
+        """
+        positions = start_days - (self._start_ordinal - _EPOCH_ORDINAL)
+        in_window = (positions >= 0) & (positions < len(self._cumulative))
+        safe_positions = np.where(in_window, positions, 0)
+        k = self._cumulative_np[safe_positions] - 1 + business_days
+        in_window &= k < len(self._business_days)
+        positive = business_days > 0
+        shifted = self._business_days_np[np.clip(k, 0, max(len(self._business_days) - 1, 0))]
+        result = np.where(positive, shifted, start_days)
+        return result, in_window | ~positive
+
+
+def business_day_index(calendar=CALENDAR_FIELD) -> BusinessDayIndex:
+    """Return the cached BusinessDayIndex for a calendar, building it on first use."""
+    _check_calendar(calendar)
+    index = _BUSINESS_DAY_INDEXES.get(calendar)
+    if index is None:
+        today = date.today()
+        index = BusinessDayIndex(
+            calendar,
+            date(today.year - _INDEX_YEARS_BACK, 1, 1),
+            date(today.year + _INDEX_YEARS_FORWARD, 12, 31),
+            holidays=_CALENDAR_HOLIDAYS[calendar],
+        )
+        _BUSINESS_DAY_INDEXES[calendar] = index
+    return index
+
+
+def _whole_business_days(business_days):
+    # The walking loops counted up to the first integer >= business_days.
+    if isinstance(business_days, int):
+        return business_days
+    return math.ceil(business_days)
+
+
+def _walk_business_days(current_date, business_days, step, calendar):
+    days = 0
+    counted = 0
+    while counted < business_days:
+        days += step
+        if is_business_day(current_date + timedelta(days=days), calendar=calendar):
+            counted += 1
+    return current_date + timedelta(days=days)
+
+
 def calculate_business_days_before(target_date, business_days=2, calendar=CALENDAR_FIELD):
     """
     Calculate the date that is a specified number of business days before the target date.
@@ -271,16 +496,11 @@ def calculate_business_days_before(target_date, business_days=2, calendar=CALEND
     if not business_days or business_days <= 0:
         return current_date
 
-    days_back = 0
-    business_days_counted = 0
-
-    while business_days_counted < business_days:
-        days_back += 1
-        check_date = current_date - timedelta(days=days_back)
-        if is_business_day(check_date, calendar=calendar):
-            business_days_counted += 1
-
-    return current_date - timedelta(days=days_back)
+    business_days = _whole_business_days(business_days)
+    result = business_day_index(calendar).subtract(current_date, business_days)
+    if result is not None:
+        return result
+    return _walk_business_days(current_date, business_days, -1, calendar)
 
 
 def add_business_days(start_date, business_days, calendar=CALENDAR_FIELD):
@@ -303,16 +523,154 @@ def add_business_days(start_date, business_days, calendar=CALENDAR_FIELD):
     if not business_days or business_days <= 0:
         return current_date
 
-    days_forward = 0
-    business_days_counted = 0
+    business_days = _whole_business_days(business_days)
+    result = business_day_index(calendar).add(current_date, business_days)
+    if result is not None:
+        return result
+    return _walk_business_days(current_date, business_days, 1, calendar)
+
+
+def add_business_days_array(start_dates, business_days, calendar=CALENDAR_FIELD):
+    """
+    Vectorized add_business_days: one call for many (start date, offset) pairs.
+
+    Args:
+        start_dates: Sequence of dates, or a datetime64 array (a single date broadcasts)
+        business_days: Sequence/array of integer offsets (a single int broadcasts)
+        calendar: CALENDAR_FIELD (Mon–Fri, default) or CALENDAR_SHOP (Mon–Thu)
+
+    Returns:
+        numpy.ndarray: datetime64[D] results, element-wise equal to add_business_days
+    """
+    starts = np.asarray(start_dates, dtype="datetime64[D]").astype(np.int64)
+    offsets = np.asarray(business_days, dtype=np.int64)
+    starts, offsets = np.broadcast_arrays(starts, offsets)
+
+    result, ok = business_day_index(calendar).add_array(starts, offsets)
+    if not ok.all():
+        # Out-of-window elements take the scalar path (rare: dates years away).
+        result = result.copy()
+        for i in np.flatnonzero(~ok):
+            start = date.fromordinal(int(starts[i]) + _EPOCH_ORDINAL)
+            result[i] = add_business_days(start, int(offsets[i]), calendar=calendar).toordinal() - _EPOCH_ORDINAL
+    return result.astype("datetime64[D]")
+
+
+def business_days_between(start_date, end_date, calendar=CALENDAR_FIELD) -> int:
+    """
+    Count business days in (start_date, end_date] — the inverse of add_business_days.
+
+    Negative when end_date is before start_date.
+    """
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime):
+        end_date = end_date.date()
+    count = business_day_index(calendar).count_between(start_date, end_date)
+    if count is not None:
+        return count
+    if end_date < start_date:
+        return -business_days_between(end_date, start_date, calendar=calendar)
+    count = 0
+    d = start_date
+    while d < end_date:
+        d += timedelta(days=1)
+        if is_business_day(d, calendar=calendar):
+            count += 1
+    return count
+
+
+# Trello's default spacing between card positions. A full renumber lays cards
+# out at POSITION_STEP * (i + 1); a fractional insert halves whatever gap is left.
+POSITION_STEP = 16384
+# Below this gap between neighbours we stop inserting fractions and renumber.
+MIN_POSITION_GAP = 1.0
+
+
+def _longest_increasing_run(values):
+    """Indexes of one longest strictly increasing subsequence of `values` (O(n log n))."""
+    tails = []          # tails[k] = index ending the best run of length k + 1
+    parents = [-1] * len(values)
+    for i, value in enumerate(values):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if values[tails[mid]] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        parents[i] = tails[lo - 1] if lo else -1
+        if lo == len(tails):
+            tails.append(i)
+        else:
+            tails[lo] = i
+    keep = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        keep.append(i)
+        i = parents[i]
+    return keep[::-1]
+
+
+def plan_fab_order_positions(cards):
+    """
+    Plan the fewest position PUTs that put a list in Fab Order.
+
+    Args:
+        cards: dicts with card_id, fab_order (None sorts last) and current_pos
 
-    while business_days_counted < business_days:
-        days_forward += 1
-        check_date = current_date + timedelta(days=days_forward)
-        if is_business_day(check_date, calendar=calendar):
-            business_days_counted += 1
+    Returns:
+        (moves, renormalized): moves is a list of (card_id, new_pos) to PUT, in target order.
 
-    return current_date + timedelta(days=days_forward)
+    Cards on a longest increasing run of current positions (taken in target
+    order) stay where they are; only the others get a fractional position
+    between their new neighbours. If any gap would drop below MIN_POSITION_GAP
+    (or a position is missing) the list is renumbered at POSITION_STEP spacing,
+    still skipping cards already sitting on their renumbered position.
+    """
+    current = sorted(
+        cards,
+        key=lambda c: (c.get("current_pos") is None, c.get("current_pos") or 0),
+    )
+    # Stable: ties in fab_order keep their current relative order.
+    target = sorted(current, key=lambda c: (c["fab_order"] is None, c["fab_order"] or 0))
+    positions = [c.get("current_pos") for c in target]
+
+    if all(isinstance(p, (int, float)) for p in positions):
+        anchors = set(_longest_increasing_run(positions))
+        moves = []
+        placed = 0.0
+        i = 0
+        gaps_ok = True
+        while i < len(target) and gaps_ok:
+            if i in anchors:
+                placed = positions[i]
+                i += 1
+                continue
+            run_end = i
+            while run_end < len(target) and run_end not in anchors:
+                run_end += 1
+            count = run_end - i
+            if run_end < len(target):
+                step = (positions[run_end] - placed) / (count + 1)
+            else:
+                step = POSITION_STEP
+            if step < MIN_POSITION_GAP:
+                gaps_ok = False
+                break
+            for offset in range(count):
+                placed += step
+                moves.append((target[i + offset]["card_id"], placed))
+            i = run_end
+        if gaps_ok:
+            return moves, False
+
+    moves = [
+        (card["card_id"], POSITION_STEP * (index + 1))
+        for index, card in enumerate(target)
+        if card.get("current_pos") != POSITION_STEP * (index + 1)
+    ]
+    return moves, True
 
 
 def should_sort_list_by_fab_order(list_id):
@@ -375,7 +733,8 @@ def sort_list_if_needed(list_id, fab_order_field_id, operation_id, list_type="li
                 "INFO",
                 f"{list_type.capitalize()} list sorted by Fab Order",
                 list_id=list_id,
-                cards_sorted=sort_result.get("cards_sorted", 0)
+                cards_sorted=sort_result.get("cards_sorted", 0),
+                api_calls_saved=sort_result.get("api_calls_saved", 0),
             )
         else:
             logger.info(
@@ -383,6 +742,7 @@ def sort_list_if_needed(list_id, fab_order_field_id, operation_id, list_type="li
                 list_id=list_id,
                 list_type=list_type,
                 count=sort_result.get("cards_sorted", 0),
+                api_calls_saved=sort_result.get("api_calls_saved", 0),
             )
         return True
     else:
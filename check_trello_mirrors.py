@@ -3,7 +3,9 @@ Check which active Job Log releases have a Trello card missing its mirror.
 
 Every release should have a primary card (in Released, Fit Up Complete., etc.)
 and a mirror card (in another list like Unassigned, a fab-guy list, Complete., etc.).
-Mirrors are copies with the same card name. This script matches by name.
+Mirrors are copies with the same card name. This script matches by name, then
+checks the "Linked card" attachment of every primary without a name match (read
+in /batch calls of ten) so a renamed mirror is not reported as missing.
 
 Usage:
     python check_trello_mirrors.py
@@ -16,7 +18,7 @@ from urllib.parse import urlparse, urlunparse
 from app import create_app
 from app.config import Config as cfg
 from app.models import Releases, db
-from app.trello.api import get_all_trello_cards
+from app.trello.api import get_all_trello_cards, resolve_mirror_short_links
 
 
 TARGET_LISTS = [
@@ -104,12 +106,21 @@ def main():
             else:
                 missing_mirror.append((rel, card))
 
+        # --- No name match: is there still a linked mirror (renamed)? ---
+        linked_only = []
+        if missing_mirror:
+            short_links = resolve_mirror_short_links([card["id"] for _, card in missing_mirror])
+            linked_only = [(r, c) for r, c in missing_mirror if short_links.get(c["id"])]
+            missing_mirror = [(r, c) for r, c in missing_mirror if not short_links.get(c["id"])]
+            has_mirror.extend(linked_only)
+
         # --- Results ---
         print(f"\n{'—' * 70}")
         print("Results (active DB releases in primary lists)")
         print(f"{'—' * 70}")
         print(f"  Total checked:               {len(active_primary):,}")
-        print(f"  WITH mirror (name match):    {len(has_mirror):,}")
+        print(f"  WITH mirror (name match):    {len(has_mirror) - len(linked_only):,}")
+        print(f"  WITH mirror (linked only):   {len(linked_only):,}")
         print(f"  WITHOUT mirror:              {len(missing_mirror):,}  <-- MISSING")
         if not_on_board:
             print(f"  Card not found on board:     {len(not_on_board):,}")
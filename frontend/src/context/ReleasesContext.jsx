@@ -1,9 +1,9 @@
 /**
  * @milehigh-header
  * schema_version: 1
- * purpose: App-level store for the releases dataset — lifts the cursor-merge + 30s polling engine out of useJobsDataFetching so Job Log, PM Board, and the Timeline share one load that survives navigation.
+ * purpose: App-level store for the releases dataset — lifts the cursor-merge + live-update engine (release stream with 30s polling fallback) out of useJobsDataFetching so Job Log, PM Board, and the Timeline share one load that survives navigation.
  * exports:
- *   ReleasesProvider: Provider that fetches all releases once (gated on `enabled`) then polls; holds jobs/columns/loading/error/lastUpdated
+ *   ReleasesProvider: Provider that fetches all releases once (gated on `enabled`) then streams/polls; holds jobs/columns/loading/error/lastUpdated
  *   useReleases: Accessor hook (throws outside the provider); returns the same shape the old useJobsDataFetching hook returned
  *   mergeJobs: Pure cursor-merge reducer (add/update/soft-delete/archive removal + id sort) — exported for unit tests
  * imports_from: [react, ../services/jobsApi]
@@ -11,6 +11,7 @@
  * invariants:
  *   - Cursor timestamp is persisted in localStorage (key jobLogCursorTimestamp); initial mount fetches all pages then sets the cursor
  *   - Polling pauses when the browser tab is hidden and resumes with an immediate fetch on visibility
+ *   - While /brain/jobs/stream is open, interval polls skip the release fetch; stream events and polls share applyDelta
  *   - Soft-deleted or archived jobs (is_active=false / is_archived=true) are removed from the in-memory array on merge
  *   - Initial fetch + polling only run while `enabled` is true (prevents 401 spam before login)
  */
@@ -105,6 +106,10 @@ export function ReleasesProvider({ children, enabled = true }) {
     const [error, setError] = useState(null);
     const [lastUpdated, setLastUpdated] = useState(null);
     const hasFetchedAllRef = useRef(false);
+    // Server-side scheduling snapshot generation. hours_in_front / projected dates
+    // are queue-wide, so a change to one release can move rows the cursor delta
+    // doesn't return; a generation bump means re-pull the full set.
+    const schedulingGenerationRef = useRef(null);
     // Sparse map "job-release" → 'received'|'pending'|'overdue' for releases that
     // have material orders. Refreshed alongside the release poll.
     const [materialStatus, setMaterialStatus] = useState({});
@@ -126,6 +131,46 @@ export function ReleasesProvider({ children, enabled = true }) {
         }
     }, []);
 
+    // Apply one /brain/jobs?since= body — from a poll or a stream event — to state.
+    const applyDelta = useCallback(async (data) => {
+        // Extract jobs array - these are only new/updated jobs
+        const newJobsList = data.jobs || [];
+        console.log(`[CURSOR] Received ${newJobsList.length} new/updated jobs from API`);
+
+        // Update cursor timestamp if we got a latest_timestamp from the server
+        if (data.latest_timestamp) {
+            setCursorTimestamp(data.latest_timestamp);
+            console.log(`[CURSOR] Updated cursor timestamp to: ${data.latest_timestamp}`);
+        } else if (newJobsList.length > 0) {
+            // No latest_timestamp but jobs were returned — shouldn't happen;
+            // log and leave the cursor untouched so the next poll retries.
+            console.warn('[CURSOR] No latest_timestamp in response, but jobs were returned');
+        }
+
+        const generation = data.scheduling_generation ?? null;
+        if (generation !== null
+            && schedulingGenerationRef.current !== null
+            && generation !== schedulingGenerationRef.current) {
+            // Scheduling projections moved queue-wide — replace, don't merge.
+            console.log(`[CURSOR] Scheduling generation ${schedulingGenerationRef.current} → ${generation}, re-fetching all jobs`);
+            schedulingGenerationRef.current = generation;
+            const allJobs = await jobsApi.fetchAllJobs();
+            setJobs(allJobs);
+        } else {
+            if (generation !== null) schedulingGenerationRef.current = generation;
+            // Merge new/updated jobs into existing jobs array
+            setJobs(prevJobs => mergeJobs(prevJobs, newJobsList));
+        }
+
+        // Get columns from first job if available (use existing or new)
+        if (newJobsList.length > 0) {
+            const jobColumns = Object.keys(newJobsList[0]).filter(key => key !== 'id');
+            setColumns(jobColumns);
+        }
+
+        setLastUpdated(new Date().toISOString());
+    }, []);
+
     const fetchData = useCallback(async (silent = false) => {
         if (!silent) setLoading(true);
         setError(null); // Reset error
@@ -137,31 +182,7 @@ export function ReleasesProvider({ children, enabled = true }) {
 
             // Fetch data from API (only new/updated jobs since last cursor)
             const data = await jobsApi.fetchData(cursorTimestamp);
-
-            // Extract jobs array - these are only new/updated jobs
-            const newJobsList = data.jobs || [];
-            console.log(`[CURSOR] Received ${newJobsList.length} new/updated jobs from API`);
-
-            // Update cursor timestamp if we got a latest_timestamp from the server
-            if (data.latest_timestamp) {
-                setCursorTimestamp(data.latest_timestamp);
-                console.log(`[CURSOR] Updated cursor timestamp to: ${data.latest_timestamp}`);
-            } else if (newJobsList.length > 0) {
-                // No latest_timestamp but jobs were returned — shouldn't happen;
-                // log and leave the cursor untouched so the next poll retries.
-                console.warn('[CURSOR] No latest_timestamp in response, but jobs were returned');
-            }
-
-            // Merge new/updated jobs into existing jobs array
-            setJobs(prevJobs => mergeJobs(prevJobs, newJobsList));
-
-            // Get columns from first job if available (use existing or new)
-            if (newJobsList.length > 0) {
-                const jobColumns = Object.keys(newJobsList[0]).filter(key => key !== 'id');
-                setColumns(jobColumns);
-            }
-
-            setLastUpdated(new Date().toISOString());
+            await applyDelta(data);
 
         } catch (error) {
             console.error('[CURSOR] Error fetching jobs data:', error);
@@ -169,7 +190,7 @@ export function ReleasesProvider({ children, enabled = true }) {
         } finally {
             if (!silent) setLoading(false);
         }
-    }, []);
+    }, [applyDelta]);
 
     const fetchAllData = useCallback(async (silent = false) => {
         if (!silent) setLoading(true);
@@ -201,6 +222,7 @@ export function ReleasesProvider({ children, enabled = true }) {
                     // Fetch once without cursor parameter - this will return latest_timestamp
                     // We already have all the jobs, so this is just to get the timestamp
                     const cursorData = await jobsApi.fetchData(null);
+                    schedulingGenerationRef.current = cursorData.scheduling_generation ?? null;
                     if (cursorData.latest_timestamp) {
                         setCursorTimestamp(cursorData.latest_timestamp);
                         console.log(`[CURSOR] Initial mount: Cursor set successfully - ${cursorData.latest_timestamp}`);
@@ -248,11 +270,47 @@ export function ReleasesProvider({ children, enabled = true }) {
         }
     }, [enabled, fetchAllData, fetchMaterialSummary]);
 
-    // Poll for updates every 30 seconds, pauses when tab is not visible to save resources
+    // Live updates: /brain/jobs/stream pushes the same delta body a since= poll
+    // returns, plus a `scheduling` event when the snapshot generation moves. The 30s interval stays as the fallback — it only refetches
+    // releases while the stream is not open — and still drives the material
+    // summary. Both pause while the tab is hidden.
     useEffect(() => {
         if (!enabled) return;
         let intervalId = null;
         let visibilityChangeHandler = null;
+        let stream = null;
+
+        const openStream = () => {
+            if (stream || typeof EventSource === 'undefined') return;
+            stream = jobsApi.openJobsStream(getCursorTimestamp());
+            stream.addEventListener('releases', (event) => {
+                applyDelta(JSON.parse(event.data)).catch((err) => {
+                    console.error('[STREAM] Error applying release delta:', err);
+                });
+            });
+            // A snapshot rebuild (input change, day rollover) moved queue-wide
+            // projections without a release row changing; applyDelta re-pulls
+            // the full set when the generation differs.
+            stream.addEventListener('scheduling', (event) => {
+                applyDelta(JSON.parse(event.data)).catch((err) => {
+                    console.error('[STREAM] Error applying scheduling generation:', err);
+                });
+            });
+            stream.onopen = () => console.log('[STREAM] Connected to release stream');
+            // EventSource reconnects on its own, resuming from Last-Event-ID;
+            // polling covers the gap until it does.
+            stream.onerror = () => console.warn('[STREAM] Release stream interrupted, polling until it reconnects');
+        };
+
+        const closeStream = () => {
+            if (stream) {
+                stream.close();
+                stream = null;
+                console.log('[STREAM] Release stream closed');
+            }
+        };
+
+        const streamOpen = () => stream !== null && stream.readyState === EventSource.OPEN;
 
         const startPolling = () => {
             // Clear any existing interval
@@ -264,7 +322,7 @@ export function ReleasesProvider({ children, enabled = true }) {
             intervalId = setInterval(() => {
                 if (!document.hidden) {
                     console.log('[CURSOR] Polling interval triggered');
-                    fetchData(true);
+                    if (!streamOpen()) fetchData(true);
                     fetchMaterialSummary();
                 } else {
                     console.log('[CURSOR] Tab is hidden, skipping poll');
@@ -284,17 +342,20 @@ export function ReleasesProvider({ children, enabled = true }) {
             if (document.hidden) {
                 console.log('[CURSOR] Tab hidden, stopping polling');
                 stopPolling();
+                closeStream();
             } else {
                 console.log('[CURSOR] Tab visible, starting polling and fetching immediately');
                 startPolling();
                 fetchData(true); // Immediately fetch when tab becomes visible
                 fetchMaterialSummary();
+                openStream();
             }
         };
 
         // Only start polling if this tab is visible (avoids timer running in background if page opened in background tab)
         if (!document.hidden) {
             startPolling();
+            openStream();
         }
 
         document.addEventListener('visibilitychange', visibilityChangeHandler);
@@ -302,9 +363,10 @@ export function ReleasesProvider({ children, enabled = true }) {
         // Cleanup
         return () => {
             stopPolling();
+            closeStream();
             document.removeEventListener('visibilitychange', visibilityChangeHandler);
         };
-    }, [enabled, fetchData, fetchMaterialSummary]);
+    }, [enabled, applyDelta, fetchData, fetchMaterialSummary]);
 
     // Merge the material-order status onto each row under the synthetic column key.
     // A release with no orders gets null → the Job Log renders a blank cell.
@@ -9,7 +9,8 @@
  * imported_by: [components/PMBoardList.jsx, components/JobsTableRow.jsx, components/GanttChart.jsx, components/ReleaseDetailModal.jsx, pages/PMBoard.jsx, pages/JobLog.jsx, pages/Archive.jsx, hooks/useJobsDataFetching.js, hooks/useArchiveDataFetching.js]
  * invariants:
  *   - Exported as a singleton; all callers share the same instance.
- *   - fetchAllJobs paginates internally and returns the full accumulated array.
+ *   - fetchAllJobs pages internally by following next_cursor and returns the full accumulated array.
+ *   - openJobsStream returns a raw EventSource; the caller owns close().
  *   - _handleError enriches axios errors with statusCode and originalError before re-throwing.
  * updated_by_agent: 2026-04-14T00:00:00Z (commit e133a47)
  */
@@ -23,15 +24,21 @@ class JobsApi {
     async fetchAllJobs(archived = false) {
         try {
             const allJobs = [];
+            let cursor = null;
             let page = 1;
             let hasMore = true;
 
-            // Fetch all pages until we have all the data
+            // Follow next_cursor until the server reports no more pages. Each
+            // page is a keyset range scan, so later pages cost the same as the first.
             while (hasMore) {
+                const params = { archived, per_page: 1000 };
+                if (cursor) {
+                    params.cursor = cursor;
+                }
                 const response = await axios.get(`${API_BASE_URL}/brain/get-all-jobs`, {
                     // per_page=1000 pulls the whole dataset in one request (the
-                    // has_more loop below stays as a safety net for >1000 rows).
-                    params: { page, archived, per_page: 1000 }
+                    // cursor loop below stays as a safety net for >1000 rows).
+                    params
                 });
 
                 // Parse response data if it's a string (sometimes axios doesn't auto-parse)
@@ -47,7 +54,8 @@ class JobsApi {
 
                 // Check if there are more pages
                 if (data.pagination) {
-                    hasMore = data.pagination.has_more === true;
+                    cursor = data.pagination.next_cursor || null;
+                    hasMore = data.pagination.has_more === true && cursor !== null;
                     console.log(`Fetched page ${page}: ${data.jobs?.length || 0} jobs (Total so far: ${allJobs.length}/${data.pagination.total_count})`);
                 } else {
                     hasMore = false;
@@ -83,6 +91,16 @@ class JobsApi {
         }
     }
 
+    /**
+     * Open the release change stream (server-sent events).
+     * Each `releases` event's data is a fetchData() response body; EventSource
+     * reconnects on its own and resumes from the last event id.
+     */
+    openJobsStream(sinceTimestamp = null) {
+        const query = sinceTimestamp ? `?since=${encodeURIComponent(sinceTimestamp)}` : '';
+        return new EventSource(`${API_BASE_URL}/brain/jobs/stream${query}`, { withCredentials: true });
+    }
+
     async updateStage(job, release, stage) {
         try {
             const response = await axios.patch(
@@ -95,6 +113,22 @@ class JobsApi {
         }
     }
 
+    /**
+     * Move many releases in one request: items = [{ job, release, stage }, ...].
+     * Resolves with per-item results even when some items failed.
+     */
+    async updateStagesBulk(items) {
+        try {
+            const response = await axios.post(
+                `${API_BASE_URL}/brain/update-stage/bulk`,
+                { items }
+            );
+            return response.data;
+        } catch (error) {
+            throw this._handleError(error, 'Failed to update stages');
+        }
+    }
+
     async updateFabOrder(job, release, fabOrder) {
         try {
             const response = await axios.patch(
@@ -1,9 +1,19 @@
 import logging
+import os
+
 from gunicorn import glogging
 
+# /brain/jobs/stream (SSE) holds its request open for up to
+# RELEASE_STREAM_MAX_SECONDS per browser tab. A sync worker would spend a whole
+# process on each open tab; gthread workers spend one thread, so polls and API
+# calls keep being served while streams are open. Size threads for the expected
+# open tabs per worker plus headroom for regular requests.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", "32"))
+
 # Paths to suppress from access logs when the response is 200.
 # Non-200 responses (errors, auth failures) are still logged.
-_QUIET_PATHS = {'/brain/notifications/unread-count', '/brain/jobs?since='}
+_QUIET_PATHS = {'/brain/notifications/unread-count', '/brain/jobs?since=', '/brain/jobs/stream'}
 
 
 class _QuietPathFilter(logging.Filter):
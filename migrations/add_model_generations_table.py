@@ -0,0 +1,199 @@
+"""
+Add `model_generations`, the shared per-model write counters behind the weak
+ETags on /brain/jobs, /brain/drafting-work-load and /brain/projects
+(app/http_cache.py). Every gunicorn worker reads the same rows, so a write
+that doesn't move a fingerprinted column changes the ETag on all of them.
+
+Nothing is backfilled: a missing row reads as generation 0 and the first
+committed write to a tracked model creates it.
+
+**Run this BEFORE deploying the code that reads the table.** Until then the
+polled reads answer untagged 200s (the version query fails and is logged).
+
+Usage:
+    python migrations/add_model_generations_table.py
+    python migrations/add_model_generations_table.py --database-url postgresql://...
+
+Safety properties (Postgres) — mirrors migrations/add_trello_scan_state_table.py:
+  - Idempotent `CREATE TABLE IF NOT EXISTS`, so NO schema reflection is needed.
+  - One AUTOCOMMIT connection: the DDL is its own implicit transaction.
+  - `lock_timeout` makes a blocked statement fail fast and auto-retry with backoff
+    instead of queueing behind live traffic.
+  - The DB URL is masked in all log output.
+"""
+
+import argparse
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SQLITE_PATH = os.path.join(ROOT_DIR, "instance", "jobs.sqlite")
+
+LOCK_TIMEOUT = "5s"
+STATEMENT_TIMEOUT = "30s"
+LOCK_RETRIES = 4
+RETRY_BASE_SECONDS = 3
+
+load_dotenv()
+
+
+def normalize_sqlite_path(path: str) -> str:
+    if not os.path.isabs(path):
+        path = os.path.join(ROOT_DIR, path)
+    return f"sqlite:///{path}"
+
+
+def _coerce_url(value: str) -> str:
+    value = value.strip()
+    if value.startswith("postgres://"):
+        return value.replace("postgres://", "postgresql://", 1)
+    if value.startswith(("postgresql://", "mysql://", "mariadb://", "sqlite://")):
+        return value
+    return normalize_sqlite_path(value)
+
+
+def infer_database_url(cli_url: str = None) -> str:
+    """Figure out which database to hit, honoring CLI and ENVIRONMENT (mirrors db_config.py)."""
+    if cli_url:
+        return _coerce_url(cli_url)
+
+    environment = (os.environ.get("ENVIRONMENT") or "local").strip().lower()
+
+    if environment == "production":
+        value = os.environ.get("PRODUCTION_DATABASE_URL") or os.environ.get("DATABASE_URL")
+        if not value:
+            raise ValueError(
+                "ENVIRONMENT=production but neither PRODUCTION_DATABASE_URL nor "
+                "DATABASE_URL is set (refusing to guess; pass --database-url)."
+            )
+        return _coerce_url(value)
+
+    if environment == "sandbox":
+        value = os.environ.get("SANDBOX_DATABASE_URL") or os.environ.get("DATABASE_URL")
+        if not value:
+            raise ValueError(
+                "ENVIRONMENT=sandbox but neither SANDBOX_DATABASE_URL nor "
+                "DATABASE_URL is set (refusing to guess; pass --database-url)."
+            )
+        return _coerce_url(value)
+
+    candidates = [
+        os.environ.get("LOCAL_DATABASE_URL"),
+        os.environ.get("DATABASE_URL"),
+        os.environ.get("SQLALCHEMY_DATABASE_URI"),
+        os.environ.get("JOBS_DB_URL"),
+        os.environ.get("JOBS_SQLITE_PATH"),
+    ]
+    for value in candidates:
+        if value:
+            return _coerce_url(value)
+
+    return normalize_sqlite_path(DEFAULT_SQLITE_PATH)
+
+
+def _mask(url: str) -> str:
+    """Render a connection URL for logging without leaking the password."""
+    try:
+        u = urlparse(url)
+        if u.hostname:
+            user = f"{u.username}@" if u.username else ""
+            return f"{u.scheme}://{user}{u.hostname}/{u.path.lstrip('/')}"
+    except Exception:
+        pass
+    return url.split("@")[-1] if "@" in url else url
+
+
+
+
+_TABLE = """
+    CREATE TABLE IF NOT EXISTS model_generations (
+        name VARCHAR(64) PRIMARY KEY,
+        generation INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+
+def _is_lock_timeout(exc: Exception) -> bool:
+    msg = str(exc).lower()
+    return "lock" in msg and ("timeout" in msg or "not available" in msg or "55p03" in msg)
+
+
+def _run_with_retry(conn, sql: str, label: str) -> None:
+    """Execute one idempotent DDL statement, retrying on lock_timeout with backoff."""
+    for attempt in range(1, LOCK_RETRIES + 1):
+        try:
+            conn.execute(text(sql))
+            print(f"✓ {label}")
+            return
+        except OperationalError as exc:
+            if _is_lock_timeout(exc) and attempt < LOCK_RETRIES:
+                delay = RETRY_BASE_SECONDS * attempt
+                print(
+                    f"  ⏳ '{label}' couldn't get the lock (attempt {attempt}/{LOCK_RETRIES}); "
+                    f"retrying in {delay}s — nothing committed, app keeps running"
+                )
+                time.sleep(delay)
+                continue
+            raise
+
+
+def _migrate_postgres(engine) -> bool:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"SET lock_timeout = '{LOCK_TIMEOUT}'"))
+        conn.execute(text(f"SET statement_timeout = '{STATEMENT_TIMEOUT}'"))
+        try:
+            _run_with_retry(conn, _TABLE, "model_generations table")
+        except OperationalError as exc:
+            if _is_lock_timeout(exc):
+                print(
+                    f"✗ Gave up after {LOCK_RETRIES} attempts to get the lock. Nothing was "
+                    "committed. Re-run during a quieter window."
+                )
+                return False
+            raise
+    return True
+
+
+def _migrate_sqlite(engine) -> bool:
+    with engine.begin() as conn:
+        conn.execute(text(_TABLE))
+        print("✓ model_generations table")
+    return True
+
+
+def migrate(database_url: str = None) -> bool:
+    db_url = infer_database_url(database_url)
+    print(f"Connecting to database: {_mask(db_url)}")
+
+    engine = create_engine(db_url)
+    try:
+        if engine.dialect.name == "sqlite":
+            return _migrate_sqlite(engine)
+        return _migrate_postgres(engine)
+    except ProgrammingError as exc:
+        print(f"✗ Database error during migration: {exc}")
+        return False
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"✗ Unexpected error: {exc}")
+        return False
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create the model_generations table behind the conditional-GET ETags.")
+    parser.add_argument(
+        "--database-url",
+        help="Override database URL (otherwise inferred from env or defaults).",
+    )
+    args = parser.parse_args()
+
+    success = migrate(args.database_url)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,204 @@
+"""
+Add the (status, next_retry_at) claim indexes to the two outbox tables:
+
+  trello_outbox:   idx_trello_outbox_status_next_retry   (status, next_retry_at)
+  procore_outbox:  idx_procore_outbox_status_next_retry  (status, next_retry_at)
+
+app/services/outbox_dispatcher.py polls both tables every few seconds for
+`status = 'pending' AND next_retry_at <= now`; without the index that is a full
+scan of every row the outbox has ever delivered. Matches the `__table_args__`
+declarations in app/models.py. Nothing is backfilled.
+
+Usage:
+    python migrations/add_outbox_dispatch_indexes.py
+    python migrations/add_outbox_dispatch_indexes.py --database-url postgresql://...
+
+Safety properties (Postgres) — mirrors migrations/add_trello_inbound_events_table.py:
+  - Idempotent `CREATE INDEX IF NOT EXISTS`, so NO schema reflection is needed.
+  - `CONCURRENTLY` on one AUTOCOMMIT connection, so the outbox keeps taking
+    writes while each index builds.
+  - `lock_timeout` makes a blocked statement fail fast and auto-retry with backoff
+    instead of queueing behind live traffic.
+  - The DB URL is masked in all log output.
+"""
+
+import argparse
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SQLITE_PATH = os.path.join(ROOT_DIR, "instance", "jobs.sqlite")
+
+LOCK_TIMEOUT = "5s"
+STATEMENT_TIMEOUT = "30s"
+LOCK_RETRIES = 4
+RETRY_BASE_SECONDS = 3
+
+load_dotenv()
+
+
+def normalize_sqlite_path(path: str) -> str:
+    if not os.path.isabs(path):
+        path = os.path.join(ROOT_DIR, path)
+    return f"sqlite:///{path}"
+
+
+def _coerce_url(value: str) -> str:
+    value = value.strip()
+    if value.startswith("postgres://"):
+        return value.replace("postgres://", "postgresql://", 1)
+    if value.startswith(("postgresql://", "mysql://", "mariadb://", "sqlite://")):
+        return value
+    return normalize_sqlite_path(value)
+
+
+def infer_database_url(cli_url: str = None) -> str:
+    """Figure out which database to hit, honoring CLI and ENVIRONMENT (mirrors db_config.py)."""
+    if cli_url:
+        return _coerce_url(cli_url)
+
+    environment = (os.environ.get("ENVIRONMENT") or "local").strip().lower()
+
+    if environment == "production":
+        value = os.environ.get("PRODUCTION_DATABASE_URL") or os.environ.get("DATABASE_URL")
+        if not value:
+            raise ValueError(
+                "ENVIRONMENT=production but neither PRODUCTION_DATABASE_URL nor "
+                "DATABASE_URL is set (refusing to guess; pass --database-url)."
+            )
+        return _coerce_url(value)
+
+    if environment == "sandbox":
+        value = os.environ.get("SANDBOX_DATABASE_URL") or os.environ.get("DATABASE_URL")
+        if not value:
+            raise ValueError(
+                "ENVIRONMENT=sandbox but neither SANDBOX_DATABASE_URL nor "
+                "DATABASE_URL is set (refusing to guess; pass --database-url)."
+            )
+        return _coerce_url(value)
+
+    candidates = [
+        os.environ.get("LOCAL_DATABASE_URL"),
+        os.environ.get("DATABASE_URL"),
+        os.environ.get("SQLALCHEMY_DATABASE_URI"),
+        os.environ.get("JOBS_DB_URL"),
+        os.environ.get("JOBS_SQLITE_PATH"),
+    ]
+    for value in candidates:
+        if value:
+            return _coerce_url(value)
+
+    return normalize_sqlite_path(DEFAULT_SQLITE_PATH)
+
+
+def _mask(url: str) -> str:
+    """Render a connection URL for logging without leaking the password."""
+    try:
+        u = urlparse(url)
+        if u.hostname:
+            user = f"{u.username}@" if u.username else ""
+            return f"{u.scheme}://{user}{u.hostname}/{u.path.lstrip('/')}"
+    except Exception:
+        pass
+    return url.split("@")[-1] if "@" in url else url
+
+
+
+
+_INDEXES = [
+    ("idx_trello_outbox_status_next_retry", "trello_outbox", "status, next_retry_at"),
+    ("idx_procore_outbox_status_next_retry", "procore_outbox", "status, next_retry_at"),
+]
+
+
+def _index_sql(name: str, table: str, columns: str, concurrently: bool) -> str:
+    mode = "CONCURRENTLY " if concurrently else ""
+    return f"CREATE INDEX {mode}IF NOT EXISTS {name} ON {table} ({columns})"
+
+
+def _is_lock_timeout(exc: Exception) -> bool:
+    msg = str(exc).lower()
+    return "lock" in msg and ("timeout" in msg or "not available" in msg or "55p03" in msg)
+
+
+def _run_with_retry(conn, sql: str, label: str) -> None:
+    """Execute one idempotent DDL statement, retrying on lock_timeout with backoff."""
+    for attempt in range(1, LOCK_RETRIES + 1):
+        try:
+            conn.execute(text(sql))
+            print(f"✓ {label}")
+            return
+        except OperationalError as exc:
+            if _is_lock_timeout(exc) and attempt < LOCK_RETRIES:
+                delay = RETRY_BASE_SECONDS * attempt
+                print(
+                    f"  ⏳ '{label}' couldn't get the lock (attempt {attempt}/{LOCK_RETRIES}); "
+                    f"retrying in {delay}s — nothing committed, app keeps running"
+                )
+                time.sleep(delay)
+                continue
+            raise
+
+
+def _migrate_postgres(engine) -> bool:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"SET lock_timeout = '{LOCK_TIMEOUT}'"))
+        conn.execute(text(f"SET statement_timeout = '{STATEMENT_TIMEOUT}'"))
+        try:
+            for name, table, columns in _INDEXES:
+                _run_with_retry(conn, _index_sql(name, table, columns, concurrently=True), name)
+        except OperationalError as exc:
+            if _is_lock_timeout(exc):
+                print(
+                    f"✗ Gave up after {LOCK_RETRIES} attempts to get the lock. Nothing was "
+                    "committed. Re-run during a quieter window."
+                )
+                return False
+            raise
+    return True
+
+
+def _migrate_sqlite(engine) -> bool:
+    with engine.begin() as conn:
+        for name, table, columns in _INDEXES:
+            conn.execute(text(_index_sql(name, table, columns, concurrently=False)))
+            print(f"✓ {name}")
+    return True
+
+
+def migrate(database_url: str = None) -> bool:
+    db_url = infer_database_url(database_url)
+    print(f"Connecting to database: {_mask(db_url)}")
+
+    engine = create_engine(db_url)
+    try:
+        if engine.dialect.name == "sqlite":
+            return _migrate_sqlite(engine)
+        return _migrate_postgres(engine)
+    except ProgrammingError as exc:
+        print(f"✗ Database error during migration: {exc}")
+        return False
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"✗ Unexpected error: {exc}")
+        return False
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add the (status, next_retry_at) claim indexes to trello_outbox and procore_outbox.")
+    parser.add_argument(
+        "--database-url",
+        help="Override database URL (otherwise inferred from env or defaults).",
+    )
+    args = parser.parse_args()
+
+    success = migrate(args.database_url)
+    sys.exit(0 if success else 1)
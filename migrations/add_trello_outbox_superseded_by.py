@@ -0,0 +1,131 @@
+"""
+Add the `superseded_by_id` column (and its index) to the `trello_outbox` table.
+
+OutboxService.add() and the outbox dispatcher now fold a card's older pending
+move_card / update_fab_order / update_release_fields items into the newest one:
+the older rows get status 'superseded' and superseded_by_id pointing at the item
+that delivers their change, whose completion closes their events too. Nothing is
+backfilled — existing rows keep superseded_by_id NULL.
+
+Usage:
+    python migrations/add_trello_outbox_superseded_by.py
+    python migrations/add_trello_outbox_superseded_by.py --database-url postgresql://...
+
+The script is idempotent and safe to run multiple times. It inspects the current
+schema before mutating.
+"""
+
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SQLITE_PATH = os.path.join(ROOT_DIR, "instance", "jobs.sqlite")
+
+# Load environment variables from a .env file if present
+load_dotenv()
+
+
+def normalize_sqlite_path(path: str) -> str:
+    """Return a SQLAlchemy-friendly SQLite URL for the given path."""
+    if not os.path.isabs(path):
+        path = os.path.join(ROOT_DIR, path)
+    return f"sqlite:///{path}"
+
+
+def infer_database_url(cli_url: str = None) -> str:
+    """Figure out which database to hit, honoring CLI and environment defaults."""
+    candidates = [
+        cli_url,
+        os.environ.get("DATABASE_URL"),
+        os.environ.get("SANDBOX_DATABASE_URL"),
+        os.environ.get("SQLALCHEMY_DATABASE_URI"),
+        os.environ.get("JOBS_DB_URL"),
+        os.environ.get("JOBS_SQLITE_PATH"),
+    ]
+
+    for value in candidates:
+        if not value:
+            continue
+
+        value = value.strip()
+        if value.startswith("postgres://"):
+            # SQLAlchemy expects postgresql://
+            return value.replace("postgres://", "postgresql://", 1)
+
+        if value.startswith(("postgresql://", "mysql://", "mariadb://", "sqlite://")):
+            return value
+
+        # Treat anything else as a filesystem path to a SQLite DB
+        return normalize_sqlite_path(value)
+
+    # Fall back to bundled SQLite file
+    return normalize_sqlite_path(DEFAULT_SQLITE_PATH)
+
+
+def column_exists(engine, table_name: str, column_name: str) -> bool:
+    """Check if a given column exists on the specified table."""
+    inspector = inspect(engine)
+    columns = inspector.get_columns(table_name)
+    return any(col["name"] == column_name for col in columns)
+
+
+def migrate(database_url: str = None) -> bool:
+    """Add `superseded_by_id` to trello_outbox and index it."""
+    db_url = infer_database_url(database_url)
+    print(f"Connecting to database: {db_url}")
+
+    engine = create_engine(db_url)
+    table = "trello_outbox"
+    column = "superseded_by_id"
+    index = "ix_trello_outbox_superseded_by_id"
+
+    try:
+        if not inspect(engine).has_table(table):
+            print(f"✗ Table '{table}' does not exist.")
+            print("  Run migrations/rename_outbox_to_trello_and_add_procore_outbox.py first.")
+            return False
+
+        if column_exists(engine, table, column):
+            print(f"✓ Column '{column}' already exists on '{table}'. Skipping add.")
+        else:
+            print(f"Adding column '{column}' (INTEGER, nullable, FK {table}.id) to '{table}'...")
+            with engine.begin() as conn:
+                conn.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER REFERENCES {table}(id)")
+                )
+            print(f"✓ Added column '{column}'.")
+
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({column})"))
+        print(f"✓ Index '{index}' in place.")
+
+        return True
+
+    except (OperationalError, ProgrammingError) as exc:
+        print(f"✗ Database error during migration: {exc}")
+        return False
+    except Exception as exc:  # pragma: no cover - defensive logging
+        print(f"✗ Unexpected error: {exc}")
+        return False
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Add superseded_by_id column (and index) to trello_outbox."
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Override database URL (otherwise inferred from env or defaults).",
+    )
+    args = parser.parse_args()
+
+    success = migrate(args.database_url)
+    sys.exit(0 if success else 1)
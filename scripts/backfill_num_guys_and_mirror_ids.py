@@ -30,32 +30,37 @@ from app.config import Config as cfg
 from app.models import Releases, db
 from app.trello.api import (
     parse_num_guys_from_description,
-    get_card_attachments_by_card_id,
-    get_trello_card_by_id,
-    _mirror_short_link_from_attachments,
+    get_trello_cards_by_ids,
+    resolve_mirror_short_links,
 )
 
 
-def resolve_mirror_card_id(primary_card_id):
-    """Return the mirror card's full id for a primary card, or None.
+def resolve_mirror_card_ids(primary_card_ids):
+    """Return {primary card id: mirror card's full id} for the primaries that have one.
+
+    Attachments and mirror cards are both read in /batch calls of ten, so a full
+    backfill costs about a fifth of the old two-GETs-per-release.
 
     Rejects a "Linked card" attachment that points to a card on a different board —
     shortLinks are global, so a stray/cross-board link would otherwise resolve to the
     wrong card. The idBoard rides along in the card fetch we already make (no extra call).
     """
-    result = get_card_attachments_by_card_id(primary_card_id)
-    if not result.get("success"):
-        return None
-    short_link = _mirror_short_link_from_attachments(result.get("attachments"))
-    if not short_link:
-        return None
-    mirror = get_trello_card_by_id(short_link)
-    if not mirror:
-        return None
-    if mirror.get("idBoard") != cfg.TRELLO_BOARD_ID:
-        print(f"  ! skipping cross-board linked card {mirror.get('id')} (board {mirror.get('idBoard')})")
-        return None
-    return mirror.get("id")
+    short_links = {
+        card_id: short_link
+        for card_id, short_link in resolve_mirror_short_links(primary_card_ids).items()
+        if short_link
+    }
+    mirrors = get_trello_cards_by_ids(sorted(set(short_links.values()))) if short_links else {}
+    resolved = {}
+    for card_id, short_link in short_links.items():
+        mirror = mirrors.get(short_link)
+        if not mirror:
+            continue
+        if mirror.get("board_id") != cfg.TRELLO_BOARD_ID:
+            print(f"  ! skipping cross-board linked card {mirror.get('id')} (board {mirror.get('board_id')})")
+            continue
+        resolved[card_id] = mirror.get("id")
+    return resolved
 
 
 def run(apply: bool):
@@ -70,6 +75,14 @@ def run(apply: bool):
         mirror_updates = 0
         errors = 0
 
+        needs_mirror = [r.trello_card_id for r in releases if r.trello_card_id and not r.mirror_trello_card_id]
+        try:
+            mirror_ids = resolve_mirror_card_ids(needs_mirror)
+        except Exception as e:
+            print(f"  ! mirror lookup failed: {e}", file=sys.stderr)
+            mirror_ids = {}
+            errors += 1
+
         for rec in releases:
             tag = f"{rec.job}-{rec.release}"
 
@@ -83,15 +96,11 @@ def run(apply: bool):
 
             # mirror_trello_card_id from the "Linked card" attachment
             if rec.trello_card_id and not rec.mirror_trello_card_id:
-                try:
-                    mirror_id = resolve_mirror_card_id(rec.trello_card_id)
-                    if mirror_id:
-                        print(f"  mirror {tag}: -> {mirror_id}")
-                        rec.mirror_trello_card_id = mirror_id
-                        mirror_updates += 1
-                except Exception as e:
-                    print(f"  ! mirror lookup failed for {tag}: {e}", file=sys.stderr)
-                    errors += 1
+                mirror_id = mirror_ids.get(rec.trello_card_id)
+                if mirror_id:
+                    print(f"  mirror {tag}: -> {mirror_id}")
+                    rec.mirror_trello_card_id = mirror_id
+                    mirror_updates += 1
 
         print(
             f"\nActive releases scanned: {len(releases)} | "
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Benchmark the job-log row serialization + JSON encoding path on N releases.
+
+Builds an in-memory SQLite app (TESTING=1), seeds N synthetic releases, loads
+them once, and then times `_serialize_job_rows` + response encoding — the part
+of /brain/jobs and /brain/get-all-jobs that scales with row count — in three
+modes:
+
+  legacy   per-row serialize_value + json.dumps validation, stdlib encoder
+           (the pre-cache path)
+  cold     row cache empty, orjson provider
+  warm     row cache populated (steady-state polling / reloads), orjson provider
+
+Prints best / median wall time and tracemalloc peak per mode.
+
+Does NOT touch a real DB.
+
+Examples:
+  python scripts/bench_job_serialization.py
+  python scripts/bench_job_serialization.py --releases 10000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# In-memory SQLite, no background workers (see tests/conftest.py).
+os.environ.setdefault("TESTING", "1")
+
+_STAGES = ["Released", "Cut Start", "Fitup Complete", "Weld Complete", "Paint Complete",
+           "Ship Complete", "Install Complete", "Complete", "Hold"]
+
+
+class _LegacyRows:
+    """Pre-cache behavior: serialize every row, then json.dumps it to validate."""
+
+    def get_or_build(self, release, build):
+        row = build(release)
+        json.dumps(row)
+        return row
+
+
+def seed(n: int, seed_value: int) -> None:
+    from app.models import Releases, db
+
+    rng = random.Random(seed_value)
+    base = datetime(2026, 1, 1, 8, 0, 0)
+    db.session.add_all([
+        Releases(
+            job=100 + i // 5,
+            release=str(i % 5 + 1),
+            job_name=f"Job {100 + i // 5}",
+            description=f"Miscellaneous steel package {i}",
+            fab_hrs=float(rng.randint(4, 200)),
+            install_hrs=float(rng.randint(0, 120)),
+            paint_color=rng.choice(["Gray", "Black", "Galv", None]),
+            pm=rng.choice(["JD", "MK", "RS"]),
+            by=rng.choice(["AB", "CD"]),
+            released=date(2025, 6, 1) + timedelta(days=i % 300),
+            fab_order=float(rng.randint(1, n // 4 or 1)),
+            stage=rng.choice(_STAGES),
+            stage_group="FABRICATION",
+            start_install=date(2026, 5, 1) + timedelta(days=i % 90),
+            start_install_formulaTF=True,
+            num_guys=rng.choice([None, 2.0, 3.0]),
+            notes=rng.choice([None, "Waiting on GC", "Field verify dims"]),
+            last_updated_at=base + timedelta(seconds=i),
+            source_of_update="Brain",
+            is_active=True,
+            is_archived=False,
+        )
+        for i in range(n)
+    ])
+    db.session.commit()
+
+
+def _measure(fn, repeat: int) -> tuple[list[float], int]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    # Peak memory from one extra traced run (tracemalloc slows the timed path).
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return samples, peak
+
+
+def run(n: int, repeat: int, seed_value: int) -> int:
+    from flask.json.provider import DefaultJSONProvider
+
+    from app import create_app
+    from app.brain.job_log import routes
+    from app.brain.job_log.row_cache import release_row_cache
+    from app.json_provider import OrjsonProvider
+    from app.models import Releases, db
+
+    app = create_app()
+    with app.app_context(), app.test_request_context("/brain/jobs"):
+        db.create_all()
+        seed(n, seed_value)
+        jobs = Releases.query.order_by(Releases.id).all()
+        routes._serialize_job_rows(jobs)  # build the scheduling snapshot once
+
+        stdlib = DefaultJSONProvider(app)
+        fast = OrjsonProvider(app)
+        cache = routes.release_row_cache
+
+        def encode(provider):
+            job_list, _, generation = routes._serialize_job_rows(jobs)
+            provider.response({"jobs": job_list, "scheduling_generation": generation})
+
+        def legacy():
+            routes.release_row_cache = _LegacyRows()
+            try:
+                encode(stdlib)
+            finally:
+                routes.release_row_cache = cache
+
+        def cold():
+            release_row_cache.clear()
+            encode(fast)
+
+        def warm():
+            encode(fast)
+
+        print("=" * 60)
+        print(f"job-log serialization  releases={n}  repeat={repeat}")
+        for label, fn in (("legacy", legacy), ("cold", cold), ("warm", warm)):
+            fn()  # warm-up (also fills the cache for "warm")
+            samples, peak = _measure(fn, repeat)
+            print(f"{label:>6}: best {min(samples) * 1000:8.1f} ms   "
+                  f"median {statistics.median(samples) * 1000:8.1f} ms   "
+                  f"peak {peak / 1e6:7.1f} MB")
+        print(f"row cache: {release_row_cache.stats()}")
+        print("=" * 60)
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--releases", type=int, default=5000, help="Synthetic release count (default 5000)")
+    ap.add_argument("--repeat", type=int, default=5, help="Timed runs after warm-up (default 5)")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+    return run(args.releases, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
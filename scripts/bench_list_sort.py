@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Count Trello position PUTs per Fab Order drag: full rewrite vs. minimal-move sort.
+
+Pure in-memory: builds a sorted list of --cards cards at Trello's default
+spacing, then applies --drags random single-card Fab Order edits (a drag in the
+job log). After each edit it plans the sort with plan_fab_order_positions,
+applies the planned positions, and tallies the PUTs. The old sort rewrote every
+card's pos, so a drag cost len(list) PUTs. Prints the per-drag average for
+both, the API calls saved, and how often gaps ran out and forced a renumber.
+
+Does NOT touch Trello or the DB.
+
+Examples:
+  python scripts/bench_list_sort.py
+  python scripts/bench_list_sort.py --cards 120 --drags 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+
+def run(n_cards: int, drags: int, seed: int) -> dict:
+    from app.trello.utils import POSITION_STEP, plan_fab_order_positions
+
+    rng = random.Random(seed)
+    cards = [
+        {"card_id": f"c{i}", "fab_order": float(i + 1), "current_pos": float(POSITION_STEP * (i + 1))}
+        for i in range(n_cards)
+    ]
+    puts = []
+    renumbers = 0
+    for _ in range(drags):
+        card = rng.choice(cards)
+        # Drop the card between two neighbours' fab orders, like a drag in the job log.
+        card["fab_order"] = rng.uniform(0, n_cards + 1)
+        moves, renormalized = plan_fab_order_positions(cards)
+        by_id = {c["card_id"]: c for c in cards}
+        for card_id, pos in moves:
+            by_id[card_id]["current_pos"] = pos
+        puts.append(len(moves))
+        renumbers += int(renormalized)
+    return {
+        "full_rewrite_puts": n_cards,
+        "mean_puts": statistics.mean(puts),
+        "median_puts": statistics.median(puts),
+        "max_puts": max(puts),
+        "renumbers": renumbers,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=60, help="cards on the list (default 60)")
+    parser.add_argument("--drags", type=int, default=1000, help="single-card edits to simulate (default 1000)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    result = run(args.cards, args.drags, args.seed)
+    saved = result["full_rewrite_puts"] - result["mean_puts"]
+    print(f"cards={args.cards} drags={args.drags}")
+    print(f"  full rewrite : {result['full_rewrite_puts']} PUTs / drag")
+    print(
+        f"  minimal move : {result['mean_puts']:.2f} mean, {result['median_puts']} median, "
+        f"{result['max_puts']} max PUTs / drag"
+    )
+    print(f"  saved        : {saved:.2f} PUTs / drag ({100 * saved / result['full_rewrite_puts']:.1f}%)")
+    print(f"  renumbers    : {result['renumbers']} of {args.drags} drags")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
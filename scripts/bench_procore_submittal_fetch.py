@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Time a multi-project Procore submittal fetch: serial pages vs. the fetch pool.
+
+Simulated: ProcoreAPI.get_submittals runs against a fake session that sleeps
+--latency-ms per call and serves --submittals rows per project in pages of 100.
+The same --projects are fetched once with workers=1 (one page after another,
+the old behaviour) and once with --workers threads for both the projects and
+their pages. The shared rate budget is set high enough not to throttle, so the
+numbers show the latency hidden by overlapping calls, not the rate cap.
+
+Does NOT touch Procore or the DB.
+
+Examples:
+  python scripts/bench_procore_submittal_fetch.py
+  python scripts/bench_procore_submittal_fetch.py --projects 12 --submittals 450 --latency-ms 250 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+PER_PAGE = 100
+
+
+def _fake_request(total: int, latency: float, calls: list):
+    def request(method, url, params=None, **kwargs):
+        time.sleep(latency)
+        calls.append(params["page"])
+        start = (params["page"] - 1) * PER_PAGE
+        rows = [{"id": i} for i in range(start, min(start + PER_PAGE, total))]
+        response = Mock(status_code=200, headers={}, text="x")
+        response.json.return_value = {"data": rows, "total": total, "per_page": PER_PAGE, "page": params["page"]}
+        return response
+    return request
+
+
+def run(projects: int, submittals: int, latency_ms: float, workers: int) -> dict:
+    from app.procore import api as procore_api
+    from app.procore.api import ProcoreAPI
+    from app.procore.fetch import fan_out
+    from app.rate_limit import TokenBucket
+
+    latency = latency_ms / 1000.0
+    timings = {}
+    with patch.object(procore_api, "get_access_token", return_value="bench"), \
+         patch.object(procore_api, "_budget", TokenBucket(10_000, 10_000)):
+        client = ProcoreAPI("bench", "bench", "https://example.invalid/webhook")
+        for label, n in (("serial", 1), ("pooled", workers)):
+            calls = []
+            with patch.object(client.session, "request", side_effect=_fake_request(submittals, latency, calls)):
+                started = time.perf_counter()
+                results = fan_out(
+                    lambda pid: client.get_submittals(pid, workers=n),
+                    range(projects),
+                    workers=n,
+                )
+                elapsed = time.perf_counter() - started
+            assert all(error is None and len(rows) == submittals for rows, error in results)
+            timings[label] = {"seconds": elapsed, "calls": len(calls)}
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=8, help="projects to fetch (default 8)")
+    parser.add_argument("--submittals", type=int, default=350, help="submittals per project (default 350)")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="simulated round trip per call (default 150)")
+    parser.add_argument("--workers", type=int, default=6, help="pool size for the pooled run (default 6)")
+    args = parser.parse_args()
+
+    result = run(args.projects, args.submittals, args.latency_ms, args.workers)
+    serial, pooled = result["serial"], result["pooled"]
+    print(
+        f"projects={args.projects} submittals/project={args.submittals} "
+        f"latency={args.latency_ms:.0f}ms workers={args.workers}"
+    )
+    print(f"  serial : {serial['seconds']:.2f}s for {serial['calls']} calls")
+    print(f"  pooled : {pooled['seconds']:.2f}s for {pooled['calls']} calls")
+    print(f"  speedup: {serial['seconds'] / pooled['seconds']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark the job-log scheduling pass on a synthetic release set.
+
+Pure in-memory: builds N fake releases (stage mix skewed toward completed work,
+like the real table with archived rows included), runs
+calculate_all_job_scheduling once as a warm-up and then --repeat times, and
+prints the best / median wall time, then the same for the columnar engine
+(compute_scheduling) without the dict API on top. With --compare it also times the legacy
+per-release calculate_hours_in_front rescan (O(n²)) on the same data.
+
+Does NOT touch the DB.
+
+Examples:
+  python scripts/bench_scheduling.py
+  python scripts/bench_scheduling.py --releases 10000 --repeat 5
+  python scripts/bench_scheduling.py --releases 2000 --compare
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# Roughly the live distribution: most rows are shipped/installed/complete (0
+# remaining fab hours), a working set sits in fab stages, a few are on Hold.
+_STAGE_WEIGHTS = [
+    ("Complete", 40),
+    ("Install Complete", 15),
+    ("Ship Complete", 10),
+    ("Paint Complete", 5),
+    ("Released", 12),
+    ("Cut Start", 5),
+    ("Fitup Complete", 4),
+    ("Weld Complete", 4),
+    ("Hold", 5),
+]
+
+DEFAULT_FAB_ORDER = 80.555
+
+
+def build_jobs(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    stages = [s for s, _ in _STAGE_WEIGHTS]
+    weights = [w for _, w in _STAGE_WEIGHTS]
+    jobs = []
+    for _ in range(n):
+        roll = rng.random()
+        if roll < 0.15:
+            fab_order = None
+        elif roll < 0.35:
+            fab_order = DEFAULT_FAB_ORDER
+        else:
+            fab_order = float(rng.randint(1, max(1, n // 4)))
+        jobs.append({
+            "fab_hrs": float(rng.randint(4, 200)),
+            "install_hrs": float(rng.randint(0, 120)),
+            "fab_order": fab_order,
+            "stage": rng.choices(stages, weights)[0],
+            "num_guys": rng.choice([None, 2.0, 3.0, 4.0]),
+            "is_hard_date": rng.random() < 0.05,
+        })
+    return jobs
+
+
+def _time(fn, repeat: int) -> list[float]:
+    fn()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def run(n: int, repeat: int, seed: int, compare: bool) -> int:
+    from app.brain.job_log.scheduling.calculator import (
+        calculate_all_job_scheduling,
+        calculate_hours_in_front,
+        calculate_remaining_fab_hours,
+    )
+    from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+    jobs = build_jobs(n, seed)
+    ref = date(2026, 4, 1)
+
+    samples = _time(lambda: calculate_all_job_scheduling(jobs, ref), repeat)
+    print("=" * 60)
+    print(f"calculate_all_job_scheduling  releases={n}  repeat={repeat}")
+    print(f"  best:   {min(samples) * 1000:8.1f} ms")
+    print(f"  median: {statistics.median(samples) * 1000:8.1f} ms")
+
+    columns = SchedulingColumns.from_jobs(jobs)
+    columnar_samples = _time(lambda: compute_scheduling(columns, ref), repeat)
+    print(f"compute_scheduling (columnar, no per-release dicts)")
+    print(f"  best:   {min(columnar_samples) * 1000:8.1f} ms")
+    print(f"  median: {statistics.median(columnar_samples) * 1000:8.1f} ms")
+
+    if compare:
+        queue = [
+            {**j, "remaining_fab_hours": calculate_remaining_fab_hours(j["fab_hrs"], j["stage"])}
+            for j in jobs
+        ]
+
+        def legacy():
+            for i, j in enumerate(queue):
+                calculate_hours_in_front(j["fab_order"], queue, i)
+
+        legacy_samples = _time(legacy, 1)
+        print(f"legacy per-release hours_in_front rescan (O(n²))")
+        print(f"  time:   {legacy_samples[0] * 1000:8.1f} ms")
+    print("=" * 60)
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--releases", type=int, default=10000, help="Synthetic release count (default 10000)")
+    ap.add_argument("--repeat", type=int, default=5, help="Timed runs after warm-up (default 5)")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--compare", action="store_true", help="Also time the legacy O(n²) hours_in_front loop")
+    args = ap.parse_args()
+    return run(args.releases, args.repeat, args.seed, args.compare)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""Tests for POST /brain/update-stage/bulk (BulkUpdateStageCommand).
+
+Locks in:
+  - every item runs the single-move workflow (stage_group, fab_order tier) and reports a result
+  - one commit and one FABRICATION scheduling recalc per batch
+  - one move_card outbox row per card, all tagged with the batch id; a release listed twice moves once
+  - a failing item rolls back alone and is reported; the rest still apply
+  - bulk moves queue their destination list for one sort per outbox pass
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.models import Releases, ReleaseEvents, TrelloOutbox, db
+from tests.conftest import make_release
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(admin_session):
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _trello_lists():
+    with patch("app.brain.job_log.routes.get_list_id_by_stage", return_value="list-ship"):
+        yield
+
+
+@pytest.fixture
+def recalc():
+    with patch("app.brain.job_log.scheduling.service.recalculate_all_jobs_scheduling") as mock:
+        yield mock
+
+
+def _post(client, items):
+    return client.post("/brain/update-stage/bulk", json={"items": items})
+
+
+def _seed(n):
+    for i in range(1, n + 1):
+        make_release(i, "A", stage="Paint Complete", stage_group="READY_TO_SHIP", fab_order=2,
+                     trello_card_id=f"card-{i}", trello_list_name="Paint complete")
+    db.session.commit()
+
+
+class TestBulkStage:
+    def test_moves_every_item_with_one_recalc(self, app, admin_client, recalc):
+        with app.app_context():
+            _seed(3)
+            resp = _post(admin_client, [{"job": i, "release": "A", "stage": "Ship Complete"} for i in (1, 2, 3)])
+            body = resp.get_json()
+            assert resp.status_code == 200
+            assert body["applied"] == 3 and body["failed"] == 0
+            assert [r["status"] for r in body["results"]] == ["success"] * 3
+            assert all(r["fab_order"] == 1 for r in body["results"])
+            recalc.assert_called_once_with(stage_group="FABRICATION")
+
+            rows = Releases.query.order_by(Releases.job).all()
+            assert [(r.stage, r.fab_order) for r in rows] == [("Ship Complete", 1)] * 3
+
+            outbox = TrelloOutbox.query.all()
+            assert len(outbox) == 3
+            assert {o.event.payload["batch_id"] for o in outbox} == {body["batch_id"]}
+
+    def test_repeated_release_moves_once(self, app, admin_client, recalc):
+        with app.app_context():
+            _seed(1)
+            body = _post(admin_client, [
+                {"job": 1, "release": "A", "stage": "Ship Planning"},
+                {"job": 1, "release": "A", "stage": "Ship Complete"},
+            ]).get_json()
+            assert [r["status"] for r in body["results"]] == ["superseded", "success"]
+            assert TrelloOutbox.query.count() == 1
+            assert db.session.get(Releases, 1).stage == "Ship Complete"
+
+    def test_failed_item_is_reported_and_isolated(self, app, admin_client, recalc):
+        with app.app_context():
+            _seed(2)
+            body = _post(admin_client, [
+                {"job": 1, "release": "A", "stage": "Ship Complete"},
+                {"job": 99, "release": "Z", "stage": "Ship Complete"},
+                {"job": 2, "release": "A", "stage": "Ship Complete"},
+            ]).get_json()
+            assert body["applied"] == 2 and body["failed"] == 1
+            assert body["results"][1]["code"] == "not_found"
+            assert ReleaseEvents.query.filter_by(action="update_stage").count() == 2
+
+    def test_item_error_mid_command_rolls_back_only_that_item(self, app, admin_client, recalc):
+        with app.app_context():
+            _seed(2)
+            # The command swallows outbox errors, so fail the stage-group lookup instead.
+            with patch("app.api.helpers.get_stage_group_from_stage",
+                       side_effect=[RuntimeError("boom"), "READY_TO_SHIP"]):
+                body = _post(admin_client, [
+                    {"job": 1, "release": "A", "stage": "Ship Complete"},
+                    {"job": 2, "release": "A", "stage": "Ship Complete"},
+                ]).get_json()
+            assert [r["status"] for r in body["results"]] == ["error", "success"]
+            assert db.session.get(Releases, 1).stage == "Paint Complete"
+            assert db.session.get(Releases, 2).stage == "Ship Complete"
+            assert ReleaseEvents.query.filter_by(job=1, action="update_stage").count() == 0
+
+    def test_malformed_body_is_400(self, app, admin_client):
+        with app.app_context():
+            assert _post(admin_client, []).status_code == 400
+            assert _post(admin_client, [{"job": "x", "release": "A", "stage": "Hold"}]).status_code == 400
+            assert admin_client.post("/brain/update-stage/bulk", json={}).status_code == 400
+
+
+class TestBatchListSort:
+    def test_batch_moves_sort_each_destination_list_once(self, app, admin_client, recalc):
+        from app.services.outbox_service import OutboxService
+
+        with app.app_context():
+            _seed(3)
+            _post(admin_client, [{"job": i, "release": "A", "stage": "Ship Complete"} for i in (1, 2, 3)])
+            with patch("app.trello.api.update_trello_card") as move, \
+                 patch("app.trello.utils.sort_list_if_needed") as sort, \
+                 patch("app.config.Config.FAB_ORDER_FIELD_ID", "field-1"):
+                assert OutboxService.process_pending_items(limit=10) == 3
+            assert move.call_count == 3
+            sort.assert_called_once_with("list-ship", "field-1", None, "batch")
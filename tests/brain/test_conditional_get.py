@@ -0,0 +1,168 @@
+"""Tests for weak-ETag / 304 support on the polled reads (app/http_cache.py).
+
+Locks in:
+  - /brain/jobs, /brain/drafting-work-load and /brain/projects tag 200s with a weak ETag
+    and answer a matching If-None-Match with a bodiless 304 without running the view
+  - a release edit, insert or an unstamped ORM write moves the ETag, even when a
+    SAVEPOINT inside the writing transaction rolls back
+  - the generation behind unstamped writes is a model_generations row, so every worker
+    computes the same ETag; untracked models never touch it
+  - the query string is part of the ETag
+  - tagged /brain responses are private, no-cache
+"""
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.models import Projects, Submittals, db
+from tests.conftest import make_release
+
+T0 = datetime(2026, 3, 1, 8, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(admin_session):
+    yield
+
+
+def _revalidate(client, path, etag, **params):
+    return client.get(path, query_string=params, headers={"If-None-Match": etag})
+
+
+class TestJobs:
+    def test_matching_etag_is_304_without_query(self, app, admin_client):
+        with app.app_context():
+            make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            first = admin_client.get("/brain/jobs")
+            etag = first.headers["ETag"]
+            assert first.status_code == 200 and etag.startswith('W/"')
+            assert first.headers["Cache-Control"] == "private, no-cache"
+
+            with patch("app.brain.job_log.routes._jobs_payload") as payload:
+                second = _revalidate(admin_client, "/brain/jobs", etag)
+            assert second.status_code == 304
+            assert second.data == b""
+            assert second.headers["ETag"] == etag
+            payload.assert_not_called()
+
+    def test_release_edit_moves_etag(self, app, admin_client):
+        with app.app_context():
+            rel = make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            etag = admin_client.get("/brain/jobs").headers["ETag"]
+            rel.notes = "Field verify"
+            rel.last_updated_at = datetime(2026, 3, 1, 9, 0, 0)
+            db.session.commit()
+            resp = _revalidate(admin_client, "/brain/jobs", etag)
+            assert resp.status_code == 200
+            assert resp.headers["ETag"] != etag
+            assert resp.get_json()["jobs"][0]["Notes"] == "Field verify"
+
+    def test_unstamped_write_moves_etag(self, app, admin_client):
+        with app.app_context():
+            rel = make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            etag = admin_client.get("/brain/jobs").headers["ETag"]
+            rel.viewer_url = "https://app.procore.com/projects/77/submittals/1"
+            db.session.commit()
+            assert _revalidate(admin_client, "/brain/jobs", etag).status_code == 200
+
+    def test_rolled_back_savepoint_keeps_pending_write(self, app, admin_client):
+        with app.app_context():
+            rel = make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            etag = admin_client.get("/brain/jobs").headers["ETag"]
+            rel.viewer_url = "https://app.procore.com/projects/77/submittals/1"
+            db.session.flush()
+            db.session.begin_nested().rollback()  # e.g. a deduplicated event
+            db.session.commit()
+            assert _revalidate(admin_client, "/brain/jobs", etag).status_code == 200
+
+    def test_generation_is_shared_state(self, app, admin_client):
+        from sqlalchemy import update
+        from app.models import ModelGeneration
+
+        with app.app_context():
+            rel = make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            rel.viewer_url = "https://app.procore.com/projects/77/submittals/1"
+            db.session.commit()
+            assert db.session.get(ModelGeneration, "Releases").generation >= 1
+            etag = admin_client.get("/brain/jobs").headers["ETag"]
+            assert _revalidate(admin_client, "/brain/jobs", etag).status_code == 304
+
+            # An unstamped write committed by another worker only shows up in the row.
+            with db.engine.begin() as conn:
+                conn.execute(
+                    update(ModelGeneration)
+                    .where(ModelGeneration.name == "Releases")
+                    .values(generation=ModelGeneration.generation + 1)
+                )
+            assert _revalidate(admin_client, "/brain/jobs", etag).status_code == 200
+
+    def test_untracked_writes_leave_generations_alone(self, app):
+        from app.models import ModelGeneration, User
+
+        with app.app_context():
+            before = {row.name: row.generation for row in ModelGeneration.query.all()}
+            db.session.add(User(username="etag-probe", password_hash="x"))
+            db.session.commit()
+            assert {row.name: row.generation for row in ModelGeneration.query.all()} == before
+
+    def test_query_string_is_part_of_etag(self, app, admin_client):
+        with app.app_context():
+            make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            etag = admin_client.get("/brain/jobs").headers["ETag"]
+            resp = _revalidate(admin_client, "/brain/jobs", etag, since=T0.isoformat())
+            assert resp.status_code == 200
+
+    def test_version_failure_serves_untagged_200(self, app, admin_client):
+        with app.app_context():
+            make_release(1, "A", last_updated_at=T0)
+            db.session.commit()
+            with patch("app.brain.job_log.routes.table_versions", side_effect=RuntimeError("boom")):
+                resp = admin_client.get("/brain/jobs", headers={"If-None-Match": '*'})
+            assert resp.status_code == 200
+            assert "ETag" not in resp.headers
+
+
+class TestDraftingWorkLoad:
+    def test_304_then_200_after_submittal_update(self, app, admin_client):
+        with app.app_context():
+            sub = Submittals(submittal_id="S1", project_number="290", title="Anchor bolts",
+                             status="Open", last_updated=T0)
+            db.session.add(sub)
+            db.session.commit()
+            etag = admin_client.get("/brain/drafting-work-load").headers["ETag"]
+            assert _revalidate(admin_client, "/brain/drafting-work-load", etag).status_code == 304
+
+            sub.notes = "Waiting on GC"
+            sub.last_updated = datetime(2026, 3, 2)
+            db.session.commit()
+            resp = _revalidate(admin_client, "/brain/drafting-work-load", etag)
+            assert resp.status_code == 200
+            assert resp.get_json()["submittals"][0]["notes"] == "Waiting on GC"
+
+    def test_tab_is_part_of_etag(self, app, admin_client):
+        with app.app_context():
+            etag = admin_client.get("/brain/drafting-work-load").headers["ETag"]
+            resp = _revalidate(admin_client, "/brain/drafting-work-load", etag, tab="draft")
+            assert resp.status_code == 200
+
+
+class TestProjects:
+    def test_304_then_200_after_new_project(self, app, admin_client):
+        with app.app_context():
+            db.session.add(Projects(job_number="290", name="Alta"))
+            db.session.commit()
+            etag = admin_client.get("/brain/projects").headers["ETag"]
+            assert _revalidate(admin_client, "/brain/projects", etag).status_code == 304
+
+            db.session.add(Projects(job_number="291", name="Metro"))
+            db.session.commit()
+            resp = _revalidate(admin_client, "/brain/projects", etag)
+            assert resp.status_code == 200
+            assert len(resp.get_json()["projects"]) == 2
@@ -0,0 +1,139 @@
+"""Tests for keyset pagination on /brain/get-all-jobs.
+
+Locks in:
+  - following next_cursor visits every row exactly once, in (id) or (last_updated_at, id) order,
+    including rows whose last_updated_at is NULL
+  - the total is counted on page 1 and carried in the cursor; has_more is exact
+  - a tampered cursor, or one reused with a different order/archived filter, is a 400
+  - legacy page=N (no cursor) still works
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.brain.job_log.pagination import decode_cursor, encode_cursor
+from app.models import db
+from tests.conftest import make_release
+
+T0 = datetime(2026, 3, 1, 8, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(admin_session):
+    yield
+
+
+def _seed():
+    # Ids ascend 1..7; last_updated_at deliberately out of id order, with ties and NULLs.
+    stamps = [T0 + timedelta(minutes=5), T0, None, T0, T0 + timedelta(minutes=1), None, T0]
+    for i, stamp in enumerate(stamps, start=1):
+        make_release(i, "A", last_updated_at=stamp)
+    make_release(8, "A", is_archived=True, last_updated_at=T0)
+    db.session.commit()
+
+
+def _walk(client, **params):
+    pages, ids, cursor = [], [], None
+    while True:
+        query = dict(params)
+        if cursor:
+            query["cursor"] = cursor
+        body = client.get("/brain/get-all-jobs", query_string=query).get_json()
+        pages.append(body["pagination"])
+        ids += [j["Job #"] for j in body["jobs"]]
+        cursor = body["pagination"]["next_cursor"]
+        if not body["pagination"]["has_more"]:
+            assert cursor is None
+            return pages, ids
+
+
+class TestKeysetPaging:
+    def test_id_order_visits_every_row_once(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            pages, ids = _walk(admin_client, per_page=3)
+            assert ids == [1, 2, 3, 4, 5, 6, 7]
+            assert [p["page"] for p in pages] == [1, 2, 3]
+            assert all(p["total_count"] == 7 for p in pages)
+
+    def test_updated_order_walks_index_then_nulls(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            pages, ids = _walk(admin_client, per_page=2, order="updated")
+            # (T0: 2, 4, 7), (T0+1m: 5), (T0+5m: 1), then NULLs by id (3, 6).
+            assert ids == [2, 4, 7, 5, 1, 3, 6]
+            assert len(pages) == 4
+
+    def test_exact_fit_page_reports_no_more(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            body = admin_client.get("/brain/get-all-jobs", query_string={"per_page": 7}).get_json()
+            assert body["pagination"]["has_more"] is False
+            assert body["pagination"]["next_cursor"] is None
+
+    def test_archived_filter_is_carried(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            _, ids = _walk(admin_client, per_page=1, archived="true")
+            assert ids == [8]
+
+    def test_later_pages_do_not_recount(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            first = admin_client.get("/brain/get-all-jobs", query_string={"per_page": 3}).get_json()
+            make_release(9, "A", last_updated_at=T0)
+            db.session.commit()
+            second = admin_client.get(
+                "/brain/get-all-jobs",
+                query_string={"per_page": 10, "cursor": first["pagination"]["next_cursor"]},
+            ).get_json()
+            assert second["pagination"]["total_count"] == 7
+            # The row inserted mid-walk is still reached by the keyset walk.
+            assert [j["Job #"] for j in second["jobs"]] == [4, 5, 6, 7, 9]
+
+    def test_count_cache_refreshes_on_insert(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            assert admin_client.get("/brain/get-all-jobs").get_json()["pagination"]["total_count"] == 7
+            make_release(9, "A", last_updated_at=T0)
+            db.session.commit()
+            assert admin_client.get("/brain/get-all-jobs").get_json()["pagination"]["total_count"] == 8
+
+
+class TestCursorValidation:
+    def test_garbage_cursor_is_400(self, app, admin_client):
+        with app.app_context():
+            resp = admin_client.get("/brain/get-all-jobs", query_string={"cursor": "not-a-cursor"})
+            assert resp.status_code == 400
+
+    def test_cursor_reused_with_other_order_is_400(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            cursor = admin_client.get(
+                "/brain/get-all-jobs", query_string={"per_page": 2}
+            ).get_json()["pagination"]["next_cursor"]
+            resp = admin_client.get(
+                "/brain/get-all-jobs", query_string={"per_page": 2, "cursor": cursor, "order": "updated"}
+            )
+            assert resp.status_code == 400
+
+    def test_unknown_order_is_400(self, app, admin_client):
+        with app.app_context():
+            resp = admin_client.get("/brain/get-all-jobs", query_string={"order": "name"})
+            assert resp.status_code == 400
+
+    def test_round_trip(self, app):
+        with app.app_context():
+            rel = make_release(1, "A", last_updated_at=T0)
+            token = encode_cursor("updated", False, rel, 2, 40)
+            assert decode_cursor(token, "updated", False) == {"key": [T0, rel.id], "page": 2, "total": 40}
+
+
+class TestLegacyOffset:
+    def test_page_param_without_cursor(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            body = admin_client.get("/brain/get-all-jobs", query_string={"per_page": 3, "page": 3}).get_json()
+            assert [j["Job #"] for j in body["jobs"]] == [7]
+            assert body["pagination"]["page"] == 3
+            assert body["pagination"]["has_more"] is False
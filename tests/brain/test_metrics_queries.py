@@ -13,7 +13,7 @@ from app.models import (
     db, AiUsage,
     CarmenChatConversation, CarmenChatMessage, CarmenDrawingReview, CarmenReviewFeedback,
     ReleasePhoto, BoardActivity, ReleaseEvents,
-    Meeting, ChecklistItem, Notification, TrelloOutbox,
+    Meeting, ChecklistItem, Notification, TrelloOutbox, ProcoreOutbox,
     SyncOperation, SyncStatus, WebhookReceipt,
 )
 from app.brain.metrics import queries
@@ -330,6 +330,25 @@ def test_system_delivery_and_freshness(app):
     assert sysm["freshness"]["last_webhook_age_minutes"] == pytest.approx(5, abs=2)
 
 
+def test_system_outbox_dispatch_lag_and_retries(app):
+    for i, (lag, retries) in enumerate([(2, 0), (4, 0), (60, 3)]):
+        done = NOW() - timedelta(minutes=10)
+        db.session.add(ProcoreOutbox(submittal_id=str(i), project_id=1, action="update_status",
+                                     status="completed", retry_count=retries,
+                                     created_at=done - timedelta(seconds=lag), completed_at=done))
+    db.session.add(ProcoreOutbox(submittal_id="9", project_id=1, action="update_status",
+                                 status="failed", retry_count=5, created_at=NOW()))
+    db.session.commit()
+
+    start, end = _window()
+    dispatch = queries.system(start, end)["outbox_dispatch"]["procore"]
+    assert dispatch["delivered"] == 3
+    assert dispatch["throughput_per_hour"] > 0
+    assert dispatch["lag_seconds"] == {"p50": 4.0, "p95": 60.0, "max": 60.0}
+    assert dispatch["retry_histogram"] == {"0": 2, "3": 1, "5": 1}
+    assert queries.system(start, end)["outbox_dispatch"]["trello"]["lag_seconds"]["p50"] is None
+
+
 # ---------------------------------------------------------------------------
 # HTTP: envelope + admin gating
 # ---------------------------------------------------------------------------
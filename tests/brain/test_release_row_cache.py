@@ -0,0 +1,89 @@
+"""Tests for the serialized release row cache behind the job-log read endpoints.
+
+Locks in:
+  - an unchanged (id, last_updated_at) is served from the cache; a moved last_updated_at rebuilds
+  - ORM writes that don't stamp last_updated_at still evict the row in this process,
+    even when a SAVEPOINT inside the transaction rolls back
+  - callers get independent copies (per-request patches never leak into the cache)
+  - rows with NULL last_updated_at are never cached
+"""
+from datetime import datetime
+
+import pytest
+
+from app.brain.job_log.row_cache import release_row_cache
+from app.models import Releases, db
+from tests.conftest import make_release
+
+T0 = datetime(2026, 3, 1, 8, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(admin_session):
+    release_row_cache.clear()
+    yield
+
+
+def _row(admin_client, job):
+    jobs = admin_client.get("/brain/jobs").get_json()["jobs"]
+    return next(j for j in jobs if j["Job #"] == job)
+
+
+class TestReleaseRowCache:
+    def test_second_read_is_a_hit(self, app, admin_client):
+        with app.app_context():
+            make_release(100, "A", last_updated_at=T0)
+            db.session.commit()
+            first = _row(admin_client, 100)
+            stats = release_row_cache.stats()
+            assert _row(admin_client, 100) == first
+            assert release_row_cache.stats()["hits"] == stats["hits"] + 1
+
+    def test_stamped_edit_is_served_fresh(self, app, admin_client):
+        with app.app_context():
+            make_release(100, "A", last_updated_at=T0, notes="old")
+            db.session.commit()
+            assert _row(admin_client, 100)["Notes"] == "old"
+            rel = Releases.query.filter_by(job=100).one()
+            rel.notes = "new"
+            rel.last_updated_at = datetime(2026, 3, 2)
+            db.session.commit()
+            assert _row(admin_client, 100)["Notes"] == "new"
+
+    def test_unstamped_orm_write_evicts(self, app, admin_client):
+        with app.app_context():
+            make_release(100, "A", last_updated_at=T0)
+            db.session.commit()
+            assert _row(admin_client, 100)["viewer_url"] is None
+            Releases.query.filter_by(job=100).one().viewer_url = "https://example.test/viewer"
+            db.session.commit()
+            assert _row(admin_client, 100)["viewer_url"] == "https://example.test/viewer"
+
+    def test_rolled_back_savepoint_keeps_pending_eviction(self, app):
+        with app.app_context():
+            rel = make_release(100, "A", last_updated_at=T0)
+            db.session.commit()
+            rel.viewer_url = "https://example.test/viewer"
+            db.session.flush()
+            db.session.begin_nested().rollback()  # e.g. a deduplicated event
+            # A concurrent request re-caches the pre-commit row in between.
+            release_row_cache.get_or_build(rel, lambda r: {"viewer_url": None})
+            db.session.commit()
+            fresh = release_row_cache.get_or_build(rel, lambda r: {"viewer_url": r.viewer_url})
+            assert fresh["viewer_url"] == "https://example.test/viewer"
+
+    def test_copies_are_independent(self, app):
+        with app.app_context():
+            rel = make_release(100, "A", last_updated_at=T0)
+            db.session.commit()
+            first = release_row_cache.get_or_build(rel, lambda r: {"id": r.id, "has_drawing": False})
+            first["has_drawing"] = True
+            second = release_row_cache.get_or_build(rel, lambda r: pytest.fail("should hit"))
+            assert second["has_drawing"] is False
+
+    def test_null_last_updated_at_is_not_cached(self, app):
+        with app.app_context():
+            rel = make_release(100, "A", last_updated_at=None)
+            db.session.commit()
+            release_row_cache.get_or_build(rel, lambda r: {"id": r.id})
+            assert release_row_cache.stats()["rows"] == 0
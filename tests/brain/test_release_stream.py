@@ -0,0 +1,209 @@
+"""Tests for the release change hub and the /brain/jobs/stream SSE endpoint.
+
+Locks in:
+  - committing a Releases last_updated_at move or a ReleaseEvents insert wakes subscribers;
+    unrelated edits, uncommitted flushes and rollbacks don't; SAVEPOINTs wait for the outer commit
+  - note_release_change covers bulk writers that bypass flush tracking
+  - stream events carry the /brain/jobs?since= body, with latest_timestamp as the event id
+  - Last-Event-ID resumes after the given cursor; no cursor starts at the newest row
+  - a commit while the stream is idle is pushed; idle streams heartbeat and end at max lifetime
+  - a scheduling snapshot rebuild that moves the generation wakes subscribers and is pushed as a `scheduling` event
+"""
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.brain.job_log.scheduling.snapshot import ensure_scheduling_snapshot
+from app.models import ReleaseEvents, Releases, db
+from app.services.release_change_hub import note_release_change, release_change_hub
+from tests.conftest import make_release
+
+T0 = datetime(2026, 3, 1, 8, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(admin_session):
+    yield
+
+
+@pytest.fixture
+def subscription():
+    sub = release_change_hub.subscribe()
+    yield sub
+    release_change_hub.unsubscribe(sub)
+
+
+@pytest.fixture
+def fast_stream(app):
+    app.config["RELEASE_STREAM_HEARTBEAT_SECONDS"] = 0.05
+    app.config["RELEASE_STREAM_MAX_SECONDS"] = 0.3
+    yield
+
+
+def _seed():
+    for i, rel in enumerate(("A", "B", "C")):
+        make_release(100, rel, last_updated_at=T0 + timedelta(minutes=i))
+    db.session.commit()
+
+
+def _frames(response):
+    """Split a streamed body into SSE frames (blank-line separated)."""
+    body = b"".join(response.response).decode()
+    return [frame for frame in body.split("\n\n") if frame]
+
+
+def _events(frames):
+    events = []
+    for frame in frames:
+        fields = dict(line.split(": ", 1) for line in frame.split("\n") if not line.startswith(":"))
+        if fields.get("event") == "releases":
+            events.append((fields["id"], json.loads(fields["data"])))
+    return events
+
+
+class TestHub:
+    def test_last_updated_at_move_wakes_after_commit(self, app, subscription):
+        with app.app_context():
+            _seed()
+            subscription.wait(0)
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            rel.last_updated_at = datetime.utcnow()
+            db.session.flush()
+            assert not subscription.wait(0)
+            db.session.commit()
+            assert subscription.wait(0)
+
+    def test_release_event_insert_wakes(self, app, subscription):
+        with app.app_context():
+            db.session.add(ReleaseEvents(
+                job=100, release="A", action="update_stage", payload={},
+                payload_hash="h1", source="Brain",
+            ))
+            db.session.commit()
+            assert subscription.wait(0)
+
+    def test_unrelated_edit_does_not_wake(self, app, subscription):
+        with app.app_context():
+            _seed()
+            subscription.wait(0)
+            Releases.query.filter_by(job=100, release="A").one().notes = "called the GC"
+            db.session.commit()
+            assert not subscription.wait(0)
+
+    def test_rollback_does_not_wake(self, app, subscription):
+        with app.app_context():
+            _seed()
+            subscription.wait(0)
+            Releases.query.filter_by(job=100, release="A").one().last_updated_at = datetime.utcnow()
+            db.session.flush()
+            db.session.rollback()
+            db.session.commit()
+            assert not subscription.wait(0)
+
+    def test_savepoint_waits_for_outer_commit(self, app, subscription):
+        with app.app_context():
+            _seed()
+            subscription.wait(0)
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            with db.session.begin_nested():
+                rel.last_updated_at = datetime.utcnow()
+            assert not subscription.wait(0)
+            # A rolled-back inner savepoint (e.g. a deduplicated event) keeps the change pending.
+            db.session.begin_nested().rollback()
+            db.session.commit()
+            assert subscription.wait(0)
+
+    def test_note_release_change_publishes_on_commit(self, app, subscription):
+        with app.app_context():
+            note_release_change(db.session)
+            assert not subscription.wait(0)
+            db.session.commit()
+            assert subscription.wait(0)
+
+
+    def test_snapshot_rebuild_that_moves_the_generation_publishes(self, app, subscription):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(date(2026, 4, 1))
+            subscription.wait(0)
+            ensure_scheduling_snapshot(date(2026, 4, 1))  # current: nothing written
+            assert not subscription.wait(0)
+            ensure_scheduling_snapshot(date(2026, 4, 8))  # day rollover moves the dates
+            assert subscription.wait(0)
+
+
+class TestStreamEndpoint:
+    def test_since_streams_delta_in_jobs_shape(self, app, admin_client, fast_stream):
+        with app.app_context():
+            _seed()
+            since = T0.isoformat()
+            response = admin_client.get("/brain/jobs/stream", query_string={"since": since})
+            assert response.status_code == 200
+            assert response.mimetype == "text/event-stream"
+            frames = _frames(response)
+            assert frames[0].startswith("retry: ")
+            events = _events(frames)
+            assert len(events) == 1
+            event_id, payload = events[0]
+            assert [j["Release #"] for j in payload["jobs"]] == ["B", "C"]
+            assert event_id == payload["latest_timestamp"] == (T0 + timedelta(minutes=2)).isoformat()
+
+            polled = admin_client.get("/brain/jobs", query_string={"since": since}).get_json()
+            assert set(payload) == set(polled)
+            assert payload["jobs"] == polled["jobs"]
+
+    def test_last_event_id_takes_precedence(self, app, admin_client, fast_stream):
+        with app.app_context():
+            _seed()
+            response = admin_client.get(
+                "/brain/jobs/stream",
+                query_string={"since": T0.isoformat()},
+                headers={"Last-Event-ID": (T0 + timedelta(minutes=1)).isoformat()},
+            )
+            events = _events(_frames(response))
+            assert [j["Release #"] for j in events[0][1]["jobs"]] == ["C"]
+
+    def test_no_cursor_starts_at_newest_and_heartbeats(self, app, admin_client, fast_stream):
+        with app.app_context():
+            _seed()
+            frames = _frames(admin_client.get("/brain/jobs/stream"))
+            assert _events(frames) == []
+            assert ": heartbeat" in frames
+
+    def test_commit_while_idle_is_pushed(self, app, admin_client, fast_stream):
+        app.config["RELEASE_STREAM_HEARTBEAT_SECONDS"] = 5
+        with app.app_context():
+            _seed()
+            response = admin_client.get("/brain/jobs/stream", buffered=False)
+            chunks = iter(response.response)
+            assert next(chunks).startswith(b"retry: ")
+
+            later = T0 + timedelta(hours=1)
+            rel = Releases.query.filter_by(job=100, release="B").one()
+            rel.last_updated_at = later
+            db.session.commit()
+
+            # The commit's signal wakes the wait immediately (well inside the 5s heartbeat).
+            event_id, payload = _events([next(chunks).decode().strip()])[0]
+            assert event_id == later.isoformat()
+            assert [j["Release #"] for j in payload["jobs"]] == ["B"]
+            response.close()
+
+    def test_snapshot_rebuild_is_pushed_as_a_scheduling_event(self, app, admin_client, fast_stream):
+        app.config["RELEASE_STREAM_HEARTBEAT_SECONDS"] = 5
+        with app.app_context():
+            _seed()
+            first = ensure_scheduling_snapshot(date(2026, 4, 1))
+            response = admin_client.get("/brain/jobs/stream", buffered=False)
+            chunks = iter(response.response)
+            assert next(chunks).startswith(b"retry: ")
+
+            second = ensure_scheduling_snapshot(date(2026, 4, 8))
+            assert second == first + 1
+
+            # No release row changed, so there is no `releases` delta, only the generation.
+            fields = dict(line.split(": ", 1) for line in next(chunks).decode().strip().split("\n"))
+            assert fields["event"] == "scheduling"
+            assert json.loads(fields["data"]) == {"scheduling_generation": second}
+            response.close()
@@ -0,0 +1,116 @@
+"""Tests for change-detecting recalculate_all_jobs_scheduling.
+
+Locks in:
+  - rows whose start_install/comp_eta didn't move are not written (last_updated_at
+    stays put, so the cursor poll doesn't re-send them)
+  - rows that moved are written with fresh last_updated_at and source 'System'
+  - examined / changed / written counts; hard dates are neither examined nor written
+  - a failed bulk write rolls back only its savepoint; the caller's pending changes still commit
+"""
+from datetime import date, datetime
+
+import pytest
+
+from app.brain.job_log.scheduling.service import recalculate_all_jobs_scheduling
+from app.models import Releases, db
+from tests.conftest import make_release
+
+REF = date(2026, 4, 1)
+STAMP = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _seed():
+    make_release(100, "A", stage="Released", fab_order=1.0, fab_hrs=40.0, install_hrs=16.0)
+    make_release(100, "B", stage="Released", fab_order=2.0, fab_hrs=60.0, install_hrs=8.0)
+    make_release(101, "A", stage="Released", fab_order=3.0, fab_hrs=20.0, install_hrs=24.0)
+    make_release(
+        102, "A", stage="Released", fab_order=4.0, fab_hrs=20.0, install_hrs=8.0,
+        start_install=date(2026, 9, 1), start_install_formulaTF=False,
+    )
+    db.session.commit()
+
+
+def _stamp_all():
+    for r in Releases.query.all():
+        r.last_updated_at = STAMP
+    db.session.commit()
+
+
+def _by_key():
+    db.session.expire_all()
+    return {(r.job, r.release): r for r in Releases.query.all()}
+
+
+class TestRecalcDiff:
+    def test_first_run_writes_every_formula_row(self, app):
+        with app.app_context():
+            _seed()
+            result = recalculate_all_jobs_scheduling(reference_date=REF)
+            assert result["examined"] == 3
+            assert result["changed"] == 3
+            assert result["written"] == 3
+            assert result["updated"] == 3
+            assert result["errors"] == []
+            rows = _by_key()
+            assert rows[(100, "A")].start_install is not None
+            assert rows[(100, "A")].source_of_update == "System"
+            assert rows[(102, "A")].start_install == date(2026, 9, 1)
+
+    def test_rerun_with_same_inputs_writes_nothing(self, app):
+        with app.app_context():
+            _seed()
+            recalculate_all_jobs_scheduling(reference_date=REF)
+            _stamp_all()
+
+            result = recalculate_all_jobs_scheduling(reference_date=REF)
+            assert result["examined"] == 3
+            assert result["changed"] == 0
+            assert result["written"] == 0
+            assert all(r.last_updated_at == STAMP for r in _by_key().values())
+
+    def test_only_moved_rows_are_touched(self, app):
+        with app.app_context():
+            _seed()
+            recalculate_all_jobs_scheduling(reference_date=REF)
+            # Growing the last formula row's own install hours moves only its comp_eta.
+            Releases.query.filter_by(job=101, release="A").one().install_hrs = 200.0
+            db.session.commit()
+            _stamp_all()
+            before = _by_key()[(101, "A")].comp_eta
+
+            result = recalculate_all_jobs_scheduling(reference_date=REF)
+            assert result["changed"] == 1
+            assert result["written"] == 1
+            rows = _by_key()
+            assert rows[(101, "A")].comp_eta != before
+            assert rows[(101, "A")].last_updated_at > STAMP
+            assert rows[(100, "A")].last_updated_at == STAMP
+            assert rows[(100, "B")].last_updated_at == STAMP
+            assert rows[(102, "A")].last_updated_at == STAMP
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    def test_small_batches_write_all_changes(self, app, batch_size):
+        with app.app_context():
+            _seed()
+            result = recalculate_all_jobs_scheduling(reference_date=REF, batch_size=batch_size)
+            assert result["written"] == 3
+            assert all(r.start_install is not None for r in _by_key().values())
+
+    def test_failed_write_keeps_the_callers_pending_changes(self, app, monkeypatch):
+        with app.app_context():
+            _seed()
+            # The caller's own edit, pending when it asks for the recalculation
+            Releases.query.filter_by(job=102, release="A").one().notes = "keep me"
+
+            def broken(*args, **kwargs):
+                raise RuntimeError("bulk write failed")
+
+            monkeypatch.setattr(db.session, "bulk_update_mappings", broken)
+            result = recalculate_all_jobs_scheduling(reference_date=REF)
+            monkeypatch.undo()
+
+            assert result["written"] == 0
+            assert result["errors"][0]["job"] == "bulk_update"
+            rows = _by_key()
+            assert rows[(102, "A")].notes == "keep me"
+            assert rows[(100, "A")].start_install is None
@@ -0,0 +1,247 @@
+"""Tests for the persisted scheduling snapshot behind /brain/jobs and /brain/get-all-jobs.
+
+Locks in:
+  - a current snapshot is reused (generation stable, no recompute)
+  - committing a change to a scheduling input invalidates it; unrelated edits don't
+  - SAVEPOINT release/rollback neither invalidates early nor drops a pending invalidation
+  - a reference-date rollover rebuilds
+  - snapshot values match the in-memory calculator for the same inputs
+  - both read endpoints join the snapshot and report scheduling_generation
+  - a GET never writes the snapshot; while it is stale the projections are computed in memory
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from app.brain.job_log.scheduling.calculator import calculate_all_job_scheduling
+from app.brain.job_log.scheduling.snapshot import (
+    ensure_scheduling_snapshot,
+    get_release_schedules,
+    mark_scheduling_snapshot_stale,
+)
+from app.models import ReleaseSchedule, Releases, SchedulingSnapshotState, db
+from tests.conftest import make_release
+
+REF = date(2026, 4, 1)
+
+
+@pytest.fixture(autouse=True)
+def setup_auth(admin_session):
+    yield
+
+
+def _seed():
+    make_release(100, "A", stage="Released", fab_order=1.0, fab_hrs=40.0, install_hrs=16.0)
+    make_release(100, "B", stage="Cut Start", fab_order=2.0, fab_hrs=60.0, install_hrs=8.0)
+    make_release(101, "A", stage="Released", fab_order=3.0, fab_hrs=20.0, install_hrs=24.0, num_guys=3.0)
+    db.session.commit()
+
+
+def _state():
+    db.session.expire_all()
+    return db.session.get(SchedulingSnapshotState, 1)
+
+
+class TestSnapshotLifecycle:
+    def test_first_call_builds_rows_for_every_release(self, app):
+        with app.app_context():
+            _seed()
+            generation = ensure_scheduling_snapshot(REF)
+            assert generation == 1
+            assert ReleaseSchedule.query.count() == 3
+            state = _state()
+            assert state.computed_inputs_version == state.inputs_version
+            assert state.reference_date == REF
+
+    def test_generation_stable_when_nothing_changed(self, app):
+        with app.app_context():
+            _seed()
+            first = ensure_scheduling_snapshot(REF)
+            computed_at = _state().computed_at
+            assert ensure_scheduling_snapshot(REF) == first
+            assert _state().computed_at == computed_at
+
+    def test_input_change_invalidates_and_rebuild_bumps_generation(self, app):
+        with app.app_context():
+            _seed()
+            first = ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            rel.fab_hrs = 400.0
+            db.session.commit()
+
+            assert _state().inputs_version == before + 1
+            second = ensure_scheduling_snapshot(REF)
+            assert second == first + 1
+            # Only rows whose projection moved carry the new generation.
+            rows = get_release_schedules([r.id for r in Releases.query.all()])
+            moved = {rid for rid, row in rows.items() if row.generation == second}
+            assert rel.id in moved
+
+    def test_unrelated_edit_does_not_invalidate(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            rel.notes = "called the GC"
+            db.session.commit()
+
+            assert _state().inputs_version == before
+
+    def test_new_release_invalidates(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+            make_release(102, "A", stage="Released", fab_order=4.0, fab_hrs=10.0)
+            db.session.commit()
+            assert _state().inputs_version == before + 1
+            ensure_scheduling_snapshot(REF)
+            assert ReleaseSchedule.query.count() == 4
+
+    def test_rolled_back_change_does_not_invalidate(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            rel.fab_order = 9.0
+            db.session.flush()
+            db.session.rollback()
+            assert _state().inputs_version == before
+
+    def test_savepoint_waits_for_outer_commit(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            rel.fab_order = 9.0
+            with db.session.begin_nested():
+                db.session.flush()
+            # A rolled-back inner savepoint (e.g. a deduplicated event) must not drop the flag.
+            inner = db.session.begin_nested()
+            inner.rollback()
+            state = db.session.get(SchedulingSnapshotState, 1)
+            assert state.inputs_version == before
+            db.session.commit()
+            assert _state().inputs_version == before + 1
+
+    def test_released_savepoint_then_outer_rollback_does_not_invalidate(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            with db.session.begin_nested():
+                rel.fab_order = 9.0
+            db.session.rollback()
+            assert _state().inputs_version == before
+
+    def test_reference_date_rollover_rebuilds(self, app):
+        with app.app_context():
+            _seed()
+            first = ensure_scheduling_snapshot(REF)
+            second = ensure_scheduling_snapshot(REF + timedelta(days=7))
+            assert second == first + 1
+            assert _state().reference_date == REF + timedelta(days=7)
+
+    def test_explicit_mark_stale(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            before = _state().inputs_version
+            mark_scheduling_snapshot_stale()
+            assert _state().inputs_version == before + 1
+
+    def test_values_match_calculator(self, app):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot(REF)
+            releases = Releases.query.order_by(Releases.id).all()
+            expected = calculate_all_job_scheduling([
+                {
+                    'fab_hrs': r.fab_hrs,
+                    'install_hrs': r.install_hrs,
+                    'fab_order': r.fab_order,
+                    'stage': r.stage,
+                    'num_guys': r.num_guys,
+                    'is_hard_date': r.start_install_formulaTF is False,
+                }
+                for r in releases
+            ], REF)
+            rows = get_release_schedules([r.id for r in releases])
+            for r, exp in zip(releases, expected):
+                row = rows[r.id]
+                assert row.hours_in_front == exp['hours_in_front']
+                assert row.days_in_front == exp['days_in_front']
+                assert row.projected_fab_complete_date == exp['projected_fab_complete_date']
+                assert row.install_start_date == exp['install_start_date']
+                assert row.install_complete_date == exp['install_complete_date']
+
+
+class TestEndpointsJoinSnapshot:
+    def test_jobs_reports_generation_and_fields(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot()
+            body = admin_client.get("/brain/jobs").get_json()
+            assert body["scheduling_generation"] == 1
+            by_release = {(j["Job #"], j["Release #"]): j for j in body["jobs"]}
+            assert by_release[(100, "A")]["hours_in_front"] == 0.0
+            assert by_release[(100, "B")]["hours_in_front"] == 40.0
+            assert by_release[(101, "A")]["projected_fab_complete_date"] is not None
+
+    def test_stale_snapshot_is_computed_in_memory_without_writing(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot()
+            rel = Releases.query.filter_by(job=100, release="A").one()
+            rel.fab_hrs = 400.0
+            db.session.commit()
+            stale = _state()
+            computed_inputs_version, computed_at = stale.computed_inputs_version, stale.computed_at
+
+            body = admin_client.get("/brain/jobs").get_json()
+            by_release = {(j["Job #"], j["Release #"]): j for j in body["jobs"]}
+            # Served from the new inputs, but the GET persisted nothing.
+            assert by_release[(100, "B")]["hours_in_front"] == 400.0
+            assert body["scheduling_generation"] == 1
+            state = _state()
+            assert state.computed_inputs_version == computed_inputs_version
+            assert state.computed_at == computed_at
+            row = db.session.get(ReleaseSchedule, by_release[(100, "B")]["id"])
+            assert row.hours_in_front == 40.0
+
+    def test_get_before_first_build_writes_nothing(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            body = admin_client.get("/brain/jobs").get_json()
+            assert body["scheduling_generation"] == 0
+            by_release = {(j["Job #"], j["Release #"]): j for j in body["jobs"]}
+            assert by_release[(100, "B")]["hours_in_front"] == 40.0
+            assert ReleaseSchedule.query.count() == 0
+            assert _state() is None
+
+    def test_delta_poll_does_not_rebuild(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot()
+            first = admin_client.get("/brain/jobs").get_json()
+            computed_at = _state().computed_at
+            second = admin_client.get(
+                "/brain/jobs", query_string={"since": first["latest_timestamp"]}
+            ).get_json()
+            assert second["scheduling_generation"] == first["scheduling_generation"]
+            assert _state().computed_at == computed_at
+
+    def test_get_all_jobs_reports_generation(self, app, admin_client):
+        with app.app_context():
+            _seed()
+            ensure_scheduling_snapshot()
+            body = admin_client.get("/brain/get-all-jobs").get_json()
+            assert body["scheduling_generation"] == 1
+            assert all("install_start_date" in j for j in body["jobs"])
@@ -33,9 +33,11 @@ def _no_outbound_network(request):
 
     External services (Trello, Procore, Graph, Anthropic) must always be
     mocked (tests/README.md); the DB is in-memory SQLite, so no test has a
-    legitimate reason to open a TCP socket. Before this guard, a locally
-    loaded .env let some tests silently hit live APIs (real Anthropic calls
-    from the material-orders ingest path, real outbox deliveries).
+    legitimate reason to open a TCP socket off the loopback interface (the
+    Trello client tests run a fake Trello server on 127.0.0.1). Before this
+    guard, a locally loaded .env let some tests silently hit live APIs (real
+    Anthropic calls from the material-orders ingest path, real outbox
+    deliveries).
 
     `pytest -m live` runs stand down: live-marked tests exist to make a real
     LLM call on purpose (see pytest.ini), and the default addopts exclude
@@ -51,6 +53,8 @@ def _no_outbound_network(request):
     def blocked_connect(self, address, *args, **kwargs):
         if self.family == getattr(socket, "AF_UNIX", None):
             return real_connect(self, address, *args, **kwargs)
+        if isinstance(address, tuple) and address[0] in ("127.0.0.1", "::1"):
+            return real_connect(self, address, *args, **kwargs)
         raise RuntimeError(
             f"Test attempted outbound network connection to {address!r}. "
             "Mock the external call (see tests/README.md)."
@@ -65,7 +69,7 @@ def _no_outbound_network(request):
 
 @pytest.fixture(autouse=True)
 def _no_retry_backoff(monkeypatch):
-    """Zero out Graph-client retry backoff so exhaust-retries tests don't
+    """Zero out Graph- and Trello-client retry backoff so exhaust-retries tests don't
     sleep for real (1+2+4s per exercise). Patches the module-local delay
     helper, not time.sleep, so tests that rely on real timing (sync lock
     threads) are unaffected."""
@@ -73,6 +77,40 @@ def _no_retry_backoff(monkeypatch):
         "app.microsoft.graph_app_client._retry_delay_seconds",
         lambda resp, attempt: 0,
     )
+    monkeypatch.setattr(
+        "app.trello.client._retry_delay_seconds",
+        lambda attempt: 0,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_trello_batch_reader(monkeypatch):
+    """Give each test its own app.trello.batch reader (empty read cache, no
+    batching window) so a cached Trello read never leaks between tests."""
+    from app.trello.batch import TrelloBatchReader
+
+    monkeypatch.setattr(
+        "app.trello.batch._reader",
+        TrelloBatchReader(window_seconds=0),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_webhook_dedup_cache(monkeypatch):
+    """Give each test an empty Procore burst-dedup cache; the per-test DB is new,
+    so a receipt hash remembered by an earlier test must not short-circuit it."""
+    from app.procore.helpers import WebhookDedupCache
+
+    monkeypatch.setattr("app.procore.helpers._dedup_cache", WebhookDedupCache())
+
+
+@pytest.fixture(autouse=True)
+def _fresh_procore_response_cache(monkeypatch):
+    """Give each test an empty Procore read cache, so a payload one test served is
+    never handed to another test's patched session."""
+    from app.procore.response_cache import ProcoreResponseCache
+
+    monkeypatch.setattr("app.procore.response_cache._cache", ProcoreResponseCache())
 
 
 @pytest.fixture
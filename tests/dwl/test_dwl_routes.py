@@ -786,3 +786,58 @@ class TestNextRelRoute:
             resp = client.get('/brain/drafting-work-load/rel/next')
             assert resp.status_code == 200
             assert resp.get_json()['next_rel'] == 108
+
+
+# ==============================================================================
+# PUT /drafting-work-load/procore-status TESTS
+# ==============================================================================
+
+class TestUpdateProcoreStatus:
+    """The status change goes out through ProcoreOutbox, so a failed call is retried."""
+
+    def _put(self, client, submittal_id, status_id=203239):
+        return client.put(
+            '/brain/drafting-work-load/procore-status',
+            json={'submittal_id': submittal_id, 'status_id': status_id},
+        )
+
+    def _outbox_rows(self, submittal_id):
+        from app.models import ProcoreOutbox
+        db.session.expire_all()
+        return ProcoreOutbox.query.filter_by(submittal_id=submittal_id).order_by(ProcoreOutbox.id).all()
+
+    def test_delivered_through_the_outbox(self, client):
+        _seed_submittal("9101")
+        procore = MagicMock()
+        with patch('app.procore.client.get_procore_client', return_value=procore):
+            response = self._put(client, "9101")
+
+        assert response.status_code == 200
+        procore.update_submittal_status.assert_called_once_with(1, 9101, 203239)
+        rows = self._outbox_rows("9101")
+        assert [(r.status, r.action, r.request_payload) for r in rows] == [
+            ("completed", "update_status", {"status_id": 203239})
+        ]
+        assert Submittals.query.filter_by(submittal_id="9101").first().status == "Closed"
+
+    def test_failed_call_stays_pending_for_the_outbox_retry(self, client):
+        from app.services.outbox_service import OutboxService
+
+        _seed_submittal("9102")
+        procore = MagicMock()
+        procore.update_submittal_status.side_effect = RuntimeError("procore down")
+        with patch('app.procore.client.get_procore_client', return_value=procore):
+            response = self._put(client, "9102")
+
+        assert response.status_code == 202
+        assert response.get_json()["queued"] is True
+        [row] = self._outbox_rows("9102")
+        assert (row.status, row.retry_count) == ("pending", 1)
+        assert Submittals.query.filter_by(submittal_id="9102").first().status == "Open"
+
+        row.next_retry_at = datetime.utcnow()
+        db.session.commit()
+        procore.update_submittal_status.side_effect = None
+        with patch('app.procore.client.get_procore_client', return_value=procore):
+            assert OutboxService.process_pending_procore_items(limit=10) == 1
+        assert self._outbox_rows("9102")[0].status == "completed"
@@ -83,3 +83,118 @@ class TestRequestRetry:
 
         assert result == {"ok": True}
         assert call_count["n"] == 2
+
+
+def _response(status=200, body=None, headers=None):
+    r = Mock()
+    r.status_code = status
+    r.headers = headers or {}
+    r.json.return_value = body
+    r.text = "x" if body is not None else ""
+    if status >= 400:
+        r.raise_for_status = Mock(side_effect=requests.HTTPError(f"{status}", response=r))
+    else:
+        r.raise_for_status = Mock()
+    return r
+
+
+class TestGetSubmittalsPagination:
+    def _pages(self, total, per_page=100):
+        def request(method, url, params=None, **kwargs):
+            page = params["page"]
+            start = (page - 1) * per_page
+            rows = [{"id": i} for i in range(start, min(start + per_page, total))]
+            return _response(body={"data": rows, "total": total, "per_page": per_page, "page": page})
+        return request
+
+    def test_remaining_pages_fetched_in_parallel_and_kept_in_order(self, api):
+        seen_threads = set()
+        inner = self._pages(450)
+
+        def request(method, url, params=None, **kwargs):
+            import threading
+            seen_threads.add(threading.current_thread().name)
+            return inner(method, url, params=params, **kwargs)
+
+        with patch("app.procore.api.get_access_token", return_value="fake-token"), \
+             patch.object(api.session, "request", side_effect=request) as req:
+            rows = api.get_submittals(7, workers=4)
+
+        assert [r["id"] for r in rows] == list(range(450))
+        assert sorted(c.kwargs["params"]["page"] for c in req.call_args_list) == [1, 2, 3, 4, 5]
+        assert any(name.startswith("procore-page-") for name in seen_threads)
+
+    def test_single_page_makes_one_call(self, api):
+        with patch("app.procore.api.get_access_token", return_value="fake-token"), \
+             patch.object(api.session, "request", side_effect=self._pages(40)) as req:
+            assert len(api.get_submittals(7)) == 40
+        assert req.call_count == 1
+
+    def test_page_error_is_raised(self, api):
+        inner = self._pages(250)
+
+        def request(method, url, params=None, **kwargs):
+            if params["page"] == 3:
+                return _response(status=500, body={})
+            return inner(method, url, params=params, **kwargs)
+
+        with patch("app.procore.api.get_access_token", return_value="fake-token"), \
+             patch.object(api.session, "request", side_effect=request):
+            with pytest.raises(requests.HTTPError):
+                api.get_submittals(7, workers=2)
+
+
+class TestRateBudget:
+    def test_429_pauses_budget_and_retries(self, api):
+        budget = MagicMock()
+        responses = [
+            _response(status=429, headers={"Retry-After": "7"}),
+            _response(body={"ok": True}),
+        ]
+        with patch("app.procore.api.get_access_token", return_value="fake-token"), \
+             patch("app.procore.api._budget", budget), \
+             patch.object(api.session, "request", side_effect=responses):
+            assert api._request("GET", "/x") == {"ok": True}
+
+        assert budget.acquire.call_count == 2
+        budget.pause.assert_called_once_with(7.0)
+
+    def test_budget_is_split_across_processes(self):
+        from app.procore import api as procore_api
+
+        with patch("app.procore.api._budget", None), \
+             patch.object(procore_api.cfg, "PROCORE_RATE_LIMIT_PER_HOUR", 3600), \
+             patch.object(procore_api.cfg, "PROCORE_RATE_LIMIT_BURST", 100), \
+             patch.object(procore_api.cfg, "PROCORE_RATE_LIMIT_PROCESSES", 4):
+            budget = procore_api.procore_rate_budget()
+
+        assert (budget.capacity, budget.refill_per_second) == (25.0, 0.25)
+
+    def test_auth_header_is_per_request_not_on_session(self, api):
+        with patch("app.procore.api.get_access_token", return_value="tok-1"), \
+             patch.object(api.session, "request", return_value=_response(body={})) as req:
+            api._request("GET", "/x")
+
+        assert req.call_args.kwargs["headers"]["Authorization"] == "Bearer tok-1"
+        assert "Authorization" not in api.session.headers
+
+
+class TestFanOut:
+    def test_results_in_input_order_with_errors_captured(self):
+        from app.procore.fetch import fan_out
+
+        def work(n):
+            if n == 2:
+                raise ValueError("boom")
+            return n * 10
+
+        results = fan_out(work, [1, 2, 3], workers=3)
+        assert [r for r, _ in results] == [10, None, 30]
+        assert isinstance(results[1][1], ValueError)
+
+    def test_runs_inline_on_in_memory_database(self, app):
+        import threading
+        from app.procore.fetch import fan_out
+
+        names = fan_out(lambda _: threading.current_thread().name, range(3), workers=3)
+        assert {name for name, _ in names} == {threading.current_thread().name}
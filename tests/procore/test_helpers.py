@@ -175,3 +175,74 @@ class TestIsDuplicateWebhook:
             second = is_duplicate_webhook(resource_id=2, project_id=200, event_type="updated")
         assert first is False
         assert second is True
+
+    def test_repeat_in_window_is_answered_from_cache(self, app):
+        from app.procore.helpers import is_duplicate_webhook, webhook_dedup_stats
+        with patch("app.procore.helpers.time.time", return_value=1000.0):
+            assert is_duplicate_webhook(resource_id=3, project_id=300, event_type="update") is False
+            with patch.object(db.session, "commit") as commit:
+                assert is_duplicate_webhook(resource_id=3, project_id=300, event_type="update") is True
+                assert is_duplicate_webhook(resource_id=3, project_id=300, event_type="update") is True
+            commit.assert_not_called()
+        stats = webhook_dedup_stats()
+        assert (stats["db_inserts"], stats["cache_hits"], stats["db_rejects"]) == (1, 2, 0)
+
+    def test_other_workers_receipt_is_a_db_reject_then_cached(self, app):
+        from app.procore.helpers import WebhookDedupCache, is_duplicate_webhook
+        with patch("app.procore.helpers.time.time", return_value=1000.0):
+            assert is_duplicate_webhook(resource_id=4, project_id=400, event_type="update") is False
+            # A second process (empty cache) still rejects through the unique key, then caches it.
+            other = WebhookDedupCache()
+            with patch("app.procore.helpers._dedup_cache", other):
+                assert is_duplicate_webhook(resource_id=4, project_id=400, event_type="update") is True
+                assert is_duplicate_webhook(resource_id=4, project_id=400, event_type="update") is True
+        assert (other.stats()["db_rejects"], other.stats()["cache_hits"]) == (1, 1)
+
+    def test_next_window_goes_back_to_the_db(self, app):
+        from app.procore.helpers import is_duplicate_webhook
+        with patch("app.procore.helpers.time.time", return_value=1000.0):
+            is_duplicate_webhook(resource_id=5, project_id=500, event_type="update")
+        with patch("app.procore.helpers.time.time", return_value=1020.0):
+            assert is_duplicate_webhook(resource_id=5, project_id=500, event_type="update") is False
+
+
+class TestWebhookDedupCache:
+    def test_drops_older_buckets_and_caps_size(self):
+        from app.procore.helpers import WebhookDedupCache
+        cache = WebhookDedupCache(max_entries=2)
+        cache.remember("a", 1, duplicate=False)
+        cache.remember("b", 2, duplicate=False)
+        assert not cache.seen("a")  # bucket 1 expired when bucket 2 arrived
+        cache.remember("c", 2, duplicate=True)
+        cache.remember("d", 2, duplicate=False)
+        assert not cache.seen("b")  # LRU beyond max_entries
+        assert cache.seen("c") and cache.seen("d")
+        stats = cache.stats()
+        assert (stats["entries"], stats["cache_hits"], stats["db_rejects"], stats["duplicates"]) == (2, 2, 1, 3)
+
+
+class TestPurgeWebhookReceipts:
+    @pytest.fixture
+    def app(self):
+        app = create_app()
+        app.config["TESTING"] = True
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.remove()
+            db.drop_all()
+
+    def test_deletes_old_procore_receipts_only(self, app):
+        from datetime import datetime, timedelta
+        from app.models import WebhookReceipt
+        from app.procore.helpers import purge_webhook_receipts
+        old = datetime.utcnow() - timedelta(days=40)
+        db.session.add_all([
+            WebhookReceipt(receipt_hash="p-old", provider="procore", received_at=old),
+            WebhookReceipt(receipt_hash="p-new", provider="procore"),
+            WebhookReceipt(receipt_hash="g-old", provider="graph", received_at=old),
+        ])
+        db.session.commit()
+
+        assert purge_webhook_receipts() == 1
+        assert sorted(r.receipt_hash for r in WebhookReceipt.query.all()) == ["g-old", "p-new"]
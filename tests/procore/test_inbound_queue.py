@@ -0,0 +1,196 @@
+"""Tests for the durable Procore inbound queue (app/procore/inbound_queue.py + drain_procore_queue).
+
+Locks in:
+  - a claim takes each submittal's oldest open delivery only; a later delivery waits until it finishes
+  - drain_procore_queue runs the batch through process_webhook_event and marks rows completed
+  - a processing error retries with backoff and ends as 'failed' without blocking the submittal's later deliveries
+  - a create or update that was not applied (error result, unreadable submittal, exception) is retried, never completed
+  - a batch of different submittals fans out to the pool
+  - stale 'processing' claims are handed back; completed rows are purged after retention
+  - queue_metrics reports depth, oldest pending age and queue lag; /procore/api/webhook/queue-stats serves it with the burst-dedup counters
+"""
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from app.models import ProcoreInboundEvent, Submittals, db
+from app.procore import drain_procore_queue, inbound_queue
+
+
+def _enqueue(submittal_id, event_type="update", project_id=99):
+    payload = {"resource_id": submittal_id, "project_id": project_id, "reason": event_type}
+    return inbound_queue.enqueue(submittal_id, project_id, event_type, payload)
+
+
+def _row(event_id):
+    db.session.expire_all()
+    return db.session.get(ProcoreInboundEvent, event_id)
+
+
+def test_claim_keeps_per_submittal_order(app):
+    a1 = _enqueue(1, "create")
+    b1 = _enqueue(2)
+    a2 = _enqueue(1)
+
+    assert [e["id"] for e in inbound_queue.claim_batch(10)] == [a1, b1]
+    assert inbound_queue.claim_batch(10) == []  # a2 waits behind a1
+
+    inbound_queue.finish_batch(completed=[{"id": a1}])
+    [claimed] = inbound_queue.claim_batch(10)
+    assert (claimed["id"], claimed["submittal_id"], claimed["event_type"]) == (a2, "1", "update")
+
+
+def test_claim_respects_limit_and_available_at(app):
+    ids = [_enqueue(i) for i in range(4)]
+    later = _row(ids[0])
+    later.available_at = datetime.utcnow() + timedelta(minutes=1)
+    db.session.commit()
+
+    assert [e["id"] for e in inbound_queue.claim_batch(2)] == ids[1:3]
+
+
+def test_drain_processes_in_arrival_order(app):
+    first, second = _enqueue(7, "create"), _enqueue(7)
+    seen = []
+    with patch("app.procore.process_webhook_event",
+               side_effect=lambda sid, pid, event_type, payload: seen.append((sid, pid, event_type))):
+        assert drain_procore_queue() == 1
+        assert drain_procore_queue() == 1
+        assert drain_procore_queue() == 0
+
+    assert seen == [(7, 99, "create"), (7, 99, "update")]
+    assert {_row(first).status, _row(second).status} == {"completed"}
+
+
+def test_processing_error_retries_then_fails_without_blocking(app):
+    bad, good = _enqueue(8), _enqueue(8)
+    with patch.object(inbound_queue.cfg, "PROCORE_INBOUND_MAX_ATTEMPTS", 2), \
+         patch("app.procore.process_webhook_event", side_effect=RuntimeError("procore 500")):
+        drain_procore_queue()
+        row = _row(bad)
+        assert (row.status, row.attempts) == ("pending", 1)
+        assert "procore 500" in row.error_message
+        assert row.available_at > datetime.utcnow()
+
+        row.available_at = datetime.utcnow()
+        db.session.commit()
+        drain_procore_queue()
+        assert (_row(bad).status, _row(bad).attempts) == ("failed", 2)
+
+    with patch("app.procore.process_webhook_event") as process:
+        drain_procore_queue()
+    process.assert_called_once()
+    assert _row(good).status == "completed"
+
+
+def _make_due(event_id):
+    row = _row(event_id)
+    row.available_at = datetime.utcnow()
+    db.session.commit()
+
+
+def test_failed_create_is_retried_not_completed(app):
+    event_id = _enqueue(9, "create")
+    with patch("app.procore.create_submittal_from_webhook", return_value=(False, None, "project lookup failed")):
+        drain_procore_queue()
+    row = _row(event_id)
+    assert (row.status, row.attempts) == ("pending", 1)
+    assert "project lookup failed" in row.error_message
+
+    _make_due(event_id)
+    with patch("app.procore.create_submittal_from_webhook", return_value=(True, Submittals(title="T"), None)):
+        drain_procore_queue()
+    assert _row(event_id).status == "completed"
+
+
+def test_failed_update_is_retried_not_completed(app):
+    event_id = _enqueue(10, "update")
+    db.session.add(Submittals(submittal_id="10", procore_project_id="99", title="Stairs"))
+    db.session.commit()
+    with patch("app.procore.procore.handle_submittal_update", return_value=None):
+        drain_procore_queue()
+    row = _row(event_id)
+    assert (row.status, row.attempts) == ("pending", 1)
+    assert "SubmittalApplyError" in row.error_message
+
+    _make_due(event_id)
+    with patch("app.procore.procore.handle_submittal_update", side_effect=RuntimeError("procore 502")):
+        drain_procore_queue()
+    assert (_row(event_id).status, _row(event_id).attempts) == ("pending", 2)
+    assert "procore 502" in _row(event_id).error_message
+
+
+def test_batch_fans_out_to_the_pool(app):
+    for sid in range(4):
+        _enqueue(sid)
+    threads = set()
+    lock = threading.Lock()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(app_, evt):
+        barrier.wait()  # at least two submittals in flight at once
+        with lock:
+            threads.add(threading.current_thread().name)
+        return None
+
+    with patch("app.procore.in_memory_database", return_value=False), \
+         patch("app.procore._run_event_in_app", side_effect=run), \
+         patch("app.procore._POOL_SIZE", 2):
+        assert drain_procore_queue(max_items=2) == 2
+
+    assert len(threads) == 2
+    assert all(name.startswith("procore-inbound-") for name in threads)
+
+
+def test_release_stale_claims_and_purge(app):
+    event_id = _enqueue(9)
+    inbound_queue.claim_batch(1)
+    row = _row(event_id)
+    row.claimed_at = datetime.utcnow() - timedelta(hours=1)
+    db.session.commit()
+
+    assert inbound_queue.release_stale_claims() == 1
+    assert _row(event_id).status == "pending"
+
+    [claimed] = inbound_queue.claim_batch(1)
+    inbound_queue.finish_batch(completed=[claimed])
+    row = _row(event_id)
+    row.completed_at = datetime.utcnow() - timedelta(days=30)
+    db.session.commit()
+    assert inbound_queue.purge_completed() == 1
+    assert ProcoreInboundEvent.query.count() == 0
+
+
+def test_queue_metrics_and_stats_endpoint(app, client):
+    done = _enqueue(10)
+    _enqueue(11)
+    row = _row(done)
+    row.created_at = datetime.utcnow() - timedelta(seconds=30)
+    db.session.commit()
+    with patch("app.procore.process_webhook_event"):
+        drain_procore_queue(max_items=1)
+
+    metrics = inbound_queue.queue_metrics()
+    assert metrics["depth"] == 1
+    assert metrics["oldest_pending_age_seconds"] >= 0
+    assert metrics["lag_max_seconds"] >= 30
+
+    stats = client.get("/procore/api/webhook/queue-stats").get_json()
+    assert stats["depth"] == 1
+    assert stats["worker_alive"] is False
+
+
+def test_is_full_at_max_depth(app):
+    _enqueue(12)
+    with patch.object(inbound_queue.cfg, "PROCORE_INBOUND_MAX_DEPTH", 1):
+        assert inbound_queue.is_full() is True
+    assert inbound_queue.is_full() is False
+
+
+def test_stats_endpoint_reports_dedup_counters(app, client):
+    with patch("app.procore.helpers.time.time", return_value=1000.0):
+        for _ in range(3):
+            client.post("/procore/webhook", json={"resource_id": 13, "project_id": 99, "reason": "update"})
+
+    dedup = client.get("/procore/api/webhook/queue-stats").get_json()["dedup"]
+    assert (dedup["db_inserts"], dedup["cache_hits"], dedup["db_rejects"]) == (1, 2, 0)
@@ -3,7 +3,8 @@ Unit tests for app/procore/reconcile.py — the delayed reconcile safety net.
 
 Covers: coalescing schedule(), process_due() happy/no-op path, the rescue path
 (a reconcile that applies a change the live webhook missed → SystemLogs WARNING),
-and that future-dated rows are not picked up.
+that future-dated rows are not picked up, and that project-batched list reads
+rescue exactly what per-submittal detail fetches would.
 """
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
@@ -168,3 +169,87 @@ class TestProcessDue:
         assert row.status == "failed"
         assert row.attempts == reconcile_mod.MAX_RECONCILE_ATTEMPTS
         assert "procore api down" in (row.last_error or "")
+
+
+def test_reconcile_refetch_bypasses_the_response_cache(app):
+    """The reconcile exists to see late Procore propagation, so it must not read cached responses."""
+    from app.procore import response_cache
+    from app.procore.reconcile import ProcoreReconcileService
+
+    TestProcessDue()._due_row()
+    seen = []
+
+    def check(project_id, submittal_id, source):
+        seen.append(response_cache._cache.bypassed())
+        return (False, False, False, False, _record_mock(), "x", "Open")
+
+    with patch("app.procore.procore.check_and_update_submittal", side_effect=check):
+        ProcoreReconcileService.process_due()
+
+    assert seen == [True]
+    assert response_cache._cache.bypassed() is False
+
+
+# ---- project-batched reads ----
+
+def _payload(sid, title="Stairs", status="Open", approvers=()):
+    return {
+        "id": int(sid), "title": title, "status": {"name": status},
+        "ball_in_court": [], "approvers": list(approvers), "submittal_manager": None,
+    }
+
+
+THIN_APPROVER = {"user": {"name": "Dana Drafter", "login": "dana"}, "response_required": True}
+
+
+def _seed_batch():
+    """Three due reconciles in project 99: a missed status flip, a no-op, and a missed
+    title change whose list row is too thin to diff (must fall back to the detail)."""
+    from app.models import Submittals
+
+    for sid in ("1", "2", "3"):
+        db.session.add(Submittals(submittal_id=sid, procore_project_id="99", title="Stairs",
+                                  status="Open", ball_in_court="", submittal_manager=""))
+        db.session.add(SubmittalReconcile(submittal_id=sid, project_id=99, status="pending",
+                                          scheduled_for=datetime.utcnow() - timedelta(seconds=1)))
+    db.session.commit()
+    detail = {"1": _payload(1, status="Closed"), "2": _payload(2), "3": _payload(3, title="Stairs rev B")}
+    listed = [detail["1"], detail["2"], _payload(3, title="Stairs rev B", approvers=[THIN_APPROVER]), _payload(77)]
+    return detail, listed
+
+
+@pytest.mark.parametrize("min_rows, detail_fetches", [(2, 1), (1000, 3)])
+def test_batched_reconcile_rescues_the_same_as_per_row(app, min_rows, detail_fetches):
+    from app.config import Config
+    from app.procore.reconcile import ProcoreReconcileService
+
+    detail, listed = _seed_batch()
+    with patch.object(Config, "PROCORE_RECONCILE_BATCH_MIN_ROWS", min_rows), \
+         patch("app.procore.procore.fetch_all_submittals_by_project",
+               return_value={99: (listed, None)}) as list_call, \
+         patch("app.procore.procore.get_submittal_by_id",
+               side_effect=lambda pid, sid: detail[str(sid)]) as detail_call:
+        assert ProcoreReconcileService.process_due() == 3
+
+    assert detail_call.call_count == detail_fetches
+    assert list_call.call_count == (1 if min_rows == 2 else 0)
+    if min_rows == 2:
+        assert "filters[updated_at]" in list_call.call_args.kwargs["filters"]
+        assert [c.args[1] for c in detail_call.call_args_list] == ["3"]
+    rescues = SystemLogs.query.filter_by(operation="reconcile_rescue").all()
+    assert sorted(log.context["submittal_id"] for log in rescues) == ["1", "3"]
+    assert {r.status for r in SubmittalReconcile.query.all()} == {"completed"}
+
+
+def test_failed_project_list_falls_back_to_detail_fetches(app):
+    from app.procore.reconcile import ProcoreReconcileService
+
+    detail, _ = _seed_batch()
+    with patch("app.procore.procore.fetch_all_submittals_by_project",
+               return_value={99: (None, RuntimeError("procore 503"))}), \
+         patch("app.procore.procore.get_submittal_by_id",
+               side_effect=lambda pid, sid: detail[str(sid)]) as detail_call:
+        ProcoreReconcileService.process_due()
+
+    assert detail_call.call_count == 3
+    assert SystemLogs.query.filter_by(operation="reconcile_rescue").count() == 2
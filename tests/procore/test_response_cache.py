@@ -0,0 +1,176 @@
+"""Tests for the Procore read cache (app/procore/response_cache.py) and its callers.
+
+Locks in:
+  - a fresh entry is served without a request, as a copy the caller may mutate
+  - a stale entry is revalidated with If-None-Match / If-Modified-Since and a 304 re-arms it
+  - invalidate_submittal drops the submittal's entries; a fetch that started before the invalidation is not stored
+  - bypass() sends an unconditional request, never reads the cache, and refreshes it
+  - ProcoreAPI.get_submittal_by_id and procore.get_workflow_data share the cache; a webhook delivery invalidates it
+  - /procore/api/webhook/queue-stats reports the cache counters
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.procore import response_cache
+from app.procore.response_cache import ProcoreResponseCache, cache_key, submittal_tag
+
+
+def _response(body, status=200, headers=None):
+    r = Mock()
+    r.status_code = status
+    r.headers = headers or {}
+    r.json.return_value = body
+    r.text = "x" if body is not None else ""
+    r.raise_for_status = Mock()
+    return r
+
+
+class _Server:
+    """send() stand-in: records the extra headers of each call and returns queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def __call__(self, headers):
+        self.sent.append(dict(headers))
+        return self.responses.pop(0)
+
+
+def _parse(response):
+    return response.json()
+
+
+def _get(cache, server, submittal_id=7, ttl=60):
+    return cache.get(f"/submittals/{submittal_id}", server, _parse, tags=(submittal_tag(submittal_id),), ttl=ttl)
+
+
+def test_fresh_entry_is_served_without_a_request():
+    cache = ProcoreResponseCache()
+    server = _Server(_response({"title": "A"}))
+
+    first = _get(cache, server)
+    first["title"] = "mutated"
+
+    assert _get(cache, server) == {"title": "A"}
+    assert len(server.sent) == 1
+    assert (cache.stats()["misses"], cache.stats()["hits"]) == (1, 1)
+
+
+def test_stale_entry_revalidates_and_304_rearms_it():
+    cache = ProcoreResponseCache()
+    server = _Server(
+        _response({"title": "A"}, headers={"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT"}),
+        _response(None, status=304),
+    )
+
+    with patch("app.procore.response_cache.time.monotonic", side_effect=[0.0, 100.0, 100.0, 100.0]):
+        _get(cache, server)
+        assert _get(cache, server) == {"title": "A"}
+        assert _get(cache, server) == {"title": "A"}  # re-armed at t=100
+
+    assert server.sent[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 14 Oct 2026 10:00:00 GMT"}
+    assert len(server.sent) == 2
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_stale_entry_with_changed_body_is_replaced():
+    cache = ProcoreResponseCache()
+    server = _Server(_response({"title": "A"}, headers={"ETag": '"v1"'}), _response({"title": "B"}))
+
+    _get(cache, server, ttl=0.0001)
+    with patch("app.procore.response_cache.time.monotonic", return_value=1e9):
+        assert _get(cache, server) == {"title": "B"}
+
+
+def test_invalidate_drops_entries_and_blocks_in_flight_store():
+    cache = ProcoreResponseCache()
+    server = _Server(_response({"title": "A"}), _response({"title": "B"}), _response({"title": "C"}))
+
+    _get(cache, server)
+    assert cache.invalidate(submittal_tag(7)) == 1
+    assert _get(cache, server) == {"title": "B"}
+    assert len(server.sent) == 2
+
+    cache.invalidate(submittal_tag(7))
+
+    def racing_send(headers):
+        cache.invalidate(submittal_tag(7))  # webhook lands while this read is in flight
+        return server(headers)
+
+    assert _get(cache, racing_send) == {"title": "C"}
+    assert cache.stats()["entries"] == 0
+
+
+def test_bypass_reads_procore_and_refreshes_the_cache():
+    cache = ProcoreResponseCache()
+    server = _Server(_response({"title": "A"}, headers={"ETag": '"v1"'}), _response({"title": "B"}))
+
+    _get(cache, server)
+    with cache.bypass():
+        assert _get(cache, server) == {"title": "B"}
+    assert server.sent[1] == {}  # unconditional
+    assert _get(cache, server) == {"title": "B"}
+    assert cache.stats()["bypassed"] == 1
+
+
+def test_lru_eviction_and_zero_ttl():
+    cache = ProcoreResponseCache(max_entries=2)
+    for sid in (1, 2, 3):
+        _get(cache, _Server(_response({"id": sid})), submittal_id=sid)
+    assert (cache.stats()["entries"], cache.stats()["evicted"]) == (2, 1)
+
+    server = _Server(_response({"id": 9}), _response({"id": 9}))
+    _get(cache, server, submittal_id=9, ttl=0)
+    _get(cache, server, submittal_id=9, ttl=0)
+    assert len(server.sent) == 2
+
+
+def test_cache_key_ignores_host_and_param_order():
+    assert cache_key("https://api.procore.com/rest/v1.1/projects?b=2&a=1") == cache_key(
+        "/rest/v1.1/projects", {"a": 1, "b": 2}
+    )
+
+
+@pytest.fixture
+def procore_client():
+    from app.procore.api import ProcoreAPI
+
+    client = ProcoreAPI("id", "secret", "https://example.com/webhook")
+    with patch("app.procore.api.get_access_token", return_value="tok"), \
+         patch("app.procore.procore.get_access_token", return_value="tok"), \
+         patch("app.procore.procore.get_procore_client", return_value=client), \
+         patch("app.procore.client.get_procore_client", return_value=client):
+        yield client
+
+
+def test_api_and_workflow_reads_are_cached_until_a_webhook(app, client, procore_client):
+    from app.procore.procore import get_submittal_by_id, get_workflow_data
+
+    detail = _response({"id": 7, "title": "Stairs"})
+    workflow = _response({"attachments": []})
+    with patch.object(procore_client.session, "request", side_effect=[detail, detail]) as request, \
+         patch.object(procore_client.session, "get", side_effect=[workflow, workflow]) as get:
+        for _ in range(2):
+            assert get_submittal_by_id(99, 7)["title"] == "Stairs"
+            assert get_workflow_data(99, 7) == {"attachments": []}
+        assert (request.call_count, get.call_count) == (1, 1)
+
+        client.post("/procore/webhook", json={"resource_id": 7, "project_id": 99, "reason": "update"})
+        get_submittal_by_id(99, 7)
+        get_workflow_data(99, 7)
+        assert (request.call_count, get.call_count) == (2, 2)
+
+    stats = client.get("/procore/api/webhook/queue-stats").get_json()["response_cache"]
+    assert (stats["hits"], stats["misses"], stats["invalidated"]) == (2, 4, 2)
+
+
+def test_status_update_drops_cached_submittal(procore_client):
+    with patch.object(procore_client.session, "request",
+                      side_effect=[_response({"id": 7}), _response({}), _response({"id": 7})]) as request:
+        procore_client.get_submittal_by_id(99, 7)
+        procore_client.update_submittal_status(99, 7, 203238)
+        procore_client.get_submittal_by_id(99, 7)
+    assert request.call_count == 3
+    assert response_cache.response_cache_stats()["invalidated"] == 1
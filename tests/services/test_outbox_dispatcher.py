@@ -0,0 +1,163 @@
+"""Tests for the shared outbox dispatcher (app/services/outbox_dispatcher.py).
+
+Locks in:
+  - a claim takes each key's due rows together, in id order, and flips them to 'processing' in one statement
+  - an earlier row for the same key that is in flight or waiting out a retry holds the key's later rows back
+  - a row left to retry stops its group; the group's later rows go back to 'pending' unattempted
+  - groups for different keys run side by side on the pool, each group on one thread in order
+  - Trello items are keyed by release through their event; Procore items by submittal
+  - stuck 'processing' claims are handed back
+"""
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.models import ProcoreOutbox, ReleaseEvents, TrelloOutbox, db
+from app.services import outbox_dispatcher
+from app.services.outbox_dispatcher import OutboxDispatcher, OutboxSpec
+from app.services.outbox_service import OutboxService, _procore_submittal_key, _trello_card_key
+
+
+def _procore_row(submittal_id, **extra):
+    row = ProcoreOutbox(submittal_id=submittal_id, project_id=7, action="update_status",
+                        request_payload={"status_id": 203238}, status="pending",
+                        next_retry_at=datetime.utcnow(), **extra)
+    db.session.add(row)
+    db.session.commit()
+    return row.id
+
+
+def _status(item_id, model=ProcoreOutbox):
+    db.session.expire_all()
+    return db.session.get(model, item_id).status
+
+
+def _dispatcher(handler, workers=1):
+    return OutboxDispatcher(
+        OutboxSpec(name="test", model=ProcoreOutbox, key=_procore_submittal_key, handler=handler),
+        max_workers=workers,
+    )
+
+
+class TestClaim:
+    def test_takes_each_keys_rows_in_order(self, app):
+        a1, b1, a2 = _procore_row("A"), _procore_row("B"), _procore_row("A")
+        claimed = _dispatcher(None).claim(10)
+        assert claimed == [(a1, ("A",)), (b1, ("B",)), (a2, ("A",))]
+        assert {_status(i) for i in (a1, b1, a2)} == {"processing"}
+
+    def test_in_flight_or_retrying_row_holds_its_key_back(self, app):
+        in_flight = _procore_row("A")
+        waiting = _procore_row("B", retry_count=1)
+        row = db.session.get(ProcoreOutbox, in_flight)
+        row.status = "processing"
+        row = db.session.get(ProcoreOutbox, waiting)
+        row.next_retry_at = datetime.utcnow() + timedelta(minutes=5)
+        db.session.commit()
+        a2, b2, c1 = _procore_row("A"), _procore_row("B"), _procore_row("C")
+
+        assert [item_id for item_id, _ in _dispatcher(None).claim(10)] == [c1]
+        assert (_status(a2), _status(b2)) == ("pending", "pending")
+
+    def test_key_cut_by_the_limit_is_not_split(self, app):
+        a1, b1, a2 = _procore_row("A"), _procore_row("B"), _procore_row("A")
+        assert [item_id for item_id, _ in _dispatcher(None).claim(1)] == [a1]
+        # a1 is now in flight, so a2 waits even though the limit would reach it
+        assert [item_id for item_id, _ in _dispatcher(None).claim(10)] == [b1]
+        assert _status(a2) == "pending"
+
+    def test_trello_items_are_keyed_by_release(self, app):
+        ids = []
+        for job, release, action in ((1, "A", "s1"), (2, "B", "s1"), (1, "A", "s2")):
+            ev = ReleaseEvents(job=job, release=release, action=action, payload={},
+                               payload_hash=f"h-{job}-{release}-{action}", source="Brain")
+            db.session.add(ev)
+            db.session.flush()
+            ids.append(OutboxService.add("trello", "update_notes", ev.id).id)  # notes never fold
+        db.session.commit()
+
+        dispatcher = OutboxDispatcher(OutboxSpec(name="trello-test", model=TrelloOutbox,
+                                                 key=_trello_card_key, handler=None))
+        assert dispatcher.claim(10) == [(ids[0], (1, "A")), (ids[1], (2, "B")), (ids[2], (1, "A"))]
+
+
+class TestDispatch:
+    def test_retry_stops_the_group_and_hands_the_rest_back(self, app):
+        a1, a2, b1 = _procore_row("A"), _procore_row("A"), _procore_row("B")
+        seen = []
+
+        def handler(item_id):
+            seen.append(item_id)
+            row = db.session.get(ProcoreOutbox, item_id)
+            row.status = "pending" if item_id == a1 else "completed"
+            db.session.commit()
+            return row.status, None
+
+        assert _dispatcher(handler).dispatch(10) == 1
+        assert seen == [a1, b1]
+        assert (_status(a1), _status(a2), _status(b1)) == ("pending", "pending", "completed")
+
+    def test_groups_run_side_by_side_in_order(self, app):
+        rows = [_procore_row(key) for key in ("A", "B", "A", "B")]
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+        lock = threading.Lock()
+
+        def handler(item_id):
+            if item_id in rows[:2]:
+                barrier.wait()  # both cards' first rows in flight at once
+            with lock:
+                calls.append((item_id, threading.current_thread().name))
+            return "completed", item_id
+
+        after = MagicMock()
+        dispatcher = OutboxDispatcher(
+            OutboxSpec(name="test", model=ProcoreOutbox, key=_procore_submittal_key,
+                       handler=handler, after_batch=after),
+            max_workers=4,
+        )
+        with patch.object(outbox_dispatcher, "in_memory_database", return_value=False):
+            assert dispatcher.dispatch(10) == 4
+
+        threads = {item_id: name for item_id, name in calls}
+        assert threads[rows[0]] == threads[rows[2]] != threads[rows[1]] == threads[rows[3]]
+        order = [item_id for item_id, _ in calls]
+        assert order.index(rows[0]) < order.index(rows[2]) and order.index(rows[1]) < order.index(rows[3])
+        assert sorted(after.call_args.args[0]) == sorted(rows)
+        assert dispatcher.stats()["max_parallel_groups"] == 2
+
+    def test_stale_claims_are_released(self, app):
+        item_id = _procore_row("A")
+        dispatcher = _dispatcher(None)
+        dispatcher.claim(1)
+        assert dispatcher.release_stale(older_than_seconds=60) == 0
+
+        row = db.session.get(ProcoreOutbox, item_id)
+        row.next_retry_at = datetime.utcnow() - timedelta(minutes=5)
+        db.session.commit()
+        assert dispatcher.release_stale(older_than_seconds=60) == 1
+        assert _status(item_id) == "pending"
+
+
+class TestProcoreOutbox:
+    def test_pending_rows_are_sent_per_submittal_in_order(self, app):
+        first, second = _procore_row("11"), _procore_row("11")
+        client = MagicMock()
+        with patch("app.procore.client.get_procore_client", return_value=client):
+            assert OutboxService.process_pending_procore_items(limit=10) == 2
+        assert client.update_submittal_status.call_count == 2
+        client.update_submittal_status.assert_called_with(7, 11, 203238)
+        assert (_status(first), _status(second)) == ("completed", "completed")
+
+    def test_failure_retries_with_backoff(self, app):
+        item_id = _procore_row("11")
+        client = MagicMock()
+        client.update_submittal_status.side_effect = RuntimeError("procore down")
+        with patch("app.procore.client.get_procore_client", return_value=client):
+            assert OutboxService.process_pending_procore_items(limit=10) == 0
+
+        db.session.expire_all()
+        row = db.session.get(ProcoreOutbox, item_id)
+        assert (row.status, row.retry_count) == ("pending", 1)
+        assert row.next_retry_at > datetime.utcnow()
+        assert "procore down" in row.error_message
@@ -174,9 +174,10 @@ def test_process_pending_items_returns_zero_when_empty(app):
 
 def test_process_pending_items_respects_limit(app):
     with app.app_context():
-        make_release(1, "A", trello_card_id="card-123")
+        # One card per item: moves for the same card would fold into one
         for i in range(3):
-            _add_move_card_item(_make_event(action=f"update_stage_{i}").id)
+            make_release(1, f"A{i}", trello_card_id=f"card-{i}")
+            _add_move_card_item(_make_event(release=f"A{i}").id)
 
         with _trello_move_patches() as mock_api:
             assert OutboxService.process_pending_items(limit=2) == 2
@@ -405,3 +406,120 @@ def test_create_card_retry_failure_does_not_double_invoke(app):
         assert item.retry_count == 2
         assert item.status == "pending"
         assert "still 500" in (item.error_message or "")
+
+
+# ---------------------------------------------------------------------------
+# Coalescing: superseded updates for the same card fold into the newest one
+# ---------------------------------------------------------------------------
+
+def _add_item(action, payload, job=1, release="A", event_action=None):
+    ev = ReleaseEvents(
+        job=job, release=release, action=event_action or action, payload=payload,
+        payload_hash=f"hash-{job}-{release}-{action}-{sorted(payload.items())}",
+        source="Brain",
+    )
+    db.session.add(ev)
+    db.session.flush()
+    item = OutboxService.add(destination="trello", action=action, event_id=ev.id)
+    db.session.commit()
+    return item
+
+
+def test_add_supersedes_pending_updates_for_the_same_card(app):
+    with app.app_context():
+        move1 = _add_item("move_card", {"to": "Paint Start"})
+        other_card = _add_item("move_card", {"to": "Paint Start"}, release="B")
+        notes = _add_item("update_notes", {"to": "call the GC"})
+        fab = _add_item("update_fab_order", {"to": 4})
+        move2 = _add_item("move_card", {"to": "Ship Planning"})
+
+        db.session.expire_all()
+        assert [db.session.get(TrelloOutbox, i.id).status for i in (move1, fab)] == ["superseded"] * 2
+        assert {db.session.get(TrelloOutbox, i.id).superseded_by_id for i in (move1, fab)} == {move2.id}
+        # Other cards, comments and the head itself are untouched
+        assert db.session.get(TrelloOutbox, other_card.id).status == "pending"
+        assert db.session.get(TrelloOutbox, notes.id).status == "pending"
+        assert [i.id for i in OutboxService.folded_items(move2)] == [move1.id, fab.id]
+
+
+def test_add_does_not_fold_items_already_in_flight(app):
+    with app.app_context():
+        move1 = _add_item("move_card", {"to": "Paint Start"})
+        move1.status = "processing"
+        db.session.commit()
+        move2 = _add_item("move_card", {"to": "Ship Planning"})
+
+        db.session.expire_all()
+        assert db.session.get(TrelloOutbox, move1.id).status == "processing"
+        assert OutboxService.folded_items(move2) == []
+
+
+def test_folded_item_sends_one_card_put_with_the_latest_state(app):
+    with app.app_context():
+        make_release(
+            1, "A", trello_card_id="card-555", job_name="Acme Tower", description="Stair Core",
+            install_hrs=10, pm="Bill", by="Dan", num_guys=2,
+        )
+        move1 = _add_item("move_card", {"to": "Paint Start"})
+        fields = _add_item("update_release_fields",
+                           {"job_name": {"old_value": "Old", "new_value": "Acme Tower"}}, event_action="updated")
+        fab1 = _add_item("update_fab_order", {"to": 4})
+        move2 = _add_item("move_card", {"to": "Ship Planning"})
+        fab2 = _add_item("update_fab_order", {"to": 2.5})
+
+        with patch("app.brain.job_log.routes.get_list_id_by_stage", side_effect=lambda s: f"list-{s}"), \
+             patch("app.trello.api.update_trello_card") as mock_put, \
+             patch("app.trello.api.update_card_custom_field_number", return_value=True) as mock_fab, \
+             patch("app.trello.api.update_mirror_card_content") as mock_mirror, \
+             patch("app.config.Config.FAB_ORDER_FIELD_ID", "fab-field"):
+            assert OutboxService.process_pending_items(limit=10) == 1
+
+        mock_put.assert_called_once_with(
+            "card-555", new_list_id="list-Ship Planning", new_name="1-A Acme Tower Stair Core", new_description=None,
+        )
+        mock_fab.assert_called_once_with("card-555", "fab-field", 3)
+        assert mock_mirror.call_args.kwargs["new_title"] == "1-A Acme Tower Stair Core"
+
+        db.session.expire_all()
+        head = db.session.get(TrelloOutbox, fab2.id)
+        assert head.status == "completed"
+        for item in (move1, fields, fab1, move2):
+            row = db.session.get(TrelloOutbox, item.id)
+            assert (row.status, row.superseded_by_id) == ("superseded", fab2.id)
+            assert row.event.applied_at is not None
+
+
+def test_folded_item_failure_retries_the_head_only(app):
+    with app.app_context():
+        make_release(1, "A", trello_card_id="card-123")
+        move1 = _add_item("move_card", {"to": "Paint Start"})
+        move2 = _add_item("move_card", {"to": "Ship Planning"})
+
+        with _trello_move_patches(side_effect=Exception("boom")):
+            assert OutboxService.process_item(move2) is False
+
+        db.session.expire_all()
+        head = db.session.get(TrelloOutbox, move2.id)
+        assert (head.status, head.retry_count) == ("pending", 1)
+        folded = db.session.get(TrelloOutbox, move1.id)
+        assert folded.status == "superseded" and folded.event.applied_at is None
+
+
+def test_dispatcher_folds_a_claimed_group(app):
+    with app.app_context():
+        make_release(1, "A", trello_card_id="card-123")
+        move1 = _add_item("move_card", {"to": "Paint Start"})
+        # Queued behind an in-flight item, so add() could not fold it
+        move1.status = "processing"
+        db.session.commit()
+        move2 = _add_item("move_card", {"to": "Ship Planning"})
+        move1.status = "pending"
+        db.session.commit()
+
+        with _trello_move_patches() as mock_api:
+            assert OutboxService.process_pending_items(limit=10) == 1
+        mock_api.assert_called_once_with("card-123", new_list_id="list-xyz", new_name=None, new_description=None)
+
+        db.session.expire_all()
+        assert db.session.get(TrelloOutbox, move1.id).status == "superseded"
+        assert db.session.get(TrelloOutbox, move2.id).status == "completed"
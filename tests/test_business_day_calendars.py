@@ -1,14 +1,21 @@
 """N4 two-calendar business-day math: shop Mon–Thu vs field Mon–Fri."""
-from datetime import date
+import random
+from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
 from app.trello.utils import (
     CALENDAR_FIELD,
     CALENDAR_SHOP,
+    BusinessDayIndex,
+    _walk_business_days,
     add_business_days,
+    add_business_days_array,
+    business_days_between,
     calculate_business_days_before,
     is_business_day,
+    set_calendar_holidays,
 )
 
 
@@ -99,3 +106,67 @@ def test_fab_projection_uses_shop_calendar():
     assert calculate_projected_fab_complete_date(1, THU) == MON
     # ~1 shop-week of queue (4 days @ FAB_HOURS_PER_DAY) from Monday → next Monday.
     assert calculate_projected_fab_complete_date(4, MON) == date(2026, 8, 17)
+
+
+# ---------------------------------------------------------------------------
+# Calendar index: O(1) lookups must match the day-by-day walk exactly.
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("calendar", [CALENDAR_SHOP, CALENDAR_FIELD])
+def test_index_matches_walk(calendar):
+    rng = random.Random(7)
+    for _ in range(2000):
+        start = date(2026, 1, 1) + timedelta(days=rng.randint(-1500, 2500))
+        n = rng.randint(1, 300)
+        assert add_business_days(start, n, calendar=calendar) == _walk_business_days(start, n, 1, calendar)
+        assert calculate_business_days_before(start, n, calendar=calendar) == _walk_business_days(start, n, -1, calendar)
+
+
+def test_out_of_window_falls_back_to_walk():
+    index = BusinessDayIndex(CALENDAR_SHOP, date(2026, 8, 1), date(2026, 8, 31))
+    assert index.add(date(2026, 7, 1), 1) is None
+    assert index.add(MON, 100) is None
+    assert index.subtract(date(2026, 8, 3), 5) is None
+    # Public helpers still answer for dates far outside the cached window.
+    far = date(1990, 1, 4)  # Thursday
+    assert add_business_days(far, 1, calendar=CALENDAR_SHOP) == date(1990, 1, 8)
+
+
+def test_fractional_business_days_round_up_like_the_walk():
+    assert add_business_days(MON, 2.5, calendar=CALENDAR_FIELD) == add_business_days(MON, 3, calendar=CALENDAR_FIELD)
+
+
+@pytest.mark.parametrize("calendar", [CALENDAR_SHOP, CALENDAR_FIELD])
+def test_vectorized_add_matches_scalar(calendar):
+    rng = random.Random(11)
+    starts = [date(2026, 1, 1) + timedelta(days=rng.randint(-400, 800)) for _ in range(500)]
+    offsets = [rng.randint(-3, 250) for _ in starts]
+    result = add_business_days_array(starts, offsets, calendar=calendar)
+    assert result.dtype == np.dtype("datetime64[D]")
+    assert result.tolist() == [add_business_days(s, o, calendar=calendar) for s, o in zip(starts, offsets)]
+
+
+def test_vectorized_add_broadcasts_scalar_start():
+    result = add_business_days_array(MON, [0, 1, 4, 5], calendar=CALENDAR_SHOP)
+    assert result.tolist() == [MON, date(2026, 8, 11), date(2026, 8, 17), date(2026, 8, 18)]
+
+
+def test_business_days_between_inverts_add():
+    assert business_days_between(MON, date(2026, 8, 17), calendar=CALENDAR_SHOP) == 4
+    assert business_days_between(MON, date(2026, 8, 17), calendar=CALENDAR_FIELD) == 5
+    assert business_days_between(date(2026, 8, 17), MON, calendar=CALENDAR_FIELD) == -5
+    assert business_days_between(MON, MON) == 0
+
+
+def test_holidays_are_skipped_and_resettable():
+    holiday = date(2026, 8, 11)  # Tuesday
+    try:
+        set_calendar_holidays([holiday], calendar=CALENDAR_SHOP)
+        assert is_business_day(holiday, calendar=CALENDAR_SHOP) is False
+        assert add_business_days(MON, 1, calendar=CALENDAR_SHOP) == date(2026, 8, 12)
+        assert calculate_business_days_before(date(2026, 8, 12), 1, calendar=CALENDAR_SHOP) == MON
+        # Field calendar untouched.
+        assert add_business_days(MON, 1, calendar=CALENDAR_FIELD) == holiday
+    finally:
+        set_calendar_holidays([], calendar=CALENDAR_SHOP)
+    assert add_business_days(MON, 1, calendar=CALENDAR_SHOP) == holiday
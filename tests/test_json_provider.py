@@ -0,0 +1,46 @@
+"""Tests for the orjson Flask JSON provider.
+
+Locks in parity with Flask's DefaultJSONProvider: sorted keys, HTTP-date strings for
+dates, trailing newline, and fallback to the stdlib for what orjson can't encode.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from app.json_provider import OrjsonProvider
+
+
+def test_app_uses_orjson_provider(app):
+    assert isinstance(app.json, OrjsonProvider)
+
+
+def test_output_matches_default_provider(app):
+    payload = {
+        "b": 1,
+        "a": [1.5, None, True, "ü"],
+        "when": datetime(2026, 4, 1, 12, 30),
+        "day": date(2026, 4, 1),
+        "amount": Decimal("12.50"),
+    }
+    expected = json.loads(DefaultJSONProvider(app).dumps(payload))
+    assert json.loads(app.json.dumps(payload)) == expected
+    assert list(json.loads(app.json.dumps(payload))) == list(expected)
+
+
+def test_response_bytes_and_fallback(app):
+    app.json.compact = True
+    with app.test_request_context():
+        response = jsonify({"z": 1, "a": 2})
+        assert response.mimetype == "application/json"
+        assert response.get_data() == b'{"a":2,"z":1}\n'
+
+        huge = jsonify({"n": 2 ** 70})
+        assert json.loads(huge.get_data()) == {"n": 2 ** 70}
+
+
+def test_nan_encodes_as_null_and_loads_accepts_nan(app):
+    assert app.json.dumps({"x": float("nan")}) == '{"x":null}'
+    assert app.json.loads('{"x": NaN}')["x"] != app.json.loads('{"x": NaN}')["x"]
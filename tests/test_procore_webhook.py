@@ -1,11 +1,15 @@
 """Tests for app/procore/__init__.py — POST /procore/webhook handler.
 
+The endpoint queues accepted deliveries (202); tests that check the create /
+update handling drain the queue with drain_procore_queue() after posting.
 Helpers (`is_duplicate_webhook`, `parse_ball_in_court_from_submittal`) are
-covered in tests/procore/test_helpers.py.
+covered in tests/procore/test_helpers.py; the queue itself in
+tests/procore/test_inbound_queue.py.
 """
 from unittest.mock import patch, MagicMock
 
-from app.models import Submittals, SubmittalReconcile, db
+from app.models import ProcoreInboundEvent, Submittals, SubmittalReconcile, db
+from app.procore import drain_procore_queue
 
 
 def _payload(resource_id=42, project_id=99, reason="update", resource_type="submittals"):
@@ -52,6 +56,12 @@ def test_duplicate_webhook_returns_deduplicated(client):
     mock_update.assert_not_called()
 
 
+def _post_and_drain(client, payload):
+    resp = client.post("/procore/webhook", json=payload)
+    drain_procore_queue()
+    return resp
+
+
 def _record_mock(**kwargs):
     record = MagicMock()
     record.title = kwargs.get("title", "Submittal 042")
@@ -66,7 +76,7 @@ def test_create_event_calls_create_submittal_from_webhook(client):
              "app.procore.create_submittal_from_webhook",
              return_value=(True, _record_mock(), None),
          ) as mock_create:
-        client.post("/procore/webhook", json=_payload(reason="create"))
+        _post_and_drain(client, _payload(reason="create"))
 
     kwargs = mock_create.call_args.kwargs
     assert kwargs["source"] == "Procore"
@@ -91,7 +101,7 @@ def test_update_event_with_existing_submittal_calls_check_and_update(app, client
              "app.procore.check_and_update_submittal",
              return_value=(False, False, False, False, _record_mock(), "Drafter A", "Open"),
          ) as mock_update:
-        client.post("/procore/webhook", json=_payload(reason="update"))
+        _post_and_drain(client, _payload(reason="update"))
 
     mock_update.assert_called_once()
     mock_create.assert_not_called()
@@ -109,7 +119,7 @@ def test_update_event_missing_submittal_falls_back_to_create(client):
              "app.procore.check_and_update_submittal",
              return_value=(False, False, False, False, record, None, None),
          ):
-        client.post("/procore/webhook", json=_payload(reason="update"))
+        _post_and_drain(client, _payload(reason="update"))
 
     mock_create.assert_called_once()
 
@@ -118,12 +128,41 @@ def test_unknown_event_type_is_ignored(client):
     with patch("app.procore.is_duplicate_webhook", return_value=False), \
          patch("app.procore.create_submittal_from_webhook") as mock_create, \
          patch("app.procore.check_and_update_submittal") as mock_update:
-        client.post("/procore/webhook", json=_payload(reason="delete"))
+        resp = _post_and_drain(client, _payload(reason="delete"))
+
+    assert resp.get_json()["status"] == "ignored"
+    assert ProcoreInboundEvent.query.count() == 0
+    mock_create.assert_not_called()
+    mock_update.assert_not_called()
+
+
+def test_accepted_webhook_is_queued_without_calling_procore(client):
+    with patch("app.procore.is_duplicate_webhook", return_value=False), \
+         patch("app.procore.create_submittal_from_webhook") as mock_create, \
+         patch("app.procore.check_and_update_submittal") as mock_update:
+        resp = client.post("/procore/webhook", json=_payload(resource_id=42, reason="update"))
 
+    assert resp.status_code == 202
+    body = resp.get_json()
+    assert body["status"] == "queued"
+    row = db.session.get(ProcoreInboundEvent, body["event_id"])
+    assert (row.submittal_id, row.project_id, row.event_type, row.status) == ("42", 99, "update", "pending")
+    assert row.payload["reason"] == "update"
     mock_create.assert_not_called()
     mock_update.assert_not_called()
 
 
+def test_full_queue_answers_429_before_dedup(app, client):
+    with patch("app.procore.inbound_queue.is_full", return_value=True), \
+         patch("app.procore.is_duplicate_webhook") as dedup:
+        resp = client.post("/procore/webhook", json=_payload(resource_id=42, reason="update"))
+
+    assert resp.status_code == 429
+    dedup.assert_not_called()  # Procore's redelivery must not be burst-deduplicated
+    assert ProcoreInboundEvent.query.count() == 0
+    assert SubmittalReconcile.query.filter_by(submittal_id="42").count() == 1
+
+
 # ---- reconcile safety net enqueue ----
 
 def test_update_webhook_enqueues_reconcile(app, client):
@@ -0,0 +1,34 @@
+"""Tests for app.rate_limit.TokenBucket.
+
+Locks in:
+  - the bucket blocks once its budget is spent and refills at its rate
+  - a pause holds every caller and drains the bucket
+"""
+import pytest
+
+from app.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    def test_blocks_once_budget_spent(self):
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(capacity=3, refill_per_second=1.0, clock=lambda: now[0], sleep=sleep)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(1.0)
+        assert slept == [pytest.approx(1.0)]
+
+    def test_pause_holds_callers_and_drains(self):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        bucket = TokenBucket(capacity=10, refill_per_second=10.0, clock=lambda: now[0], sleep=sleep)
+        bucket.pause(2.0)
+        assert bucket.acquire() == pytest.approx(2.1)
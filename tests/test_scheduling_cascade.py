@@ -11,6 +11,18 @@ from app.brain.job_log.scheduling.calculator import (
 )
 
 
+def _apply_bulk_writes(mock_db, recs):
+    """Replay the bulk_update_mappings calls onto the mock rows (keyed by id) so
+    assertions can read the written values off the records, as with the ORM."""
+    by_id = {rec.id: rec for rec in recs}
+    for call in mock_db.session.bulk_update_mappings.call_args_list:
+        for mapping in call.args[1]:
+            rec = by_id[mapping['id']]
+            for key, value in mapping.items():
+                if key != 'id':
+                    setattr(rec, key, value)
+
+
 class TestRedDateProtection:
     """Verify that hard-date (red date) releases are not overwritten by the cascade."""
 
@@ -48,6 +60,7 @@ class TestRedDateProtection:
         mock_releases.query.all.return_value = releases
 
         result = recalculate_all_jobs_scheduling(reference_date=date(2026, 4, 1))
+        _apply_bulk_writes(mock_db, releases)
 
         # Hard date release should be untouched
         assert releases[0].start_install == hard_date
@@ -71,6 +84,7 @@ class TestRedDateProtection:
         mock_releases.query.all.return_value = releases
 
         result = recalculate_all_jobs_scheduling(reference_date=date(2026, 4, 1))
+        _apply_bulk_writes(mock_db, releases)
 
         # Formula-driven date should be recalculated (different from old stale value)
         assert releases[0].start_install != old_date
@@ -89,6 +103,7 @@ class TestRedDateProtection:
         mock_releases.query.all.return_value = releases
 
         recalculate_all_jobs_scheduling(reference_date=date(2026, 4, 1))
+        _apply_bulk_writes(mock_db, releases)
 
         # Should be updated (not skipped)
         assert releases[0].start_install is not None
@@ -148,6 +163,7 @@ class TestHoldReleaseCascade:
         mock_releases.query.all.return_value = [rec]
 
         recalculate_all_jobs_scheduling(reference_date=date(2026, 4, 1))
+        _apply_bulk_writes(mock_db, [rec])
 
         assert rec.start_install is not None
         assert rec.comp_eta is not None
@@ -282,9 +298,225 @@ class TestSentinelChronologicalCascade:
         mock_releases.query.all.return_value = [rec_c, rec_a, rec_b]
 
         recalculate_all_jobs_scheduling(reference_date=date(2026, 4, 1))
+        _apply_bulk_writes(mock_db, [rec_c, rec_a, rec_b])
 
         # Earliest existing start_install (C) is first in queue → earliest recomputed date,
         # then A, then B — strictly non-decreasing in chronological order of the OLD dates.
         assert rec_c.start_install <= rec_a.start_install <= rec_b.start_install
         # And they must not all collapse onto the same date (they have differing hours).
         assert rec_c.start_install < rec_b.start_install
+
+
+class TestColumnarEngine:
+    """compute_scheduling must match calculate_scheduling_fields: remaining hours,
+    days_in_front and dates exactly, and hours_in_front exactly whenever the hours
+    sum without rounding (otherwise to the last bits of the float sum)."""
+
+    def _jobs(self, n, seed):
+        import random
+        from app.api.helpers import DEFAULT_FAB_ORDER
+
+        rng = random.Random(seed)
+        stages = ['Released', 'Cut Start', 'Fitup Complete', 'Weld Complete', 'Hold',
+                  'Complete', None, 'weld start ', 'Unknown Stage']
+        jobs = []
+        for _ in range(n):
+            jobs.append({
+                'fab_hrs': rng.choice([None, -4.0, 0.0, float(rng.randint(1, 400)) / 3]),
+                'install_hrs': rng.choice([None, 0.0, float(rng.randint(1, 200))]),
+                'fab_order': rng.choice([None, DEFAULT_FAB_ORDER, float('nan'), rng.randint(1, 60)]),
+                'stage': rng.choice(stages),
+                'num_guys': rng.choice([None, 0, 1, 2.0, 3, 5.0]),
+                'is_hard_date': rng.random() < 0.1,
+            })
+        return jobs
+
+    def _assert_matches_scalar(self, result, expected, exact_hours):
+        if not exact_hours:
+            assert result['hours_in_front'] == pytest.approx(expected['hours_in_front'], rel=1e-12, abs=1e-12)
+            result = {**result, 'hours_in_front': expected['hours_in_front']}
+        assert result == expected
+
+    def test_matches_scalar_formulas_exactly(self):
+        from app.brain.job_log.scheduling.calculator import calculate_scheduling_fields
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        ref = date(2026, 4, 1)
+        for seed in range(5):
+            jobs = self._jobs(400, seed)
+            result = compute_scheduling(SchedulingColumns.from_jobs(jobs), ref).to_dicts()
+            for i, job in enumerate(jobs):
+                self._assert_matches_scalar(
+                    result[i], calculate_scheduling_fields(job, jobs, ref, job_index=i), exact_hours=False
+                )
+
+    def test_whole_and_half_hours_match_bit_for_bit(self):
+        import random
+        from app.brain.job_log.scheduling.calculator import calculate_scheduling_fields
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        rng = random.Random(11)
+        jobs = [
+            {
+                'fab_hrs': rng.randint(1, 160) / 2,
+                'install_hrs': float(rng.randint(0, 60)),
+                'fab_order': rng.choice([None, rng.randint(1, 40)]),
+                'stage': rng.choice(['Released', 'Fitup Complete', 'Complete']),
+                'num_guys': rng.choice([None, 3]),
+                'is_hard_date': rng.random() < 0.1,
+            }
+            for _ in range(400)
+        ]
+        ref = date(2026, 4, 1)
+        result = compute_scheduling(SchedulingColumns.from_jobs(jobs), ref).to_dicts()
+        for i, job in enumerate(jobs):
+            assert result[i] == calculate_scheduling_fields(job, jobs, ref, job_index=i)
+
+    def test_fractional_hours_never_flip_a_day(self):
+        """Queue-order and list-order sums of fractional hours differ in the last
+        bits; rows near a day boundary are re-summed in list order, so days and
+        dates stay identical to the scalar formulas."""
+        import random
+        from app.brain.job_log.scheduling.calculator import calculate_scheduling_fields
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        rng = random.Random(6000)
+        jobs = [
+            {
+                'fab_hrs': round(rng.uniform(0.1, 60.0), rng.choice([1, 2, 3])),
+                'install_hrs': round(rng.uniform(0.0, 50.0), rng.choice([1, 2])),
+                'fab_order': rng.randint(1, 400),
+                'stage': rng.choice(['Released', 'Cut Start', 'Fitup Complete', 'Weld Complete']),
+                'num_guys': rng.choice([None, 1, 2.5, 3]),
+                'is_hard_date': False,
+            }
+            for _ in range(6000)
+        ]
+        ref = date(2026, 4, 1)
+
+        result = compute_scheduling(SchedulingColumns.from_jobs(jobs), ref).to_dicts()
+
+        # The scalar formula is O(n) per release, so spot-check a sample of rows.
+        for i in rng.sample(range(len(jobs)), 300):
+            self._assert_matches_scalar(
+                result[i],
+                calculate_scheduling_fields(job=jobs[i], all_jobs=jobs, reference_date=ref, job_index=i),
+                exact_hours=False,
+            )
+
+    def test_sum_landing_on_a_day_boundary_uses_the_list_order_sum(self):
+        """80.73 + 102.43 + 24.84 is 208.00000000000003 in list order but can be
+        208.0 (exactly two days) in queue order; the scalar formula says three."""
+        from app.brain.job_log.scheduling.calculator import calculate_scheduling_fields
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        ref = date(2026, 4, 1)
+        hours = [80.73, 102.43, 24.84]
+        for fab_orders in ([1, 2, 3], [3, 1, 2], [2, 3, 1], [1, 3, 2]):
+            jobs = [
+                {'fab_hrs': h, 'install_hrs': 8.0, 'fab_order': o, 'stage': 'Released',
+                 'num_guys': None, 'is_hard_date': False}
+                for h, o in zip(hours, fab_orders)
+            ] + [{'fab_hrs': 1.0, 'install_hrs': 8.0, 'fab_order': 10, 'stage': 'Released',
+                  'num_guys': None, 'is_hard_date': False}]
+            result = compute_scheduling(SchedulingColumns.from_jobs(jobs), ref).to_dicts()
+            expected = calculate_scheduling_fields(jobs[3], jobs, ref, job_index=3)
+            assert result[3] == expected
+
+    def test_tiny_install_hours_finish_on_the_start_date(self):
+        from app.brain.job_log.scheduling.calculator import calculate_scheduling_fields
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        ref = date(2026, 4, 1)
+        jobs = [{'fab_hrs': 10.0, 'install_hrs': h, 'fab_order': 1, 'stage': 'Released',
+                 'num_guys': None, 'is_hard_date': False} for h in (1e-7, 0.0)]
+        result = compute_scheduling(SchedulingColumns.from_jobs(jobs), ref).to_dicts()
+        for i, job in enumerate(jobs):
+            expected = calculate_scheduling_fields(job, jobs, ref, job_index=i)
+            assert expected['install_complete_date'] == expected['install_start_date']
+            assert result[i] == expected
+
+    def _hours_in_front(self, rows):
+        """compute_scheduling hours_in_front for (fab_order, fab_hrs, is_hard_date) rows at 100% remaining."""
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        jobs = [
+            {'fab_hrs': hours, 'install_hrs': None, 'fab_order': fab_order, 'stage': 'Released',
+             'num_guys': None, 'is_hard_date': hard}
+            for fab_order, hours, hard in rows
+        ]
+        result = compute_scheduling(SchedulingColumns.from_jobs(jobs), date(2026, 4, 1))
+        reference = [
+            calculate_hours_in_front(
+                job['fab_order'],
+                [{**j, 'remaining_fab_hours': calculate_remaining_fab_hours(j['fab_hrs'], j['stage'])} for j in jobs],
+                job_index=i,
+            )
+            for i, job in enumerate(jobs)
+        ]
+        assert result.hours_in_front.tolist() == reference
+        return reference
+
+    def test_none_fab_order_rows_sit_at_tail(self):
+        # Real-order rows never see the None tail; None rows see all real work
+        # (minus hard dates) plus earlier None rows.
+        assert self._hours_in_front([
+            (None, 10.0, False),
+            (7, 20.0, False),
+            (None, 30.0, False),
+            (2, 40.0, True),
+        ]) == [20.0, 0.0, 30.0, 0.0]
+
+    def test_nan_fab_order_sees_nothing_in_front(self):
+        assert self._hours_in_front([
+            (float('nan'), 10.0, False),
+            (3, 20.0, False),
+            (None, 30.0, False),
+        ]) == [0.0, 0.0, 30.0]
+
+    def test_equal_fab_orders_cascade_by_list_index(self):
+        from app.api.helpers import DEFAULT_FAB_ORDER
+
+        assert self._hours_in_front([
+            (DEFAULT_FAB_ORDER, 10.0, False),
+            (DEFAULT_FAB_ORDER, 20.0, False),
+            (1, 5.0, False),
+            (DEFAULT_FAB_ORDER, 40.0, False),
+        ]) == [5.0, 15.0, 0.0, 35.0]
+
+    def test_batch_dates_match_single_job_calculation(self):
+        from app.brain.job_log.scheduling.calculator import calculate_scheduling_fields
+
+        jobs = [
+            {'fab_hrs': 300.0, 'install_hrs': 40.0, 'stage': 'Released', 'fab_order': 3, 'num_guys': 3},
+            {'fab_hrs': 150.0, 'install_hrs': 0.0, 'stage': 'Weld Start', 'fab_order': 1},
+            {'fab_hrs': 90.0, 'install_hrs': 24.0, 'stage': 'Released', 'fab_order': None},
+            {'fab_hrs': 500.0, 'install_hrs': 16.0, 'stage': 'Cut Start', 'fab_order': 3},
+        ]
+        ref = date(2026, 4, 1)
+
+        results = calculate_all_job_scheduling(jobs, reference_date=ref)
+
+        for i, job in enumerate(jobs):
+            expected = calculate_scheduling_fields(job, jobs, ref, job_index=i)
+            for key, value in expected.items():
+                assert results[i][key] == value
+
+    def test_empty_queue(self):
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns, compute_scheduling
+
+        assert compute_scheduling(SchedulingColumns.from_jobs([]), date(2026, 4, 1)).to_dicts() == []
+
+    def test_from_releases_applies_db_conventions(self):
+        from app.brain.job_log.scheduling.columnar import SchedulingColumns
+
+        rows = [
+            MagicMock(fab_hrs=10.0, install_hrs=8.0, fab_order=float('nan'), stage=None,
+                      num_guys=None, start_install_formulaTF=False),
+            MagicMock(fab_hrs=20.0, install_hrs=8.0, fab_order=2.0, stage='Cut Start',
+                      num_guys=3.0, start_install_formulaTF=None),
+        ]
+        columns = SchedulingColumns.from_releases(rows)
+        assert columns.fab_order == [None, 2.0]
+        assert columns.stage == ['Released', 'Cut Start']
+        assert columns.is_hard_date == [True, False]
@@ -1,10 +1,18 @@
-"""Tests for app/sync_lock.py — SyncLockManager and synchronized_sync."""
+"""Tests for app/sync_lock.py — SyncLockManager (board-wide and keyed locks) and synchronized_sync."""
 import threading
 import time
 
 import pytest
 
-from app.sync_lock import SyncLockManager, synchronized_sync, sync_lock_manager
+from app.sync_lock import (
+    SyncLockManager,
+    SyncLockUnavailable,
+    card_key,
+    list_key,
+    release_key,
+    synchronized_sync,
+    sync_lock_manager,
+)
 
 
 def test_initial_state_is_unlocked():
@@ -119,3 +127,119 @@ def test_synchronized_sync_propagates_function_exception():
 
 def test_module_singleton_is_a_sync_lock_manager():
     assert isinstance(sync_lock_manager, SyncLockManager)
+
+
+# ---------------------------------------------------------------------------
+# Keyed locks
+# ---------------------------------------------------------------------------
+
+def test_unrelated_cards_hold_keys_at_the_same_time():
+    mgr = SyncLockManager()
+    both_inside = threading.Barrier(2, timeout=2)
+
+    def sync(card):
+        with mgr.acquire_keys("hook", [card_key(card)]):
+            both_inside.wait()  # BrokenBarrierError if the two were serialized
+
+    threads = [threading.Thread(target=sync, args=(c,)) for c in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not both_inside.broken
+    assert mgr.stats()["keyed_acquired"] == 2
+
+
+def test_same_card_runs_in_reservation_order():
+    mgr = SyncLockManager()
+    order = []
+    first = mgr.reserve("hook", [card_key("a")])
+    second = mgr.reserve("hook", [card_key("a"), list_key("L")])
+
+    def sync(ticket, label):
+        with mgr.acquire_keys("hook", ticket=ticket):
+            order.append(label)
+
+    # Start the later ticket's worker first: it must still wait its turn.
+    t2 = threading.Thread(target=sync, args=(second, "second"))
+    t2.start()
+    time.sleep(0.05)
+    assert order == []
+    t1 = threading.Thread(target=sync, args=(first, "first"))
+    t1.start()
+    t1.join(2)
+    t2.join(2)
+    assert order == ["first", "second"]
+    assert mgr.stats()["keyed_contended"] == 1
+
+
+def test_cancelled_ticket_lets_the_next_one_run():
+    mgr = SyncLockManager()
+    stale = mgr.reserve("hook", [card_key("a")])
+    mgr.cancel(stale)
+    with mgr.acquire_keys("hook", [card_key("a")], timeout_seconds=1):
+        assert mgr.stats()["keyed_holders"] == 1
+
+
+def test_key_timeout_raises_and_frees_the_line():
+    mgr = SyncLockManager()
+    mgr.reserve("stuck", [release_key(100, "A")])
+    with pytest.raises(SyncLockUnavailable):
+        with mgr.acquire_keys("hook", [release_key(100, "A")], timeout_seconds=0.05):
+            pass
+    stats = mgr.stats()
+    assert stats["keyed_timeouts"] == 1
+    assert stats["waiting_tickets"] == 1  # only the stuck reservation remains
+
+
+def test_exclusive_waits_for_keyed_holders_and_blocks_new_ones():
+    mgr = SyncLockManager()
+    events = []
+    holding = threading.Event()
+    release_card = threading.Event()
+
+    def card_sync():
+        with mgr.acquire_keys("hook", [card_key("a")]):
+            holding.set()
+            release_card.wait(2)
+            events.append("card-done")
+
+    def scanner():
+        holding.wait(2)
+        with mgr.acquire_sync_lock("scanner", timeout_seconds=2):
+            events.append("scanner")
+            time.sleep(0.1)
+
+    def late_card():
+        while not mgr.is_locked():
+            time.sleep(0.005)
+        with mgr.acquire_keys("hook", [card_key("b")], timeout_seconds=2):
+            events.append("late-card")
+
+    threads = [threading.Thread(target=f) for f in (card_sync, scanner, late_card)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    assert mgr.is_locked() is True  # claimed while draining
+    assert events == []
+    release_card.set()
+    for t in threads:
+        t.join(3)
+    assert events == ["card-done", "scanner", "late-card"]
+    assert mgr.stats()["exclusive_acquired"] == 1
+
+
+def test_keys_inside_own_exclusive_do_not_block():
+    mgr = SyncLockManager()
+    with mgr.acquire_sync_lock("scanner"):
+        with mgr.acquire_keys("scanner-card", [card_key("a")], timeout_seconds=0.1):
+            pass
+    assert mgr.is_locked() is False
+
+
+def test_same_thread_reenters_its_own_keys():
+    mgr = SyncLockManager()
+    with mgr.acquire_keys("outer", [card_key("a")]):
+        with mgr.acquire_keys("inner", [card_key("a"), list_key("L")], timeout_seconds=0.1):
+            assert mgr.stats()["keys_held"] == 2
+    assert mgr.stats()["keys_held"] == 0
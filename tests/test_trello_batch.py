@@ -0,0 +1,285 @@
+"""Tests for app.trello.batch.TrelloBatchReader and the api helpers built on it.
+
+Locks in:
+  - paths are chunked into GET /batch calls of max_urls, commas inside a url escaped
+  - a single path goes out as a plain GET
+  - per-url statuses from the batch body (200 and error objects) come back per path
+  - 200s are cached for the TTL; use_cache=False and invalidate_card bypass / drop them
+  - a read in flight across invalidate_card answers its caller but is not cached
+  - concurrent readers of the same path share one request
+  - a failed or raising /batch call fails every path in its chunk
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from app.trello import api as trello_api
+from app.trello import batch as batch_module
+from app.trello.batch import TrelloBatchReader
+
+
+class _Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+        self.text = str(body)
+
+    def json(self):
+        return self._body
+
+
+class StubClient:
+    """Answers GET /batch from a {path: (status, body)} table and records every call."""
+
+    def __init__(self, table=None, batch_status=200):
+        self.table = table or {}
+        self.batch_status = batch_status
+        self.calls = []
+        self.gate = None
+
+    def _entry(self, path):
+        status, body = self.table.get(path, (404, {"message": "not found"}))
+        if status == 200:
+            return {"200": body}
+        return {"name": "Error", "message": str(body), "statusCode": status}
+
+    def get(self, path, params=None, **kwargs):
+        self.calls.append((path, dict(params or {})))
+        if self.gate is not None:
+            self.gate.wait(5)
+        if path == "/batch":
+            if self.batch_status != 200:
+                return _Response(self.batch_status, "batch rejected")
+            urls = [u.replace("%2C", ",") for u in params["urls"].split(",")]
+            return _Response(200, [self._entry(u) for u in urls])
+        status, body = self.table.get(path, (404, {"message": "not found"}))
+        return _Response(status, body)
+
+
+def _reader(client, **kwargs):
+    kwargs.setdefault("window_seconds", 0)
+    kwargs.setdefault("cache_ttl_seconds", 60)
+    return TrelloBatchReader(client=client, **kwargs)
+
+
+def _attachments(n):
+    return {f"/cards/c{i}/attachments": (200, [{"name": "Linked card", "fileName": f"m{i}"}]) for i in range(n)}
+
+
+def test_paths_are_chunked_into_batch_calls_of_max_urls():
+    client = StubClient(_attachments(23))
+    reader = _reader(client, max_urls=10)
+
+    results = reader.get_many([f"/cards/c{i}/attachments" for i in range(23)])
+
+    assert len(results) == 23
+    assert all(r.ok for r in results.values())
+    assert [path for path, _ in client.calls] == ["/batch", "/batch", "/batch"]
+    assert [len(params["urls"].split(",")) for _, params in client.calls] == [10, 10, 3]
+    assert results["/cards/c7/attachments"].body == [{"name": "Linked card", "fileName": "m7"}]
+
+
+def test_single_path_is_a_plain_get():
+    client = StubClient(_attachments(1))
+    result = _reader(client).get("/cards/c0/attachments")
+    assert result.ok
+    assert client.calls == [("/cards/c0/attachments", {})]
+
+
+def test_commas_inside_a_url_are_escaped():
+    table = {
+        "/cards/a?fields=id,name": (200, {"id": "a"}),
+        "/cards/b?fields=id,name": (200, {"id": "b"}),
+    }
+    client = StubClient(table)
+    results = _reader(client).get_many(table)
+    assert client.calls[0][1]["urls"] == "/cards/a?fields=id%2Cname,/cards/b?fields=id%2Cname"
+    assert results["/cards/b?fields=id,name"].body == {"id": "b"}
+
+
+def test_error_entries_keep_their_status():
+    client = StubClient({"/cards/a/attachments": (200, [])})
+    results = _reader(client).get_many(["/cards/a/attachments", "/cards/gone/attachments"])
+    assert results["/cards/a/attachments"].ok
+    assert results["/cards/gone/attachments"].status == 404
+
+
+def test_successful_reads_are_cached_until_invalidated():
+    client = StubClient(_attachments(2))
+    reader = _reader(client)
+    paths = ["/cards/c0/attachments", "/cards/c1/attachments"]
+
+    reader.get_many(paths)
+    reader.get_many(paths)
+    assert len(client.calls) == 1
+    assert reader.stats()["cache_hits"] == 2
+
+    reader.get_many(paths, use_cache=False)
+    assert len(client.calls) == 2
+
+    reader.invalidate_card("c0")
+    reader.get_many(paths)
+    assert client.calls[-1] == ("/cards/c0/attachments", {})
+
+
+def test_read_in_flight_across_an_invalidation_is_not_cached():
+    client = StubClient(_attachments(2))
+    client.gate = threading.Event()
+    reader = _reader(client)
+    paths = ["/cards/c0/attachments", "/cards/c1/attachments"]
+    results = []
+
+    reader_thread = threading.Thread(target=lambda: results.append(reader.get_many(paths)))
+    reader_thread.start()
+    while not client.calls:
+        pass
+    # A write to c0 lands while the batch holding its old attachments is in flight.
+    reader.invalidate_card("c0")
+    client.gate.set()
+    reader_thread.join(5)
+    client.gate = None
+
+    assert all(r.ok for r in results[0].values())
+    reader.get_many(paths)
+    assert client.calls[-1] == ("/cards/c0/attachments", {})
+    assert reader.stats()["cache_hits"] == 1
+
+
+def test_cache_expires_after_ttl():
+    now = [0.0]
+    client = StubClient(_attachments(1))
+    reader = _reader(client, cache_ttl_seconds=30, clock=lambda: now[0])
+    reader.get("/cards/c0/attachments")
+    now[0] = 31.0
+    reader.get("/cards/c0/attachments")
+    assert len(client.calls) == 2
+
+
+def test_failures_are_not_cached():
+    client = StubClient()
+    reader = _reader(client)
+    assert reader.get("/cards/gone/attachments").status == 404
+    reader.get("/cards/gone/attachments")
+    assert len(client.calls) == 2
+
+
+def test_concurrent_readers_share_one_request():
+    client = StubClient(_attachments(1))
+    client.gate = threading.Event()
+    reader = _reader(client)
+    results = []
+
+    def read():
+        results.append(reader.get("/cards/c0/attachments", use_cache=False))
+
+    first = threading.Thread(target=read)
+    first.start()
+    while not client.calls:
+        pass
+    second = threading.Thread(target=read)
+    second.start()
+    while reader.stats()["coalesced"] < 1:
+        pass
+    client.gate.set()
+    first.join(5)
+    second.join(5)
+
+    assert len(client.calls) == 1
+    assert len(results) == 2 and all(r.ok for r in results)
+
+
+def test_window_gathers_separate_callers_into_one_batch():
+    client = StubClient(_attachments(4))
+    reader = _reader(client, window_seconds=0.2)
+    threads = [
+        threading.Thread(target=reader.get, args=(f"/cards/c{i}/attachments",)) for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert [path for path, _ in client.calls] == ["/batch"]
+
+
+def test_rejected_batch_fails_every_path_in_the_chunk():
+    client = StubClient(_attachments(2), batch_status=429)
+    results = _reader(client).get_many(["/cards/c0/attachments", "/cards/c1/attachments"])
+    assert {r.status for r in results.values()} == {429}
+
+
+def test_raising_client_fails_paths_and_releases_the_leader():
+    class Boom(StubClient):
+        def get(self, path, params=None, **kwargs):
+            raise requests.ConnectionError("down")
+
+    reader = _reader(Boom())
+    result = reader.get("/cards/c0/attachments")
+    assert result.status is None and not result.ok
+    assert reader.stats()["inflight"] == 0
+
+    reader._client = StubClient(_attachments(1))
+    assert reader.get("/cards/c0/attachments").ok
+
+
+@pytest.fixture
+def api_reader():
+    client = StubClient()
+    reader = _reader(client)
+    with patch.object(batch_module, "_reader", reader):
+        yield client
+
+
+def test_resolve_mirror_short_links_batches_attachment_reads(api_reader):
+    api_reader.table.update(_attachments(12))
+    api_reader.table["/cards/plain/attachments"] = (200, [{"name": "FC Drawing", "url": "https://x"}])
+
+    links = trello_api.resolve_mirror_short_links([f"c{i}" for i in range(12)] + ["plain", "gone"])
+
+    assert links["c11"] == "m11"
+    assert links["plain"] is None
+    assert links["gone"] is None
+    assert [path for path, _ in api_reader.calls] == ["/batch", "/batch"]
+
+
+def test_single_card_helpers_keep_their_contracts(api_reader):
+    api_reader.table["/cards/c0/attachments"] = (200, [{"name": "Linked card", "fileName": "m0"}])
+    api_reader.table["/cards/c0/customFieldItems"] = (200, [{"idCustomField": "f", "value": {"number": "3"}}])
+
+    assert trello_api.get_card_attachments_by_card_id("c0")["attachments"][0]["fileName"] == "m0"
+    assert trello_api.resolve_mirror_card_id("c0") == "m0"
+    assert trello_api.card_has_link_to("c0") is True
+    assert trello_api.get_card_custom_field_items("c0")[0]["idCustomField"] == "f"
+
+    missing = trello_api.get_card_attachments_by_card_id("gone")
+    assert missing["success"] is False and missing["attachments"] == []
+    assert trello_api.get_card_custom_field_items("gone") is None
+    with pytest.raises(requests.exceptions.HTTPError):
+        trello_api.card_has_link_to("gone")
+
+
+def test_get_trello_cards_by_ids_batches_and_maps_deleted_cards(api_reader):
+    fields = "id,name,idList,idBoard,closed,dateLastActivity"
+    api_reader.table[f"/cards/a?fields={fields}"] = (
+        200, {"id": "a", "name": "101-201 Stairs", "idList": "L1", "idBoard": "B", "closed": False},
+    )
+    with patch.object(trello_api, "get_list_name_by_id", return_value="Released"):
+        cards = trello_api.get_trello_cards_by_ids(["a", "b"])
+    assert cards["a"]["list_name"] == "Released"
+    assert cards["b"] is None
+    assert [path for path, _ in api_reader.calls] == ["/batch"]
+
+
+def test_adding_a_procore_link_drops_the_cached_attachments(api_reader):
+    api_reader.table["/cards/c0/attachments"] = (200, [])
+    assert trello_api.get_card_attachments_by_card_id("c0")["attachments"] == []
+
+    posted = _Response(200, {"id": "att1", "url": "https://procore/x", "name": "FC Drawing - Procore Link"})
+    posted.raise_for_status = lambda: None
+    api_reader.table["/cards/c0/attachments"] = (200, [{"id": "att1", "name": "FC Drawing - Procore Link"}])
+    with patch("app.trello.api.get_trello_client") as get_client:
+        get_client.return_value.post.return_value = posted
+        assert trello_api.add_procore_link("c0", "https://procore/x")["success"] is True
+
+    assert trello_api.get_card_attachments_by_card_id("c0")["attachments"][0]["id"] == "att1"
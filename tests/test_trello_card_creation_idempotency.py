@@ -35,7 +35,7 @@ def test_find_card_in_list_returns_first_exact_name_match():
         {"id": "a2", "name": "500-615 Brinkman - Novel Flatiron SE Canopy"},
         {"id": "a3", "name": "Another unrelated"},
     ]
-    with patch("app.trello.api.requests.get", return_value=_mock_get_response(cards)):
+    with patch("app.trello.client.TrelloClient.get", return_value=_mock_get_response(cards)):
         result = find_card_in_list_by_name(
             "list-abc", "500-615 Brinkman - Novel Flatiron SE Canopy"
         )
@@ -45,19 +45,19 @@ def test_find_card_in_list_returns_first_exact_name_match():
 
 def test_find_card_in_list_returns_none_when_no_match():
     cards = [{"id": "a1", "name": "Other card"}]
-    with patch("app.trello.api.requests.get", return_value=_mock_get_response(cards)):
+    with patch("app.trello.client.TrelloClient.get", return_value=_mock_get_response(cards)):
         result = find_card_in_list_by_name("list-abc", "Nope")
     assert result is None
 
 
 def test_find_card_in_list_returns_none_for_empty_list():
-    with patch("app.trello.api.requests.get", return_value=_mock_get_response([])):
+    with patch("app.trello.client.TrelloClient.get", return_value=_mock_get_response([])):
         assert find_card_in_list_by_name("list-abc", "Anything") is None
 
 
 def test_find_card_in_list_propagates_http_errors():
     with patch(
-        "app.trello.api.requests.get",
+        "app.trello.client.TrelloClient.get",
         return_value=_mock_get_response({"message": "boom"}, status=500),
     ):
         with pytest.raises(requests.HTTPError):
@@ -79,8 +79,8 @@ def _mock_post_response(card_id="created-1", name="Title", status=200):
 
 
 def test_create_core_without_idempotency_check_posts_directly():
-    with patch("app.trello.card_creation.requests.post", return_value=_mock_post_response()) as mock_post, \
-         patch("app.trello.api.requests.get") as mock_get:
+    with patch("app.trello.client.TrelloClient.post", return_value=_mock_post_response()) as mock_post, \
+         patch("app.trello.client.TrelloClient.get") as mock_get:
         result = create_trello_card_core(
             card_title="Title",
             card_description="Desc",
@@ -103,10 +103,10 @@ def test_create_core_with_idempotency_check_adopts_existing_card():
         "idList": "list-abc",
     }
     with patch(
-        "app.trello.api.requests.get",
+        "app.trello.client.TrelloClient.get",
         return_value=_mock_get_response([{"id": "other", "name": "x"}, existing]),
     ) as mock_get, \
-         patch("app.trello.card_creation.requests.post") as mock_post:
+         patch("app.trello.client.TrelloClient.post") as mock_post:
         result = create_trello_card_core(
             card_title="Title",
             card_description="Desc",
@@ -124,11 +124,11 @@ def test_create_core_with_idempotency_check_adopts_existing_card():
 
 def test_create_core_with_idempotency_check_posts_when_no_match():
     with patch(
-        "app.trello.api.requests.get",
+        "app.trello.client.TrelloClient.get",
         return_value=_mock_get_response([{"id": "other", "name": "Different"}]),
     ) as mock_get, \
          patch(
-        "app.trello.card_creation.requests.post",
+        "app.trello.client.TrelloClient.post",
         return_value=_mock_post_response(card_id="new-7", name="Title"),
     ) as mock_post:
         result = create_trello_card_core(
@@ -149,11 +149,11 @@ def test_create_core_falls_through_to_post_when_scan_fails():
     """If the idempotency GET errors out we'd rather risk a duplicate than
     block the retry — verify the create path still runs."""
     with patch(
-        "app.trello.api.requests.get",
+        "app.trello.client.TrelloClient.get",
         side_effect=requests.ConnectionError("network down"),
     ), \
          patch(
-        "app.trello.card_creation.requests.post",
+        "app.trello.client.TrelloClient.post",
         return_value=_mock_post_response(card_id="fallback-3"),
     ) as mock_post:
         result = create_trello_card_core(
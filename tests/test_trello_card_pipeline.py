@@ -0,0 +1,226 @@
+"""Tests for app.trello.card_pipeline (bulk, checkpointed card creation).
+
+Locks in:
+  - every card gets created, all post-creation steps are checkpointed and the build ends 'done'
+  - each list that got a Fab Order is sorted once after the run, never per card
+  - a build that died part-way resumes at the first missing step on the same card
+  - a build whose card id was never recorded retries the create with idempotency_check
+  - the card id and list reach the release in the checkpoint commit; a failed release update fails the build
+  - a resumed build re-links a release that is missing its card id
+  - releases that already have a card (and no unfinished build) are skipped
+  - apply_card_post_creation_features honours skip_steps and reports each step through on_step
+  - sync_releases_to_trello routes creates through the pipeline
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.trello import card_pipeline
+from app.trello.card_creation import POST_CREATION_STEPS, apply_card_post_creation_features
+from app.trello.card_pipeline import create_cards_for_releases, unfinished_release_ids
+from tests.conftest import make_release
+
+
+def _fake_post(fail_after=None):
+    """Stand-in for apply_card_post_creation_features that records each step it runs."""
+    calls = []
+
+    def post(card_id, list_id, job_record=None, skip_steps=(), on_step=None, **kwargs):
+        calls.append({"card_id": card_id, "skip": set(skip_steps), "sort_list": kwargs.get("sort_list")})
+        for step in POST_CREATION_STEPS:
+            if step in skip_steps:
+                continue
+            if step == fail_after:
+                raise RuntimeError(f"{step} blew up")
+            on_step(step)
+        return {"fab_order_set": "fab_order" not in skip_steps, "mirror_card_id": f"m-{card_id}"}
+
+    post.calls = calls
+    return post
+
+
+def _created(counter):
+    def create(card_title, card_description, list_id, position="top", idempotency_check=False):
+        counter.append(idempotency_check)
+        card_id = f"card-{len(counter)}"
+        return {"success": True, "card_id": card_id, "card_data": {"id": card_id, "name": card_title}, "adopted": False}
+    return create
+
+
+@pytest.fixture
+def board():
+    creates = []
+    post = _fake_post()
+    with patch("app.trello.api.get_list_by_name", side_effect=lambda name: {"id": f"L-{name}", "name": name}), \
+         patch("app.trello.card_creation.create_trello_card_core", side_effect=_created(creates)), \
+         patch("app.trello.api.update_job_record_with_trello_data", return_value=True), \
+         patch("app.trello.card_creation.apply_card_post_creation_features", side_effect=post), \
+         patch.object(card_pipeline, "_sort_list", return_value=True) as sort:
+        yield {"creates": creates, "post": post, "sort": sort}
+
+
+def test_builds_every_card_and_sorts_each_list_once(app, board):
+    from app.models import TrelloCardBuild
+
+    with app.app_context():
+        releases = [make_release(101, f"20{i}", trello_card_id=None) for i in range(3)]
+        progress = []
+
+        summary = create_cards_for_releases(
+            releases,
+            list_names={releases[0].id: "Released", releases[1].id: "Released", releases[2].id: "Paint complete"},
+            progress=lambda done, total, result: progress.append((done, total, result["success"])),
+        )
+
+        assert (summary["created"], summary["failed"], summary["skipped"]) == (3, 0, 0)
+        assert len(board["creates"]) == 3
+        assert all(call["sort_list"] is False for call in board["post"].calls)
+        assert sorted(c.args[0] for c in board["sort"].call_args_list) == ["L-Paint complete", "L-Released"]
+        assert progress == [(1, 3, True), (2, 3, True), (3, 3, True)]
+        builds = TrelloCardBuild.query.all()
+        assert {b.status for b in builds} == {"done"}
+        assert all(b.steps == list(POST_CREATION_STEPS) for b in builds)
+        assert unfinished_release_ids() == []
+
+
+def test_interrupted_build_resumes_at_the_missing_step(app, board):
+    from app.models import TrelloCardBuild
+
+    with app.app_context():
+        rec = make_release(101, "301", trello_card_id=None)
+        failing = _fake_post(fail_after="notes")
+        with patch("app.trello.card_creation.apply_card_post_creation_features", side_effect=failing):
+            first = create_cards_for_releases([rec])
+        assert first["failed"] == 1
+        build = TrelloCardBuild.query.one()
+        assert (build.status, build.card_id, build.steps) == ("failed", "card-1", ["fab_order", "fc_drawing"])
+        assert unfinished_release_ids() == [rec.id]
+        assert (rec.trello_card_id, rec.trello_list_id) == ("card-1", "L-Released")
+
+        second = create_cards_for_releases([rec])
+
+        assert (second["resumed"], second["failed"]) == (1, 0)
+        assert len(board["creates"]) == 1  # no second card
+        assert board["post"].calls[-1]["skip"] == {"fab_order", "fc_drawing"}
+        assert board["post"].calls[-1]["card_id"] == "card-1"
+        assert TrelloCardBuild.query.one().status == "done"
+
+
+def test_failed_release_update_fails_the_build(app, board):
+    from app.models import TrelloCardBuild
+
+    with app.app_context():
+        rec = make_release(101, "351", trello_card_id=None)
+        with patch("app.trello.api.update_job_record_with_trello_data", return_value=False):
+            summary = create_cards_for_releases([rec])
+
+        assert (summary["created"], summary["failed"]) == (0, 1)
+        build = TrelloCardBuild.query.one()
+        assert (build.status, build.card_id) == ("failed", "card-1")
+        assert rec.trello_card_id == "card-1"  # linked in the checkpoint commit
+        assert board["post"].calls == []
+
+
+def test_resume_relinks_a_release_missing_its_card(app, board):
+    from app.models import TrelloCardBuild, db
+
+    with app.app_context():
+        rec = make_release(101, "361", trello_card_id=None)
+        db.session.add(TrelloCardBuild(release_id=rec.id, list_name="Released", list_id="L-Released",
+                                       card_id="card-9", steps=["fab_order"], status="failed", attempts=1))
+        db.session.commit()
+
+        summary = create_cards_for_releases([rec])
+
+        assert (summary["resumed"], summary["failed"]) == (1, 0)
+        assert board["creates"] == []
+        assert (rec.trello_card_id, rec.trello_list_id, rec.trello_list_name) == ("card-9", "L-Released", "Released")
+
+
+def test_lost_card_id_retries_create_with_idempotency_check(app, board):
+    with app.app_context():
+        rec = make_release(101, "401", trello_card_id=None)
+        with patch("app.trello.card_creation.create_trello_card_core",
+                   return_value={"success": False, "error": "502 Bad Gateway"}):
+            assert create_cards_for_releases([rec])["failed"] == 1
+
+        create_cards_for_releases([rec])
+        assert board["creates"] == [True]
+
+
+def test_release_with_a_card_and_no_open_build_is_skipped(app, board):
+    with app.app_context():
+        rec = make_release(101, "501", trello_card_id="existing")
+        summary = create_cards_for_releases([rec])
+        assert summary["skipped"] == 1
+        assert summary["results"][0]["error"] == "Card already exists"
+        assert board["creates"] == []
+
+
+def test_builds_fan_out_to_the_pool(app):
+    with app.app_context():
+        releases = [make_release(101, f"60{i}", trello_card_id=None) for i in range(4)]
+        threads = set()
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def build(app_, build_id):
+            barrier.wait()  # at least two cards in flight at once
+            with lock:
+                threads.add(threading.current_thread().name)
+            return {"success": True, "identifier": str(build_id), "list_id": "L", "fab_order_set": False}
+
+        with patch("app.trello.api.get_list_by_name", return_value={"id": "L", "name": "Released"}), \
+             patch.object(card_pipeline, "in_memory_database", return_value=False), \
+             patch.object(card_pipeline, "_build_card_in_app", side_effect=build):
+            summary = create_cards_for_releases(releases, workers=2)
+
+        assert summary["created"] == 4
+        assert len(threads) == 2
+        assert all(name.startswith("trello-card-build-") for name in threads)
+
+
+def test_post_creation_steps_skip_and_report(app):
+    with app.app_context():
+        rec = make_release(101, "701", trello_card_id="c1", fab_order=5, viewer_url=None)
+        steps = []
+        with patch("app.trello.api.update_card_custom_field_number", return_value=True) as set_fab, \
+             patch("app.trello.api.add_comment_to_trello_card", return_value=True) as comment, \
+             patch("app.trello.api.card_has_link_to", return_value=True), \
+             patch("app.trello.utils.sort_list_if_needed") as sort, \
+             patch("app.procore.procore.get_viewer_url_for_job") as procore, \
+             patch("app.trello.card_creation.cfg") as cfg:
+            cfg.FAB_ORDER_FIELD_ID = "fab"
+            cfg.UNASSIGNED_CARDS_LIST_ID = "unassigned"
+            apply_card_post_creation_features(
+                "c1", "L", job_record=rec, notes="call first", create_mirror=True,
+                sort_list=False, skip_steps={"notes", "fc_drawing"}, on_step=steps.append,
+            )
+
+        set_fab.assert_called_once()
+        comment.assert_not_called()
+        procore.assert_not_called()
+        sort.assert_not_called()
+        assert steps == ["fab_order", "mirror"]
+
+
+def test_sync_releases_to_trello_creates_through_the_pipeline(app):
+    from app.trello.scanner import sync_releases_to_trello
+
+    with app.app_context():
+        make_release(101, "801", trello_card_id=None)
+        make_release(101, "802", trello_card_id=None)
+        pipeline = MagicMock(return_value={
+            "run_id": "r1",
+            "results": [
+                {"success": True, "job": 101, "release": "801", "identifier": "101-801", "card_id": "a", "list_name": "Released"},
+                {"success": False, "job": 101, "release": "802", "identifier": "101-802", "error": "boom"},
+            ],
+        })
+        with patch.object(card_pipeline, "create_cards_for_releases", pipeline):
+            result = sync_releases_to_trello(create_only=True)
+
+        assert pipeline.call_count == 1
+        assert len(pipeline.call_args.args[0]) == 2
+        assert (result["created"], result["failed"], result["pipeline_run_id"]) == (1, 1, "r1")
@@ -0,0 +1,177 @@
+"""Tests for app.trello.client.TrelloClient against a local fake Trello server.
+
+Locks in:
+  - paths resolve against the configured base URL and key/token are filled in
+  - one pooled keep-alive connection is reused across calls
+  - 429 honours Retry-After and pauses the shared bucket; 5xx retries GET/PUT but never POST
+  - per-endpoint latency stats normalise ids to :id
+  - the default bucket is this process's share of the per-token budget
+  - app.trello.api helpers go through the client
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.trello import client as client_module
+from app.trello.client import TrelloClient, endpoint_key
+
+CARD_ID = "5f0c0c0c0c0c0c0c0c0c0c0c"
+
+
+class FakeTrello:
+    """Scripted Trello: queue (status, body, headers) per path, record every request."""
+
+    def __init__(self):
+        self.scripts = {}
+        self.requests = []
+        self.client_ports = set()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                fake.requests.append((self.command, url.path, parse_qs(url.query), body))
+                fake.client_ports.add(self.client_address[1])
+                queue = fake.scripts.get((self.command, url.path)) or []
+                status, payload, headers = queue.pop(0) if len(queue) > 1 else (queue[0] if queue else (404, {}, {}))
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/1"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def script(self, method, path, *responses):
+        self.scripts[(method, path)] = [
+            (r[0], r[1], r[2] if len(r) > 2 else {}) for r in responses
+        ]
+
+    def calls(self, method, path):
+        return [r for r in self.requests if r[0] == method and r[1] == path]
+
+
+@pytest.fixture
+def fake_trello():
+    fake = FakeTrello()
+    fake.thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+@pytest.fixture
+def trello(fake_trello):
+    client = TrelloClient(base_url=fake_trello.base_url, max_retries=3, timeout=5)
+    # Patch the class the client holds: tests/test_storage_roots.py reloads app.config.
+    with patch.object(client_module.cfg, "TRELLO_API_KEY", "k"), \
+         patch.object(client_module.cfg, "TRELLO_TOKEN", "t"):
+        yield client
+    client.session.close()
+
+
+class TestRequests:
+    def test_path_resolves_against_base_and_auth_is_added(self, fake_trello, trello):
+        fake_trello.script("GET", f"/1/cards/{CARD_ID}", (200, {"id": CARD_ID}))
+        resp = trello.get(f"/cards/{CARD_ID}", params={"fields": "id"})
+        assert resp.json() == {"id": CARD_ID}
+        _, _, query, _ = fake_trello.calls("GET", f"/1/cards/{CARD_ID}")[0]
+        assert query == {"key": ["k"], "token": ["t"], "fields": ["id"]}
+
+    def test_keep_alive_reuses_one_connection(self, fake_trello, trello):
+        fake_trello.script("GET", "/1/boards/b1/lists", (200, []))
+        for _ in range(5):
+            trello.get("/boards/b1/lists")
+        assert len(fake_trello.calls("GET", "/1/boards/b1/lists")) == 5
+        assert len(fake_trello.client_ports) == 1
+
+    def test_429_honours_retry_after_and_pauses_bucket(self, fake_trello, trello):
+        fake_trello.script(
+            "PUT", f"/1/cards/{CARD_ID}",
+            (429, {"message": "rate limited"}, {"Retry-After": "0"}),
+            (200, {"id": CARD_ID}),
+        )
+        with patch.object(trello.bucket, "pause", wraps=trello.bucket.pause) as pause:
+            resp = trello.put(f"/cards/{CARD_ID}", params={"idList": "L"})
+        assert resp.status_code == 200
+        pause.assert_called_once_with(0.0)
+        assert len(fake_trello.calls("PUT", f"/1/cards/{CARD_ID}")) == 2
+        assert trello.stats()["rate_limited"] == 1
+
+    def test_429_retries_post(self, fake_trello, trello):
+        fake_trello.script("POST", "/1/cards", (429, {}, {"Retry-After": "0"}), (200, {"id": "new"}))
+        assert trello.post("/cards", params={"name": "x"}).json() == {"id": "new"}
+        assert len(fake_trello.calls("POST", "/1/cards")) == 2
+
+    def test_5xx_retries_idempotent_get(self, fake_trello, trello):
+        fake_trello.script("GET", "/1/lists/L1/cards", (503, {}), (502, {}), (200, [{"id": "c"}]))
+        resp = trello.get("/lists/L1/cards")
+        assert resp.json() == [{"id": "c"}]
+        assert len(fake_trello.calls("GET", "/1/lists/L1/cards")) == 3
+        assert trello.stats()["retries"] == 2
+
+    def test_5xx_never_replays_post(self, fake_trello, trello):
+        fake_trello.script("POST", "/1/cards", (500, {}), (200, {"id": "dup"}))
+        resp = trello.post("/cards", params={"name": "x"})
+        assert resp.status_code == 500
+        assert len(fake_trello.calls("POST", "/1/cards")) == 1
+
+    def test_retries_exhausted_returns_last_response(self, fake_trello, trello):
+        fake_trello.script("GET", "/1/boards/b1", (503, {}))
+        resp = trello.get("/boards/b1")
+        assert resp.status_code == 503
+        assert len(fake_trello.calls("GET", "/1/boards/b1")) == 4
+
+    def test_latency_recorded_per_normalised_endpoint(self, fake_trello, trello):
+        fake_trello.script("GET", f"/1/cards/{CARD_ID}/attachments", (200, []))
+        fake_trello.script("GET", "/1/cards/abc123/attachments", (404, {}))
+        trello.get(f"/cards/{CARD_ID}/attachments")
+        trello.get("/cards/abc123/attachments")
+        entry = trello.stats()["endpoints"]["GET /cards/:id/attachments"]
+        assert entry["count"] == 2
+        assert entry["errors"] == 1
+        assert entry["max_ms"] >= entry["avg_ms"] >= 0
+
+
+def test_endpoint_key_normalises_ids():
+    assert endpoint_key("put", f"/cards/{CARD_ID}/customField/{CARD_ID}/item") == (
+        "PUT /cards/:id/customField/:id/item"
+    )
+    assert endpoint_key("GET", "/boards/b1/lists?fields=id") == "GET /boards/:id/lists"
+
+
+def test_budget_is_split_across_processes():
+    with patch.object(client_module.cfg, "TRELLO_RATE_LIMIT_REQUESTS", 100), \
+         patch.object(client_module.cfg, "TRELLO_RATE_LIMIT_WINDOW_SECONDS", 10), \
+         patch.object(client_module.cfg, "TRELLO_RATE_LIMIT_PROCESSES", 4):
+        client = TrelloClient(base_url="http://127.0.0.1:1/1")
+    client.session.close()
+
+    assert (client.bucket.capacity, client.bucket.refill_per_second) == (25.0, 2.5)
+
+
+def test_api_helpers_use_the_shared_client(fake_trello, trello):
+    from app.trello.api import get_trello_card_by_id
+
+    fake_trello.script("GET", f"/1/cards/{CARD_ID}", (200, {"id": CARD_ID, "name": "100-A"}))
+    with patch.object(client_module, "_client", trello):
+        assert get_trello_card_by_id(CARD_ID) == {"id": CARD_ID, "name": "100-A"}
+    assert trello.stats()["endpoints"]["GET /cards/:id"]["count"] == 1
@@ -0,0 +1,273 @@
+"""Tests for the durable Trello inbound queue (app/trello/inbound_queue.py + drain_trello_queue).
+
+Locks in:
+  - a claim takes each card's head event in arrival order and folds the card's later pending events into it;
+    an event arriving while its card is in flight waits until that finishes
+  - merge_webhook_events keeps the latest field values, spans list moves and keeps every action for audit
+  - new events wait out the coalescing window; syncs_saved counts the folded events
+  - drain_trello_queue runs the batch through sync_from_trello and marks rows completed in one pass
+  - a sync error retries with backoff and ends as 'failed' without blocking the card's later events
+  - lock contention defers the row without using an attempt; nothing is claimed while the board lock is held
+  - stale 'processing' claims are handed back; completed rows are purged after retention
+  - queue_metrics reports depth, oldest pending age and throughput
+  - the worker thread drains back to back and idles when empty
+"""
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.models import TrelloInboundEvent, db
+from app.sync_lock import SyncLockUnavailable, sync_lock_manager
+from app.trello import drain_trello_queue, inbound_queue
+from app.trello.utils import merge_webhook_events
+
+
+@pytest.fixture(autouse=True)
+def _no_coalesce_window():
+    with patch.object(inbound_queue.cfg, "TRELLO_COALESCE_WINDOW_SECONDS", 0):
+        yield
+
+
+def _event(card_id, **extra):
+    return {"handled": True, "action_type": "updateCard", "card_id": card_id, **extra}
+
+
+def _rows():
+    db.session.expire_all()
+    return TrelloInboundEvent.query.order_by(TrelloInboundEvent.id).all()
+
+
+def _row(event_id):
+    db.session.expire_all()
+    return db.session.get(TrelloInboundEvent, event_id)
+
+
+class TestClaim:
+    def test_card_burst_is_folded_into_its_head(self, app):
+        a1 = inbound_queue.enqueue(_event("A", seq=1))
+        b1 = inbound_queue.enqueue(_event("B", seq=1))
+        a2 = inbound_queue.enqueue(_event("A", seq=2))
+
+        claimed = inbound_queue.claim_batch(10)
+        assert [(e["id"], e["ids"]) for e in claimed] == [(a1, [a1, a2]), (b1, [b1])]
+        assert claimed[0]["payload"]["seq"] == 2
+        assert {r.status for r in _rows()} == {"processing"}
+
+    def test_event_arriving_mid_sync_waits_for_its_card(self, app):
+        a1 = inbound_queue.enqueue(_event("A", seq=1))
+        [head] = inbound_queue.claim_batch(10)
+        a2 = inbound_queue.enqueue(_event("A", seq=2))
+        assert inbound_queue.claim_batch(10) == []
+
+        inbound_queue.finish_batch(completed=[head])
+        assert [e["id"] for e in inbound_queue.claim_batch(10)] == [a2]
+        assert _row(a1).status == "completed"
+
+    def test_respects_limit_and_available_at(self, app):
+        ids = [inbound_queue.enqueue(_event(f"C{i}")) for i in range(4)]
+        later = _row(ids[0])
+        later.available_at = datetime.utcnow() + timedelta(minutes=1)
+        db.session.commit()
+
+        assert [e["id"] for e in inbound_queue.claim_batch(2)] == ids[1:3]
+
+    def test_duplicate_action_id_returns_none(self, app):
+        assert inbound_queue.enqueue(_event("A"), action_id="act-1") is not None
+        assert inbound_queue.enqueue(_event("A"), action_id="act-1") is None
+        assert len(_rows()) == 1
+
+    def test_full_backlog_raises(self, app):
+        with patch.object(inbound_queue.cfg, "TRELLO_INBOUND_MAX_DEPTH", 2):
+            inbound_queue.enqueue(_event("A"))
+            inbound_queue.enqueue(_event("B"))
+            with pytest.raises(inbound_queue.InboundQueueFull):
+                inbound_queue.enqueue(_event("C"))
+
+
+class TestDrain:
+    def test_runs_batch_and_marks_completed(self, app):
+        ids = [inbound_queue.enqueue(_event(card)) for card in ("A", "B", "C", "A")]
+        seen = []
+        lock = threading.Lock()
+
+        def fake_sync(evt):
+            with lock:
+                seen.append(evt["card_id"])
+
+        with patch("app.trello.sync_from_trello", side_effect=fake_sync):
+            assert drain_trello_queue() == 3
+            assert drain_trello_queue() == 0
+
+        assert sorted(seen) == ["A", "B", "C"]
+        assert [_row(i).status for i in ids] == ["completed"] * 4
+        assert all(_row(i).completed_at is not None for i in ids)
+
+    def test_error_retries_with_backoff_then_fails_without_blocking_card(self, app):
+        bad = inbound_queue.enqueue(_event("A", seq=1))
+
+        def fake_sync(evt):
+            if evt["seq"] == 1:
+                raise ValueError("boom")
+
+        with patch("app.trello.sync_from_trello", side_effect=fake_sync), \
+             patch.object(inbound_queue.cfg, "TRELLO_INBOUND_MAX_ATTEMPTS", 2):
+            assert drain_trello_queue() == 1
+            row = _row(bad)
+            assert (row.status, row.attempts) == ("pending", 1)
+            assert row.available_at > datetime.utcnow()
+            assert "boom" in row.error_message
+
+            # A later event for the card is folded in on retry, and stays pending if it fails again.
+            good = inbound_queue.enqueue(_event("A", seq=2))
+            assert drain_trello_queue() == 0
+            row.available_at = datetime.utcnow()
+            db.session.commit()
+            with patch("app.trello.sync_from_trello", side_effect=ValueError("boom")):
+                assert drain_trello_queue() == 1
+            assert (_row(bad).status, _row(bad).attempts) == ("failed", 2)
+            assert (_row(good).status, _row(good).attempts) == ("pending", 0)
+
+            assert drain_trello_queue() == 1
+        assert _row(good).status == "completed"
+
+    def test_lock_timeout_defers_without_using_an_attempt(self, app):
+        event_id = inbound_queue.enqueue(_event("A"))
+        with patch("app.trello.sync_from_trello", side_effect=SyncLockUnavailable("timed out")):
+            assert drain_trello_queue() == 1
+        row = _row(event_id)
+        assert (row.status, row.attempts) == ("pending", 0)
+        assert row.available_at > datetime.utcnow()
+
+    def test_nothing_claimed_while_board_lock_held(self, app):
+        event_id = inbound_queue.enqueue(_event("A"))
+        with patch("app.trello.sync_from_trello") as sync, \
+             sync_lock_manager.acquire_sync_lock("scanner"):
+            assert drain_trello_queue() == 0
+        sync.assert_not_called()
+        assert _row(event_id).status == "pending"
+
+
+class TestCoalescing:
+    def test_merge_spans_list_moves_and_keeps_latest_fields(self):
+        merged = merge_webhook_events([
+            _event("A", event="card_updated", time="t1", change_types=["list_move"], has_list_move=True,
+                   needs_excel_update=True, username="ann", **{"from": "Fab", "to": "Paint"},
+                   list_id_before="L1", list_id_after="L2"),
+            _event("A", event="card_updated", time="t2", change_types=["due_date_change"],
+                   has_due_date_change=True, username="bob"),
+            _event("A", event="card_updated", time="t3", change_types=["list_move"], has_list_move=True,
+                   username="bob", **{"from": "Paint", "to": "Shipping"},
+                   list_id_before="L2", list_id_after="L3"),
+        ])
+        assert merged["time"] == "t3" and merged["username"] == "bob"
+        assert merged["change_types"] == ["list_move", "due_date_change"]
+        assert (merged["from"], merged["to"]) == ("Fab", "Shipping")
+        assert (merged["list_id_before"], merged["list_id_after"]) == ("L1", "L3")
+        assert merged["has_list_move"] and merged["has_due_date_change"] and merged["needs_excel_update"]
+        assert [a["time"] for a in merged["coalesced"]] == ["t1", "t2", "t3"]
+        assert merged["coalesced"][0]["to"] == "Paint"
+
+    def test_move_that_nets_out_is_dropped(self):
+        merged = merge_webhook_events([
+            _event("A", change_types=["list_move"], has_list_move=True, list_id_before="L1",
+                   list_id_after="L2", **{"from": "Fab", "to": "Paint"}),
+            _event("A", change_types=["list_move", "name_change"], has_list_move=True, list_id_before="L2",
+                   list_id_after="L1", **{"from": "Paint", "to": "Fab"}),
+        ])
+        assert merged["change_types"] == ["name_change"]
+        assert merged["has_list_move"] is False
+        assert "list_id_before" not in merged and "to" not in merged
+
+    def test_card_created_wins_and_single_event_is_untouched(self):
+        created = _event("A", event="card_created", list_id="L1")
+        assert merge_webhook_events([created]) is created
+        merged = merge_webhook_events([created, _event("A", event="card_updated", change_types=["name_change"])])
+        assert merged["event"] == "card_created" and merged["list_id"] == "L1"
+
+    def test_burst_costs_one_sync_and_counts_syncs_saved(self, app):
+        before = inbound_queue.queue_metrics()["syncs_saved"]
+        for seq in range(4):
+            inbound_queue.enqueue(_event("A", seq=seq))
+        with patch("app.trello.sync_from_trello") as sync:
+            assert drain_trello_queue() == 1
+        sync.assert_called_once()
+        assert len(sync.call_args.args[0]["coalesced"]) == 4
+        assert {r.status for r in _rows()} == {"completed"}
+        assert inbound_queue.queue_metrics()["syncs_saved"] == before + 3
+
+    def test_new_event_waits_out_the_window(self, app):
+        with patch.object(inbound_queue.cfg, "TRELLO_COALESCE_WINDOW_SECONDS", 60):
+            event_id = inbound_queue.enqueue(_event("A"))
+        assert inbound_queue.claim_batch(10) == []
+        assert _row(event_id).available_at > datetime.utcnow() + timedelta(seconds=50)
+
+
+class TestMaintenance:
+    def test_stale_claims_are_released(self, app):
+        event_id = inbound_queue.enqueue(_event("A"))
+        inbound_queue.claim_batch(1)
+        assert inbound_queue.release_stale_claims(older_than_seconds=60) == 0
+
+        row = _row(event_id)
+        row.claimed_at = datetime.utcnow() - timedelta(minutes=5)
+        db.session.commit()
+        assert inbound_queue.release_stale_claims(older_than_seconds=60) == 1
+        assert _row(event_id).status == "pending"
+
+    def test_purge_keeps_recent_and_open_rows(self, app):
+        old, recent, open_ = (inbound_queue.enqueue(_event(c)) for c in ("A", "B", "C"))
+        inbound_queue.finish_batch(completed=inbound_queue.claim_batch(2))
+        row = _row(old)
+        row.completed_at = datetime.utcnow() - timedelta(days=30)
+        db.session.commit()
+
+        assert inbound_queue.purge_completed(older_than_days=7) == 1
+        assert [r.id for r in _rows()] == [recent, open_]
+
+    def test_metrics_report_depth_age_and_throughput(self, app):
+        before = inbound_queue.queue_metrics()
+        first = inbound_queue.enqueue(_event("A"))
+        inbound_queue.enqueue(_event("B"))
+        row = _row(first)
+        row.created_at = datetime.utcnow() - timedelta(seconds=90)
+        db.session.commit()
+
+        metrics = inbound_queue.queue_metrics()
+        assert metrics["depth"] == 2
+        assert metrics["oldest_pending_age_seconds"] >= 90
+
+        inbound_queue.finish_batch(completed=inbound_queue.claim_batch(1))
+        metrics = inbound_queue.queue_metrics()
+        assert metrics["depth"] == 1
+        assert metrics["completed"] == before["completed"] + 1
+        assert metrics["completed_last_minute"] >= 1
+
+
+def test_worker_drains_back_to_back_and_wakes(app):
+    batches = [2, 1, 0]
+    calls = []
+    drained_all = threading.Event()
+    woken = threading.Event()
+
+    def drain():
+        calls.append(1)
+        if batches:
+            n = batches.pop(0)
+            if not batches:
+                drained_all.set()
+            return n
+        woken.set()
+        return 0
+
+    worker = inbound_queue.InboundEventWorker(app, drain, idle_seconds=30)
+    worker.start()
+    try:
+        assert drained_all.wait(5)
+        worker.wake()
+        assert woken.wait(5)
+    finally:
+        worker.stop(timeout=5)
+    assert not worker.is_alive()
+    assert len(calls) >= 4
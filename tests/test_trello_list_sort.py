@@ -0,0 +1,113 @@
+"""Tests for the minimal-move Fab Order list sort (plan_fab_order_positions / sort_list_by_fab_order).
+
+Locks in:
+  - a sorted list costs zero PUTs; one dragged card costs one PUT
+  - cards on the longest ordered run keep their position, the rest land between new neighbours
+  - ties keep their current order and cards without a Fab Order sort last
+  - exhausted gaps fall back to a renumber that still skips cards already in place
+  - sort_list_by_fab_order reports api_calls_saved
+"""
+import random
+from unittest.mock import MagicMock, patch
+
+from app.trello.utils import POSITION_STEP, plan_fab_order_positions
+
+FIELD = "fab-field"
+
+
+def _cards(fab_orders, positions=None):
+    positions = positions or [POSITION_STEP * (i + 1) for i in range(len(fab_orders))]
+    return [
+        {"card_id": f"c{i}", "fab_order": fab, "current_pos": pos}
+        for i, (fab, pos) in enumerate(zip(fab_orders, positions))
+    ]
+
+
+def _apply(cards, moves):
+    final = {c["card_id"]: c["current_pos"] for c in cards}
+    final.update(dict(moves))
+    return [cid for cid, _ in sorted(final.items(), key=lambda kv: kv[1])]
+
+
+def _expected(cards):
+    by_pos = sorted(cards, key=lambda c: c["current_pos"])
+    ordered = sorted(by_pos, key=lambda c: (c["fab_order"] is None, c["fab_order"] or 0))
+    return [c["card_id"] for c in ordered]
+
+
+class TestPlan:
+    def test_sorted_list_needs_no_moves(self):
+        moves, renormalized = plan_fab_order_positions(_cards([1, 2, 3, 4]))
+        assert moves == [] and renormalized is False
+
+    def test_one_dragged_card_on_sixty_card_list_is_one_put(self):
+        fab = list(range(1, 61))
+        fab[0] = 60.5  # card 0 now belongs at the bottom
+        cards = _cards(fab)
+        moves, renormalized = plan_fab_order_positions(cards)
+        assert len(moves) == 1 and moves[0][0] == "c0"
+        assert not renormalized
+        assert _apply(cards, moves) == _expected(cards)
+
+    def test_mover_lands_between_new_neighbours(self):
+        cards = _cards([3, 1, 2])  # positions 16384, 32768, 49152
+        moves, _ = plan_fab_order_positions(cards)
+        assert moves == [("c0", 49152 + POSITION_STEP)]
+
+    def test_run_of_movers_is_spaced_inside_the_gap(self):
+        cards = _cards([1, 5, 6, 2, 3, 4, 7])
+        moves, _ = plan_fab_order_positions(cards)
+        assert {cid for cid, _ in moves} == {"c1", "c2"}
+        assert _apply(cards, moves) == _expected(cards)
+
+    def test_ties_keep_current_order_and_missing_fab_order_sorts_last(self):
+        cards = _cards([None, 2, 2, 1])
+        moves, _ = plan_fab_order_positions(cards)
+        assert _apply(cards, moves) == ["c3", "c1", "c2", "c0"]
+
+    def test_exhausted_gap_renumbers_but_skips_cards_in_place(self):
+        # c2 belongs in front of c0 at pos 1: only a 0.5 gap is left.
+        cards = _cards([2, 3, 1, 4], positions=[1.0, 1.5, 2.0, 4 * POSITION_STEP])
+        moves, renormalized = plan_fab_order_positions(cards)
+        assert renormalized is True
+        assert dict(moves) == {"c2": POSITION_STEP, "c0": 2 * POSITION_STEP, "c1": 3 * POSITION_STEP}
+        assert _apply(cards, moves) == ["c2", "c0", "c1", "c3"]
+
+    def test_missing_positions_renumber(self):
+        cards = _cards([2, 1], positions=[None, 5.0])
+        moves, renormalized = plan_fab_order_positions(cards)
+        assert renormalized is True
+        assert dict(moves) == {"c1": POSITION_STEP, "c0": 2 * POSITION_STEP}
+
+    def test_random_shuffles_always_sort(self):
+        rng = random.Random(12)
+        for _ in range(200):
+            n = rng.randint(1, 40)
+            cards = _cards([rng.choice([None, *range(1, 15)]) for _ in range(n)])
+            moves, _ = plan_fab_order_positions(cards)
+            assert _apply(cards, moves) == _expected(cards)
+
+
+def _trello_card(card_id, fab, pos):
+    items = [{"idCustomField": FIELD, "value": {"number": str(fab)}}] if fab is not None else []
+    return {"id": card_id, "name": card_id, "pos": pos, "customFieldItems": items}
+
+
+def test_sort_list_by_fab_order_puts_only_moved_cards():
+    from app.trello.api import sort_list_by_fab_order
+
+    cards = [_trello_card(f"c{i}", i + 1, POSITION_STEP * (i + 1)) for i in range(20)]
+    cards[5]["customFieldItems"][0]["value"]["number"] = "0.5"  # dragged to the top
+    listing = MagicMock(status_code=200)
+    listing.json.return_value = cards
+    with patch("app.trello.client.TrelloClient.get", return_value=listing), \
+         patch("app.trello.client.TrelloClient.put", return_value=MagicMock(status_code=200)) as put:
+        result = sort_list_by_fab_order("list-1", FIELD)
+
+    assert result["success"] is True
+    assert put.call_count == 1
+    assert put.call_args.args[0] == "/cards/c5"
+    assert put.call_args.kwargs["params"]["pos"] == POSITION_STEP / 2
+    assert result["cards_sorted"] == 1
+    assert result["api_calls_saved"] == 19
+    assert result["renormalized"] is False
@@ -0,0 +1,208 @@
+"""Tests for the incremental Trello<->DB scan (scan_trello_db_incremental in app/trello/scanner.py).
+
+Locks in:
+  - the first run reads the whole board and builds the standing report
+  - later runs fetch only cards named by board actions since the watermark, and skip cards whose name/list hash is unchanged
+  - releases whose last_updated_at moved (or new releases) are re-classified without any Trello call,
+    including one committed after the last scan with a stamp at or just behind its watermark
+  - deleted releases drop out of the report (their card, if any, becomes trello_only)
+  - deleted cards drop out; a truncated action page falls back to a full read
+  - deleteCard / updateCard:closed / moveCardFromBoard actions drop a card without fetching it
+"""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models import Releases, TrelloScanState, db
+from app.trello import api as trello_api
+from app.trello import scanner
+from app.trello.scanner import get_expected_trello_list_from_stage, get_trello_scan_report, scan_trello_db_incremental
+
+from tests.conftest import make_release
+
+
+@pytest.fixture
+def board():
+    """Patch the three Trello reads the scanner makes; tests mutate the dicts they return."""
+    state = {"cards": [], "activity": {"card_ids": set(), "removed_card_ids": set(), "latest": None,
+                                       "truncated": False}, "by_id": {}}
+    with patch.object(scanner, "get_all_trello_cards", side_effect=lambda: list(state["cards"])) as full, \
+         patch.object(scanner, "get_board_card_activity_since", side_effect=lambda since: state["activity"]) as activity, \
+         patch.object(scanner, "get_trello_cards_by_ids",
+                      side_effect=lambda ids: {i: state["by_id"].get(i) for i in ids}) as by_ids:
+        state.update(full=full, activity_mock=activity, by_ids_mock=by_ids)
+        yield state
+
+
+def _card(card_id, name, list_name, list_id=None):
+    return {"id": card_id, "name": name, "list_id": list_id or f"list-{list_name}", "list_name": list_name,
+            "closed": False}
+
+
+def _identifiers(report, category):
+    return sorted(entry["identifier"] for entry in report[category])
+
+
+def test_first_run_is_a_full_read(app, board):
+    make_release(101, "201", stage="Cut Start")
+    make_release(102, "202")
+    db.session.commit()
+    board["cards"] = [_card("c1", "101-201 Tower", get_expected_trello_list_from_stage("Cut Start")),
+                      _card("c3", "103-203 Orphan", "Shipping planning")]
+
+    report = scan_trello_db_incremental()
+
+    assert report["scan"]["mode"] == "full"
+    assert _identifiers(report, "in_both") == ["101-201"]
+    assert _identifiers(report, "db_only") == ["102-202"]
+    assert _identifiers(report, "trello_only") == ["103-203"]
+    assert report["list_mismatches"] == []
+    board["activity_mock"].assert_not_called()
+    assert get_trello_scan_report()["summary"] == report["summary"]
+
+
+def test_incremental_run_only_fetches_active_cards(app, board):
+    make_release(101, "201", stage="Cut Start")
+    make_release(102, "202", stage="Cut Start")
+    db.session.commit()
+    expected = get_expected_trello_list_from_stage("Cut Start")
+    board["cards"] = [_card("c1", "101-201 Tower", expected), _card("c2", "102-202 Stair", expected)]
+    scan_trello_db_incremental()
+
+    # c1 moved to the wrong list; c2 only got a comment (same name/list hash)
+    board["activity"] = {"card_ids": {"c1", "c2"}, "latest": datetime.utcnow(), "truncated": False}
+    board["by_id"] = {"c1": _card("c1", "101-201 Tower", "Shipping planning"),
+                      "c2": _card("c2", "102-202 Stair", expected)}
+    report = scan_trello_db_incremental()
+
+    assert report["scan"]["mode"] == "incremental"
+    assert (report["scan"]["cards_checked"], report["scan"]["cards_changed"]) == (2, 1)
+    assert _identifiers(report, "list_mismatches") == ["101-201"]
+    assert board["full"].call_count == 1
+
+
+def test_release_edits_are_reclassified_without_card_fetches(app, board):
+    job = make_release(101, "201", stage="Cut Start", last_updated_at=datetime.utcnow() - timedelta(hours=1))
+    db.session.commit()
+    board["cards"] = [_card("c1", "101-201 Tower", get_expected_trello_list_from_stage("Cut Start"))]
+    scan_trello_db_incremental()
+
+    job.stage = "Shipping completed"
+    job.last_updated_at = datetime.utcnow()
+    make_release(104, "204")
+    db.session.commit()
+    report = scan_trello_db_incremental()
+
+    board["by_ids_mock"].assert_not_called()
+    assert report["scan"]["releases_checked"] == 2
+    assert _identifiers(report, "db_only") == ["104-204"]
+    in_both = {entry["identifier"]: entry for entry in report["in_both"]}
+    assert in_both["101-201"]["db_stage"] == "Shipping completed"
+
+
+def test_release_stamped_at_the_watermark_but_committed_later_is_seen(app, board):
+    stamp = datetime.utcnow() - timedelta(hours=1)
+    make_release(101, "201", stage="Cut Start", last_updated_at=stamp)
+    late = make_release(102, "202", stage="Cut Start", last_updated_at=stamp - timedelta(hours=2))
+    db.session.commit()
+    expected = get_expected_trello_list_from_stage("Cut Start")
+    board["cards"] = [_card("c1", "101-201 Tower", expected), _card("c2", "102-202 Stair", expected)]
+    scan_trello_db_incremental()
+
+    # A writer that read its clock before the scan commits afterwards: same stamp as
+    # the watermark, and an id below last_release_id.
+    late.stage = "Shipping completed"
+    late.last_updated_at = stamp
+    db.session.commit()
+    report = scan_trello_db_incremental()
+
+    in_both = {entry["identifier"]: entry for entry in report["in_both"]}
+    assert in_both["102-202"]["db_stage"] == "Shipping completed"
+
+
+def test_deleted_releases_drop_out_of_the_report(app, board):
+    make_release(101, "201")
+    make_release(102, "202")
+    db.session.commit()
+    board["cards"] = [_card("c1", "101-201 Tower", "Fab")]
+    scan_trello_db_incremental()
+
+    for job in Releases.query.all():
+        db.session.delete(job)
+    db.session.commit()
+    report = scan_trello_db_incremental()
+
+    board["by_ids_mock"].assert_not_called()
+    assert report["scan"]["releases_removed"] == 2
+    assert report["in_both"] == [] and report["db_only"] == []
+    assert _identifiers(report, "trello_only") == ["101-201"]
+
+
+def test_deleted_card_drops_out_of_the_board(app, board):
+    make_release(101, "201")
+    db.session.commit()
+    board["cards"] = [_card("c1", "101-201 Tower", "Fab")]
+    scan_trello_db_incremental()
+
+    board["activity"] = {"card_ids": {"c1"}, "latest": datetime.utcnow(), "truncated": False}
+    report = scan_trello_db_incremental()  # by_id has no c1 -> deleted
+
+    assert _identifiers(report, "db_only") == ["101-201"]
+    assert report["summary"]["trello_total"] == 0
+
+
+def test_archived_card_drops_out_without_a_fetch(app, board):
+    make_release(101, "201")
+    make_release(102, "202")
+    db.session.commit()
+    board["cards"] = [_card("c1", "101-201 Tower", "Fab"), _card("c2", "102-202 Stair", "Fab")]
+    scan_trello_db_incremental()
+
+    board["activity"] = {"card_ids": set(), "removed_card_ids": {"c1"}, "latest": datetime.utcnow(),
+                         "truncated": False}
+    report = scan_trello_db_incremental()
+
+    board["by_ids_mock"].assert_not_called()
+    assert report["scan"]["cards_changed"] == 1
+    assert _identifiers(report, "db_only") == ["101-201"]
+    assert _identifiers(report, "in_both") == ["102-202"]
+    assert report["summary"]["trello_total"] == 1
+
+
+def test_activity_splits_removed_cards_from_touched_ones(app):
+    actions = [  # newest first, as Trello returns them
+        {"date": "2026-10-16T12:05:00.000Z", "type": "updateCard",
+         "data": {"card": {"id": "restored", "closed": False}, "old": {"closed": True}}},
+        {"date": "2026-10-16T12:04:00.000Z", "type": "deleteCard", "data": {"card": {"id": "gone"}}},
+        {"date": "2026-10-16T12:03:00.000Z", "type": "updateCard",
+         "data": {"card": {"id": "archived", "closed": True}, "old": {"closed": False}}},
+        {"date": "2026-10-16T12:02:00.000Z", "type": "moveCardFromBoard", "data": {"card": {"id": "moved"}}},
+        {"date": "2026-10-16T12:01:00.000Z", "type": "updateCard",
+         "data": {"card": {"id": "restored", "closed": True}, "old": {"closed": False}}},
+        {"date": "2026-10-16T12:00:00.000Z", "type": "updateCard",
+         "data": {"card": {"id": "renamed", "name": "101-201 Tower"}, "old": {"name": "101-201"}}},
+    ]
+    response = MagicMock()
+    response.json.return_value = actions
+    with patch.object(trello_api, "get_trello_client") as get_client:
+        get_client.return_value.get.return_value = response
+        activity = trello_api.get_board_card_activity_since(datetime(2026, 10, 16, 11, 0))
+
+    assert activity["removed_card_ids"] == {"gone", "archived", "moved"}
+    assert activity["card_ids"] == {"restored", "renamed"}
+    assert activity["latest"] == datetime(2026, 10, 16, 12, 5)
+    assert activity["truncated"] is False
+
+
+def test_truncated_activity_or_stale_full_read_falls_back_to_full(app, board):
+    scan_trello_db_incremental()
+    board["activity"] = {"card_ids": set(), "removed_card_ids": set(), "latest": None, "truncated": True}
+    assert scan_trello_db_incremental()["scan"]["mode"] == "full"
+
+    board["activity"] = {"card_ids": set(), "removed_card_ids": set(), "latest": None, "truncated": False}
+    assert scan_trello_db_incremental()["scan"]["mode"] == "incremental"
+    state = db.session.get(TrelloScanState, 1)
+    state.last_full_scan_at = datetime.utcnow() - timedelta(days=2)
+    db.session.commit()
+    assert scan_trello_db_incremental()["scan"]["mode"] == "full"
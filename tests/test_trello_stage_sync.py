@@ -419,3 +419,57 @@ class TestInboundListMoveRetiersFabOrder:
 
             assert rec.stage == "Ship Complete"  # gate held
             assert rec.fab_order == 1            # untouched
+
+
+class TestCoalescedBurstEcho:
+    """A coalesced webhook burst whose list move is Brain's own echo still applies the user's other edits."""
+
+    def _drive(self, coalesced):
+        from app.models import Releases
+        from app.trello.sync import sync_from_trello
+
+        event_time = datetime.utcnow() + timedelta(hours=1)
+        card = {"id": "card-1", "name": "500-101 Renamed", "desc": "", "idList": "list-after", "due": None}
+        event_info = {
+            "handled": True,
+            "card_id": "card-1",
+            "time": event_time.isoformat() + "Z",
+            "event": "card_updated",
+            "change_types": ["list_move", "name_change"],
+            "has_list_move": True,
+            "from": "Paint complete",
+            "to": "Shipping completed",
+            "list_id_before": "list-before",
+            "list_id_after": "list-after",
+            "trello_user_id": None,
+        }
+        if coalesced:
+            event_info["coalesced"] = [{"change_types": ["list_move"]}, {"change_types": ["name_change"]}]
+
+        with patch("app.trello.sync.get_trello_card_by_id", return_value=card), \
+             patch("app.trello.sync.get_list_name_by_id", return_value="Shipping completed"), \
+             patch("app.trello.sync._is_brain_echo_webhook", return_value=True), \
+             patch("app.brain.job_log.scheduling.service.recalculate_all_jobs_scheduling"):
+            sync_from_trello(event_info)
+
+        db.session.expire_all()
+        return Releases.query.filter_by(trello_card_id="card-1").first()
+
+    def _seed(self):
+        make_release(500, "101", "Paint Complete", "READY_TO_SHIP", 2,
+                     trello_card_id="card-1", trello_list_name="Paint complete",
+                     trello_card_name="500-101", last_updated_at=datetime.utcnow())
+        db.session.commit()
+
+    def test_echoed_move_dropped_but_rename_applied(self, app):
+        with app.app_context():
+            self._seed()
+            rec = self._drive(coalesced=True)
+            assert rec.trello_card_name == "500-101 Renamed"
+            assert rec.stage == "Paint Complete"
+
+    def test_single_echo_is_still_skipped_whole(self, app):
+        with app.app_context():
+            self._seed()
+            rec = self._drive(coalesced=False)
+            assert rec.trello_card_name == "500-101"
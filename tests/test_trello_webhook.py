@@ -1,33 +1,33 @@
 """Tests for app/trello/__init__.py — POST /trello/webhook handler."""
-from queue import Queue
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
+from app.models import TrelloInboundEvent
+from app.sync_lock import card_key, list_key, release_key
+from app.trello import inbound_queue, trello_event_lock_keys
+
 
 _HANDLED = {
     "handled": True, "action_type": "updateCard",
     "card_id": "abc-123", "list_id": "list-1",
 }
 _UNHANDLED = {"handled": False, "action_type": "createList"}
-_BODY = {"action": {"type": "updateCard"}}
+_BODY = {"action": {"id": "act-1", "type": "updateCard"}}
 
 
 @pytest.fixture
 def trello_patches(request):
-    """Patch the four module-level dependencies the webhook handler reads.
-
-    Marker `event_payload` overrides parse_webhook_data's return; defaults
-    to the handled fixture above. Marker `queue_size` provisions a fresh
-    bounded queue (default 10).
-    """
+    """Patch parse_webhook_data (handled event by default) and the sync lock manager."""
     parsed = getattr(request, "param", None) or _HANDLED
-    queue = Queue(maxsize=getattr(request, "param_queue", 10))
     with patch("app.trello.parse_webhook_data", return_value=parsed), \
          patch("app.trello.executor") as mock_executor, \
-         patch("app.trello.sync_lock_manager") as mock_lock, \
-         patch("app.trello.trello_event_queue", queue):
-        yield mock_executor, mock_lock, queue
+         patch("app.trello.sync_lock_manager") as mock_lock:
+        yield mock_executor, mock_lock
+
+
+def _queued():
+    return TrelloInboundEvent.query.order_by(TrelloInboundEvent.id).all()
 
 
 def test_head_returns_200(client):
@@ -49,19 +49,42 @@ def test_webhook_dropped_when_trello_mock_enabled(client, app):
         app.config["TRELLO_MOCK"] = False
 
 
-def test_unhandled_event_returns_200_without_submitting(client):
+def test_unhandled_event_returns_200_without_enqueueing(client):
     with patch("app.trello.parse_webhook_data", return_value=_UNHANDLED), \
-         patch("app.trello.executor") as mock_executor, \
-         patch("app.trello.sync_lock_manager") as mock_lock:
-        mock_lock.is_locked.return_value = False
+         patch("app.trello.executor") as mock_executor:
         resp = client.post("/trello/webhook", json=_BODY)
 
     assert resp.status_code == 200
+    assert _queued() == []
+    mock_executor.submit.assert_not_called()
+
+
+def test_handled_event_is_persisted_before_200(client, trello_patches):
+    mock_executor, mock_lock = trello_patches
+    mock_lock.is_locked.return_value = False
+
+    resp = client.post("/trello/webhook", json=_BODY)
+
+    assert resp.status_code == 200
+    [row] = _queued()
+    assert (row.status, row.card_id, row.action_id) == ("pending", "abc-123", "act-1")
+    assert row.payload == _HANDLED
+    # The inbound worker applies it; the request thread never touches the pool.
     mock_executor.submit.assert_not_called()
 
 
-def test_lock_held_returns_202_and_enqueues(client, trello_patches):
-    mock_executor, mock_lock, queue = trello_patches
+def test_redelivered_action_is_stored_once(client, trello_patches):
+    _, mock_lock = trello_patches
+    mock_lock.is_locked.return_value = False
+
+    assert client.post("/trello/webhook", json=_BODY).status_code == 200
+    assert client.post("/trello/webhook", json=_BODY).status_code == 200
+
+    assert len(_queued()) == 1
+
+
+def test_lock_held_returns_202_and_persists(client, trello_patches):
+    mock_executor, mock_lock = trello_patches
     mock_lock.is_locked.return_value = True
     mock_lock.get_current_operation.return_value = "OneDrive-Snapshot"
 
@@ -71,37 +94,28 @@ def test_lock_held_returns_202_and_enqueues(client, trello_patches):
     assert resp.status_code == 202
     assert body["status"] == "queued"
     assert "OneDrive-Snapshot" in body["reason"]
-    assert queue.qsize() == 1
+    assert [r.status for r in _queued()] == ["pending"]
     mock_executor.submit.assert_not_called()
 
 
-def test_queue_full_when_lock_held_returns_429(client):
-    full_queue = Queue(maxsize=1)
-    full_queue.put_nowait({"already": "queued"})
-    with patch("app.trello.parse_webhook_data", return_value=_HANDLED), \
-         patch("app.trello.executor") as mock_executor, \
-         patch("app.trello.sync_lock_manager") as mock_lock, \
-         patch("app.trello.trello_event_queue", full_queue):
-        mock_lock.is_locked.return_value = True
-        mock_lock.get_current_operation.return_value = "OneDrive-Snapshot"
-        resp = client.post("/trello/webhook", json=_BODY)
+def test_backlog_at_max_depth_returns_429(client, trello_patches):
+    _, mock_lock = trello_patches
+    mock_lock.is_locked.return_value = False
+    with patch.object(inbound_queue.cfg, "TRELLO_INBOUND_MAX_DEPTH", 1):
+        assert client.post("/trello/webhook", json=_BODY).status_code == 200
+        resp = client.post("/trello/webhook", json={"action": {"id": "act-2"}})
 
     assert resp.status_code == 429
     assert resp.get_json()["status"] == "overloaded"
-    mock_executor.submit.assert_not_called()
+    assert len(_queued()) == 1
 
 
-def test_lock_free_submits_to_executor(client, trello_patches):
-    mock_executor, mock_lock, _ = trello_patches
-    mock_lock.is_locked.return_value = False
-    future = MagicMock()
-    mock_executor.submit.return_value = future
-
-    resp = client.post("/trello/webhook", json=_BODY)
-
-    assert resp.status_code == 200
-    mock_executor.submit.assert_called_once()
-    future.add_done_callback.assert_called_once()
+def test_event_lock_keys_cover_card_release_and_both_lists():
+    keys = trello_event_lock_keys({
+        "card_id": "c1", "card_name": "123-v456 Canopy",
+        "list_id_before": "L1", "list_id_after": "L2",
+    })
+    assert keys == [card_key("c1"), release_key("123", "V456"), list_key("L1"), list_key("L2")]
 
 
 def test_thread_stats_returns_tracker_snapshot(client):
@@ -109,3 +123,7 @@ def test_thread_stats_returns_tracker_snapshot(client):
     for key in ("total_started", "total_completed", "total_failed",
                 "total_rejected", "active_count", "max_concurrent"):
         assert key in body
+    assert body["locks"]["exclusive_operation"] is None
+    assert "keyed_contended" in body["locks"]
+    assert body["inbound"]["depth"] == 0
+    assert body["inbound"]["worker_alive"] is False